@@ -0,0 +1,39 @@
+import os
+import tempfile
+import time
+
+# Benchmarks run against a scratch SQLite database, never the configured
+# one. Import this module before anything that imports app.
+_tmp_dir = tempfile.mkdtemp(prefix="restrostats-bench-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + os.path.join(_tmp_dir, "bench.sqlite3")
+os.environ["MODEL_STORE_DIR"] = os.path.join(_tmp_dir, "model_store")
+os.environ["SCHEDULER_DB"] = os.path.join(_tmp_dir, "scheduler.sqlite3")
+os.environ["UPLOAD_DIR"] = _tmp_dir
+
+from app import app, db  # noqa: E402
+from entities.Restaurant import Restaurant  # noqa: E402
+
+
+def seed_payments(rows):
+    """Create the schema and one restaurant holding `rows` payments. Returns its id."""
+    from cleaning.payments import clean_upload_chunk
+    from repository.Bulk_Insert import bulk_insert_payments
+    from tests.factories import payment_rows
+
+    db.create_all()
+    restaurant = Restaurant(name="Bench", email="bench@example.com", password="-", city="-", state="-")
+    db.session.add(restaurant)
+    db.session.commit()
+    bulk_insert_payments(clean_upload_chunk(payment_rows(rows)), restaurant.id)
+    db.session.commit()
+    return restaurant.id
+
+
+def best_of(function, repeat):
+    """Fastest of `repeat` timed calls, in seconds, and the last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
@@ -0,0 +1,50 @@
+"""
+Time to list 100k payments as ORM objects vs as column projections
+turned into dicts, the /transactions read path.
+
+    python -m benchmarks.projection [--rows 100000] [--repeat 5]
+"""
+import argparse
+
+from benchmarks.common import app, best_of, db, seed_payments
+from entities.Payment import Payment
+from repository.Read_Models import TRANSACTION_COLUMNS, project, to_dicts
+
+FIELDS = [column.key for column in TRANSACTION_COLUMNS]
+
+
+def orm_listing(restaurant_id):
+    payments = Payment.query.filter_by(restaurant_id=restaurant_id).all()
+    return [{field: getattr(payment, field) for field in FIELDS} for payment in payments]
+
+
+def projected_listing(restaurant_id):
+    rows = project(TRANSACTION_COLUMNS).filter(Payment.restaurant_id == restaurant_id).all()
+    return to_dicts(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        restaurant_id = seed_payments(args.rows)
+        results = {}
+        for label, listing in (("orm", orm_listing), ("projection", projected_listing)):
+            # A fresh session per run, so the identity map does not carry over
+            def run():
+                db.session.remove()
+                return listing(restaurant_id)
+
+            results[label] = best_of(run, args.repeat)
+
+    assert results["orm"][1] == results["projection"][1]
+    for label, (seconds, rows) in results.items():
+        print(f"{label:12s} {seconds * 1000:8.1f} ms  {len(rows) / seconds:12,.0f} rows/s")
+    print(f"speedup      {results['orm'][0] / results['projection'][0]:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Parsing 1M POS export timestamps: per-row .apply vs normalize_timestamps.
+
+    python -m benchmarks.timestamps [--rows 1000000] [--lines-per-order 3] [--repeat 3]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from cleaning.timestamp import normalize_timestamps
+
+
+def export_timestamps(rows, lines_per_order):
+    """Day-first strings like /api/load-data receives, one per order line."""
+    orders = np.arange(rows) // lines_per_order
+    timestamps = pd.Timestamp("2023-01-01 08:00") + pd.to_timedelta(orders * 7, unit="min")
+    return pd.Series(timestamps.strftime("%d-%m-%Y %H:%M"), name="timestamp")
+
+
+def clean_timestamp(date_str):
+    # The per-row cleaner cleaning/timestamp.py used to apply to every value
+    try:
+        return pd.to_datetime(date_str, errors="coerce", dayfirst=True)
+    except Exception:
+        return None
+
+
+def apply_path(values):
+    return pd.to_datetime(values.apply(clean_timestamp))
+
+
+def normalized_path(values):
+    parsed, _ = normalize_timestamps(values, dayfirst=True)
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lines-per-order", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values = export_timestamps(args.rows, args.lines_per_order)
+    # The .apply path takes minutes on 1M rows, one run of it is enough
+    results = {
+        "apply": best_of(lambda: apply_path(values), 1),
+        "normalize": best_of(lambda: normalized_path(values), args.repeat),
+    }
+
+    pd.testing.assert_series_equal(results["apply"][1], results["normalize"][1], check_dtype=False)
+    for label, (seconds, parsed) in results.items():
+        print(f"{label:12s} {seconds * 1000:10.1f} ms  {len(parsed) / seconds:12,.0f} rows/s")
+    print(f"speedup      {results['apply'][0] / results['normalize'][0]:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
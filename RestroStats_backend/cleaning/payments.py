@@ -0,0 +1,41 @@
+from cleaning.timestamp import normalize_timestamps
+
+# Only pandas here: the cleaners run inside spawned ingest workers, which
+# must not import the web app to clean a chunk.
+
+
+def _fill_transaction_type(df):
+    mode = df["transaction_type"].mode()
+    df["transaction_type"] = df["transaction_type"].fillna(mode[0] if not mode.empty else "Unknown")
+    return df
+
+
+def _parse_timestamps(df, dayfirst, state):
+    # The first chunk's detected format is kept in state and reused for the
+    # rest of the upload, so an ambiguous later chunk cannot switch between
+    # day-first and month-first
+    fmt = state.get("timestamp_format") if state is not None else None
+    df["timestamp"], report = normalize_timestamps(df["timestamp"], dayfirst=dayfirst, fmt=fmt)
+    if state is not None and fmt is None and report["format"]:
+        state["timestamp_format"] = report["format"]
+    return df.dropna(subset=["timestamp"])
+
+
+def clean_upload_chunk(df, state=None):
+    """
+    Cleaning applied to /upload CSVs, per chunk. state is a dict shared by
+    the chunks of one upload (see stream_insert_payments).
+    """
+    df = df.dropna()
+    return _parse_timestamps(df, False, state)
+
+
+def clean_load_chunk(df, state=None):
+    """
+    Cleaning applied to /api/load-data uploads, per chunk or per file: drop
+    incomplete rows, parse day-first timestamps (the only place they are
+    parsed on this path) and fill missing transaction types. state is a
+    dict shared by the chunks of one upload.
+    """
+    df = df.dropna()
+    return _fill_transaction_type(_parse_timestamps(df, True, state))
@@ -1,39 +1,129 @@
 import pandas as pd
 
-# Load the uploaded CSV file
-file_path = "E:/Users/Documents/College/Engineering/S.Y. Eng/Sem 4/PBL/archive/Balaji Fast Food Sales - Copy.csv"
-df = pd.read_csv(file_path)
-
-# Display the first few rows to understand its structure
-df.head()
-
-# Define a function to standardize timestamps
-def clean_timestamp(date_str):
-    try:
-        return pd.to_datetime(date_str, errors='coerce', dayfirst=False)
-    except Exception:
+# Formats seen in POS exports, tried in order when detecting. Day-first and
+# month-first variants of the ambiguous ones are reordered by detect_format.
+CANDIDATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d-%m-%Y %H:%M",
+    "%d-%m-%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m-%d-%Y %H:%M",
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+]
+
+SAMPLE_SIZE = 200
+
+
+def _candidates(dayfirst):
+    if dayfirst:
+        return CANDIDATE_FORMATS
+    # Prefer month-first where a value could be read either way
+    month_first = [f for f in CANDIDATE_FORMATS if f.startswith("%m")]
+    return [f for f in CANDIDATE_FORMATS if f not in month_first and not f.startswith("%d")] + month_first + [
+        f for f in CANDIDATE_FORMATS if f.startswith("%d")
+    ]
+
+
+def detect_format(values, dayfirst=False, sample_size=SAMPLE_SIZE):
+    """
+    Pick the candidate format that parses the most of a sample of distinct
+    values, or None if none of them parses anything.
+    """
+    sample = pd.Series(pd.unique(values.dropna().astype(str).str.strip())[:sample_size])
+    if sample.empty:
         return None
 
-# Apply function to clean timestamp column
-df['timestamp'] = df['timestamp'].apply(clean_timestamp)
+    best_format, best_parsed = None, 0
+    for fmt in _candidates(dayfirst):
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum()
+        if parsed > best_parsed:
+            best_format, best_parsed = fmt, parsed
+            if parsed == len(sample):
+                break
+    return best_format
+
+
+def normalize_timestamps(values, dayfirst=False, fmt=None):
+    """
+    Parse a column of timestamp strings to datetime64 in one vectorised pass.
+
+    The format is detected from a sample unless fmt is given. Only distinct
+    strings are parsed (POS exports repeat the same timestamp for every line
+    of an order) and the results are broadcast back. Values the detected
+    format misses get one flexible retry. Returns (parsed, report) where
+    report holds the format used and the rows that could not be parsed.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, {"format": None, "unparsed": int(values.isna().sum()), "unparsed_examples": []}
+
+    codes, uniques = pd.factorize(values.astype("string").str.strip())
+    uniques = pd.Series(uniques, dtype="string")
+    fmt = fmt or detect_format(uniques, dayfirst=dayfirst)
+
+    if uniques.empty:
+        parsed = pd.Series([pd.NaT], dtype="datetime64[ns]")
+    elif fmt:
+        parsed = pd.to_datetime(uniques, format=fmt, errors="coerce")
+    else:
+        parsed = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+
+    missed = parsed.isna() & uniques.notna()
+    if missed.any():
+        parsed[missed] = pd.to_datetime(
+            uniques[missed], format="mixed", dayfirst=dayfirst, errors="coerce"
+        )
+
+    # factorize marks missing values with code -1
+    result = pd.Series(
+        parsed.to_numpy()[codes], index=values.index, name=values.name
+    ).where(codes >= 0)
+    result = pd.to_datetime(result)
+
+    failed = result.isna()
+    report = {
+        "format": fmt,
+        "unparsed": int(failed.sum()),
+        "unparsed_examples": values[failed].dropna().astype(str).unique()[:5].tolist(),
+    }
+    if report["unparsed"]:
+        print(f"Warning: {report['unparsed']} timestamps could not be parsed, e.g. {report['unparsed_examples']}")
+    return result, report
+
+
+if __name__ == "__main__":
+    # Load the uploaded CSV file
+    file_path = "E:/Users/Documents/College/Engineering/S.Y. Eng/Sem 4/PBL/archive/Balaji Fast Food Sales - Copy.csv"
+    df = pd.read_csv(file_path)
+
+    # Standardize timestamps
+    df['timestamp'], _ = normalize_timestamps(df['timestamp'])
 
-# Mapping time_of_sale to approximate hours
-time_mapping = {
-    "Morning": "08:00:00",
-    "Afternoon": "14:00:00",
-    "Evening": "18:00:00",
-    "Night": "22:00:00"
-}
+    # Mapping time_of_sale to approximate hours
+    time_mapping = {
+        "Morning": "08:00:00",
+        "Afternoon": "14:00:00",
+        "Evening": "18:00:00",
+        "Night": "22:00:00"
+    }
 
-# Replace time_of_sale with mapped time values
-df['time_of_sale'] = df['time_of_sale'].map(time_mapping)
+    # Replace time_of_sale with mapped time values
+    df['time_of_sale'] = df['time_of_sale'].map(time_mapping)
 
-# Combine timestamp and time_of_sale into a single datetime column
-df['timestamp'] = df['timestamp'].astype(str) + " " + df['time_of_sale'].astype(str)
-df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+    # Combine timestamp and time_of_sale into a single datetime column
+    df['timestamp'] = df['timestamp'].dt.strftime("%Y-%m-%d") + " " + df['time_of_sale'].astype(str)
+    df['timestamp'], _ = normalize_timestamps(df['timestamp'], fmt="%Y-%m-%d %H:%M:%S")
 
-# Drop original time_of_sale column
-df = df.drop(columns=['time_of_sale'])
+    # Drop original time_of_sale column
+    df = df.drop(columns=['time_of_sale'])
 
-# Display cleaned data
-df.head()
+    # Display cleaned data
+    print(df.head())
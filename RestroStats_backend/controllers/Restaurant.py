@@ -12,21 +12,48 @@ from app import (
     render_template,
 )
 
+import csv
+import io
+import json
+import uuid
+
 import pandas as pd
-import pickle
 from datetime import datetime, timedelta
+from flask import Response, stream_with_context
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from cleaning.payments import clean_upload_chunk
 
 from entities.Restaurant import Restaurant
 from entities.Payment import Payment
+from entities.PaymentRollup import PaymentRollup
 from entities.Bill import Bill
 from entities.BillItem import BillItem
-
-from prediction_models.food_sales_analysis import (
-    generate_insights,
-    analysis_results,
-    df_clean,
-    df_time_analysis,
+from entities.UploadJob import UploadJob
+
+from repository.Bulk_Insert import stream_insert_payments
+from repository.Features import WEEKDAY_NAMES, validate_time_slots
+from repository.Group_Commit import BillCommitPending, bill_committer
+from repository.Pagination import keyset_page, page_size
+from repository.Read_Models import (
+    BILL_COLUMNS,
+    BILL_FORMATS,
+    BILL_ITEM_COLUMNS,
+    TRANSACTION_COLUMNS,
+    project,
+    to_dicts,
 )
+from repository.Sql_Functions import weekday_of
+from repository.Upload_Jobs import enqueue_upload, wants_async_upload
+
+from prediction_models.analysis_cache import (
+    get_insights,
+    mark_payments_changed,
+    request_restaurant_id,
+    restaurant_time_slots,
+)
+from prediction_models.model_registry import model_registry
 
 CORS(app)
 
@@ -169,6 +196,42 @@ def update_restaurant_profile():
     return jsonify({"message": "Profile updated successfully"})
 
 
+# Time-of-day slots used to bucket sales in the analysis and predictions
+@app.route("/restaurant/time-slots", methods=["GET"])
+@jwt_required()
+def get_time_slots():
+    restaurant_id = get_jwt_identity()
+    slots = restaurant_time_slots(restaurant_id)
+    return jsonify({"time_slots": [{"name": name, "start": start} for name, start in slots]})
+
+
+@app.route("/restaurant/time-slots", methods=["PUT"])
+@jwt_required()
+def update_time_slots():
+    restaurant_id = get_jwt_identity()
+    restaurant = Restaurant.query.get(restaurant_id)
+
+    if not restaurant:
+        return jsonify({"error": "Restaurant not found"}), 404
+
+    # null resets the restaurant to the default slots
+    slots = (request.json or {}).get("time_slots")
+    if slots is None:
+        restaurant.time_slots = None
+    else:
+        try:
+            pairs = validate_time_slots(slots)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        restaurant.time_slots = [{"name": name, "start": start} for name, start in pairs]
+
+    # Cached analysis was bucketed with the old slots
+    mark_payments_changed(restaurant_id)
+    db.session.commit()
+
+    return jsonify({"message": "Time slots updated successfully"})
+
+
 # Upload and clean payment data
 @app.route("/upload", methods=["POST"])
 @jwt_required()
@@ -178,28 +241,85 @@ def upload_payments():
         return jsonify({"error": "No file uploaded"}), 400
 
     file = request.files["file"]
-    df = pd.read_csv(file)
-    df = df.dropna()
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-    df = df.dropna(subset=["timestamp"])
-
-    for _, row in df.iterrows():
-        payment = Payment(
-            restaurant_id=restaurant_id,
-            order_id=row["order_id"],
-            timestamp=row["timestamp"],
-            item_name=row["item_name"],
-            item_type=row["item_type"],
-            item_price=row["item_price"],
-            quantity=row["quantity"],
-            transaction_amount=row["transaction_amount"],
-            transaction_type=row.get("transaction_type", None),
-            received_by=row["received_by"],
-        )
-        db.session.add(payment)
+    if wants_async_upload(request):
+        job = enqueue_upload(file, restaurant_id, clean_upload_chunk, "upload")
+        return jsonify({"message": "Upload queued", "job_id": job.id}), 202
+
+    stats = stream_insert_payments(file.stream, restaurant_id, clean_upload_chunk)
     db.session.commit()
 
-    return jsonify({"message": "Data uploaded and cleaned successfully"})
+    return jsonify(
+        {
+            "message": "Data uploaded and cleaned successfully",
+            "rows_inserted": stats["inserted"],
+            "rows_skipped": stats["skipped"],
+            "rows_per_second": stats["rows_per_second"],
+        }
+    )
+
+
+@app.route("/jobs/<int:job_id>", methods=["GET"])
+@jwt_required()
+def get_job(job_id):
+    restaurant_id = get_jwt_identity()
+    job = UploadJob.query.filter_by(id=job_id, restaurant_id=restaurant_id).first()
+
+    if not job:
+        return jsonify({"error": "Job not found or unauthorized"}), 404
+
+    return jsonify(job.to_dict())
+
+
+def parse_date_range():
+    """Read the optional ?from=YYYY-MM-DD&to=YYYY-MM-DD window (both inclusive)."""
+    try:
+        start = request.args.get("from")
+        end = request.args.get("to")
+        start = datetime.strptime(start, "%Y-%m-%d") if start else None
+        end = datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1) if end else None
+    except ValueError:
+        return None, None, "Dates must be in YYYY-MM-DD format"
+    return start, end, None
+
+
+def sales_columns():
+    """
+    (date, weekday, hour, amount) columns to aggregate, from payment_rollups
+    when enabled. weekday is Monday = 0, as stored on payments.
+    """
+    if app.config["USE_PAYMENT_ROLLUPS"]:
+        return (
+            PaymentRollup.sale_date,
+            weekday_of(PaymentRollup.sale_date),
+            PaymentRollup.hour,
+            PaymentRollup.total_amount,
+        )
+    return (
+        func.date(Payment.timestamp),
+        Payment.day_of_week,
+        Payment.hour_of_day,
+        Payment.transaction_amount,
+    )
+
+
+def filter_sales(query, restaurant_id, start, end):
+    if app.config["USE_PAYMENT_ROLLUPS"]:
+        # Served by the (restaurant_id, sale_date, ...) unique index
+        query = query.filter(PaymentRollup.restaurant_id == restaurant_id)
+        if start:
+            query = query.filter(PaymentRollup.sale_date >= start.date())
+        if end:
+            query = query.filter(PaymentRollup.sale_date < end.date())
+        return query
+
+    # Restaurant equality plus a timestamp range keeps the scan on
+    # idx_payment_restaurant_timestamp
+    query = query.filter(Payment.restaurant_id == restaurant_id)
+    if start:
+        query = query.filter(Payment.timestamp >= start)
+    if end:
+        query = query.filter(Payment.timestamp < end)
+    return query
 
 
 # Analyze sales trends
@@ -207,13 +327,15 @@ def upload_payments():
 @jwt_required()
 def get_sales():
     restaurant_id = get_jwt_identity()
-    payments = Payment.query.filter_by(restaurant_id=restaurant_id).all()
-    # payments = Payment.query.all()
-    daily_sales = {}
+    start, end, error = parse_date_range()
+    if error:
+        return jsonify({"error": error}), 400
+
+    day, _, _, amount = sales_columns()
+    query = db.session.query(day, func.sum(amount))
+    rows = filter_sales(query, restaurant_id, start, end).group_by(day).order_by(day)
 
-    for payment in payments:
-        date = payment.timestamp.date().strftime("%Y-%m-%d")
-        daily_sales[date] = daily_sales.get(date, 0) + payment.transaction_amount
+    daily_sales = {str(date): float(total) for date, total in rows}
 
     return jsonify(daily_sales)
 
@@ -223,17 +345,32 @@ def get_sales():
 @jwt_required()
 def get_peak_hours():
     restaurant_id = get_jwt_identity()
-    payments = Payment.query.filter_by(restaurant_id=restaurant_id).all()
-    # payments = Payment.query.all()
-    hourly_sales = {}
+    start, end, error = parse_date_range()
+    if error:
+        return jsonify({"error": error}), 400
+
+    _, weekday, hour, amount = sales_columns()
+    query = db.session.query(hour, func.sum(amount))
+    rows = filter_sales(query, restaurant_id, start, end).group_by(hour)
+
+    hourly_sales = {h: 0.0 for h in range(24)}
+    for h, total in rows:
+        hourly_sales[int(h)] = float(total)
+
+    peak_hour = max(hourly_sales, key=hourly_sales.get) if any(hourly_sales.values()) else None
+    response = {"peak_hour": peak_hour, "hourly_sales": hourly_sales}
 
-    for payment in payments:
-        hour = payment.timestamp.hour
-        hourly_sales[hour] = hourly_sales.get(hour, 0) + payment.transaction_amount
+    # Optional 7x24 day-of-week by hour grid
+    if request.args.get("by_day", "").lower() in ("1", "true", "yes"):
+        query = db.session.query(weekday, hour, func.sum(amount))
+        rows = filter_sales(query, restaurant_id, start, end).group_by(weekday, hour)
 
-    peak_hour = max(hourly_sales, key=hourly_sales.get) if hourly_sales else None
+        grid = {day_name: [0.0] * 24 for day_name in WEEKDAY_NAMES}
+        for d, h, total in rows:
+            grid[WEEKDAY_NAMES[int(d)]][int(h)] = float(total)
+        response["day_hour_sales"] = grid
 
-    return jsonify({"peak_hour": peak_hour, "hourly_sales": hourly_sales})
+    return jsonify(response)
 
 
 @app.route("/predict", methods=["POST"])
@@ -242,67 +379,139 @@ def predict():
     data = request.json
     X_input = pd.DataFrame([data])  # Convert input JSON to DataFrame
 
-    with open("sales_model.pkl", "rb") as f:
-        model = pickle.load(f)
+    model = model_registry.get()
+    if model is None:
+        return jsonify({"error": "No trained model available"}), 503
 
     prediction = model.predict(X_input)
     return jsonify({"predicted_sales": prediction[0]})
 
 
-@app.route("/transactions/<limit>", methods=["GET"])
+@app.route("/transactions", methods=["GET"])
+@jwt_required()
+def transactions_page():
+    restaurant_id = get_jwt_identity()
+    try:
+        limit = page_size()
+        query = project(TRANSACTION_COLUMNS).filter(Payment.restaurant_id == restaurant_id)
+        rows, next_cursor = keyset_page(
+            query, Payment.timestamp, Payment.id, request.args.get("cursor"), limit
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"transactions": to_dicts(rows), "next_cursor": next_cursor})
+
+
+EXPORT_COLUMNS = [
+    Payment.id,
+    Payment.order_id,
+    Payment.timestamp,
+    Payment.item_name,
+    Payment.item_type,
+    Payment.item_price,
+    Payment.quantity,
+    Payment.transaction_amount,
+    Payment.transaction_type,
+    Payment.received_by,
+]
+
+
+@app.route("/transactions/export", methods=["GET"])
+@jwt_required()
+def export_transactions():
+    restaurant_id = get_jwt_identity()
+    export_format = request.args.get("format", "ndjson").lower()
+    if export_format not in ("ndjson", "csv"):
+        return jsonify({"error": "format must be ndjson or csv"}), 400
+    start, end, error = parse_date_range()
+    if error:
+        return jsonify({"error": error}), 400
+
+    stmt = select(*EXPORT_COLUMNS).where(Payment.restaurant_id == restaurant_id)
+    if start:
+        stmt = stmt.where(Payment.timestamp >= start)
+    if end:
+        stmt = stmt.where(Payment.timestamp < end)
+    # Server-side cursor: rows are fetched and written batch by batch
+    stmt = stmt.order_by(Payment.timestamp, Payment.id).execution_options(
+        stream_results=True, yield_per=1000
+    )
+    header = [column.key for column in EXPORT_COLUMNS]
+
+    def generate():
+        result = db.session.execute(stmt)
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(header)
+            yield buffer.getvalue()
+            for rows in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(rows)
+                yield buffer.getvalue()
+        else:
+            for rows in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(header, row)), default=str) + "\n" for row in rows
+                )
+
+    mimetype = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=transactions.{export_format}"
+        },
+    )
+
+
+@app.route("/transactions/<int:limit>", methods=["GET"])
+@jwt_required()
 def transactions(limit):
-    # payments = Payment.query.all()
-    payments = Payment.query.order_by(Payment.timestamp.desc()).limit(limit).all()
-
-    # Convert SQLAlchemy objects to dictionaries
-    payment_list = []
-    for payment in payments:
-        payment_dict = {
-            "order_id": payment.order_id,
-            "timestamp": payment.timestamp,
-            "item_name": payment.item_name,
-            "item_price": payment.item_price,
-            "quantity": payment.quantity,
-            "transaction_amount": payment.transaction_amount,
-            "transaction_type": payment.transaction_type,
-        }
-        payment_list.append(payment_dict)
+    restaurant_id = get_jwt_identity()
+    limit = max(1, min(limit, app.config["MAX_PAGE_SIZE"]))
+    query = project(TRANSACTION_COLUMNS).filter(Payment.restaurant_id == restaurant_id)
+    rows, _ = keyset_page(query, Payment.timestamp, Payment.id, None, limit)
 
-    return jsonify(payment_list)
+    return jsonify(to_dicts(rows))
 
 
 @app.route("/transactions/all", methods=["GET"])
+@jwt_required()
 def alltransactions():
-    # payments = Payment.query.all()
-    payments = Payment.query.order_by(Payment.timestamp.desc()).all()
-
-    # Convert SQLAlchemy objects to dictionaries
-    payment_list = []
-    for payment in payments:
-        payment_dict = {
-            "order_id": payment.order_id,
-            "timestamp": payment.timestamp,
-            "item_name": payment.item_name,
-            "item_price": payment.item_price,
-            "quantity": payment.quantity,
-            "transaction_amount": payment.transaction_amount,
-            "transaction_type": payment.transaction_type,
-        }
-        payment_list.append(payment_dict)
-
-    return jsonify(payment_list)
+    restaurant_id = get_jwt_identity()
+    query = project(TRANSACTION_COLUMNS).filter(Payment.restaurant_id == restaurant_id)
+
+    def generate():
+        # The same JSON list as before, written one keyset page at a time so
+        # the restaurant's history is never held in memory at once
+        cursor, separator = None, "["
+        while True:
+            rows, cursor = keyset_page(
+                query, Payment.timestamp, Payment.id, cursor, app.config["MAX_PAGE_SIZE"]
+            )
+            for row in to_dicts(rows):
+                yield separator + app.json.dumps(row)
+                separator = ","
+            if cursor is None:
+                break
+        yield "[]" if separator == "[" else "]"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
 
 
 @app.route("/popularitem", methods=["GET"])
 def popularitem():
-    insights_list, top_item = generate_insights(df_clean, df_time_analysis)
+    _, top_item = get_insights(request_restaurant_id())
     return jsonify({"popular_item": top_item})
 
 
 @app.route("/insights", methods=["GET"])
 def insights():
-    insights_list, top_item = generate_insights(df_clean, df_time_analysis)
-    return jsonify({"insights": insights_list})
+    insights, _ = get_insights(request_restaurant_id())
+    return jsonify({"insights": insights})
 
 
 @app.route("/generate-bill", methods=["POST"])
@@ -337,9 +546,17 @@ def generate_bill():
     except ValueError:
         return jsonify({"error": "Invalid date or time format"}), 400
 
-    # Create new bill record
-    new_bill = Bill(
+    # Retries carrying the same key get the bill saved by the first attempt
+    idempotency_key = request.headers.get("Idempotency-Key") or uuid.uuid4().hex
+    if len(idempotency_key) > 64:
+        return jsonify({"error": "Idempotency-Key must be at most 64 characters"}), 400
+    saved = _bill_for_key(restaurant_id, idempotency_key)
+    if saved is not None:
+        return _bill_saved(*saved, idempotency_key, 200)
+
+    bill_fields = dict(
         restaurant_id=restaurant_id,
+        idempotency_key=idempotency_key,
         bill_number=data["billNumber"],
         timestamp=bill_datetime,
         customer_name=data["customerName"],
@@ -348,62 +565,121 @@ def generate_bill():
         tax_amount=data["tax"],
         total_amount=data["grandTotal"] + data["tax"],
     )
-
-    db.session.add(new_bill)
-    db.session.flush()  # To get the bill ID
-
-    # Add bill items
-    for item in data["items"]:
-        bill_item = BillItem(
-            bill_id=new_bill.id,
+    item_rows = [
+        dict(
             description=item["description"],
             quantity=item["quantity"],
             unit_price=item["price"],
             total_price=item["total"],
         )
-        db.session.add(bill_item)
+        for item in data["items"]
+    ]
 
     try:
-        db.session.commit()
+        if app.config["BILL_GROUP_COMMIT"]:
+            # Shares one transaction with bills from other terminals
+            bill_id = bill_committer.submit(bill_fields, item_rows)
+        else:
+            # Create new bill record
+            new_bill = Bill(**bill_fields)
+            db.session.add(new_bill)
+            db.session.flush()  # To get the bill ID
+            bill_id = new_bill.id
+
+            # Add bill items
+            for item in item_rows:
+                db.session.add(BillItem(bill_id=bill_id, **item))
+            db.session.commit()
+
+        return _bill_saved(bill_id, bill_fields["bill_number"], idempotency_key, 201)
+    except BillCommitPending:
+        # The batch may still commit: the client retries with this key
+        # instead of treating the bill as failed
         return (
             jsonify(
                 {
-                    "message": "Bill generated successfully",
-                    "bill_id": new_bill.id,
-                    "bill_number": new_bill.bill_number,
+                    "message": "Bill is still being saved, retry with the same Idempotency-Key",
+                    "idempotency_key": idempotency_key,
+                    "bill_number": bill_fields["bill_number"],
                 }
             ),
-            201,
+            202,
         )
+    except IntegrityError as e:
+        db.session.rollback()
+        # A concurrent retry with the same key won the race
+        saved = _bill_for_key(restaurant_id, idempotency_key)
+        if saved is not None:
+            return _bill_saved(*saved, idempotency_key, 200)
+        return jsonify({"error": f"Failed to generate bill: {str(e)}"}), 500
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": f"Failed to generate bill: {str(e)}"}), 500
+
+
+def _bill_for_key(restaurant_id, idempotency_key):
+    """(id, bill_number) of the bill saved under an Idempotency-Key, or None."""
+    return (
+        db.session.query(Bill.id, Bill.bill_number)
+        .filter(Bill.restaurant_id == restaurant_id, Bill.idempotency_key == idempotency_key)
+        .first()
+    )
+
+
+def _bill_saved(bill_id, bill_number, idempotency_key, status):
+    return (
+        jsonify(
+            {
+                "message": "Bill generated successfully",
+                "bill_id": bill_id,
+                "bill_number": bill_number,
+                "idempotency_key": idempotency_key,
+            }
+        ),
+        status,
+    )
     
 # Get all bills for restaurant
 @app.route("/bills", methods=["GET"])
 @jwt_required()
 def get_bills():
     restaurant_id = get_jwt_identity()
+    query = project(BILL_COLUMNS).filter(Bill.restaurant_id == restaurant_id)
     
-    # Get bills with newest first
-    bills = Bill.query.filter_by(restaurant_id=restaurant_id).order_by(Bill.timestamp.desc()).all()
+    # Clients that pass ?limit= or ?cursor= get a page of bills, newest first,
+    # and {bills, next_cursor}; without them the plain list of every bill
+    # is kept for older clients
+    paged = "limit" in request.args or "cursor" in request.args
+    if paged:
+        try:
+            limit = page_size()
+            rows, next_cursor = keyset_page(
+                query, Bill.timestamp, Bill.id, request.args.get("cursor"), limit
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    else:
+        rows = query.order_by(Bill.timestamp.desc(), Bill.id.desc()).all()
     
-    bills_list = []
-    for bill in bills:
-        bill_dict = {
-            "id": bill.id,
-            "bill_number": bill.bill_number,
-            "timestamp": bill.timestamp.strftime("%Y-%m-%d %H:%M"),
-            "customer_name": bill.customer_name,
-            "table_number": bill.table_number,
-            "subtotal": bill.subtotal,
-            "tax_amount": bill.tax_amount,
-            "total_amount": bill.total_amount,
-            "created_at": bill.created_at.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        bills_list.append(bill_dict)
+    bills_list = to_dicts(rows, BILL_FORMATS)
     
-    return jsonify(bills_list)
+    # Items for the whole page in one IN query
+    if request.args.get("include_items", "").lower() in ("1", "true", "yes"):
+        items_by_bill = {bill["id"]: [] for bill in bills_list}
+        if items_by_bill:
+            items = (
+                project((BillItem.bill_id,) + BILL_ITEM_COLUMNS)
+                .filter(BillItem.bill_id.in_(items_by_bill))
+                .all()
+            )
+            for item in to_dicts(items):
+                items_by_bill[item.pop("bill_id")].append(item)
+        for bill in bills_list:
+            bill["items"] = items_by_bill[bill["id"]]
+    
+    if not paged:
+        return jsonify(bills_list)
+    return jsonify({"bills": bills_list, "next_cursor": next_cursor})
 
 # Get specific bill with items
 @app.route("/bills/<int:bill_id>", methods=["GET"])
@@ -411,34 +687,20 @@ def get_bills():
 def get_bill_detail(bill_id):
     restaurant_id = get_jwt_identity()
     
-    bill = Bill.query.filter_by(id=bill_id, restaurant_id=restaurant_id).first()
+    rows = (
+        project(BILL_COLUMNS)
+        .filter(Bill.id == bill_id, Bill.restaurant_id == restaurant_id)
+        .limit(1)
+        .all()
+    )
     
-    if not bill:
+    if not rows:
         return jsonify({"error": "Bill not found or unauthorized"}), 404
     
-    items_list = []
-    for item in bill.items:
-        item_dict = {
-            "id": item.id,
-            "description": item.description,
-            "quantity": item.quantity,
-            "unit_price": item.unit_price,
-            "total_price": item.total_price
-        }
-        items_list.append(item_dict)
+    items = project(BILL_ITEM_COLUMNS).filter(BillItem.bill_id == bill_id).all()
     
-    bill_dict = {
-        "id": bill.id,
-        "bill_number": bill.bill_number,
-        "timestamp": bill.timestamp.strftime("%Y-%m-%d %H:%M"),
-        "customer_name": bill.customer_name,
-        "table_number": bill.table_number,
-        "subtotal": bill.subtotal,
-        "tax_amount": bill.tax_amount,
-        "total_amount": bill.total_amount,
-        "created_at": bill.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-        "items": items_list
-    }
+    bill_dict = to_dicts(rows, BILL_FORMATS)[0]
+    bill_dict["items"] = to_dicts(items)
     
     return jsonify(bill_dict)
 
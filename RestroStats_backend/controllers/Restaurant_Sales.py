@@ -1,4 +1,3 @@
-import pickle
 import os
 from datetime import datetime
 
@@ -13,7 +12,18 @@ from flask_jwt_extended import get_jwt_identity, jwt_required
 import json
 
 from entities.Payment import Payment
+from repository.Bulk_Insert import stream_insert_payments
+from cleaning.payments import clean_load_chunk
+from repository.Parallel_Ingest import ingest_files_parallel, is_multi_file_upload
+from repository.Features import slot_translation, time_of_day, time_slot_names
+from repository.Upload_Jobs import enqueue_upload, wants_async_upload
 from prediction_models import food_sales_analysis
+from prediction_models.analysis_cache import (
+    get_analysis_state,
+    request_restaurant_id,
+    restaurant_time_slots,
+)
+from prediction_models.model_registry import model_registry
 
 CORS(app)
 
@@ -31,32 +41,6 @@ class NumpyEncoder(json.JSONEncoder):
 
 app.json_encoder = NumpyEncoder
 
-# Load model if it exists
-try:
-    with open("sales_model.pkl", "rb") as f:
-        model_pipeline = pickle.load(f)
-    print("Model loaded successfully!")
-
-    categorical_features = [
-        "item_name",
-        "item_type",
-        "day_of_week",
-        "time_of_day",
-        "received_by",
-    ]
-    numerical_features = ["item_price"]
-except:
-    print("Model not found, will be created when data is loaded")
-    model_pipeline = None
-    categorical_features = None
-    numerical_features = None
-    
-with app.app_context():
-    engine = db.engine
-    df = pd.read_sql_query("SELECT * FROM payments", engine)
-    print(df.head())
-
-
 # Configuration
 REACT_FOLDER = ''
 BUILD_DIR = os.path.join(os.getcwd(), REACT_FOLDER, 'templates')
@@ -89,47 +73,49 @@ def catch_all(path):
 @jwt_required()
 def load_data():
     restaurant_id = get_jwt_identity()
-    global model_pipeline, categorical_features, numerical_features
 
     try:
         if "file" not in request.files:
             return jsonify({"error": "No file uploaded"}), 400
 
-        file = request.files["file"]
-        df = pd.read_csv(file)
-        df = df.dropna()
-        df["timestamp"] = pd.to_datetime(df["timestamp"], dayfirst=True, errors="coerce")
-        df_clean, df_time_analysis = food_sales_analysis.clean_data(df)
-        analysis_results = food_sales_analysis.analyze_data(df_clean, df_time_analysis)
+        files = request.files.getlist("file")
+        if is_multi_file_upload(files):
+            # Zip or several CSVs: parse and clean them in parallel
+            stats = ingest_files_parallel(files, restaurant_id)
+            db.session.commit()
+            return jsonify(
+                {
+                    "success": True,
+                    "message": "Data loaded and analyzed successfully",
+                    "files": stats["files"],
+                    "rows_read": stats["rows_read"],
+                    "rows_inserted": stats["inserted"],
+                    "rows_skipped": stats["skipped"],
+                    "rows_per_second": stats["rows_per_second"],
+                }
+            )
+
+        file = files[0]
+        if wants_async_upload(request):
+            job = enqueue_upload(file, restaurant_id, clean_load_chunk, "load-data")
+            return jsonify({"success": True, "message": "Upload queued", "job_id": job.id}), 202
 
         # Build prediction model
-        if model_pipeline is None:
-            model_pipeline, categorical_features, numerical_features = (
-                # food_sales_analysis.build_prediction_model(df_time_analysis)
-            )
+        # if model_registry.get() is None:
+        #     food_sales_analysis.build_prediction_model(df_time_analysis)
 
-        for _, row in df_clean.iterrows():
-            payment = Payment(
-                restaurant_id=restaurant_id,
-                order_id=row["order_id"],
-                timestamp=row["timestamp"],
-                item_name=row["item_name"],
-                item_type=row["item_type"],
-                item_price=row["item_price"],
-                quantity=row["quantity"],
-                transaction_amount=row["transaction_amount"],
-                transaction_type=row.get("transaction_type", None),
-                received_by=row["received_by"],
-            )
-            db.session.add(payment)
+        stats = stream_insert_payments(file.stream, restaurant_id, clean_load_chunk)
         db.session.commit()
 
         return jsonify(
             {
                 "success": True,
                 "message": "Data loaded and analyzed successfully",
-                "data_preview": df.head().to_dict(),
-                "data_shape": df.shape,
+                "data_preview": stats["preview"].to_dict(),
+                "data_shape": (stats["rows_read"], stats["columns"]),
+                "rows_inserted": stats["inserted"],
+                "rows_skipped": stats["skipped"],
+                "rows_per_second": stats["rows_per_second"],
             }
         )
     except Exception as e:
@@ -141,8 +127,10 @@ def load_data():
 @app.route("/api/get-analysis", methods=["GET"])
 def get_analysis():
     try:
-        df_clean, df_time_analysis = food_sales_analysis.clean_data(df)
-        analysis_results = food_sales_analysis.analyze_data(df_clean, df_time_analysis)
+        restaurant_id = request_restaurant_id()
+        state = get_analysis_state(restaurant_id)
+        df_time_analysis = state["df_time_analysis"]
+        analysis_results = state["analysis_results"]
 
         # Convert to JSON-compatible format
         day_time_sales_records = []
@@ -193,22 +181,17 @@ def get_analysis():
             "values": [item["sales"] for item in monthly_sales],
         }
 
-        # heatmap data format
+        # heatmap data format, read off the day x time-of-day totals
         heatmap_data = []
+        day_time_sales = analysis_results["day_time_sales"]
+        times = time_slot_names(restaurant_time_slots(restaurant_id))
         for day in df_time_analysis["day_of_week"].unique():
-            for time in ["Morning", "Afternoon", "Evening", "Night"]:
-                filtered = df_time_analysis[
-                    (df_time_analysis["day_of_week"] == day)
-                    & (df_time_analysis["time_of_day"] == time)
-                ]
-                if not filtered.empty:
-                    heatmap_data.append(
-                        {
-                            "day": day,
-                            "time": time,
-                            "value": float(filtered["transaction_amount"].sum()),
-                        }
-                    )
+            for time in times:
+                if day not in day_time_sales.index or time not in day_time_sales.columns:
+                    continue
+                value = day_time_sales.at[day, time]
+                if pd.notnull(value):
+                    heatmap_data.append({"day": day, "time": time, "value": float(value)})
 
         return jsonify(
             {
@@ -227,18 +210,72 @@ def get_analysis():
             }
         )
     except Exception as e:
-        import traceback
+        # The traceback goes to the server log, the client sees the message
+        app.logger.exception("Analysis failed")
+        return jsonify({"success": False, "message": f"Error getting analysis: {str(e)}"}), 500
+
+
+DAYS = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+
+def prediction_scenario(data):
+    return {
+        "item_name": data.get("item_name", "Vadapav"),
+        "item_type": data.get("item_type", "Fastfood"),
+        "day_of_week": data.get("day_of_week", "Monday"),
+        "time_of_day": data.get("time_of_day", "Evening"),
+        "received_by": data.get("received_by", "Mr."),
+        "item_price": float(data.get("item_price", 20)),
+    }
+
+
+def prediction_scenarios(items, time_slots):
+    """
+    Build scenarios from request items. Items that send an "hour" instead of
+    a "time_of_day" are bucketed with the same slots the analysis uses, all
+    in one pass.
+    """
+    scenarios = [prediction_scenario(item) for item in items]
+    hourly = [
+        i for i, item in enumerate(items)
+        if "time_of_day" not in item and item.get("hour") is not None
+    ]
+    if hourly:
+        hours = pd.Series([int(items[i]["hour"]) % 24 for i in hourly])
+        for i, slot in zip(hourly, time_of_day(hours, time_slots)):
+            scenarios[i]["time_of_day"] = slot
+    return scenarios
 
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "message": f"Error getting analysis: {str(e)}",
-                    "traceback": traceback.format_exc(),
-                }
-            ),
-            500,
-        )
+
+def predict_scenarios(scenarios, time_slots):
+    """
+    Score all scenarios with one vectorised predict call. Their time_of_day is
+    named by the restaurant's slots and is translated to the default slots
+    the model was trained on; names neither scheme knows raise ValueError
+    instead of silently predicting as if no slot was given.
+    """
+    translation = slot_translation(time_slots, food_sales_analysis.default_time_slots())
+    records = []
+    for scenario in scenarios:
+        slot = scenario["time_of_day"]
+        if slot not in translation:
+            raise ValueError(f"unknown time_of_day {slot!r}, expected one of {time_slot_names(time_slots)}")
+        records.append(dict(scenario, time_of_day=translation[slot]))
+
+    return food_sales_analysis.predict_sales_batch(
+        model_registry.get(),
+        records,
+        food_sales_analysis.CATEGORICAL_FEATURES,
+        food_sales_analysis.NUMERICAL_FEATURES,
+    )
 
 
 # predictions
@@ -246,51 +283,32 @@ def get_analysis():
 def make_prediction():
     try:
         data = request.json
+        time_slots = restaurant_time_slots(request_restaurant_id())
+        times = time_slot_names(time_slots)
+        (scenario,) = prediction_scenarios([data], time_slots)
+        day_of_week = scenario["day_of_week"]
 
-        item_name = data.get("item_name", "Vadapav")
-        item_type = data.get("item_type", "Fastfood")
-        day_of_week = data.get("day_of_week", "Monday")
-        time_of_day = data.get("time_of_day", "Evening")
-        received_by = data.get("received_by", "Mr.")
-        item_price = float(data.get("item_price", 20))
-
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        predictions = []
-
-        for day in days:
-            predicted_sales, predicted_profit = food_sales_analysis.predict_sales(
-                model_pipeline, item_name, item_type, day, time_of_day, received_by, item_price, categorical_features, numerical_features
-            )
-            predictions.append(
-                {
-                    "day": day,
-                    "sales": round(float(predicted_sales), 2),
-                    "profit": round(float(predicted_profit), 2),
-                }
-            )
+        # 7 days followed by the restaurant's time slots, scored as one batch
+        scenarios = [dict(scenario, day_of_week=day) for day in DAYS]
+        scenarios += [dict(scenario, time_of_day=time) for time in times]
+        sales, profit = predict_scenarios(scenarios, time_slots)
 
-        times = ["Morning", "Afternoon", "Evening", "Night"]
-        time_predictions = []
-
-        for time in times:
-            predicted_sales, predicted_profit = food_sales_analysis.predict_sales(
-                model_pipeline, item_name, item_type, day, time_of_day, received_by, item_price, categorical_features, numerical_features
-            )
-            time_predictions.append(
-                {
-                    "time": time,
-                    "sales": round(float(predicted_sales), 2),
-                    "profit": round(float(predicted_profit), 2),
-                }
-            )
+        predictions = [
+            {
+                "day": day,
+                "sales": round(float(sales[i]), 2),
+                "profit": round(float(profit[i]), 2),
+            }
+            for i, day in enumerate(DAYS)
+        ]
+        time_predictions = [
+            {
+                "time": time,
+                "sales": round(float(sales[len(DAYS) + i]), 2),
+                "profit": round(float(profit[len(DAYS) + i]), 2),
+            }
+            for i, time in enumerate(times)
+        ]
 
         day_prediction_chart = {
             "labels": [p["day"] for p in predictions],
@@ -310,24 +328,55 @@ def make_prediction():
                 "day_predictions": day_prediction_chart,
                 "time_predictions": time_prediction_chart,
                 "single_prediction": {
-                    "sales": predictions[days.index(day_of_week)]["sales"],
-                    "profit": predictions[days.index(day_of_week)]["profit"],
+                    "sales": predictions[DAYS.index(day_of_week)]["sales"],
+                    "profit": predictions[DAYS.index(day_of_week)]["profit"],
                 },
             }
         )
+    except ValueError as e:
+        # Unknown time slot or malformed numbers in the request
+        return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
-        import traceback
+        # The traceback goes to the server log, the client sees the message
+        app.logger.exception("Prediction failed")
+        return jsonify({"success": False, "message": f"Error making prediction: {str(e)}"}), 500
 
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "message": f"Error making prediction: {str(e)}",
-                    "traceback": traceback.format_exc(),
-                }
-            ),
-            500,
-        )
+
+@app.route("/api/predict/batch", methods=["POST"])
+def make_batch_prediction():
+    try:
+        data = request.get_json(silent=True)
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return jsonify({"success": False, "message": "items must be a list of objects"}), 400
+        max_items = app.config["MAX_BATCH_PREDICTIONS"]
+        if len(items) > max_items:
+            return (
+                jsonify({"success": False, "message": f"at most {max_items} items per request"}),
+                400,
+            )
+
+        time_slots = restaurant_time_slots(request_restaurant_id())
+        scenarios = prediction_scenarios(items, time_slots)
+        sales, profit = predict_scenarios(scenarios, time_slots)
+
+        predictions = [
+            dict(
+                scenario,
+                sales=round(float(sales[i]), 2),
+                profit=round(float(profit[i]), 2),
+            )
+            for i, scenario in enumerate(scenarios)
+        ]
+
+        return jsonify({"success": True, "predictions": predictions})
+    except ValueError as e:
+        # Unknown time slot or malformed numbers in the request
+        return jsonify({"success": False, "message": str(e)}), 400
+    except Exception as e:
+        # The traceback goes to the server log, the client sees the message
+        app.logger.exception("Batch prediction failed")
+        return jsonify({"success": False, "message": f"Error making prediction: {str(e)}"}), 500
 
 
 # options for predictions
@@ -335,12 +384,19 @@ def make_prediction():
 def get_options():
     try:
         # df = pd.read_csv("sample_data.csv")
+        restaurant_id = request_restaurant_id()
+
+        def distinct(column):
+            query = db.session.query(column).distinct()
+            if restaurant_id is not None:
+                query = query.filter(Payment.restaurant_id == restaurant_id)
+            return [value for (value,) in query]
 
         return jsonify(
             {
                 "success": True,
-                "items": df["item_name"].unique().tolist(),
-                "item_types": df["item_type"].unique().tolist(),
+                "items": distinct(Payment.item_name),
+                "item_types": distinct(Payment.item_type),
                 "days": [
                     "Monday",
                     "Tuesday",
@@ -350,8 +406,8 @@ def get_options():
                     "Saturday",
                     "Sunday",
                 ],
-                "times": ["Morning", "Afternoon", "Evening", "Night"],
-                "customer_types": df["received_by"].unique().tolist(),
+                "times": time_slot_names(restaurant_time_slots(restaurant_id)),
+                "customer_types": distinct(Payment.received_by),
             }
         )
     except Exception as e:
@@ -15,10 +15,18 @@ class Bill(db.Model):
     tax_amount = db.Column(db.Float, nullable=False)
     total_amount = db.Column(db.Float, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Client-supplied Idempotency-Key, a retried request returns the saved bill
+    idempotency_key = db.Column(db.String(64))
     
     # Relationships
     items = db.relationship('BillItem', backref='bill', lazy=True, cascade="all, delete-orphan")
     restaurant = db.relationship('Restaurant', backref='bills', lazy=True)
     
+    # Bill history is listed per restaurant, newest first
+    __table_args__ = (
+        db.Index('idx_bill_restaurant_timestamp', 'restaurant_id', 'timestamp'),
+        db.UniqueConstraint('restaurant_id', 'idempotency_key', name='uq_bill_idempotency_key'),
+    )
+    
     def __repr__(self):
         return f'<Bill {self.bill_number}>'
\ No newline at end of file
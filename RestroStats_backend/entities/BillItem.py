@@ -12,5 +12,9 @@ class BillItem(db.Model):
     unit_price = db.Column(db.Float, nullable=False)
     total_price = db.Column(db.Float, nullable=False)
     
+    __table_args__ = (
+        db.Index('idx_bill_item_bill_id', 'bill_id'),
+    )
+    
     def __repr__(self):
         return f'<BillItem {self.description}>'
\ No newline at end of file
@@ -0,0 +1,30 @@
+from app import db
+from datetime import datetime
+
+
+class ModelWatermark(db.Model):
+    __tablename__ = 'model_watermarks'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    # Model name in the model store
+    model_name = db.Column(db.String(255), nullable=False, unique=True)
+    # Highest payments.id the model has been trained on (informational)
+    last_payment_id = db.Column(db.Integer, nullable=False, default=0)
+    # Payments created up to this time have been trained on, None before the
+    # first run. Ids are not a safe watermark: a transaction can commit a
+    # lower id after a higher one was already read
+    last_created_at = db.Column(db.DateTime, nullable=True)
+    rows_trained = db.Column(db.Integer, nullable=False, default=0)
+    trained_at = db.Column(db.DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<ModelWatermark {self.model_name} @ {self.last_payment_id}>"
+    
+    def to_dict(self):
+        return {
+            "model_name": self.model_name,
+            "last_payment_id": self.last_payment_id,
+            "last_created_at": self.last_created_at.isoformat() if self.last_created_at else None,
+            "rows_trained": self.rows_trained,
+            "trained_at": self.trained_at.isoformat() if self.trained_at else None,
+        }
@@ -18,6 +18,13 @@ class Payment(db.Model):
     received_by = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Derived from timestamp once at ingest (repository/Features.py), Monday=0
+    day_of_week = db.Column(db.SmallInteger, nullable=False)
+    hour_of_day = db.Column(db.SmallInteger, nullable=False)
+    month = db.Column(db.SmallInteger, nullable=False)
+    day_of_month = db.Column(db.SmallInteger, nullable=False)
+    is_weekend = db.Column(db.Boolean, nullable=False)
+    
     # Relationship with restaurant
     restaurant = relationship("Restaurant", back_populates="payments")
     
@@ -26,6 +33,11 @@ class Payment(db.Model):
         db.Index('idx_payment_restaurant_id', 'restaurant_id'),
         db.Index('idx_payment_timestamp', 'timestamp'),
         db.Index('idx_payment_restaurant_timestamp', 'restaurant_id', 'timestamp'),
+        db.Index('idx_payment_restaurant_day_hour', 'restaurant_id', 'day_of_week', 'hour_of_day'),
+        # Incremental retraining reads payments in (created_at, id) order
+        db.Index('idx_payment_created_at', 'created_at', 'id'),
+        # Natural key of a POS line, lets re-uploaded exports skip existing rows
+        db.UniqueConstraint('restaurant_id', 'order_id', 'item_name', 'timestamp', name='uq_payment_natural_key'),
     )
     
     def __repr__(self):
@@ -0,0 +1,28 @@
+from app import db
+
+
+class PaymentRollup(db.Model):
+    """Pre-aggregated payments per restaurant, day, hour, item and customer type."""
+
+    __tablename__ = 'payment_rollups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id', ondelete='CASCADE'), nullable=False)
+    sale_date = db.Column(db.Date, nullable=False)
+    hour = db.Column(db.Integer, nullable=False)
+    item_name = db.Column(db.String(100), nullable=False)
+    item_type = db.Column(db.String(255), nullable=False)
+    received_by = db.Column(db.String(255), nullable=False)
+    total_amount = db.Column(db.Float, nullable=False, default=0)
+    total_quantity = db.Column(db.Integer, nullable=False, default=0)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            'restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type', 'received_by',
+            name='uq_payment_rollup_bucket',
+        ),
+    )
+
+    def __repr__(self):
+        return f"<PaymentRollup {self.restaurant_id} {self.sale_date} {self.hour}h {self.item_name}>"
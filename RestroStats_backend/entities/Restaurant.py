@@ -18,6 +18,12 @@ class Restaurant(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Bumped whenever this restaurant's payments change, used to invalidate cached analysis
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
+    # Custom time-of-day slots, [{"name": ..., "start": hour}, ...]; None uses TIME_OF_DAY_SLOTS
+    time_slots = db.Column(db.JSON, nullable=True)
+    
     # Relationship with payment records
     payments = relationship("Payment", back_populates="restaurant", cascade="all, delete-orphan")
     
@@ -0,0 +1,49 @@
+from app import db
+from datetime import datetime
+
+
+class UploadJob(db.Model):
+    __tablename__ = 'upload_jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String(50), nullable=False)
+    filename = db.Column(db.String(255), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, failed
+    rows_read = db.Column(db.Integer, nullable=False, default=0)
+    rows_processed = db.Column(db.Integer, nullable=False, default=0)
+    rows_inserted = db.Column(db.Integer, nullable=True)
+    rows_skipped = db.Column(db.Integer, nullable=True)
+    rows_per_second = db.Column(db.Float, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    # Touched while queued, when started and after every chunk; queued or running
+    # jobs that stop beating were lost with their process
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    
+    __table_args__ = (
+        db.Index('idx_upload_job_restaurant_id', 'restaurant_id'),
+    )
+    
+    def __repr__(self):
+        return f"<UploadJob {self.id} {self.status}>"
+    
+    def to_dict(self):
+        """Convert job to dictionary representation for the status endpoint"""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "filename": self.filename,
+            "status": self.status,
+            "rows_read": self.rows_read,
+            "rows_processed": self.rows_processed,
+            "rows_inserted": self.rows_inserted,
+            "rows_skipped": self.rows_skipped,
+            "rows_per_second": self.rows_per_second,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
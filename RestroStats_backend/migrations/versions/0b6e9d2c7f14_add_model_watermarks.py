@@ -0,0 +1,32 @@
+"""Add model watermarks
+
+Revision ID: 0b6e9d2c7f14
+Revises: f7c2b8e4a613
+Create Date: 2026-10-18 18:12:09.461570
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b6e9d2c7f14'
+down_revision = 'f7c2b8e4a613'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('model_watermarks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('model_path', sa.String(length=255), nullable=False),
+    sa.Column('last_payment_id', sa.Integer(), nullable=False),
+    sa.Column('rows_trained', sa.Integer(), nullable=False),
+    sa.Column('trained_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('model_path')
+    )
+
+
+def downgrade():
+    op.drop_table('model_watermarks')
@@ -0,0 +1,30 @@
+"""Rename model watermark path to model name
+
+Revision ID: 2d8f4a6b1e93
+Revises: 0b6e9d2c7f14
+Create Date: 2026-10-18 19:40:16.207731
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d8f4a6b1e93'
+down_revision = '0b6e9d2c7f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Watermarks were keyed by pickle path, models now live in the model store.
+    # Old rows cannot be matched to a stored model and would only restart the
+    # catch-up, so they are dropped
+    op.execute('DELETE FROM model_watermarks')
+    with op.batch_alter_table('model_watermarks', schema=None) as batch_op:
+        batch_op.alter_column('model_path', new_column_name='model_name', existing_type=sa.String(length=255), existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('model_watermarks', schema=None) as batch_op:
+        batch_op.alter_column('model_name', new_column_name='model_path', existing_type=sa.String(length=255), existing_nullable=False)
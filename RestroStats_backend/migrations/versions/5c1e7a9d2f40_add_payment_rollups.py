@@ -0,0 +1,37 @@
+"""Add payment rollups
+
+Revision ID: 5c1e7a9d2f40
+Revises: 3ab6edc7cf76
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e7a9d2f40'
+down_revision = '3ab6edc7cf76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('payment_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('sale_date', sa.Date(), nullable=False),
+    sa.Column('hour', sa.Integer(), nullable=False),
+    sa.Column('item_name', sa.String(length=100), nullable=False),
+    sa.Column('item_type', sa.String(length=255), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('total_quantity', sa.Integer(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type', name='uq_payment_rollup_bucket')
+    )
+
+
+def downgrade():
+    op.drop_table('payment_rollups')
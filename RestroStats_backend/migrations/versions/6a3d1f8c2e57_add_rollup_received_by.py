@@ -0,0 +1,75 @@
+"""Add received_by to payment rollups
+
+Revision ID: 6a3d1f8c2e57
+Revises: 2d8f4a6b1e93
+Create Date: 2026-10-18 21:05:42.318904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a3d1f8c2e57'
+down_revision = '2d8f4a6b1e93'
+branch_labels = None
+depends_on = None
+
+payments = sa.table(
+    'payments',
+    sa.column('restaurant_id', sa.Integer),
+    sa.column('timestamp', sa.DateTime),
+    sa.column('hour_of_day', sa.SmallInteger),
+    sa.column('item_name', sa.String),
+    sa.column('item_type', sa.String),
+    sa.column('received_by', sa.String),
+    sa.column('transaction_amount', sa.Float),
+    sa.column('quantity', sa.Integer),
+)
+payment_rollups = sa.table(
+    'payment_rollups',
+    sa.column('restaurant_id', sa.Integer),
+    sa.column('sale_date', sa.Date),
+    sa.column('hour', sa.Integer),
+    sa.column('item_name', sa.String),
+    sa.column('item_type', sa.String),
+    sa.column('received_by', sa.String),
+    sa.column('total_amount', sa.Float),
+    sa.column('total_quantity', sa.Integer),
+    sa.column('row_count', sa.Integer),
+)
+
+
+def _rebuild(key):
+    # Rollups are derived from payments, rebuild them at the new grain
+    day = sa.func.date(payments.c.timestamp)
+    columns = [payments.c.restaurant_id, day, payments.c.hour_of_day, payments.c.item_name, payments.c.item_type]
+    if 'received_by' in key:
+        columns.append(payments.c.received_by)
+    source = sa.select(
+        *columns,
+        sa.func.sum(payments.c.transaction_amount),
+        sa.func.sum(payments.c.quantity),
+        sa.func.count(),
+    ).group_by(*columns)
+    op.execute(
+        payment_rollups.insert().from_select(key + ['total_amount', 'total_quantity', 'row_count'], source)
+    )
+
+
+def upgrade():
+    op.execute(payment_rollups.delete())
+    with op.batch_alter_table('payment_rollups', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_payment_rollup_bucket', type_='unique')
+        batch_op.add_column(sa.Column('received_by', sa.String(length=255), nullable=False))
+        batch_op.create_unique_constraint('uq_payment_rollup_bucket', ['restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type', 'received_by'])
+    _rebuild(['restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type', 'received_by'])
+
+
+def downgrade():
+    op.execute(payment_rollups.delete())
+    with op.batch_alter_table('payment_rollups', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_payment_rollup_bucket', type_='unique')
+        batch_op.drop_column('received_by')
+        batch_op.create_unique_constraint('uq_payment_rollup_bucket', ['restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type'])
+    _rebuild(['restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type'])
@@ -0,0 +1,28 @@
+"""Add bill idempotency key
+
+Revision ID: 7b4e2a9c5d31
+Revises: 6a3d1f8c2e57
+Create Date: 2026-10-18 23:12:47.906215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b4e2a9c5d31'
+down_revision = '6a3d1f8c2e57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('bills', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint('uq_bill_idempotency_key', ['restaurant_id', 'idempotency_key'])
+
+
+def downgrade():
+    with op.batch_alter_table('bills', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_bill_idempotency_key', type_='unique')
+        batch_op.drop_column('idempotency_key')
@@ -0,0 +1,26 @@
+"""Add upload job heartbeat
+
+Revision ID: 8c5f3b0d6e42
+Revises: 7b4e2a9c5d31
+Create Date: 2026-10-18 23:41:09.518372
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c5f3b0d6e42'
+down_revision = '7b4e2a9c5d31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('upload_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('upload_jobs', schema=None) as batch_op:
+        batch_op.drop_column('heartbeat_at')
@@ -0,0 +1,26 @@
+"""Add restaurant data version
+
+Revision ID: 8e2b4d61c7a3
+Revises: 5c1e7a9d2f40
+Create Date: 2026-10-18 11:03:54.917260
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2b4d61c7a3'
+down_revision = '5c1e7a9d2f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
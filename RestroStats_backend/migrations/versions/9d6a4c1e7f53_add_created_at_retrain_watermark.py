@@ -0,0 +1,42 @@
+"""Add created_at retrain watermark
+
+Revision ID: 9d6a4c1e7f53
+Revises: 8c5f3b0d6e42
+Create Date: 2026-10-19 00:24:51.730164
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d6a4c1e7f53'
+down_revision = '8c5f3b0d6e42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Retraining reads payments by created_at, rows from before it was always
+    # set fall back to their sale time
+    op.execute("UPDATE payments SET created_at = timestamp WHERE created_at IS NULL")
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index('idx_payment_created_at', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('model_watermarks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_created_at', sa.DateTime(), nullable=True))
+    # Carry existing id watermarks over, so models are not retrained on rows
+    # they have already seen
+    op.execute(
+        "UPDATE model_watermarks SET last_created_at = "
+        "(SELECT MAX(payments.created_at) FROM payments WHERE payments.id <= model_watermarks.last_payment_id) "
+        "WHERE trained_at IS NOT NULL"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('model_watermarks', schema=None) as batch_op:
+        batch_op.drop_column('last_created_at')
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('idx_payment_created_at')
@@ -0,0 +1,32 @@
+"""Add bill indexes
+
+Revision ID: a47f3c90e1d5
+Revises: 8e2b4d61c7a3
+Create Date: 2026-10-18 12:26:08.331574
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a47f3c90e1d5'
+down_revision = '8e2b4d61c7a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('bills', schema=None) as batch_op:
+        batch_op.create_index('idx_bill_restaurant_timestamp', ['restaurant_id', 'timestamp'], unique=False)
+
+    with op.batch_alter_table('bill_items', schema=None) as batch_op:
+        batch_op.create_index('idx_bill_item_bill_id', ['bill_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('bill_items', schema=None) as batch_op:
+        batch_op.drop_index('idx_bill_item_bill_id')
+
+    with op.batch_alter_table('bills', schema=None) as batch_op:
+        batch_op.drop_index('idx_bill_restaurant_timestamp')
@@ -0,0 +1,123 @@
+"""Add payment natural key
+
+Revision ID: c3d9f5a18b62
+Revises: a47f3c90e1d5
+Create Date: 2026-10-18 13:41:17.058893
+
+"""
+import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d9f5a18b62'
+down_revision = 'a47f3c90e1d5'
+branch_labels = None
+depends_on = None
+
+
+payments = sa.table(
+    'payments',
+    sa.column('id', sa.Integer),
+    sa.column('restaurant_id', sa.Integer),
+    sa.column('order_id', sa.String),
+    sa.column('timestamp', sa.DateTime),
+    sa.column('item_name', sa.String),
+    sa.column('item_type', sa.String),
+    sa.column('transaction_amount', sa.Float),
+    sa.column('quantity', sa.Integer),
+)
+# payment_rollups as of this revision, keyed without received_by
+payment_rollups = sa.table(
+    'payment_rollups',
+    sa.column('restaurant_id', sa.Integer),
+    sa.column('sale_date', sa.Date),
+    sa.column('hour', sa.Integer),
+    sa.column('item_name', sa.String),
+    sa.column('item_type', sa.String),
+    sa.column('total_amount', sa.Float),
+    sa.column('total_quantity', sa.Integer),
+    sa.column('row_count', sa.Integer),
+)
+NATURAL_KEY = [payments.c.restaurant_id, payments.c.order_id, payments.c.item_name, payments.c.timestamp]
+
+
+def _duplicated_days(bind):
+    """(restaurant_id, day) of every payment that has a duplicate."""
+    duplicated = (
+        sa.select(*NATURAL_KEY).group_by(*NATURAL_KEY).having(sa.func.count() > 1).subquery()
+    )
+    rows = bind.execute(
+        sa.select(duplicated.c.restaurant_id, sa.func.date(duplicated.c.timestamp)).distinct()
+    ).all()
+    # SQLite returns date() as text
+    return [
+        (restaurant_id, datetime.date.fromisoformat(day) if isinstance(day, str) else day)
+        for restaurant_id, day in rows
+    ]
+
+
+def _rebuild_rollup_day(restaurant_id, day):
+    # Same INSERT ... SELECT as Rollups._replace_rollups, at this revision's grain
+    start = datetime.datetime.combine(day, datetime.time())
+    end = start + datetime.timedelta(days=1)
+    op.execute(
+        payment_rollups.delete().where(
+            payment_rollups.c.restaurant_id == restaurant_id, payment_rollups.c.sale_date == day
+        )
+    )
+    columns = [
+        payments.c.restaurant_id,
+        sa.func.date(payments.c.timestamp),
+        sa.extract('hour', payments.c.timestamp),
+        payments.c.item_name,
+        payments.c.item_type,
+    ]
+    source = (
+        sa.select(
+            *columns,
+            sa.func.sum(payments.c.transaction_amount),
+            sa.func.sum(payments.c.quantity),
+            sa.func.count(),
+        )
+        .where(
+            payments.c.restaurant_id == restaurant_id,
+            payments.c.timestamp >= start,
+            payments.c.timestamp < end,
+        )
+        .group_by(*columns)
+    )
+    op.execute(
+        payment_rollups.insert().from_select(
+            ['restaurant_id', 'sale_date', 'hour', 'item_name', 'item_type', 'total_amount', 'total_quantity', 'row_count'],
+            source,
+        )
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    # Rollups counted the duplicates too, their days are re-aggregated below
+    days = _duplicated_days(bind)
+
+    # Keep the first copy of every duplicated POS line so the constraint can
+    # be created
+    op.execute(
+        "DELETE FROM payments WHERE id NOT IN ("
+        "SELECT keep_id FROM ("
+        "SELECT MIN(id) AS keep_id FROM payments "
+        "GROUP BY restaurant_id, order_id, item_name, timestamp"
+        ") AS keepers)"
+    )
+    for restaurant_id, day in days:
+        _rebuild_rollup_day(restaurant_id, day)
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_payment_natural_key', ['restaurant_id', 'order_id', 'item_name', 'timestamp'])
+
+
+def downgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_payment_natural_key', type_='unique')
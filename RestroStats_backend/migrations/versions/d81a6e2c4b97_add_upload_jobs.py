@@ -0,0 +1,43 @@
+"""Add upload jobs
+
+Revision ID: d81a6e2c4b97
+Revises: c3d9f5a18b62
+Create Date: 2026-10-18 14:52:40.226715
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81a6e2c4b97'
+down_revision = 'c3d9f5a18b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('upload_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('rows_read', sa.Integer(), nullable=False),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('rows_inserted', sa.Integer(), nullable=True),
+    sa.Column('rows_skipped', sa.Integer(), nullable=True),
+    sa.Column('rows_per_second', sa.Float(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('upload_jobs', schema=None) as batch_op:
+        batch_op.create_index('idx_upload_job_restaurant_id', ['restaurant_id'], unique=False)
+
+
+def downgrade():
+    op.drop_table('upload_jobs')
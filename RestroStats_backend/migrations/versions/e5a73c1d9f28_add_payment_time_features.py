@@ -0,0 +1,68 @@
+"""Add payment time features
+
+Revision ID: e5a73c1d9f28
+Revises: d81a6e2c4b97
+Create Date: 2026-10-18 16:21:07.583104
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a73c1d9f28'
+down_revision = 'd81a6e2c4b97'
+branch_labels = None
+depends_on = None
+
+FEATURES = ['day_of_week', 'hour_of_day', 'month', 'day_of_month', 'is_weekend']
+
+# Backfill expressions per dialect, day_of_week is Monday=0 like pandas
+BACKFILL = {
+    'mysql': {
+        'day_of_week': 'WEEKDAY({ts})',
+        'hour_of_day': 'HOUR({ts})',
+        'month': 'MONTH({ts})',
+        'day_of_month': 'DAYOFMONTH({ts})',
+    },
+    'postgresql': {
+        'day_of_week': 'CAST(EXTRACT(ISODOW FROM {ts}) AS INTEGER) - 1',
+        'hour_of_day': 'CAST(EXTRACT(HOUR FROM {ts}) AS INTEGER)',
+        'month': 'CAST(EXTRACT(MONTH FROM {ts}) AS INTEGER)',
+        'day_of_month': 'CAST(EXTRACT(DAY FROM {ts}) AS INTEGER)',
+    },
+    'sqlite': {
+        'day_of_week': "(CAST(strftime('%w', {ts}) AS INTEGER) + 6) % 7",
+        'hour_of_day': "CAST(strftime('%H', {ts}) AS INTEGER)",
+        'month': "CAST(strftime('%m', {ts}) AS INTEGER)",
+        'day_of_month': "CAST(strftime('%d', {ts}) AS INTEGER)",
+    },
+}
+
+
+def upgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        for name in FEATURES[:-1]:
+            batch_op.add_column(sa.Column(name, sa.SmallInteger(), nullable=True))
+        batch_op.add_column(sa.Column('is_weekend', sa.Boolean(), nullable=True))
+
+    dialect = op.get_bind().dialect
+    ts = dialect.identifier_preparer.quote('timestamp')
+    assignments = ', '.join(
+        f'{name} = ' + expr.format(ts=ts) for name, expr in BACKFILL[dialect.name].items()
+    )
+    op.execute(f'UPDATE payments SET {assignments}')
+    op.execute('UPDATE payments SET is_weekend = (day_of_week >= 5)')
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        for name in FEATURES[:-1]:
+            batch_op.alter_column(name, existing_type=sa.SmallInteger(), nullable=False)
+        batch_op.alter_column('is_weekend', existing_type=sa.Boolean(), nullable=False)
+        batch_op.create_index('idx_payment_restaurant_day_hour', ['restaurant_id', 'day_of_week', 'hour_of_day'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('idx_payment_restaurant_day_hour')
+        for name in reversed(FEATURES):
+            batch_op.drop_column(name)
@@ -0,0 +1,26 @@
+"""Add restaurant time slots
+
+Revision ID: f7c2b8e4a613
+Revises: e5a73c1d9f28
+Create Date: 2026-10-18 17:05:42.319846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7c2b8e4a613'
+down_revision = 'e5a73c1d9f28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('time_slots', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.drop_column('time_slots')
@@ -1,7 +1,7 @@
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
-from repository.Features import df
-from repository import Features
+# Time features are stored on payments at ingest, no need to derive them here
+from repository.Restaurants_Data import df
 import pickle
 
 X = df[['hour_of_day', 'day_of_week', 'item_price']]  # Features
@@ -1,33 +1,109 @@
-import mysql.connector
-import pickle
-from repository.Load_New_Data import new_data
-
-def retrain_model():
-    if not new_data.empty:
-        categorical_features = [
-            "item_name",
-            "item_type",
-            "day_of_week",
-            "time_of_day",
-            "received_by",
-        ]
-        numerical_features = ["item_price"]
-        X_new = new_data[categorical_features + numerical_features]
-        y_new = new_data['transaction_amount']
-
-        # Load existing model
-        with open("sales_model.pkl", "rb") as f:
-            model = pickle.load(f)
-
-        model.fit(X_new, y_new)  # Incremental Training
-
-        # Save updated model
-        with open("sales_model.pkl", "wb") as f:
-            pickle.dump(model, f)
-
-        # Update last trained timestamp
-        conn = mysql.connector.connect(host="localhost", user="root", password="root", database="restaurant_db")
-        cursor = conn.cursor()
-        cursor.execute(f"INSERT INTO model_metadata (last_trained) VALUES (NOW())")
-        conn.commit()
-        conn.close()
+import time
+from datetime import datetime, timedelta
+
+import click
+
+from app import app, db
+from entities.ModelWatermark import ModelWatermark
+from prediction_models import food_sales_analysis
+from prediction_models.food_sales_analysis import CATEGORICAL_FEATURES, NUMERICAL_FEATURES
+from prediction_models.model_registry import model_registry
+from prediction_models.model_store import model_store
+from repository.Load_New_Data import iter_new_payments, load_training_history, training_frame
+
+
+def get_watermark(name):
+    """Watermark row of a stored model, created (unsaved) on first use."""
+    watermark = ModelWatermark.query.filter_by(model_name=name).first()
+    if watermark is None:
+        watermark = ModelWatermark(model_name=name, last_payment_id=0, rows_trained=0)
+        db.session.add(watermark)
+    return watermark
+
+
+def retrain_model(name=None, batch_size=None):
+    """
+    Update the incremental sales model with the payments created since its
+    watermark, one RETRAIN_BATCH_SIZE batch at a time, then save the model and
+    advance the watermark. Only payments older than RETRAIN_SETTLE_SECONDS
+    are read: by then every transaction that could still add rows to the
+    window has committed, so each payment is trained on exactly once. The
+    first run (or a run after the artifact went missing) starts a fresh model
+    and catches up on the full history.
+    """
+    # sklearn is only needed when training, keep it out of the web import path
+    from prediction_models.incremental_model import IncrementalSalesModel
+
+    name = name or app.config["RETRAIN_MODEL_NAME"]
+    watermark = get_watermark(name)
+    # A private, writable copy: the registry's memory-mapped one is serving
+    model, _ = model_store.load(name, mmap=False)
+
+    if model is None or watermark.trained_at is None or not hasattr(model, "partial_fit"):
+        model = IncrementalSalesModel(CATEGORICAL_FEATURES, NUMERICAL_FEATURES)
+        watermark.last_payment_id = 0
+        watermark.last_created_at = None
+        watermark.rows_trained = 0
+
+    start = time.perf_counter()
+    cutoff = datetime.utcnow() - timedelta(seconds=app.config["RETRAIN_SETTLE_SECONDS"])
+    last_payment_id = watermark.last_payment_id
+    rows = 0
+    for batch in iter_new_payments(watermark.last_created_at, cutoff, batch_size):
+        frame = training_frame(batch)
+        model.partial_fit(
+            frame[CATEGORICAL_FEATURES + NUMERICAL_FEATURES], frame["transaction_amount"]
+        )
+        last_payment_id = max(last_payment_id, int(batch["id"].max()))
+        rows += len(batch)
+
+    stats = {"rows": rows, "last_payment_id": last_payment_id, "version": None}
+    if rows == 0:
+        db.session.rollback()
+        return stats
+
+    watermark.last_payment_id = last_payment_id
+    watermark.last_created_at = cutoff
+    watermark.rows_trained += rows
+    watermark.trained_at = datetime.utcnow()
+    stats["version"] = model_registry.save(
+        model,
+        name,
+        {
+            "features": {"categorical": CATEGORICAL_FEATURES, "numerical": NUMERICAL_FEATURES},
+            "watermark": watermark.to_dict(),
+        },
+    )
+    db.session.commit()
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    print(f"Retrained {name} on {rows} new payments (created up to {cutoff:%Y-%m-%d %H:%M:%S})")
+    return stats
+
+
+def train_full_model():
+    """Full-history training of the served model (MODEL_NAME), see trainer.py."""
+    df_time_analysis = load_training_history()
+    model, _, _ = food_sales_analysis.build_prediction_model(df_time_analysis)
+    return model
+
+
+@app.cli.command("retrain-model")
+@click.option("--name", default=None, help="Stored model to update, defaults to RETRAIN_MODEL_NAME.")
+def retrain_model_command(name):
+    """Train the incremental model on payments added since the last run."""
+    stats = retrain_model(name)
+    click.echo(f"Trained on {stats['rows']} new payments (up to id {stats['last_payment_id']})")
+
+
+@app.cli.command("train-model")
+def train_model_command():
+    """Train the served model on the full history with a parallel grid search."""
+    model = train_full_model()
+    report = getattr(model, "training_report_", None)
+    if report is None:
+        click.echo("No model trained")
+    else:
+        click.echo(f"Best {report['best_params']} on {report['rows']} rows")
+        if not report["promoted"]:
+            click.echo(f"Version {report['version']} kept, CV RMSE worse than the served version")
@@ -0,0 +1,159 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from sqlalchemy import func, select, update
+
+from app import app, db
+from entities.Restaurant import Restaurant
+from prediction_models import food_sales_analysis
+from repository.Features import validate_time_slots
+from repository.Job_Store import job_store
+from repository.Rollups import rollup_frame
+
+# restaurant_id (None = all restaurants) -> {"version", "state", "bytes"},
+# least recently used first
+_cache = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+# Striped locks held while a restaurant's state is built, a fixed pool so
+# they do not grow with the number of restaurants ever requested
+BUILD_LOCK_STRIPES = 64
+_build_locks = [threading.Lock() for _ in range(BUILD_LOCK_STRIPES)]
+
+
+def request_restaurant_id():
+    """Restaurant of the caller's JWT, or None for anonymous requests."""
+    verify_jwt_in_request(optional=True)
+    identity = get_jwt_identity()
+    return int(identity) if identity else None
+
+
+def data_version(restaurant_id=None):
+    """Current payments version of a restaurant (or of all restaurants)."""
+    if restaurant_id is None:
+        query = select(func.coalesce(func.sum(Restaurant.data_version), 0))
+    else:
+        query = select(Restaurant.data_version).where(Restaurant.id == restaurant_id)
+    return db.session.execute(query).scalar() or 0
+
+
+def restaurant_time_slots(restaurant_id=None):
+    """Time-of-day slots of a restaurant, or the configured default."""
+    if restaurant_id is not None:
+        slots = db.session.execute(
+            select(Restaurant.time_slots).where(Restaurant.id == restaurant_id)
+        ).scalar()
+        if slots:
+            return validate_time_slots(slots)
+    return food_sales_analysis.default_time_slots()
+
+
+def mark_payments_changed(restaurant_id):
+    """
+    Bump the restaurant's data version. Call inside the transaction that
+    changes its payments (or anything else the analysis depends on, like its
+    time slots) so every worker's cache sees the change on commit.
+    """
+    db.session.execute(
+        update(Restaurant)
+        .where(Restaurant.id == int(restaurant_id))
+        .values(
+            data_version=Restaurant.data_version + 1,
+            updated_at=Restaurant.updated_at,
+        )
+    )
+
+
+def _build_state(restaurant_id):
+    time_slots = restaurant_time_slots(restaurant_id)
+    if app.config["USE_PAYMENT_ROLLUPS"]:
+        df_clean = df_time_analysis = rollup_frame(restaurant_id, time_slots)
+    else:
+        df = food_sales_analysis.load_payments(restaurant_id)
+        df_clean, df_time_analysis = food_sales_analysis.clean_data(df, time_slots)
+    return food_sales_analysis.build_analysis_state(df_clean, df_time_analysis)
+
+
+def _state_bytes(state):
+    frames = [state["df_clean"], state["df_time_analysis"]]
+    frames += [v for v in state["analysis_results"].values() if isinstance(v, (pd.DataFrame, pd.Series))]
+    seen = set()
+    total = 0
+    for frame in frames:
+        if id(frame) in seen:
+            continue
+        seen.add(id(frame))
+        usage = frame.memory_usage(deep=True)
+        total += int(usage.sum() if isinstance(frame, pd.DataFrame) else usage)
+    return total
+
+
+def _drop(key):
+    global _cache_bytes
+    entry = _cache.pop(key, None)
+    if entry:
+        _cache_bytes -= entry["bytes"]
+
+
+def _cached_state(restaurant_id, version):
+    with _cache_lock:
+        entry = _cache.get(restaurant_id)
+        if entry and entry["version"] == version:
+            _cache.move_to_end(restaurant_id)
+            return entry["state"]
+    return None
+
+
+def get_analysis_state(restaurant_id=None):
+    """
+    Cleaned frames, analyze_data results and insights for one restaurant.
+    Nothing is loaded until the first request asks for it. The state is then
+    cached and rebuilt only when the restaurant's data version has moved.
+    Concurrent requests for the same restaurant wait for one build instead
+    of each loading its payments.
+    """
+    global _cache_bytes
+    version = data_version(restaurant_id)
+    state = _cached_state(restaurant_id, version)
+    if state is not None:
+        return state
+
+    # Striped by restaurant, so one slow tenant does not block the others
+    with _build_locks[hash(restaurant_id) % BUILD_LOCK_STRIPES]:
+        state = _cached_state(restaurant_id, version)
+        if state is not None:
+            return state
+
+        state = _build_state(restaurant_id)
+        size = _state_bytes(state)
+        budget = app.config["ANALYSIS_CACHE_MAX_BYTES"]
+
+        with _cache_lock:
+            _drop(restaurant_id)
+            if size <= budget:
+                _cache[restaurant_id] = {"version": version, "state": state, "bytes": size}
+                _cache_bytes += size
+                while _cache_bytes > budget:
+                    _drop(next(iter(_cache)))
+
+    return state
+
+
+def get_insights(restaurant_id=None):
+    """
+    (insights, top_item) for a restaurant, from the scheduler's precomputed
+    copy when it matches the current data version, otherwise computed here.
+    """
+    stored = job_store.load_insights(restaurant_id, data_version(restaurant_id))
+    if stored is not None:
+        return stored["insights"], stored["top_item"]
+    state = get_analysis_state(restaurant_id)
+    return state["insights"], state["top_item"]
+
+
+def clear_analysis_cache():
+    with _cache_lock:
+        for key in list(_cache):
+            _drop(key)
@@ -0,0 +1,111 @@
+import numpy as np
+
+# Only numpy here: the compiled path must not pull pandas or sklearn into a
+# prediction call. Pipelines are recognised by their fitted attributes.
+
+
+class CompiledPipeline:
+    """
+    Array-only replacement for a fitted one-hot + regressor pipeline's
+    predict. The encoder's vocabularies are turned into {value: column}
+    maps once, request dicts are written straight into a feature row, and
+    the model is evaluated on that array: forests tree by tree through
+    tree_.predict on float32 rows (the dtype their splits are stored in),
+    linear models as a float64 dot product. Values the encoder never
+    saw leave their block at zero, like handle_unknown="ignore". Predictions
+    match the sklearn pipeline up to float rounding.
+    """
+
+    def __init__(self, columns, n_columns, estimator):
+        # columns: [(feature, {value: column} for one-hot, int column for numeric)]
+        self.columns = columns
+        self.n_columns = n_columns
+        self.estimator = estimator
+        self._trees = None
+        self._coef = None
+
+        trees = getattr(estimator, "estimators_", None)
+        if trees is not None and getattr(estimator, "n_outputs_", 1) == 1 and all(
+            hasattr(tree, "tree_") for tree in trees
+        ):
+            self._trees = [tree.tree_ for tree in trees]
+        elif getattr(estimator, "coef_", None) is not None and np.ndim(estimator.coef_) == 1:
+            self._coef = np.asarray(estimator.coef_, dtype=np.float64)
+            self._intercept = float(np.ravel(estimator.intercept_)[0])
+
+    def encode(self, records):
+        """Feature rows for a list of scenario dicts, as sklearn would see them."""
+        # Trees compare float32 thresholds, anything else sees float64 like in sklearn
+        dtype = np.float32 if self._trees is not None else np.float64
+        X = np.zeros((len(records), self.n_columns), dtype=dtype)
+        for i, record in enumerate(records):
+            for feature, target in self.columns:
+                if isinstance(target, dict):
+                    column = target.get(record.get(feature))
+                    if column is not None:
+                        X[i, column] = 1.0
+                else:
+                    X[i, target] = record[feature]
+        return X
+
+    def predict(self, X):
+        if self._trees is not None:
+            # Same accumulation order as RandomForestRegressor.predict
+            total = np.zeros(len(X), dtype=np.float64)
+            for tree in self._trees:
+                total += np.ravel(tree.predict(X))
+            return total / len(self._trees)
+        if self._coef is not None:
+            return np.asarray(X, dtype=np.float64) @ self._coef + self._intercept
+        return self.estimator.predict(X)
+
+    def predict_records(self, records):
+        return self.predict(self.encode(records))
+
+
+def _is_passthrough(transformer):
+    # Fitted ColumnTransformers may hold passthrough as an identity FunctionTransformer
+    if isinstance(transformer, str):
+        return transformer == "passthrough"
+    return type(transformer).__name__ == "FunctionTransformer" and transformer.func is None
+
+
+def compile_model(model):
+    """
+    CompiledPipeline for a fitted Pipeline(ColumnTransformer(OneHotEncoder,
+    remainder="passthrough"), regressor), or None for anything else, which
+    then keeps using its own predict.
+    """
+    steps = getattr(model, "steps", None)
+    if not steps or len(steps) != 2:
+        return None
+    preprocessor, estimator = steps[0][1], steps[1][1]
+    transformers = getattr(preprocessor, "transformers_", None)
+    input_columns = getattr(preprocessor, "feature_names_in_", None)
+    if transformers is None or input_columns is None:
+        return None
+
+    columns = []
+    offset = 0
+    for name, transformer, selected in transformers:
+        if (isinstance(transformer, str) and transformer == "drop") or len(selected) == 0:
+            continue
+        names = [input_columns[c] if isinstance(c, (int, np.integer)) else c for c in selected]
+        if _is_passthrough(transformer):
+            for feature in names:
+                columns.append((feature, offset))
+                offset += 1
+        elif type(transformer).__name__ == "OneHotEncoder":
+            infrequent = getattr(transformer, "infrequent_categories_", None)
+            if transformer.drop is not None or (infrequent and any(c is not None for c in infrequent)):
+                return None
+            for feature, categories in zip(names, transformer.categories_):
+                index = {value: offset + i for i, value in enumerate(categories.tolist())}
+                columns.append((feature, index))
+                offset += len(categories)
+        else:
+            return None
+
+    if getattr(estimator, "n_features_in_", offset) != offset:
+        return None
+    return CompiledPipeline(columns, offset, estimator)
@@ -1,6 +1,7 @@
 import os
 import pickle
 
+import numpy as np
 import pandas as pd
 
 # from sklearn.model_selection import train_test_split
@@ -10,59 +11,88 @@ import pandas as pd
 # from sklearn.pipeline import Pipeline
 # from sklearn.metrics import mean_squared_error, r2_score
 
+from sqlalchemy import text
+
 from app import app, db
+from cleaning.timestamp import normalize_timestamps
+from repository.Features import (
+    TIME_FEATURES,
+    has_time_features,
+    month_names,
+    parse_time_slots,
+    time_features,
+    time_of_day,
+    weekday_names,
+)
 
 # from prediction_models.Retrain_Model import Retrain_Model 
 
+
+CATEGORICAL_FEATURES = [
+    "item_name",
+    "item_type",
+    "day_of_week",
+    "time_of_day",
+    "received_by",
+]
+NUMERICAL_FEATURES = ["item_price"]
+
+EMPTY_COLUMNS = [
+    "timestamp",
+    "transaction_type",
+    "transaction_amount",
+    "item_name",
+    "item_type",
+    "quantity",
+    "item_price",
+    "received_by",
+]
+
+
+def default_time_slots():
+    """Time-of-day slots from TIME_OF_DAY_SLOTS, used unless a restaurant sets its own."""
+    return parse_time_slots(app.config["TIME_OF_DAY_SLOTS"])
+
+
 # --- Data Loading ---
-with app.app_context():
-    engine = db.engine
-    df = pd.read_sql_query("SELECT * FROM payments", engine)
-    print(df.head())
+def load_payments(restaurant_id=None):
+    query = "SELECT * FROM payments"
+    params = {}
+    if restaurant_id is not None:
+        query += " WHERE restaurant_id = :restaurant_id"
+        params["restaurant_id"] = int(restaurant_id)
+
+    with app.app_context():
+        engine = db.engine
+        # Stored timestamps were normalised at ingest, read them back as
+        # datetimes so clean_data does not parse them a second time
+        df = pd.read_sql_query(text(query), engine, params=params, parse_dates=["timestamp"])
+
+    if not df.empty:
+        print("Data fetched from database")
+        return df
+    if restaurant_id is not None:
+        # A restaurant without payments must not be shown the sample data as its own
+        return pd.DataFrame(columns=EMPTY_COLUMNS)
 
-if df.empty:
     fallback_file = "sample_data.csv"
     if os.path.exists(fallback_file):
         try:
             df = pd.read_csv(fallback_file)
             print(f"Fallback: Loaded data from {fallback_file}")
+            return df
         except Exception as e:
             print(f"Error loading {fallback_file}: {e}")
-            # Create an empty DataFrame with expected columns
-            df = pd.DataFrame(
-                columns=[
-                    "timestamp",
-                    "transaction_type",
-                    "transaction_amount",
-                    "item_name",
-                    "item_type",
-                    "quantity",
-                    "item_price",
-                    "received_by",
-                ]
-            )
-            print("Using empty DataFrame with default columns")
     else:
         print(f"Fallback file {fallback_file} not found")
-        df = pd.DataFrame(
-            columns=[
-                "timestamp",
-                "transaction_type",
-                "transaction_amount",
-                "item_name",
-                "item_type",
-                "quantity",
-                "item_price",
-                "received_by",
-            ]
-        )
-        print("Using empty DataFrame with default columns")
-else:
-    print("Data fetched from database")
+
+    # Create an empty DataFrame with expected columns
+    print("Using empty DataFrame with default columns")
+    return pd.DataFrame(columns=EMPTY_COLUMNS)
 
 
 # --- Data Cleaning and Preprocessing ---
-def clean_data(df):
+def clean_data(df, time_slots=None):
     if df.empty:
         print(
             "Warning: Input DataFrame is empty. Returning empty DataFrames with expected structure."
@@ -70,18 +100,22 @@ def clean_data(df):
         return df.copy(), df.copy()
 
     df_clean = df.copy()
-    df_clean["timestamp"] = pd.to_datetime(
-        df_clean["timestamp"], format="%d-%m-%Y %H:%M", errors="coerce"
-    )
+    # A no-op for payments from the database, only the CSV fallback is parsed
+    df_clean["timestamp"], _ = normalize_timestamps(df_clean["timestamp"], dayfirst=True)
     df_time_analysis = df_clean.dropna(subset=["timestamp"]).copy()
 
     if not df_time_analysis.empty:
-        df_time_analysis["day_of_week"] = df_time_analysis["timestamp"].dt.day_name()
-        df_time_analysis["month"] = df_time_analysis["timestamp"].dt.month_name()
-        df_time_analysis["hour"] = df_time_analysis["timestamp"].dt.hour
-
-        time_of_day_map = {8: "Morning", 14: "Afternoon", 18: "Evening", 22: "Night"}
-        df_time_analysis["time_of_day"] = df_time_analysis["hour"].map(time_of_day_map)
+        # Rows read from payments carry the features stored at ingest, only
+        # uploads and the CSV fallback need them derived here
+        if not has_time_features(df_time_analysis):
+            df_time_analysis[TIME_FEATURES] = time_features(df_time_analysis["timestamp"])
+        df_time_analysis["day_of_week"] = weekday_names(df_time_analysis["day_of_week"])
+        df_time_analysis["month"] = month_names(df_time_analysis["month"])
+        df_time_analysis["hour"] = df_time_analysis["hour_of_day"]
+
+        df_time_analysis["time_of_day"] = time_of_day(
+            df_time_analysis["hour"], time_slots or default_time_slots()
+        )
 
     mode = df_clean["transaction_type"].mode()
     fill_value = mode[0] if not mode.empty else "Unknown"
@@ -120,9 +154,15 @@ def analyze_data(df_clean, df_time_analysis):
     )
     item_type_sales = df_clean.groupby("item_type")["transaction_amount"].sum()
     monthly_sales = df_time_analysis.groupby("month")["transaction_amount"].sum()
-    customer_time_preference = (
-        df_time_analysis.groupby(["time_of_day", "received_by"]).size().unstack()
-    )
+    # Rollup frames hold one row per bucket, row_count payments each
+    if "row_count" in df_time_analysis.columns:
+        customer_time_preference = (
+            df_time_analysis.groupby(["time_of_day", "received_by"])["row_count"].sum().unstack()
+        )
+    else:
+        customer_time_preference = (
+            df_time_analysis.groupby(["time_of_day", "received_by"]).size().unstack()
+        )
     df_clean["profit"] = df_clean["transaction_amount"] * 0.4
 
     return {
@@ -136,57 +176,18 @@ def analyze_data(df_clean, df_time_analysis):
 
 
 # --- Prediction Model ---
-# def build_prediction_model(df_time_analysis):
+def build_prediction_model(df_time_analysis):
     if df_time_analysis.empty:
         print(
             "Warning: Empty data provided for model building. Skipping model training."
         )
         return None, [], []
 
-    model_df = df_time_analysis.copy()
-    categorical_features = [
-        "item_name",
-        "item_type",
-        "day_of_week",
-        "time_of_day",
-        "received_by",
-    ]
-    numerical_features = ["item_price"]
-
-    preprocessor = ColumnTransformer(
-        transformers=[
-            ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_features)
-        ],
-        remainder="passthrough",
-    )
-
-    model_pipeline = Pipeline(
-        steps=[
-            ("preprocessor", preprocessor),
-            ("model", RandomForestRegressor(n_estimators=100, random_state=42)),
-        ]
-    )
-
-    X = model_df[categorical_features + numerical_features]
-    y = model_df["transaction_amount"]
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
-    model_pipeline.fit(X_train, y_train)
-
-    y_pred = model_pipeline.predict(X_test)
-    mse = mean_squared_error(y_test, y_pred)
-    r2 = r2_score(y_test, y_pred)
-
-    print("Model Evaluation:")
-    print(f"Mean Squared Error: {mse:.2f}")
-    print(f"R² Score: {r2:.2f}")
-
-    with open("sales_model.pkl", "wb") as f:
-        pickle.dump(model_pipeline, f)
+    # Cross-validated parallel grid search, saved through the model registry
+    from prediction_models.trainer import train_model
 
-    return model_pipeline, categorical_features, numerical_features
+    model, _ = train_model(df_time_analysis, CATEGORICAL_FEATURES, NUMERICAL_FEATURES)
+    return model, CATEGORICAL_FEATURES, NUMERICAL_FEATURES
 
 
 # --- Sales Prediction ---
@@ -201,22 +202,45 @@ def predict_sales(
     cat_features,
     num_features,
 ):
-    if model is None:
-        print("Warning: No model available for prediction.")
-        return 0.0, 0.0
-
-    input_data = pd.DataFrame(
-        {
-            "item_name": [item_name],
-            "item_type": [item_type],
-            "day_of_week": [day_of_week],
-            "time_of_day": [time_of_day],
-            "received_by": [received_by],
-            "item_price": [item_price],
-        }
+    predicted_sales, predicted_profit = predict_sales_batch(
+        model,
+        [
+            {
+                "item_name": item_name,
+                "item_type": item_type,
+                "day_of_week": day_of_week,
+                "time_of_day": time_of_day,
+                "received_by": received_by,
+                "item_price": item_price,
+            }
+        ],
+        cat_features,
+        num_features,
     )
 
-    predicted_sales = model.predict(input_data[cat_features + num_features])[0]
+    return predicted_sales[0], predicted_profit[0]
+
+
+def predict_sales_batch(model, scenarios, cat_features, num_features):
+    """
+    Score a list of scenario dicts (the predict_sales fields) with a single
+    model.predict call. Returns (sales, profit) arrays in scenario order.
+    """
+    if model is None:
+        print("Warning: No model available for prediction.")
+        zeros = np.zeros(len(scenarios))
+        return zeros, zeros
+    if not scenarios:
+        return np.zeros(0), np.zeros(0)
+
+    # Pipelines compiled at training or load time skip pandas and the
+    # ColumnTransformer entirely (prediction_models/fast_inference.py)
+    compiled = getattr(model, "compiled_", None)
+    if compiled is not None:
+        predicted_sales = compiled.predict_records(scenarios)
+    else:
+        input_data = pd.DataFrame.from_records(scenarios, columns=cat_features + num_features)
+        predicted_sales = model.predict(input_data)
     predicted_profit = predicted_sales * 0.4
 
     return predicted_sales, predicted_profit
@@ -283,11 +307,23 @@ def generate_insights(df_clean, df_time_analysis):
     return insights, top_item
 
 
-# --- Main Execution ---
-df_clean, df_time_analysis = clean_data(df)
-analysis_results = analyze_data(df_clean, df_time_analysis)
-# model, cat_features, num_features = build_prediction_model(df_time_analysis)
-insights, top_item = generate_insights(df_clean, df_time_analysis)
+# --- Analysis State ---
+def build_analysis_state(df_clean, df_time_analysis):
+    """
+    Everything the analysis endpoints serve for one set of cleaned frames.
+    Built on first use per restaurant and cached by analysis_cache, never at
+    import time.
+    """
+    analysis_results = analyze_data(df_clean, df_time_analysis)
+    insights, top_item = generate_insights(df_clean, df_time_analysis)
+    return {
+        "df_clean": df_clean,
+        "df_time_analysis": df_time_analysis,
+        "analysis_results": analysis_results,
+        "insights": insights,
+        "top_item": top_item,
+    }
+
 
 # --- Retrain Model on New Data  ---
 # Retrain_Model.retrain_model()
\ No newline at end of file
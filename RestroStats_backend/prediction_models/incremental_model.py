@@ -0,0 +1,41 @@
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.linear_model import SGDRegressor
+
+
+class IncrementalSalesModel:
+    """
+    Sales regressor that keeps learning from new payments without revisiting
+    old ones. Categorical features are hashed, so items or staff first seen
+    after the initial fit need no encoder refit, and the SGD regressor is
+    updated with partial_fit. The target is learned on a log scale to keep
+    SGD steps stable across price ranges. predict takes the same DataFrame
+    predict_sales_batch builds for the other models.
+    """
+
+    def __init__(self, cat_features, num_features, n_features=2**14, random_state=42):
+        self.cat_features = list(cat_features)
+        self.num_features = list(num_features)
+        self.hasher = FeatureHasher(
+            n_features=n_features, input_type="string", alternate_sign=False
+        )
+        self.regressor = SGDRegressor(random_state=random_state)
+        self.rows_seen = 0
+
+    def _transform(self, X):
+        # One "column=value" token per categorical feature and row
+        columns = [(name + "=" + X[name].astype(str)).to_numpy() for name in self.cat_features]
+        hashed = self.hasher.transform(zip(*columns))
+        numeric = np.log1p(X[self.num_features].to_numpy(dtype=float))
+        return sparse.hstack([hashed, sparse.csr_matrix(numeric)], format="csr")
+
+    def partial_fit(self, X, y):
+        """Update the model with one batch of rows."""
+        target = np.log1p(np.clip(np.asarray(y, dtype=float), 0, None))
+        self.regressor.partial_fit(self._transform(X), target)
+        self.rows_seen += len(X)
+        return self
+
+    def predict(self, X):
+        return np.expm1(self.regressor.predict(self._transform(X)))
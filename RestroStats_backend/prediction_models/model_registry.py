@@ -0,0 +1,193 @@
+import os
+import pickle
+import threading
+import time
+
+import click
+
+from app import app
+from prediction_models.fast_inference import compile_model
+from prediction_models.model_store import model_store
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of model artifacts from the versioned model store.
+    Each version is loaded once (memory-mapped) and kept in memory; a cheap
+    os.stat of the model's CURRENT pointer on every lookup picks up a newer
+    or rolled-back version and swaps it in atomically. Until the store holds
+    a version of MODEL_NAME, the legacy MODEL_PATH pickle is served.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _stamp(self, name):
+        stamp = model_store.pointer_stamp(name)
+        if stamp is None and name == app.config["MODEL_NAME"]:
+            try:
+                return ("pickle", os.stat(app.config["MODEL_PATH"]).st_mtime_ns)
+            except FileNotFoundError:
+                return None
+        return stamp
+
+    def _load(self, name, stamp):
+        if stamp[0] == "pickle":
+            with open(app.config["MODEL_PATH"], "rb") as f:
+                model, manifest, version = pickle.load(f), None, None
+        else:
+            version = model_store.current_version(name)
+            model, manifest = model_store.load(name, version)
+
+        # Models trained before the compiled predict path get it on load
+        if model is not None and getattr(model, "compiled_", None) is None:
+            compiled = compile_model(model)
+            if compiled is not None:
+                model.compiled_ = compiled
+        return model, manifest, version
+
+    def get(self, name=None):
+        """Return the current model of name (default MODEL_NAME), or None if there is none."""
+        name = name or app.config["MODEL_NAME"]
+        stamp = self._stamp(name)
+        entry = self._entries.get(name)
+        if entry and entry["stamp"] == stamp:
+            return entry["model"]
+        if stamp is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and entry["stamp"] == stamp:
+                return entry["model"]
+
+            model, manifest, version = self._load(name, stamp)
+            self._entries[name] = {
+                "model": model,
+                "manifest": manifest,
+                "stamp": stamp,
+                "version": version,
+            }
+            print(f"Model {name} loaded (version {version or 'legacy pickle'})")
+            return model
+
+    def save(self, model, name=None, manifest=None, gate=None):
+        """Store a model as a new version of name and register it. Returns the version."""
+        name = name or app.config["MODEL_NAME"]
+        version = model_store.save(model, name, manifest, gate=gate)
+        # Next get() maps the stored copy, so every process shares its pages
+        with self._lock:
+            self._entries.pop(name, None)
+        return version
+
+    def info(self, name=None):
+        """Version and manifest of the loaded artifact, without the model itself."""
+        name = name or app.config["MODEL_NAME"]
+        entry = self._entries.get(name)
+        if not entry:
+            return None
+        return {"name": name, "version": entry["version"], "manifest": entry["manifest"]}
+
+
+model_registry = ModelRegistry()
+
+
+@app.cli.command("model-versions")
+@click.option("--name", default=None, help="Model name, defaults to MODEL_NAME.")
+def model_versions_command(name):
+    """List the stored versions of a model."""
+    name = name or app.config["MODEL_NAME"]
+    current = model_store.current_version(name)
+    for version in model_store.versions(name):
+        manifest = model_store.manifest(name, version)
+        marker = "*" if version == current else " "
+        click.echo(f"{marker} {version}  {manifest.get('created_at')}  {manifest.get('model_class')}")
+
+
+@app.cli.command("model-rollback")
+@click.argument("version", type=int)
+@click.option("--name", default=None, help="Model name, defaults to MODEL_NAME.")
+def model_rollback_command(version, name):
+    """Serve an older stored version of a model."""
+    name = name or app.config["MODEL_NAME"]
+    model_store.activate(name, version)
+    click.echo(f"{name} now serves version {version}")
+
+
+@app.cli.command("benchmark-model-load")
+@click.option("--name", default=None, help="Model name, defaults to MODEL_NAME.")
+@click.option("--repeat", default=5, help="Loads per format.")
+def benchmark_model_load_command(name, repeat):
+    """Time loading the current version as a plain pickle and from the store."""
+    import tempfile
+
+    name = name or app.config["MODEL_NAME"]
+    model, _ = model_store.load(name, mmap=False)
+    if model is None:
+        click.echo(f"{name} has no stored version")
+        return
+
+    def best_of(load):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    with tempfile.NamedTemporaryFile(suffix=".pkl") as f:
+        pickle.dump(model, f)
+        f.flush()
+
+        def load_pickle():
+            with open(f.name, "rb") as pickled:
+                pickle.load(pickled)
+
+        results = {
+            "pickle": best_of(load_pickle),
+            "joblib": best_of(lambda: model_store.load(name, mmap=False)),
+            "joblib mmap": best_of(lambda: model_store.load(name)),
+        }
+
+    for label, seconds in results.items():
+        click.echo(f"{label:12s} {seconds * 1000:8.1f} ms")
+
+
+@app.cli.command("benchmark-predict")
+@click.option("--name", default=None, help="Model name, defaults to MODEL_NAME.")
+@click.option("--repeat", default=1000, help="Calls per path.")
+def benchmark_predict_command(name, repeat):
+    """Per-call latency of a single-row prediction, compiled path vs pandas pipeline."""
+    import pandas as pd
+
+    from prediction_models.food_sales_analysis import CATEGORICAL_FEATURES, NUMERICAL_FEATURES
+
+    model = model_registry.get(name)
+    compiled = getattr(model, "compiled_", None)
+    if compiled is None:
+        click.echo("The current model has no compiled predict path")
+        return
+
+    scenario = {
+        "item_name": "Vadapav",
+        "item_type": "Fastfood",
+        "day_of_week": "Monday",
+        "time_of_day": "Evening",
+        "received_by": "Mr.",
+        "item_price": 20.0,
+    }
+    columns = CATEGORICAL_FEATURES + NUMERICAL_FEATURES
+
+    def pipeline_predict():
+        return model.predict(pd.DataFrame.from_records([scenario], columns=columns))
+
+    def compiled_predict():
+        return compiled.predict_records([scenario])
+
+    for label, predict in (("pipeline", pipeline_predict), ("compiled", compiled_predict)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = predict()
+        click.echo(f"{label:10s} {(time.perf_counter() - start) / repeat * 1e6:10.1f} us/call  -> {result[0]:.6f}")
+
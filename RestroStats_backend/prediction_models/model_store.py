@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+from app import app
+
+ARTIFACT_FILE = "model.joblib"
+MANIFEST_FILE = "manifest.json"
+POINTER_FILE = "CURRENT"
+
+
+def _version_dir(version):
+    return f"v{version:06d}"
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, text):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def vocabularies(model):
+    """Categorical vocabularies of a one-hot pipeline, {feature: [values]}; {} for other models."""
+    try:
+        preprocessor = model.named_steps["preprocessor"]
+    except (AttributeError, KeyError):
+        return {}
+
+    vocab = {}
+    for name, encoder, columns in preprocessor.transformers_:
+        categories = getattr(encoder, "categories_", None)
+        if categories is None:
+            continue
+        for column, values in zip(columns, categories):
+            vocab[column] = values.tolist()
+    return vocab
+
+
+class ModelStore:
+    """
+    Versioned model artifacts under MODEL_STORE_DIR:
+
+        <name>/v000007/model.joblib   the model, uncompressed joblib
+        <name>/v000007/manifest.json  features, vocabularies, watermark, metrics
+        <name>/CURRENT                the version being served
+
+    A version is written to a temporary directory and renamed into place,
+    then CURRENT is swapped with os.replace, so readers never see a partial
+    artifact. The last MODEL_STORE_KEEP versions stay on disk for rollback.
+    Artifacts are loaded with mmap_mode="r", so numpy arrays in the model
+    (coefficients, encoder categories, ...) are mapped from the page cache
+    and shared between worker processes instead of copied into each one.
+    """
+
+    def __init__(self, directory=None):
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return os.path.abspath(self._directory or app.config["MODEL_STORE_DIR"])
+
+    def _base(self, name):
+        return os.path.join(self.directory, name)
+
+    def pointer_stamp(self, name):
+        """Cheap change marker of a model's CURRENT pointer, None if it has no versions."""
+        try:
+            stat = os.stat(os.path.join(self._base(name), POINTER_FILE))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def current_version(self, name):
+        try:
+            with open(os.path.join(self._base(name), POINTER_FILE)) as f:
+                return int(f.read().strip())
+        except FileNotFoundError:
+            return None
+
+    def versions(self, name):
+        """Stored version numbers of a model, oldest first."""
+        try:
+            entries = os.listdir(self._base(name))
+        except FileNotFoundError:
+            return []
+        return sorted(int(entry[1:]) for entry in entries if entry.startswith("v") and entry[1:].isdigit())
+
+    def manifest(self, name, version=None):
+        version = version or self.current_version(name)
+        if version is None:
+            return None
+        with open(os.path.join(self._base(name), _version_dir(version), MANIFEST_FILE)) as f:
+            return json.load(f)
+
+    def load(self, name, version=None, mmap=True):
+        """Return (model, manifest) of a version (default: the current one), or (None, None)."""
+        import joblib
+
+        version = version or self.current_version(name)
+        if version is None:
+            return None, None
+        path = os.path.join(self._base(name), _version_dir(version), ARTIFACT_FILE)
+        model = joblib.load(path, mmap_mode="r" if mmap else None)
+        return model, self.manifest(name, version)
+
+    def save(self, model, name, manifest=None, gate=None):
+        """
+        Write a new version, make it current and prune old ones. Returns the version.
+
+        gate names a lower-is-better manifest metric (e.g. "cv_rmse"): the new
+        version is then only made current if it scores no worse than the
+        current one, otherwise it is kept on disk but not served.
+        """
+        import joblib
+
+        base = self._base(name)
+        os.makedirs(base, exist_ok=True)
+
+        tmp_dir = tempfile.mkdtemp(dir=base, prefix=".tmp-")
+        try:
+            artifact = os.path.join(tmp_dir, ARTIFACT_FILE)
+            start = time.perf_counter()
+            # No compression: compressed arrays cannot be memory-mapped
+            joblib.dump(model, artifact)
+            save_seconds = time.perf_counter() - start
+
+            version = (self.versions(name) or [0])[-1] + 1
+            manifest = dict(
+                manifest or {},
+                name=name,
+                version=version,
+                created_at=datetime.utcnow().isoformat(),
+                model_class=f"{type(model).__module__}.{type(model).__name__}",
+                vocabularies=vocabularies(model),
+                artifact={
+                    "file": ARTIFACT_FILE,
+                    "bytes": os.path.getsize(artifact),
+                    "sha256": _sha256(artifact),
+                    "save_seconds": round(save_seconds, 3),
+                },
+            )
+
+            # Another process may claim the same number first, take the next
+            while True:
+                manifest["version"] = version
+                with open(os.path.join(tmp_dir, MANIFEST_FILE), "w") as f:
+                    json.dump(manifest, f, indent=2, default=str)
+                try:
+                    os.rename(tmp_dir, os.path.join(base, _version_dir(version)))
+                    break
+                except OSError:
+                    if not os.path.exists(os.path.join(base, _version_dir(version))):
+                        raise
+                    version += 1
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        if self._passes_gate(name, manifest, gate):
+            self.activate(name, version)
+        self._prune(name)
+        return version
+
+    def _passes_gate(self, name, manifest, gate):
+        if gate is None or self.current_version(name) is None:
+            return True
+        current = (self.manifest(name) or {}).get(gate)
+        if current is None:
+            return True
+        candidate = manifest.get(gate)
+        return candidate is not None and candidate <= current
+
+    def activate(self, name, version):
+        """Point CURRENT at a stored version, e.g. to roll back."""
+        if not os.path.isdir(os.path.join(self._base(name), _version_dir(version))):
+            raise ValueError(f"{name} has no version {version}")
+        _write_atomic(os.path.join(self._base(name), POINTER_FILE), str(version))
+
+    def _prune(self, name):
+        keep = app.config["MODEL_STORE_KEEP"]
+        current = self.current_version(name)
+        for version in self.versions(name)[:-keep]:
+            if version != current:
+                shutil.rmtree(os.path.join(self._base(name), _version_dir(version)), ignore_errors=True)
+
+
+model_store = ModelStore()
@@ -0,0 +1,180 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import ParameterGrid, TimeSeriesSplit
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from prediction_models.fast_inference import compile_model
+
+# app is imported inside train_model only: spawned search workers import this
+# module on their own and must not load the whole web app.
+
+PARAM_GRID = {
+    "n_estimators": [100, 200],
+    "max_depth": [None, 20],
+    "min_samples_leaf": [1, 5],
+}
+
+# Data shared by every candidate, sent once per worker process
+_worker_data = {}
+
+
+def make_pipeline(cat_features, params, n_jobs=1):
+    """The build_prediction_model pipeline: one-hot categoricals into a random forest."""
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("cat", OneHotEncoder(handle_unknown="ignore"), cat_features)
+        ],
+        remainder="passthrough",
+    )
+    return Pipeline(
+        steps=[
+            ("preprocessor", preprocessor),
+            ("model", RandomForestRegressor(random_state=42, n_jobs=n_jobs, **params)),
+        ]
+    )
+
+
+def _init_worker(X, y, splits, cat_features, tree_jobs):
+    _worker_data.update(X=X, y=y, splits=splits, cat_features=cat_features, tree_jobs=tree_jobs)
+
+
+def _evaluate_candidate(params):
+    """Cross-validate one parameter set over the time-ordered folds."""
+    X, y = _worker_data["X"], _worker_data["y"]
+    folds = []
+    for train_index, test_index in _worker_data["splits"]:
+        pipeline = make_pipeline(_worker_data["cat_features"], params, _worker_data["tree_jobs"])
+        start = time.perf_counter()
+        pipeline.fit(X.iloc[train_index], y.iloc[train_index])
+        fit_seconds = time.perf_counter() - start
+
+        y_true = y.iloc[test_index]
+        y_pred = pipeline.predict(X.iloc[test_index])
+        folds.append(
+            {
+                "train_rows": len(train_index),
+                "test_rows": len(test_index),
+                "fit_seconds": round(fit_seconds, 3),
+                "rmse": float(np.sqrt(mean_squared_error(y_true, y_pred))),
+                "mae": float(mean_absolute_error(y_true, y_pred)),
+                "r2": float(r2_score(y_true, y_pred)),
+            }
+        )
+
+    return {
+        "params": params,
+        "rmse": float(np.mean([f["rmse"] for f in folds])),
+        "mae": float(np.mean([f["mae"] for f in folds])),
+        "r2": float(np.mean([f["r2"] for f in folds])),
+        "fit_seconds": round(sum(f["fit_seconds"] for f in folds), 3),
+        "folds": folds,
+    }
+
+
+def train_model(df_time_analysis, cat_features, num_features, param_grid=None, name=None):
+    """
+    Restored build_prediction_model trainer. Rows are ordered by timestamp
+    and scored with TimeSeriesSplit, so every fold predicts sales after the
+    ones it was fit on. The PARAM_GRID candidates are spread over
+    TRAIN_PROCESSES worker processes, and each forest also uses the cores
+    left over per process. Candidates not started within TRAIN_TIME_BUDGET
+    seconds are dropped. The best candidate by mean RMSE is refit on the full
+    history with every core and saved as a new version in the model store,
+    with the report and training watermark in its manifest. Returns
+    (model, report), where the report lists fit time and metrics per
+    candidate. The report is also kept on the model as training_report_.
+    """
+    from app import app
+    from prediction_models.model_registry import model_registry
+    from prediction_models.model_store import model_store
+
+    name = name or app.config["MODEL_NAME"]
+    model_df = df_time_analysis.dropna(subset=cat_features + num_features + ["transaction_amount"])
+    if "timestamp" in model_df.columns:
+        model_df = model_df.sort_values("timestamp", kind="stable")
+    X = model_df[cat_features + num_features].reset_index(drop=True)
+    y = model_df["transaction_amount"].reset_index(drop=True)
+
+    n_splits = app.config["TRAIN_CV_SPLITS"]
+    if len(X) <= n_splits:
+        print("Warning: Not enough data for model training. Skipping model training.")
+        return None, None
+
+    candidates = list(ParameterGrid(param_grid or PARAM_GRID))
+    processes = max(1, min(app.config["TRAIN_PROCESSES"], len(candidates)))
+    tree_jobs = max(1, (os.cpu_count() or 1) // processes)
+    splits = list(TimeSeriesSplit(n_splits=n_splits).split(X))
+
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(X, y, splits, cat_features, tree_jobs),
+    )
+    try:
+        futures = [pool.submit(_evaluate_candidate, params) for params in candidates]
+        _, not_done = wait(futures, timeout=app.config["TRAIN_TIME_BUDGET"])
+        # Candidates already running are allowed to finish
+        skipped = sum(future.cancel() for future in not_done)
+    finally:
+        pool.shutdown(wait=True)
+    results = [f.result() for f in futures if not f.cancelled()]
+    search_seconds = time.perf_counter() - start
+    if not results:
+        print("Warning: No candidate finished within TRAIN_TIME_BUDGET. Skipping model training.")
+        return None, None
+
+    results.sort(key=lambda result: result["rmse"])
+    best = results[0]
+
+    model = make_pipeline(cat_features, best["params"], n_jobs=-1)
+    start = time.perf_counter()
+    model.fit(X, y)
+    final_fit_seconds = time.perf_counter() - start
+    # One-hot index maps for the pandas-free predict path, stored with the model
+    model.compiled_ = compile_model(model)
+
+    report = {
+        "rows": len(X),
+        "cv_splits": n_splits,
+        "processes": processes,
+        "tree_jobs": tree_jobs,
+        "search_seconds": round(search_seconds, 3),
+        "skipped_candidates": skipped,
+        "best_params": best["params"],
+        "final_fit_seconds": round(final_fit_seconds, 3),
+        "candidates": results,
+    }
+    model.training_report_ = report
+
+    manifest = {
+        "features": {"categorical": cat_features, "numerical": num_features},
+        "cv_rmse": best["rmse"],
+        "metrics": report,
+    }
+    if "id" in model_df.columns:
+        manifest["watermark"] = {"last_payment_id": int(model_df["id"].max())}
+    # Only served if its CV RMSE is no worse than the current version's
+    version = model_registry.save(model, name, manifest, gate="cv_rmse")
+    report["version"] = version
+    report["promoted"] = model_store.current_version(name) == version
+    print("Model Evaluation:")
+    for result in results:
+        print(
+            f"{result['params']}: RMSE {result['rmse']:.2f}, MAE {result['mae']:.2f}, "
+            f"R² {result['r2']:.2f}, fit {result['fit_seconds']:.1f}s"
+        )
+    if report["promoted"]:
+        print(f"Saved best model {best['params']} (version {version})")
+    else:
+        print(f"Saved best model {best['params']} (version {version}), not promoted: CV RMSE worse than current")
+    return model, report
@@ -0,0 +1,172 @@
+import time
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import insert
+
+from app import app, db
+from entities.Payment import Payment
+from prediction_models.analysis_cache import mark_payments_changed
+from repository.Features import TIME_FEATURES, time_features
+from repository.Rollups import refresh_rollup_hours, update_rollups
+
+PAYMENT_COLUMNS = [
+    "order_id",
+    "timestamp",
+    "item_name",
+    "item_type",
+    "item_price",
+    "quantity",
+    "transaction_amount",
+    "transaction_type",
+    "received_by",
+]
+
+
+def payment_frame(df, restaurant_id):
+    """Convert a cleaned upload DataFrame into insert-ready payment columns."""
+    # timestamp is NOT NULL, rows that failed to parse can never be stored
+    frame = df.dropna(subset=["timestamp"]).reindex(columns=PAYMENT_COLUMNS)
+    frame[TIME_FEATURES] = time_features(frame["timestamp"])
+
+    frame["order_id"] = frame["order_id"].astype(str)
+    frame["item_price"] = frame["item_price"].astype(float)
+    frame["quantity"] = frame["quantity"].astype(int)
+    frame["transaction_amount"] = frame["transaction_amount"].astype(float)
+    frame["transaction_type"] = (
+        frame["transaction_type"].astype(object).where(frame["transaction_type"].notna(), None)
+    )
+    # DB drivers expect plain datetime objects, not pandas Timestamps
+    frame["timestamp"] = pd.Series(
+        frame["timestamp"].to_numpy(dtype="datetime64[us]").astype(object),
+        index=frame.index,
+        dtype=object,
+    )
+
+    frame["restaurant_id"] = int(restaurant_id)
+    frame["created_at"] = datetime.utcnow()
+
+    return frame
+
+
+PAYMENT_KEY = ["restaurant_id", "order_id", "item_name", "timestamp"]
+
+
+def _insert_skipping_duplicates(table, dialect):
+    """INSERT that lets the database drop rows already present under uq_payment_natural_key."""
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        # A no-op update on duplicate keys; unlike INSERT IGNORE it still
+        # raises on bad values, foreign keys and other errors
+        return mysql_insert(table).on_duplicate_key_update(id=table.c.id)
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=PAYMENT_KEY)
+
+
+def bulk_insert_payments(df, restaurant_id, batch_size=None):
+    """
+    Insert every row of a cleaned DataFrame into payments using batched Core
+    INSERTs instead of one ORM object per row, fold the rows into
+    payment_rollups and bump the restaurant's data version. Rows that
+    duplicate an existing (restaurant_id, order_id, item_name, timestamp)
+    are skipped by the database, so re-uploading an export is idempotent.
+    The caller owns the transaction and must commit.
+    """
+    batch_size = batch_size or app.config["BULK_INSERT_BATCH_SIZE"]
+    table = Payment.__table__
+    frame = payment_frame(df, restaurant_id)
+    records = frame.to_dict("records")
+
+    # MySQL is fastest with one multi-row VALUES statement per batch, other
+    # dialects go through the driver's executemany.
+    dialect = db.session.get_bind().dialect.name
+    stmt = _insert_skipping_duplicates(table, dialect)
+
+    start = time.perf_counter()
+    inserted = 0
+    for offset in range(0, len(records), batch_size):
+        batch = records[offset : offset + batch_size]
+        if dialect == "mysql":
+            result = db.session.execute(stmt.values(batch))
+        else:
+            result = db.session.execute(stmt, batch)
+        # rowcount counts only inserted rows on SQLite; MySQL counts
+        # duplicates as found rows too and other drivers may not report it
+        # for executemany
+        if (
+            dialect != "mysql"
+            and inserted is not None
+            and result.rowcount is not None
+            and result.rowcount >= 0
+        ):
+            inserted += result.rowcount
+        else:
+            inserted = None
+
+    if inserted == len(records):
+        update_rollups(frame)
+    elif records:
+        # Some rows may have been duplicates, re-aggregate just the hours
+        # this upload touched instead
+        refresh_rollup_hours(restaurant_id, frame["timestamp"])
+    mark_payments_changed(restaurant_id)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rows": len(records),
+        "inserted": inserted,
+        "skipped": len(records) - inserted if inserted is not None else None,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(len(records) / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def stream_insert_payments(stream, restaurant_id, clean_chunk, chunk_size=None, on_chunk=None):
+    """
+    Read an uploaded CSV in chunks of UPLOAD_CHUNK_SIZE rows, clean each chunk
+    with clean_chunk and hand it straight to bulk_insert_payments, so peak
+    memory depends on the chunk size rather than the file size. clean_chunk
+    gets a state dict shared by all chunks of the upload, where the cleaners
+    keep the timestamp format detected on the first chunk. on_chunk, if
+    given, is called with the running totals after every chunk. The caller
+    owns the transaction and must commit.
+    """
+    chunk_size = chunk_size or app.config["UPLOAD_CHUNK_SIZE"]
+
+    totals = {
+        "rows_read": 0,
+        "rows": 0,
+        "inserted": 0,
+        "skipped": 0,
+        "columns": 0,
+        "preview": pd.DataFrame(),
+        "seconds": 0.0,
+        "rows_per_second": None,
+    }
+
+    state = {}
+    start = time.perf_counter()
+    for chunk in pd.read_csv(stream, chunksize=chunk_size):
+        if totals["rows_read"] == 0:
+            totals["preview"] = chunk.head()
+            totals["columns"] = chunk.shape[1]
+        totals["rows_read"] += len(chunk)
+        stats = bulk_insert_payments(clean_chunk(chunk, state=state), restaurant_id)
+        totals["rows"] += stats["rows"]
+        if totals["inserted"] is not None and stats["inserted"] is not None:
+            totals["inserted"] += stats["inserted"]
+            totals["skipped"] += stats["skipped"]
+        else:
+            totals["inserted"] = totals["skipped"] = None
+
+        elapsed = time.perf_counter() - start
+        totals["seconds"] = round(elapsed, 3)
+        totals["rows_per_second"] = round(totals["rows"] / elapsed, 1) if elapsed > 0 else None
+        if on_chunk:
+            on_chunk(totals)
+
+    return totals
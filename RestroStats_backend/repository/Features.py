@@ -1,42 +1,141 @@
+import numpy as np
 import pandas as pd
-# from repository import Load_New_Data
-from repository.Restaurants_Data import df as data
-
-# Sample DataFrame with timestamps
-# data = {
-#     "payment_id": [1, 2, 3, 4, 5],
-#     "timestamp": [
-#         "2024-02-14 12:45:30",
-#         "2024-02-14 18:20:15",
-#         "2024-02-15 09:10:05",
-#         "2024-02-16 23:50:45",
-#         "2024-02-17 07:30:00"
-#     ],
-#     "item_price": [
-#         "200","200","200","200","200"
-#     ],
-#     "quantity":[
-#         "2","2","2","2","2"
-#     ],
-#     "transaction_amount":[
-#         "400","400","400","400","400"
-#     ]
-# }
-
-df = pd.DataFrame(data)
-
-# Convert timestamp column to datetime format
-df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-# Feature Engineering
-df["day_of_week"] = df["timestamp"].dt.dayofweek  # Monday=0, Sunday=6
-df["hour_of_day"] = df["timestamp"].dt.hour
-df["month"] = df["timestamp"].dt.month
-df["day_of_month"] = df["timestamp"].dt.day
-df["is_weekend"] = df["day_of_week"].apply(lambda x: 1 if x >= 5 else 0)  # 1 if Sat/Sun, else 0
-
-# Drop the original timestamp column if not needed
-df.drop(columns=["timestamp"], inplace=True)
-
-# Print the transformed DataFrame
-print(df)
+
+# Time features derived from payments.timestamp. They are computed once when
+# a payment is written and stored on the row (see entities/Payment.py), so
+# analysis and training read them instead of re-deriving them per request.
+# day_of_week follows pandas: Monday=0 ... Sunday=6
+TIME_FEATURES = ["day_of_week", "hour_of_day", "month", "day_of_month", "is_weekend"]
+
+WEEKDAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"], dtype=object
+)
+MONTH_NAMES = np.array(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ],
+    dtype=object,
+)
+
+
+def time_features(timestamps):
+    """TIME_FEATURES of a datetime64 Series as a DataFrame on the same index."""
+    dt = timestamps.dt
+    day_of_week = dt.dayofweek
+    return pd.DataFrame(
+        {
+            "day_of_week": day_of_week,
+            "hour_of_day": dt.hour,
+            "month": dt.month,
+            "day_of_month": dt.day,
+            "is_weekend": day_of_week >= 5,
+        },
+        index=timestamps.index,
+    )
+
+
+def has_time_features(df):
+    """True if df already carries every stored time feature, e.g. rows read from payments."""
+    return set(TIME_FEATURES).issubset(df.columns) and not df[TIME_FEATURES].isna().any().any()
+
+
+def weekday_names(day_of_week):
+    """Map stored day_of_week numbers to names, as Series.dt.day_name() would."""
+    return pd.Series(WEEKDAY_NAMES[day_of_week.to_numpy(dtype=int)], index=day_of_week.index)
+
+
+def month_names(month):
+    """Map stored month numbers (1-12) to names, as Series.dt.month_name() would."""
+    return pd.Series(MONTH_NAMES[month.to_numpy(dtype=int) - 1], index=month.index)
+
+
+def validate_time_slots(slots):
+    """
+    Check a list of {"name", "start"} slots and return it as (name, start)
+    pairs sorted by start hour. Raises ValueError on a malformed scheme.
+    """
+    if not isinstance(slots, list) or not slots:
+        raise ValueError("time_slots must be a non-empty list")
+
+    pairs = []
+    for slot in slots:
+        if not isinstance(slot, dict):
+            raise ValueError("each time slot needs a name and a start hour")
+        name, start = slot.get("name"), slot.get("start")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("time slot names must be non-empty strings")
+        if isinstance(start, bool) or not isinstance(start, int) or not 0 <= start <= 23:
+            raise ValueError("time slot start must be an hour between 0 and 23")
+        pairs.append((name.strip(), start))
+
+    pairs.sort(key=lambda pair: pair[1])
+    starts = [start for _, start in pairs]
+    if len(set(starts)) != len(starts):
+        raise ValueError("time slots must start at different hours")
+    return pairs
+
+
+def parse_time_slots(spec):
+    """Parse a "Morning=5,Afternoon=12,..." string into validated (name, start) pairs."""
+    slots = []
+    for part in spec.split(","):
+        name, _, start = part.partition("=")
+        try:
+            start = int(start)
+        except ValueError:
+            raise ValueError(f"invalid time slot {part!r}, expected name=hour")
+        slots.append({"name": name, "start": start})
+    return validate_time_slots(slots)
+
+
+def time_slot_names(slots):
+    """Slot names in start-hour order."""
+    return [name for name, _ in slots]
+
+
+def time_of_day(hours, slots):
+    """
+    Bucket a Series of hours (0-23) into named slots with a single pd.cut.
+    Each slot covers [start, next start) and the last one wraps past
+    midnight, so every hour lands in a slot.
+    """
+    starts = [start for _, start in slots]
+    names = time_slot_names(slots)
+    if starts[0] > 0:
+        # Hours before the first slot belong to the last one
+        bins, labels = [0] + starts + [24], [names[-1]] + names
+    else:
+        bins, labels = starts + [24], names
+
+    buckets = pd.cut(hours, bins=bins, labels=labels, right=False, ordered=False)
+    return pd.Series(buckets, index=hours.index).astype(object)
+
+
+def slot_translation(slots, reference):
+    """
+    Map every slot name of slots to the reference slot sharing most of its
+    hours, e.g. a restaurant's "Lunch" (11-15) to the default "Afternoon".
+    The reference's own names map to themselves unless slots redefines them.
+    """
+    hours = pd.Series(range(24))
+    overlap = pd.crosstab(time_of_day(hours, slots), time_of_day(hours, reference))
+    translation = {name: name for name in time_slot_names(reference)}
+    translation.update(overlap.idxmax(axis=1).to_dict())
+    return translation
+
+
+if __name__ == "__main__":
+    from repository.Restaurants_Data import df
+
+    print(df[["timestamp"] + TIME_FEATURES].head())
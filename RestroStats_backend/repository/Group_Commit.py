@@ -0,0 +1,118 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+from sqlalchemy import insert
+
+from app import app, db
+from entities.Bill import Bill
+from entities.BillItem import BillItem
+
+
+class BillCommitPending(Exception):
+    """The bill was not committed within BILL_GROUP_COMMIT_TIMEOUT, it may still be."""
+
+
+class BillGroupCommitter:
+    """
+    Batches bills submitted by concurrent requests within a short window
+    (BILL_GROUP_COMMIT_WINDOW_MS) into one transaction: bills are flushed
+    together, their items go out as a single executemany, and the database
+    pays one commit for the whole batch. Callers block until their own bill
+    is committed and get back its id, or BillCommitPending if that takes
+    longer than BILL_GROUP_COMMIT_TIMEOUT.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, bill, items):
+        """Queue one bill (Bill column values) and its item rows, return its id."""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((bill, items, future))
+        try:
+            return future.result(timeout=app.config["BILL_GROUP_COMMIT_TIMEOUT"])
+        except TimeoutError:
+            raise BillCommitPending() from None
+
+    def _ensure_worker(self):
+        # Started lazily so every forked web worker gets its own thread
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="bill-group-commit", daemon=True
+                )
+                self._thread.start()
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        window = app.config["BILL_GROUP_COMMIT_WINDOW_MS"] / 1000
+        max_batch = app.config["BILL_GROUP_COMMIT_MAX_BATCH"]
+        deadline = time.monotonic() + window
+        while len(batch) < max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            with app.app_context():
+                try:
+                    self._commit(batch)
+                except Exception as e:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                finally:
+                    db.session.remove()
+
+    def _commit(self, batch):
+        try:
+            bill_ids = self._write(batch)
+        except Exception:
+            db.session.rollback()
+            # One bad bill must not fail its neighbours: retry them one by one
+            for entry in batch:
+                try:
+                    (bill_id,) = self._write([entry])
+                    entry[2].set_result(bill_id)
+                except Exception as e:
+                    db.session.rollback()
+                    entry[2].set_exception(e)
+            return
+
+        for (_, _, future), bill_id in zip(batch, bill_ids):
+            future.set_result(bill_id)
+
+    def _write(self, batch):
+        bills = [Bill(**bill) for bill, _, _ in batch]
+        db.session.add_all(bills)
+        db.session.flush()  # To get the bill IDs
+        # Read before commit, afterwards each access would reload the row
+        bill_ids = [bill.id for bill in bills]
+
+        item_rows = [
+            dict(item, bill_id=bill_id)
+            for bill_id, (_, items, _) in zip(bill_ids, batch)
+            for item in items
+        ]
+        if item_rows:
+            db.session.execute(insert(BillItem.__table__), item_rows)
+
+        db.session.commit()
+        return bill_ids
+
+
+bill_committer = BillGroupCommitter()
@@ -0,0 +1,192 @@
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from app import app
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_jobs (
+    name TEXT PRIMARY KEY,
+    interval_seconds REAL NOT NULL,
+    next_run_at REAL NOT NULL,
+    locked_by TEXT,
+    locked_until REAL,
+    last_started_at REAL,
+    last_finished_at REAL,
+    last_status TEXT,
+    last_error TEXT,
+    last_duration_seconds REAL,
+    run_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS precomputed_insights (
+    restaurant_key TEXT PRIMARY KEY,
+    data_version INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    computed_at REAL NOT NULL
+);
+"""
+
+
+def _iso(timestamp):
+    return datetime.utcfromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+def _restaurant_key(restaurant_id):
+    return "all" if restaurant_id is None else str(int(restaurant_id))
+
+
+class JobStore:
+    """
+    SQLite file shared by the scheduler worker and the web processes on one
+    host. It holds the recurring job table, whose leases make sure only one
+    worker runs a given job at a time, and the insights the worker
+    precomputes for the web processes to serve.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+
+    @property
+    def path(self):
+        return os.path.abspath(self._path or app.config["SCHEDULER_DB"])
+
+    def _connect(self):
+        # isolation_level=None: transactions are opened explicitly below
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init(self):
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def register(self, name, interval_seconds):
+        """Add a recurring job (due immediately) or update its interval."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO scheduled_jobs (name, interval_seconds, next_run_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET interval_seconds = excluded.interval_seconds",
+                (name, interval_seconds, time.time()),
+            )
+        finally:
+            conn.close()
+
+    def unregister(self, name):
+        """Remove a recurring job that is no longer enabled."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM scheduled_jobs WHERE name = ?", (name,))
+        finally:
+            conn.close()
+
+    def claim(self, name, worker_id, lease_seconds):
+        """
+        Take the lease on a due job. Returns False if the job is not due or
+        another worker holds an unexpired lease; an expired lease (a crashed
+        worker) can be taken over.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                "UPDATE scheduled_jobs SET locked_by = ?, locked_until = ?, last_started_at = ?, "
+                "last_status = 'running' WHERE name = ? AND next_run_at <= ? "
+                "AND (locked_until IS NULL OR locked_until < ?)",
+                (worker_id, now + lease_seconds, now, name, now, now),
+            )
+            conn.execute("COMMIT")
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def finish(self, name, worker_id, error=None):
+        """Release the lease and schedule the next run one interval from now."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE scheduled_jobs SET locked_by = NULL, locked_until = NULL, "
+                "next_run_at = ? + interval_seconds, last_finished_at = ?, last_status = ?, "
+                "last_error = ?, last_duration_seconds = ? - last_started_at, "
+                "run_count = run_count + 1 WHERE name = ? AND locked_by = ?",
+                (now, now, "failed" if error else "done", error, now, name, worker_id),
+            )
+        finally:
+            conn.close()
+
+    def jobs(self):
+        """Status of every registered job, for `flask scheduler-jobs`."""
+        if not os.path.exists(self.path):
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT * FROM scheduled_jobs ORDER BY name").fetchall()
+        except sqlite3.OperationalError:
+            # The worker has not created the schema yet
+            return []
+        finally:
+            conn.close()
+
+        now = time.time()
+        return [
+            {
+                "name": row["name"],
+                "interval_seconds": row["interval_seconds"],
+                "running": bool(row["locked_until"] and row["locked_until"] >= now),
+                "locked_by": row["locked_by"],
+                "next_run_at": _iso(row["next_run_at"]),
+                "last_started_at": _iso(row["last_started_at"]),
+                "last_finished_at": _iso(row["last_finished_at"]),
+                "last_status": row["last_status"],
+                "last_error": row["last_error"],
+                "last_duration_seconds": row["last_duration_seconds"],
+                "run_count": row["run_count"],
+            }
+            for row in rows
+        ]
+
+    def save_insights(self, restaurant_id, data_version, insights, top_item):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO precomputed_insights "
+                "(restaurant_key, data_version, payload, computed_at) VALUES (?, ?, ?, ?)",
+                (
+                    _restaurant_key(restaurant_id),
+                    data_version,
+                    json.dumps({"insights": insights, "top_item": top_item}, default=str),
+                    time.time(),
+                ),
+            )
+        finally:
+            conn.close()
+
+    def load_insights(self, restaurant_id, data_version):
+        """Precomputed {"insights", "top_item"} if they match data_version, else None."""
+        if not os.path.exists(self.path):
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT data_version, payload FROM precomputed_insights WHERE restaurant_key = ?",
+                (_restaurant_key(restaurant_id),),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        finally:
+            conn.close()
+
+        if row is None or row["data_version"] != data_version:
+            return None
+        return json.loads(row["payload"])
+
+
+job_store = JobStore()
@@ -0,0 +1,53 @@
+import base64
+from datetime import datetime
+
+from flask import request
+from sqlalchemy import and_, or_
+
+from app import app
+
+
+def page_size():
+    """?limit= clamped to 1..MAX_PAGE_SIZE, PAGE_SIZE when absent. Raises ValueError."""
+    limit = int(request.args.get("limit", app.config["PAGE_SIZE"]))
+    return max(1, min(limit, app.config["MAX_PAGE_SIZE"]))
+
+
+def encode_cursor(timestamp, row_id):
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (UnicodeError, TypeError, ValueError, base64.binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_page(query, timestamp_column, id_column, cursor, limit):
+    """
+    Newest-first page of query seeking past cursor on (timestamp, id), so a
+    deep page costs the same index range scan as the first one. Returns
+    (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                timestamp_column < timestamp,
+                and_(timestamp_column == timestamp, id_column < row_id),
+            )
+        )
+
+    rows = query.order_by(timestamp_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, timestamp_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
@@ -0,0 +1,98 @@
+import io
+import multiprocessing
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pandas as pd
+
+from cleaning.payments import clean_load_chunk
+
+# app is imported inside the functions: this module is imported while app is
+# still loading, and spawned workers must be able to import it (and the
+# app-free cleaning module) on their own.
+
+_pool = None
+
+
+def clean_payment_file(name, data):
+    """Parse and clean one CSV inside a worker process."""
+    df = pd.read_csv(io.BytesIO(data))
+    return name, len(df), clean_load_chunk(df)
+
+
+def iter_upload_files(files):
+    """Yield (name, bytes) for every CSV among the uploaded files, expanding zips."""
+    for file in files:
+        if file.filename.lower().endswith(".zip"):
+            with zipfile.ZipFile(file.stream) as archive:
+                for info in archive.infolist():
+                    name = info.filename
+                    if info.is_dir() or name.startswith("__MACOSX/"):
+                        continue
+                    if name.lower().endswith(".csv"):
+                        yield name, archive.read(info)
+        else:
+            yield file.filename, file.read()
+
+
+def is_multi_file_upload(files):
+    return len(files) > 1 or any(f.filename.lower().endswith(".zip") for f in files)
+
+
+def _get_pool():
+    from app import app
+
+    global _pool
+    if _pool is None:
+        # spawn: forking a web worker that already runs threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=app.config["INGEST_PROCESSES"],
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def ingest_files_parallel(files, restaurant_id):
+    """
+    Parse and clean every CSV (zips are expanded) in a process pool and feed
+    the cleaned frames to the bulk writer as they complete. At most two files
+    per worker are in flight, which bounds memory. The caller owns the
+    transaction and must commit.
+    """
+    from app import app
+    from repository.Bulk_Insert import bulk_insert_payments
+
+    pool = _get_pool()
+    max_in_flight = 2 * app.config["INGEST_PROCESSES"]
+    totals = {"files": [], "rows_read": 0, "rows": 0, "inserted": 0, "skipped": 0}
+
+    def insert(future):
+        name, rows_read, df_clean = future.result()
+        stats = bulk_insert_payments(df_clean, restaurant_id)
+        totals["files"].append({"name": name, "rows_read": rows_read, "rows_inserted": stats["inserted"]})
+        totals["rows_read"] += rows_read
+        totals["rows"] += stats["rows"]
+        if totals["inserted"] is not None and stats["inserted"] is not None:
+            totals["inserted"] += stats["inserted"]
+            totals["skipped"] += stats["skipped"]
+        else:
+            totals["inserted"] = totals["skipped"] = None
+
+    start = time.perf_counter()
+    pending = set()
+    for name, data in iter_upload_files(files):
+        pending.add(pool.submit(clean_payment_file, name, data))
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                insert(future)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            insert(future)
+    elapsed = time.perf_counter() - start
+
+    totals["seconds"] = round(elapsed, 3)
+    totals["rows_per_second"] = round(totals["rows"] / elapsed, 1) if elapsed > 0 else None
+    return totals
@@ -0,0 +1,63 @@
+from app import db
+from entities.Bill import Bill
+from entities.BillItem import BillItem
+from entities.Payment import Payment
+
+# Column projections for read-only listings. Selecting these returns plain
+# rows instead of ORM instances, so no identity map or attribute
+# instrumentation is paid per row.
+TRANSACTION_COLUMNS = (
+    Payment.id,
+    Payment.order_id,
+    Payment.timestamp,
+    Payment.item_name,
+    Payment.item_price,
+    Payment.quantity,
+    Payment.transaction_amount,
+    Payment.transaction_type,
+)
+
+BILL_COLUMNS = (
+    Bill.id,
+    Bill.bill_number,
+    Bill.timestamp,
+    Bill.customer_name,
+    Bill.table_number,
+    Bill.subtotal,
+    Bill.tax_amount,
+    Bill.total_amount,
+    Bill.created_at,
+)
+
+BILL_ITEM_COLUMNS = (
+    BillItem.id,
+    BillItem.description,
+    BillItem.quantity,
+    BillItem.unit_price,
+    BillItem.total_price,
+)
+
+BILL_FORMATS = {
+    "timestamp": lambda value: value.strftime("%Y-%m-%d %H:%M"),
+    "created_at": lambda value: value.strftime("%Y-%m-%d %H:%M:%S"),
+}
+
+
+def project(columns):
+    """Query selecting only the given columns."""
+    return db.session.query(*columns)
+
+
+def to_dicts(rows, formats=None):
+    """Serialise projected rows to dicts, applying optional per-field formatters."""
+    if not rows:
+        return []
+    formats = formats or {}
+    fields = [(key, formats.get(key)) for key in rows[0]._fields]
+    return [
+        {
+            key: fmt(value) if fmt and value is not None else value
+            for (key, fmt), value in zip(fields, row)
+        }
+        for row in rows
+    ]
@@ -0,0 +1,222 @@
+import click
+import pandas as pd
+from sqlalchemy import and_, delete, func, insert, or_, select
+
+from app import app, db
+from entities.Payment import Payment
+from entities.PaymentRollup import PaymentRollup
+from prediction_models.food_sales_analysis import default_time_slots
+from repository.Features import time_of_day
+
+ROLLUP_KEY = ["restaurant_id", "sale_date", "hour", "item_name", "item_type", "received_by"]
+
+
+def rollup_rows(frame):
+    """Aggregate a frame of payment records into payment_rollups rows."""
+    timestamps = pd.to_datetime(frame["timestamp"])
+    grouped = (
+        frame.assign(sale_date=timestamps.dt.date, hour=frame["hour_of_day"])
+        .groupby(ROLLUP_KEY)
+        .agg(
+            total_amount=("transaction_amount", "sum"),
+            total_quantity=("quantity", "sum"),
+            row_count=("transaction_amount", "size"),
+        )
+        .reset_index()
+    )
+    grouped["hour"] = grouped["hour"].astype(int)
+    grouped["total_quantity"] = grouped["total_quantity"].astype(int)
+    return grouped.to_dict("records")
+
+
+def _upsert_statement():
+    table = PaymentRollup.__table__
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(
+            total_amount=table.c.total_amount + stmt.inserted.total_amount,
+            total_quantity=table.c.total_quantity + stmt.inserted.total_quantity,
+            row_count=table.c.row_count + stmt.inserted.row_count,
+        )
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    stmt = dialect_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=ROLLUP_KEY,
+        set_={
+            "total_amount": table.c.total_amount + stmt.excluded.total_amount,
+            "total_quantity": table.c.total_quantity + stmt.excluded.total_quantity,
+            "row_count": table.c.row_count + stmt.excluded.row_count,
+        },
+    )
+
+
+def update_rollups(frame):
+    """
+    Add a batch of newly inserted payments to payment_rollups. Must run in the
+    same session transaction as the payment insert so both commit together.
+    """
+    rows = rollup_rows(frame)
+    if rows:
+        db.session.execute(_upsert_statement(), rows)
+    return len(rows)
+
+
+def _rollup_source(*conditions):
+    """payments matching conditions, grouped into payment_rollups rows."""
+    day = func.date(Payment.timestamp)
+    group = (
+        Payment.restaurant_id,
+        day,
+        Payment.hour_of_day,
+        Payment.item_name,
+        Payment.item_type,
+        Payment.received_by,
+    )
+    return (
+        select(
+            *group,
+            func.sum(Payment.transaction_amount),
+            func.sum(Payment.quantity),
+            func.count(),
+        )
+        .where(*conditions)
+        .group_by(*group)
+    )
+
+
+def _replace_rollups(clear_conditions, source_conditions):
+    """Delete the matching rollup rows and re-aggregate them with one INSERT ... SELECT."""
+    db.session.execute(delete(PaymentRollup).where(*clear_conditions))
+    result = db.session.execute(
+        insert(PaymentRollup).from_select(
+            ROLLUP_KEY + ["total_amount", "total_quantity", "row_count"],
+            _rollup_source(*source_conditions),
+        )
+    )
+    return result.rowcount
+
+
+def _rebuild_rollups(restaurant_id=None, start=None, end=None):
+    """Replace rollup rows with a fresh INSERT ... SELECT over payments in [start, end)."""
+    clear, source = [], []
+    if restaurant_id is not None:
+        clear.append(PaymentRollup.restaurant_id == restaurant_id)
+        source.append(Payment.restaurant_id == restaurant_id)
+    if start is not None:
+        clear.append(PaymentRollup.sale_date >= start.date())
+        source.append(Payment.timestamp >= start)
+    if end is not None:
+        clear.append(PaymentRollup.sale_date < end.date())
+        source.append(Payment.timestamp < end)
+    return _replace_rollups(clear, source)
+
+
+# Hour runs re-aggregated per statement by refresh_rollup_hours
+REFRESH_RUNS_PER_STATEMENT = 200
+
+
+def refresh_rollup_hours(restaurant_id, timestamps):
+    """
+    Re-aggregate only the (day, hour) buckets the given payment timestamps
+    fall in, for writes whose exact inserted rows are unknown (e.g. when
+    duplicates were skipped). Consecutive hours of a day are merged into one
+    range, so the work follows the size of the write rather than the
+    restaurant's history. Runs in the caller's transaction.
+    """
+    hours = pd.Series(pd.to_datetime(timestamps).dt.floor("h").unique()).sort_values()
+    runs = []
+    for hour in hours:
+        if runs and runs[-1][1] == hour and hour.hour != 0:
+            runs[-1][1] = hour + pd.Timedelta(hours=1)
+        else:
+            runs.append([hour, hour + pd.Timedelta(hours=1)])
+
+    restaurant_id = int(restaurant_id)
+    rows = 0
+    for offset in range(0, len(runs), REFRESH_RUNS_PER_STATEMENT):
+        batch = runs[offset : offset + REFRESH_RUNS_PER_STATEMENT]
+        buckets = or_(
+            *(
+                and_(
+                    PaymentRollup.sale_date == first.date(),
+                    PaymentRollup.hour >= first.hour,
+                    PaymentRollup.hour < first.hour + (end - first) // pd.Timedelta(hours=1),
+                )
+                for first, end in batch
+            )
+        )
+        ranges = or_(
+            *(
+                and_(Payment.timestamp >= first.to_pydatetime(), Payment.timestamp < end.to_pydatetime())
+                for first, end in batch
+            )
+        )
+        rows += _replace_rollups(
+            [PaymentRollup.restaurant_id == restaurant_id, buckets],
+            [Payment.restaurant_id == restaurant_id, ranges],
+        )
+    return rows
+
+
+def refresh_recent_rollups(days):
+    """
+    Rebuild the last `days` days of rollups for every restaurant, run by the
+    scheduler to reconcile anything written around the bulk writer. Commits.
+    """
+    start = (pd.Timestamp.now().normalize() - pd.Timedelta(days=days)).to_pydatetime()
+    rows = _rebuild_rollups(start=start)
+    db.session.commit()
+    return rows
+
+
+def backfill_rollups(restaurant_id=None):
+    """Rebuild payment_rollups from the raw payments table in one INSERT ... SELECT."""
+    rows = _rebuild_rollups(restaurant_id)
+    db.session.commit()
+    return rows
+
+
+def rollup_frame(restaurant_id=None, time_slots=None):
+    """
+    Load rollup rows as a DataFrame shaped like clean_data's time analysis
+    frame (day_of_week, month, hour, time_of_day, item_name, item_type,
+    received_by, quantity, transaction_amount), so the pandas analysis can run
+    on thousands of buckets instead of millions of payments. row_count holds
+    the number of payments behind each bucket.
+    """
+    query = select(
+        PaymentRollup.sale_date,
+        PaymentRollup.hour,
+        PaymentRollup.item_name,
+        PaymentRollup.item_type,
+        PaymentRollup.received_by,
+        PaymentRollup.total_amount.label("transaction_amount"),
+        PaymentRollup.total_quantity.label("quantity"),
+        PaymentRollup.row_count,
+    )
+    if restaurant_id is not None:
+        query = query.where(PaymentRollup.restaurant_id == restaurant_id)
+
+    df = pd.read_sql(query, db.session.connection())
+    dates = pd.to_datetime(df["sale_date"])
+    df["day_of_week"] = dates.dt.day_name()
+    df["month"] = dates.dt.month_name()
+    df["time_of_day"] = time_of_day(df["hour"], time_slots or default_time_slots())
+    return df
+
+
+@app.cli.command("backfill-rollups")
+@click.option("--restaurant-id", type=int, default=None, help="Only rebuild one restaurant.")
+def backfill_rollups_command(restaurant_id):
+    """Build payment_rollups from existing payments."""
+    rows = backfill_rollups(restaurant_id)
+    click.echo(f"Wrote {rows} rollup rows")
@@ -0,0 +1,125 @@
+import os
+import socket
+import time
+import traceback
+
+import click
+from sqlalchemy import select
+
+from app import app, db
+from entities.Restaurant import Restaurant
+from prediction_models.analysis_cache import data_version, get_analysis_state
+from prediction_models.Retrain_Model import retrain_model, train_full_model
+from repository.Job_Store import job_store
+from repository.Rollups import refresh_recent_rollups
+from repository.Upload_Jobs import fail_stale_upload_jobs
+
+
+def refresh_rollups_job():
+    refresh_recent_rollups(app.config["ROLLUP_REFRESH_DAYS"])
+
+
+def retrain_model_job():
+    retrain_model()
+
+
+def train_model_job():
+    train_full_model()
+
+
+def fail_stale_uploads_job():
+    fail_stale_upload_jobs()
+
+
+def precompute_insights_job():
+    """Store insights for every restaurant (and all of them together) whose data moved."""
+    restaurant_ids = [None] + list(db.session.execute(select(Restaurant.id)).scalars())
+    for restaurant_id in restaurant_ids:
+        version = data_version(restaurant_id)
+        if job_store.load_insights(restaurant_id, version) is not None:
+            continue
+        state = get_analysis_state(restaurant_id)
+        job_store.save_insights(restaurant_id, version, state["insights"], state["top_item"])
+
+
+# name -> (function, app.config key of its interval in seconds)
+JOBS = {
+    "refresh-rollups": (refresh_rollups_job, "ROLLUP_REFRESH_INTERVAL"),
+    "retrain-model": (retrain_model_job, "RETRAIN_INTERVAL"),
+    "train-model": (train_model_job, "TRAIN_INTERVAL"),
+    "precompute-insights": (precompute_insights_job, "INSIGHTS_INTERVAL"),
+    "fail-stale-uploads": (fail_stale_uploads_job, "UPLOAD_JOB_STALE_SECONDS"),
+}
+
+
+def enabled_jobs():
+    """Names of the JOBS this deployment runs: rollups only exist with USE_PAYMENT_ROLLUPS."""
+    return [
+        name for name in JOBS
+        if name != "refresh-rollups" or app.config["USE_PAYMENT_ROLLUPS"]
+    ]
+
+
+def run_job(name, worker_id):
+    """Run one job if this worker can claim it. Returns True if it ran."""
+    lease = app.config["SCHEDULER_LEASE_SECONDS"]
+    if not job_store.claim(name, worker_id, lease):
+        return False
+
+    function, _ = JOBS[name]
+    error = None
+    start = time.perf_counter()
+    with app.app_context():
+        try:
+            function()
+        except Exception:
+            db.session.rollback()
+            error = traceback.format_exc()
+        finally:
+            db.session.remove()
+    job_store.finish(name, worker_id, error)
+
+    status = "failed" if error else "done"
+    print(f"Job {name} {status} in {time.perf_counter() - start:.1f}s")
+    if error:
+        print(error)
+    return True
+
+
+def run_worker(once=False):
+    """
+    Scheduler loop: register the jobs, then every SCHEDULER_POLL_SECONDS run
+    whichever are due. Several workers may run side by side, the job leases
+    keep each job to one of them at a time.
+    """
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    names = enabled_jobs()
+    job_store.init()
+    for name, (_, interval_key) in JOBS.items():
+        if name in names:
+            job_store.register(name, app.config[interval_key])
+        else:
+            job_store.unregister(name)
+    print(f"Scheduler {worker_id} started with jobs {', '.join(names)}")
+
+    while True:
+        for name in names:
+            run_job(name, worker_id)
+        if once:
+            return
+        time.sleep(app.config["SCHEDULER_POLL_SECONDS"])
+
+
+@app.cli.command("scheduler")
+@click.option("--once", is_flag=True, help="Run the due jobs once and exit.")
+def scheduler_command(once):
+    """Run the background job scheduler."""
+    run_worker(once)
+
+
+@app.cli.command("scheduler-jobs")
+def scheduler_jobs_command():
+    """Show the status of the recurring background jobs."""
+    for job in job_store.jobs():
+        state = "running" if job["running"] else job["last_status"] or "pending"
+        click.echo(f"{job['name']:22s} {state:8s} next {job['next_run_at']}  last {job['last_finished_at']}")
@@ -0,0 +1,21 @@
+from sqlalchemy import Integer, cast, extract, func
+
+from app import db
+
+
+def hour_of(column):
+    """SQL expression for the hour (0-23) of a timestamp."""
+    return cast(extract("hour", column), Integer)
+
+
+def weekday_of(column):
+    """
+    SQL expression for the day of week of a timestamp or date, Monday = 0 like
+    the day_of_week stored on payments (repository/Features.py).
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "mysql":
+        return func.weekday(column)
+    if dialect == "sqlite":
+        return (cast(func.strftime("%w", column), Integer) + 6) % 7
+    return cast(extract("isodow", column), Integer) - 1
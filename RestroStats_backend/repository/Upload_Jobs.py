@@ -0,0 +1,164 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, update
+
+from app import app, db
+from entities.UploadJob import UploadJob
+from repository.Bulk_Insert import stream_insert_payments
+
+# Background pool that runs queued uploads, created on first use so every
+# forked web worker gets its own threads
+_executor = None
+# Ids of jobs waiting in this process's pool, kept alive by _beat_queued_jobs
+_queued_ids = set()
+_queued_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # Jobs a previous run of the server left behind will never finish
+        fail_stale_upload_jobs()
+        _executor = ThreadPoolExecutor(
+            max_workers=app.config["UPLOAD_WORKERS"], thread_name_prefix="upload-job"
+        )
+        threading.Thread(target=_heartbeat_loop, name="upload-job-heartbeat", daemon=True).start()
+    return _executor
+
+
+def _beat_queued_jobs():
+    """
+    Touch the heartbeat of jobs still waiting in this process's pool, so
+    time spent queued behind long uploads is not mistaken for a lost job.
+    """
+    with _queued_lock:
+        job_ids = list(_queued_ids)
+    if not job_ids:
+        return
+    db.session.execute(
+        update(UploadJob)
+        .where(UploadJob.id.in_(job_ids), UploadJob.status == "queued")
+        .values(heartbeat_at=datetime.utcnow())
+    )
+    db.session.commit()
+
+
+def _heartbeat_loop():
+    while True:
+        time.sleep(max(1, app.config["UPLOAD_JOB_STALE_SECONDS"] / 3))
+        with app.app_context():
+            try:
+                _beat_queued_jobs()
+            except Exception:
+                app.logger.exception("Refreshing queued upload job heartbeats failed")
+            finally:
+                db.session.remove()
+
+
+def wants_async_upload(request):
+    return app.config["ASYNC_UPLOADS"] or request.args.get("async", "").lower() in ("1", "true", "yes")
+
+
+def enqueue_upload(file, restaurant_id, clean_chunk, kind):
+    """
+    Spool the uploaded file to disk, record a queued UploadJob and hand it to
+    the background pool. Returns the job, whose id the client polls.
+    """
+    fd, path = tempfile.mkstemp(prefix="upload-", suffix=".csv", dir=app.config["UPLOAD_DIR"])
+    with os.fdopen(fd, "wb") as f:
+        file.save(f)
+
+    job = UploadJob(
+        restaurant_id=restaurant_id,
+        kind=kind,
+        filename=file.filename,
+        status="queued",
+        heartbeat_at=datetime.utcnow(),
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    executor = _get_executor()
+    with _queued_lock:
+        _queued_ids.add(job.id)
+    executor.submit(run_upload_job, job.id, path, restaurant_id, clean_chunk)
+    return job
+
+
+def run_upload_job(job_id, path, restaurant_id, clean_chunk):
+    with _queued_lock:
+        _queued_ids.discard(job_id)
+    with app.app_context():
+        # Claim the job only if it is still queued: one already failed as
+        # stale keeps that status, the user was told to upload again
+        now = datetime.utcnow()
+        claimed = db.session.execute(
+            update(UploadJob)
+            .where(UploadJob.id == job_id, UploadJob.status == "queued")
+            .values(status="running", started_at=now, heartbeat_at=now)
+        ).rowcount
+        db.session.commit()
+        if not claimed:
+            app.logger.warning("Upload job %s is no longer queued, skipping it", job_id)
+            db.session.remove()
+            os.unlink(path)
+            return
+        job = db.session.get(UploadJob, job_id)
+
+        def report(totals):
+            # Each chunk commits with its progress. Re-running a failed job
+            # is safe because duplicate rows are skipped.
+            job.rows_read = totals["rows_read"]
+            job.rows_processed = totals["rows"]
+            job.rows_inserted = totals["inserted"]
+            job.rows_skipped = totals["skipped"]
+            job.rows_per_second = totals["rows_per_second"]
+            job.heartbeat_at = datetime.utcnow()
+            db.session.commit()
+
+        try:
+            with open(path, "rb") as f:
+                stream_insert_payments(f, restaurant_id, clean_chunk, on_chunk=report)
+            job.status = "done"
+        except Exception as e:
+            db.session.rollback()
+            # The traceback goes to the server log, the client sees the message
+            app.logger.exception("Upload job %s failed", job_id)
+            job.status = "failed"
+            job.error = str(e) or type(e).__name__
+        finally:
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+            db.session.remove()
+            os.unlink(path)
+
+
+def fail_stale_upload_jobs():
+    """
+    Mark queued and running jobs whose heartbeat is older than
+    UPLOAD_JOB_STALE_SECONDS as failed: the process that held them in its
+    queue was restarted and nothing will pick them up again. Jobs still
+    queued in a live process have their heartbeat refreshed while they
+    wait. Returns the number of jobs failed.
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=app.config["UPLOAD_JOB_STALE_SECONDS"])
+    result = db.session.execute(
+        update(UploadJob)
+        .where(
+            UploadJob.status.in_(("queued", "running")),
+            func.coalesce(UploadJob.heartbeat_at, UploadJob.created_at) < cutoff,
+        )
+        .values(
+            status="failed",
+            error="Interrupted by a server restart, upload the file again",
+            finished_at=now,
+        )
+    )
+    db.session.commit()
+    return result.rowcount
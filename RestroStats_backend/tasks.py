@@ -1,8 +1,8 @@
-from celery import Celery
-from model_training import train_model_incrementally
+from app import app
+from repository.Scheduler import run_worker
 
-app = Celery('tasks', broker='redis://localhost:6379/0')
-
-@app.task
-def scheduled_training():
-    train_model_incrementally()
+# Background worker for the recurring jobs in repository/Scheduler.py (rollup
+# refresh, incremental retraining, insight precomputation). Run it as its own
+# process next to the web server: `python tasks.py` or `flask scheduler`.
+if __name__ == '__main__':
+    run_worker()
@@ -89,11 +89,11 @@ Please change the parent <Route path="${T}"> to <Route path="${T==="/"?"*":`${T}
  * Released under the MIT License
  */class d5{constructor(){this._request=null,this._charts=new Map,this._running=!1,this._lastDate=void 0}_notify(e,n,a,l){const o=n.listeners[l],c=n.duration;o.forEach(d=>d({chart:e,initial:n.initial,numSteps:c,currentStep:Math.min(a-n.start,c)}))}_refresh(){this._request||(this._running=!0,this._request=Hy.call(window,()=>{this._update(),this._request=null,this._running&&this._refresh()}))}_update(e=Date.now()){let n=0;this._charts.forEach((a,l)=>{if(!a.running||!a.items.length)return;const o=a.items;let c=o.length-1,d=!1,h;for(;c>=0;--c)h=o[c],h._active?(h._total>a.duration&&(a.duration=h._total),h.tick(e),d=!0):(o[c]=o[o.length-1],o.pop());d&&(l.draw(),this._notify(l,a,e,"progress")),o.length||(a.running=!1,this._notify(l,a,e,"complete"),a.initial=!1),n+=o.length}),this._lastDate=e,n===0&&(this._running=!1)}_getAnims(e){const n=this._charts;let a=n.get(e);return a||(a={running:!1,initial:!0,items:[],listeners:{complete:[],progress:[]}},n.set(e,a)),a}listen(e,n,a){this._getAnims(e).listeners[n].push(a)}add(e,n){!n||!n.length||this._getAnims(e).items.push(...n)}has(e){return this._getAnims(e).items.length>0}start(e){const n=this._charts.get(e);n&&(n.running=!0,n.start=Date.now(),n.duration=n.items.reduce((a,l)=>Math.max(a,l._duration),0),this._refresh())}running(e){if(!this._running)return!1;const n=this._charts.get(e);return!(!n||!n.running||!n.items.length)}stop(e){const n=this._charts.get(e);if(!n||!n.items.length)return;const a=n.items;let l=a.length-1;for(;l>=0;--l)a[l].cancel();n.items=[],this._notify(e,n,Date.now(),"complete")}remove(e){return this._charts.delete(e)}}var Di=new d5;const Ex="transparent",f5={boolean(t,e,n){return n>.5?e:t},color(t,e,n){const a=px(t||Ex),l=a.valid&&px(e||Ex);return l&&l.valid?l.mix(a,n).hexString():e},number(t,e,n){return t+(e-t)*n}};class h5{constructor(e,n,a,l){const o=n[a];l=dr([e.to,l,o,e.from]);const c=dr([e.from,o,l]);this._active=!0,this._fn=e.fn||f5[e.type||typeof c],this._easing=br[e.easing]||br.linear,this._start=Math.floor(Date.now()+(e.delay||0)),this._duration=this._total=Math.floor(e.duration),this._loop=!!e.loop,this._target=n,this._prop=a,this._from=c,this._to=l,this._promises=void 0}active(){return this._active}update(e,n,a){if(this._active){this._notify(!1);const l=this._target[this._prop],o=a-this._start,c=this._duration-o;this._start=a,this._duration=Math.floor(Math.max(c,e.duration)),this._total+=o,this._loop=!!e.loop,this._to=dr([e.to,n,l,e.from]),this._from=dr([e.from,l,n])}}cancel(){this._active&&(this.tick(Date.now()),this._active=!1,this._notify(!1))}tick(e){const n=e-this._start,a=this._duration,l=this._prop,o=this._from,c=this._loop,d=this._to;let h;if(this._active=o!==d&&(c||n<a),!this._active){this._target[l]=d,this._notify(!0);return}if(n<0){this._target[l]=o;return}h=n/a%2,h=c&&h>1?2-h:h,h=this._easing(Math.min(1,Math.max(0,h))),this._target[l]=this._fn(o,d,h)}wait(){const e=this._promises||(this._promises=[]);return new Promise((n,a)=>{e.push({res:n,rej:a})})}_notify(e){const n=e?"res":"rej",a=this._promises||[];for(let l=0;l<a.length;l++)a[l][n]()}}class nv{constructor(e,n){this._chart=e,this._properties=new Map,this.configure(n)}configure(e){if(!Be(e))return;const n=Object.keys(lt.animation),a=this._properties;Object.getOwnPropertyNames(e).forEach(l=>{const o=e[l];if(!Be(o))return;const c={};for(const d of n)c[d]=o[d];(st(o.properties)&&o.properties||[l]).forEach(d=>{(d===l||!a.has(d))&&a.set(d,c)})})}_animateOptions(e,n){const a=n.options,l=g5(e,a);if(!l)return[];const o=this._createAnimations(l,a);return a.$shared&&m5(e.options.$animations,a).then(()=>{e.options=a},()=>{}),o}_createAnimations(e,n){const a=this._properties,l=[],o=e.$animations||(e.$animations={}),c=Object.keys(n),d=Date.now();let h;for(h=c.length-1;h>=0;--h){const m=c[h];if(m.charAt(0)==="$")continue;if(m==="options"){l.push(...this._animateOptions(e,n));continue}const p=n[m];let b=o[m];const y=a.get(m);if(b)if(y&&b.active()){b.update(y,p,d);continue}else b.cancel();if(!y||!y.duration){e[m]=p;continue}o[m]=b=new h5(y,e,m,p),l.push(b)}return l}update(e,n){if(this._properties.size===0){Object.assign(e,n);return}const a=this._createAnimations(e,n);if(a.length)return Di.add(this._chart,a),!0}}function m5(t,e){const n=[],a=Object.keys(e);for(let l=0;l<a.length;l++){const o=t[a[l]];o&&o.active()&&n.push(o.wait())}return Promise.all(n)}function g5(t,e){if(!e)return;let n=t.options;if(!n){t.options=e;return}return n.$shared&&(t.options=n=Object.assign({},n,{$shared:!1,$animations:{}})),n}function Mx(t,e){const n=t&&t.options||{},a=n.reverse,l=n.min===void 0?e:0,o=n.max===void 0?e:0;return{start:a?o:l,end:a?l:o}}function p5(t,e,n){if(n===!1)return!1;const a=Mx(t,n),l=Mx(e,n);return{top:l.end,right:a.end,bottom:l.start,left:a.start}}function x5(t){let e,n,a,l;return Be(t)?(e=t.top,n=t.right,a=t.bottom,l=t.left):e=n=a=l=t,{top:e,right:n,bottom:a,left:l,disabled:t===!1}}function iv(t,e){const n=[],a=t._getSortedDatasetMetas(e);let l,o;for(l=0,o=a.length;l<o;++l)n.push(a[l].index);return n}function Tx(t,e,n,a={}){const l=t.keys,o=a.mode==="single";let c,d,h,m;if(e===null)return;let p=!1;for(c=0,d=l.length;c<d;++c){if(h=+l[c],h===n){if(p=!0,a.all)continue;break}m=t.values[h],pt(m)&&(o||e===0||ai(e)===ai(m))&&(e+=m)}return!p&&!a.all?0:e}function b5(t,e){const{iScale:n,vScale:a}=e,l=n.axis==="x"?"x":"y",o=a.axis==="x"?"x":"y",c=Object.keys(t),d=new Array(c.length);let h,m,p;for(h=0,m=c.length;h<m;++h)p=c[h],d[h]={[l]:p,[o]:t[p]};return d}function Df(t,e){const n=t&&t.options.stacked;return n||n===void 0&&e.stack!==void 0}function y5(t,e,n){return`${t.id}.${e.id}.${n.stack||n.type}`}function v5(t){const{min:e,max:n,minDefined:a,maxDefined:l}=t.getUserBounds();return{min:a?e:Number.NEGATIVE_INFINITY,max:l?n:Number.POSITIVE_INFINITY}}function w5(t,e,n){const a=t[e]||(t[e]={});return a[n]||(a[n]={})}function Dx(t,e,n,a){for(const l of e.getMatchingVisibleMetas(a).reverse()){const o=t[l.index];if(n&&o>0||!n&&o<0)return l.index}return null}function Rx(t,e){const{chart:n,_cachedMeta:a}=t,l=n._stacks||(n._stacks={}),{iScale:o,vScale:c,index:d}=a,h=o.axis,m=c.axis,p=y5(o,c,a),b=e.length;let y;for(let v=0;v<b;++v){const w=e[v],{[h]:N,[m]:j}=w,M=w._stacks||(w._stacks={});y=M[m]=w5(l,p,N),y[d]=j,y._top=Dx(y,c,!0,a.type),y._bottom=Dx(y,c,!1,a.type);const T=y._visualValues||(y._visualValues={});T[d]=j}}function Rf(t,e){const n=t.scales;return Object.keys(n).filter(a=>n[a].axis===e).shift()}function _5(t,e){return xa(t,{active:!1,dataset:void 0,datasetIndex:e,index:e,mode:"default",type:"dataset"})}function S5(t,e,n){return xa(t,{active:!1,dataIndex:e,parsed:void 0,raw:void 0,element:n,index:e,mode:"default",type:"data"})}function ir(t,e){const n=t.controller.index,a=t.vScale&&t.vScale.axis;if(a){e=e||t._parsed;for(const l of e){const o=l._stacks;if(!o||o[a]===void 0||o[a][n]===void 0)return;delete o[a][n],o[a]._visualValues!==void 0&&o[a]._visualValues[n]!==void 0&&delete o[a]._visualValues[n]}}}const Af=t=>t==="reset"||t==="none",Ax=(t,e)=>e?t:Object.assign({},t),j5=(t,e,n)=>t&&!e.hidden&&e._stacked&&{keys:iv(n,!0),values:null};class qn{constructor(e,n){this.chart=e,this._ctx=e.ctx,this.index=n,this._cachedDataOpts={},this._cachedMeta=this.getMeta(),this._type=this._cachedMeta.type,this.options=void 0,this._parsing=!1,this._data=void 0,this._objectData=void 0,this._sharedOptions=void 0,this._drawStart=void 0,this._drawCount=void 0,this.enableOptionSharing=!1,this.supportsDecimation=!1,this.$context=void 0,this._syncList=[],this.datasetElementType=new.target.datasetElementType,this.dataElementType=new.target.dataElementType,this.initialize()}initialize(){const e=this._cachedMeta;this.configure(),this.linkScales(),e._stacked=Df(e.vScale,e),this.addElements(),this.options.fill&&!this.chart.isPluginEnabled("filler")&&console.warn("Tried to use the 'fill' option without the 'Filler' plugin enabled. Please import and register the 'Filler' plugin and make sure it is not disabled in the options")}updateIndex(e){this.index!==e&&ir(this._cachedMeta),this.index=e}linkScales(){const e=this.chart,n=this._cachedMeta,a=this.getDataset(),l=(b,y,v,w)=>b==="x"?y:b==="r"?w:v,o=n.xAxisID=Re(a.xAxisID,Rf(e,"x")),c=n.yAxisID=Re(a.yAxisID,Rf(e,"y")),d=n.rAxisID=Re(a.rAxisID,Rf(e,"r")),h=n.indexAxis,m=n.iAxisID=l(h,o,c,d),p=n.vAxisID=l(h,c,o,d);n.xScale=this.getScaleForId(o),n.yScale=this.getScaleForId(c),n.rScale=this.getScaleForId(d),n.iScale=this.getScaleForId(m),n.vScale=this.getScaleForId(p)}getDataset(){return this.chart.data.datasets[this.index]}getMeta(){return this.chart.getDatasetMeta(this.index)}getScaleForId(e){return this.chart.scales[e]}_getOtherScale(e){const n=this._cachedMeta;return e===n.iScale?n.vScale:n.iScale}reset(){this._update("reset")}_destroy(){const e=this._cachedMeta;this._data&&hx(this._data,this),e._stacked&&ir(e)}_dataCheck(){const e=this.getDataset(),n=e.data||(e.data=[]),a=this._data;if(Be(n)){const l=this._cachedMeta;this._data=b5(n,l)}else if(a!==n){if(a){hx(a,this);const l=this._cachedMeta;ir(l),l._parsed=[]}n&&Object.isExtensible(n)&&cN(n,this),this._syncList=[],this._data=n}}addElements(){const e=this._cachedMeta;this._dataCheck(),this.datasetElementType&&(e.dataset=new this.datasetElementType)}buildOrUpdateElements(e){const n=this._cachedMeta,a=this.getDataset();let l=!1;this._dataCheck();const o=n._stacked;n._stacked=Df(n.vScale,n),n.stack!==a.stack&&(l=!0,ir(n),n.stack=a.stack),this._resyncElements(e),(l||o!==n._stacked)&&(Rx(this,n._parsed),n._stacked=Df(n.vScale,n))}configure(){const e=this.chart.config,n=e.datasetScopeKeys(this._type),a=e.getOptionScopes(this.getDataset(),n,!0);this.options=e.createResolver(a,this.getContext()),this._parsing=this.options.parsing,this._cachedDataOpts={}}parse(e,n){const{_cachedMeta:a,_data:l}=this,{iScale:o,_stacked:c}=a,d=o.axis;let h=e===0&&n===l.length?!0:a._sorted,m=e>0&&a._parsed[e-1],p,b,y;if(this._parsing===!1)a._parsed=l,a._sorted=!0,y=l;else{st(l[e])?y=this.parseArrayData(a,l,e,n):Be(l[e])?y=this.parseObjectData(a,l,e,n):y=this.parsePrimitiveData(a,l,e,n);const v=()=>b[d]===null||m&&b[d]<m[d];for(p=0;p<n;++p)a._parsed[p+e]=b=y[p],h&&(v()&&(h=!1),m=b);a._sorted=h}c&&Rx(this,y)}parsePrimitiveData(e,n,a,l){const{iScale:o,vScale:c}=e,d=o.axis,h=c.axis,m=o.getLabels(),p=o===c,b=new Array(l);let y,v,w;for(y=0,v=l;y<v;++y)w=y+a,b[y]={[d]:p||o.parse(m[w],w),[h]:c.parse(n[w],w)};return b}parseArrayData(e,n,a,l){const{xScale:o,yScale:c}=e,d=new Array(l);let h,m,p,b;for(h=0,m=l;h<m;++h)p=h+a,b=n[p],d[h]={x:o.parse(b[0],p),y:c.parse(b[1],p)};return d}parseObjectData(e,n,a,l){const{xScale:o,yScale:c}=e,{xAxisKey:d="x",yAxisKey:h="y"}=this._parsing,m=new Array(l);let p,b,y,v;for(p=0,b=l;p<b;++p)y=p+a,v=n[y],m[p]={x:o.parse(ma(v,d),y),y:c.parse(ma(v,h),y)};return m}getParsed(e){return this._cachedMeta._parsed[e]}getDataElement(e){return this._cachedMeta.data[e]}applyStack(e,n,a){const l=this.chart,o=this._cachedMeta,c=n[e.axis],d={keys:iv(l,!0),values:n._stacks[e.axis]._visualValues};return Tx(d,c,o.index,{mode:a})}updateRangeFromParsed(e,n,a,l){const o=a[n.axis];let c=o===null?NaN:o;const d=l&&a._stacks[n.axis];l&&d&&(l.values=d,c=Tx(l,o,this._cachedMeta.index)),e.min=Math.min(e.min,c),e.max=Math.max(e.max,c)}getMinMax(e,n){const a=this._cachedMeta,l=a._parsed,o=a._sorted&&e===a.iScale,c=l.length,d=this._getOtherScale(e),h=j5(n,a,this.chart),m={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY},{min:p,max:b}=v5(d);let y,v;function w(){v=l[y];const N=v[d.axis];return!pt(v[e.axis])||p>N||b<N}for(y=0;y<c&&!(!w()&&(this.updateRangeFromParsed(m,e,v,h),o));++y);if(o){for(y=c-1;y>=0;--y)if(!w()){this.updateRangeFromParsed(m,e,v,h);break}}return m}getAllParsedValues(e){const n=this._cachedMeta._parsed,a=[];let l,o,c;for(l=0,o=n.length;l<o;++l)c=n[l][e.axis],pt(c)&&a.push(c);return a}getMaxOverflow(){return!1}getLabelAndValue(e){const n=this._cachedMeta,a=n.iScale,l=n.vScale,o=this.getParsed(e);return{label:a?""+a.getLabelForValue(o[a.axis]):"",value:l?""+l.getLabelForValue(o[l.axis]):""}}_update(e){const n=this._cachedMeta;this.update(e||"default"),n._clip=x5(Re(this.options.clip,p5(n.xScale,n.yScale,this.getMaxOverflow())))}update(e){}draw(){const e=this._ctx,n=this.chart,a=this._cachedMeta,l=a.data||[],o=n.chartArea,c=[],d=this._drawStart||0,h=this._drawCount||l.length-d,m=this.options.drawActiveElementsOnTop;let p;for(a.dataset&&a.dataset.draw(e,o,d,h),p=d;p<d+h;++p){const b=l[p];b.hidden||(b.active&&m?c.push(b):b.draw(e,o))}for(p=0;p<c.length;++p)c[p].draw(e,o)}getStyle(e,n){const a=n?"active":"default";return e===void 0&&this._cachedMeta.dataset?this.resolveDatasetElementOptions(a):this.resolveDataElementOptions(e||0,a)}getContext(e,n,a){const l=this.getDataset();let o;if(e>=0&&e<this._cachedMeta.data.length){const c=this._cachedMeta.data[e];o=c.$context||(c.$context=S5(this.getContext(),e,c)),o.parsed=this.getParsed(e),o.raw=l.data[e],o.index=o.dataIndex=e}else o=this.$context||(this.$context=_5(this.chart.getContext(),this.index)),o.dataset=l,o.index=o.datasetIndex=this.index;return o.active=!!n,o.mode=a,o}resolveDatasetElementOptions(e){return this._resolveElementOptions(this.datasetElementType.id,e)}resolveDataElementOptions(e,n){return this._resolveElementOptions(this.dataElementType.id,n,e)}_resolveElementOptions(e,n="default",a){const l=n==="active",o=this._cachedDataOpts,c=e+"-"+n,d=o[c],h=this.enableOptionSharing&&Er(a);if(d)return Ax(d,h);const m=this.chart.config,p=m.datasetElementScopeKeys(this._type,e),b=l?[`${e}Hover`,"hover",e,""]:[e,""],y=m.getOptionScopes(this.getDataset(),p),v=Object.keys(lt.elements[e]),w=()=>this.getContext(a,l,n),N=m.resolveNamedOptions(y,v,w,b);return N.$shared&&(N.$shared=h,o[c]=Object.freeze(Ax(N,h))),N}_resolveAnimations(e,n,a){const l=this.chart,o=this._cachedDataOpts,c=`animation-${n}`,d=o[c];if(d)return d;let h;if(l.options.animation!==!1){const p=this.chart.config,b=p.datasetAnimationScopeKeys(this._type,n),y=p.getOptionScopes(this.getDataset(),b);h=p.createResolver(y,this.getContext(e,a,n))}const m=new nv(l,h&&h.animations);return h&&h._cacheable&&(o[c]=Object.freeze(m)),m}getSharedOptions(e){if(e.$shared)return this._sharedOptions||(this._sharedOptions=Object.assign({},e))}includeOptions(e,n){return!n||Af(e)||this.chart._animationsDisabled}_getSharedOptions(e,n){const a=this.resolveDataElementOptions(e,n),l=this._sharedOptions,o=this.getSharedOptions(a),c=this.includeOptions(n,o)||o!==l;return this.updateSharedOptions(o,n,a),{sharedOptions:o,includeOptions:c}}updateElement(e,n,a,l){Af(l)?Object.assign(e,a):this._resolveAnimations(n,l).update(e,a)}updateSharedOptions(e,n,a){e&&!Af(n)&&this._resolveAnimations(void 0,n).update(e,a)}_setStyle(e,n,a,l){e.active=l;const o=this.getStyle(n,l);this._resolveAnimations(n,a,l).update(e,{options:!l&&this.getSharedOptions(o)||o})}removeHoverStyle(e,n,a){this._setStyle(e,a,"active",!1)}setHoverStyle(e,n,a){this._setStyle(e,a,"active",!0)}_removeDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!1)}_setDatasetHoverStyle(){const e=this._cachedMeta.dataset;e&&this._setStyle(e,void 0,"active",!0)}_resyncElements(e){const n=this._data,a=this._cachedMeta.data;for(const[d,h,m]of this._syncList)this[d](h,m);this._syncList=[];const l=a.length,o=n.length,c=Math.min(o,l);c&&this.parse(0,c),o>l?this._insertElements(l,o-l,e):o<l&&this._removeElements(o,l-o)}_insertElements(e,n,a=!0){const l=this._cachedMeta,o=l.data,c=e+n;let d;const h=m=>{for(m.length+=n,d=m.length-1;d>=c;d--)m[d]=m[d-n]};for(h(o),d=e;d<c;++d)o[d]=new this.dataElementType;this._parsing&&h(l._parsed),this.parse(e,n),a&&this.updateElements(o,e,n,"reset")}updateElements(e,n,a,l){}_removeElements(e,n){const a=this._cachedMeta;if(this._parsing){const l=a._parsed.splice(e,n);a._stacked&&ir(a,l)}a.data.splice(e,n)}_sync(e){if(this._parsing)this._syncList.push(e);else{const[n,a,l]=e;this[n](a,l)}this.chart._dataChanges.push([this.index,...e])}_onDataPush(){const e=arguments.length;this._sync(["_insertElements",this.getDataset().data.length-e,e])}_onDataPop(){this._sync(["_removeElements",this._cachedMeta.data.length-1,1])}_onDataShift(){this._sync(["_removeElements",0,1])}_onDataSplice(e,n){n&&this._sync(["_removeElements",e,n]);const a=arguments.length-2;a&&this._sync(["_insertElements",e,a])}_onDataUnshift(){this._sync(["_insertElements",0,arguments.length])}}ae(qn,"defaults",{}),ae(qn,"datasetElementType",null),ae(qn,"dataElementType",null);function N5(t,e){if(!t._cache.$bar){const n=t.getMatchingVisibleMetas(e);let a=[];for(let l=0,o=n.length;l<o;l++)a=a.concat(n[l].controller.getAllParsedValues(t));t._cache.$bar=By(a.sort((l,o)=>l-o))}return t._cache.$bar}function E5(t){const e=t.iScale,n=N5(e,t.type);let a=e._length,l,o,c,d;const h=()=>{c===32767||c===-32768||(Er(d)&&(a=Math.min(a,Math.abs(c-d)||a)),d=c)};for(l=0,o=n.length;l<o;++l)c=e.getPixelForValue(n[l]),h();for(d=void 0,l=0,o=e.ticks.length;l<o;++l)c=e.getPixelForTick(l),h();return a}function M5(t,e,n,a){const l=n.barThickness;let o,c;return Le(l)?(o=e.min*n.categoryPercentage,c=n.barPercentage):(o=l*a,c=1),{chunk:o/a,ratio:c,start:e.pixels[t]-o/2}}function T5(t,e,n,a){const l=e.pixels,o=l[t];let c=t>0?l[t-1]:null,d=t<l.length-1?l[t+1]:null;const h=n.categoryPercentage;c===null&&(c=o-(d===null?e.end-e.start:d-o)),d===null&&(d=o+o-c);const m=o-(o-Math.min(c,d))/2*h;return{chunk:Math.abs(d-c)/2*h/a,ratio:n.barPercentage,start:m}}function D5(t,e,n,a){const l=n.parse(t[0],a),o=n.parse(t[1],a),c=Math.min(l,o),d=Math.max(l,o);let h=c,m=d;Math.abs(c)>Math.abs(d)&&(h=d,m=c),e[n.axis]=m,e._custom={barStart:h,barEnd:m,start:l,end:o,min:c,max:d}}function av(t,e,n,a){return st(t)?D5(t,e,n,a):e[n.axis]=n.parse(t,a),e}function Cx(t,e,n,a){const l=t.iScale,o=t.vScale,c=l.getLabels(),d=l===o,h=[];let m,p,b,y;for(m=n,p=n+a;m<p;++m)y=e[m],b={},b[l.axis]=d||l.parse(c[m],m),h.push(av(y,b,o,m));return h}function Cf(t){return t&&t.barStart!==void 0&&t.barEnd!==void 0}function R5(t,e,n){return t!==0?ai(t):(e.isHorizontal()?1:-1)*(e.min>=n?1:-1)}function A5(t){let e,n,a,l,o;return t.horizontal?(e=t.base>t.x,n="left",a="right"):(e=t.base<t.y,n="bottom",a="top"),e?(l="end",o="start"):(l="start",o="end"),{start:n,end:a,reverse:e,top:l,bottom:o}}function C5(t,e,n,a){let l=e.borderSkipped;const o={};if(!l){t.borderSkipped=o;return}if(l===!0){t.borderSkipped={top:!0,right:!0,bottom:!0,left:!0};return}const{start:c,end:d,reverse:h,top:m,bottom:p}=A5(t);l==="middle"&&n&&(t.enableBorderRadius=!0,(n._top||0)===a?l=m:(n._bottom||0)===a?l=p:(o[Ox(p,c,d,h)]=!0,l=m)),o[Ox(l,c,d,h)]=!0,t.borderSkipped=o}function Ox(t,e,n,a){return a?(t=O5(t,e,n),t=kx(t,n,e)):t=kx(t,e,n),t}function O5(t,e,n){return t===e?n:t===n?e:t}function kx(t,e,n){return t==="start"?e:t==="end"?n:t}function k5(t,{inflateAmount:e},n){t.inflateAmount=e==="auto"?n===1?.33:0:e}class _c extends qn{parsePrimitiveData(e,n,a,l){return Cx(e,n,a,l)}parseArrayData(e,n,a,l){return Cx(e,n,a,l)}parseObjectData(e,n,a,l){const{iScale:o,vScale:c}=e,{xAxisKey:d="x",yAxisKey:h="y"}=this._parsing,m=o.axis==="x"?d:h,p=c.axis==="x"?d:h,b=[];let y,v,w,N;for(y=a,v=a+l;y<v;++y)N=n[y],w={},w[o.axis]=o.parse(ma(N,m),y),b.push(av(ma(N,p),w,c,y));return b}updateRangeFromParsed(e,n,a,l){super.updateRangeFromParsed(e,n,a,l);const o=a._custom;o&&n===this._cachedMeta.vScale&&(e.min=Math.min(e.min,o.min),e.max=Math.max(e.max,o.max))}getMaxOverflow(){return 0}getLabelAndValue(e){const n=this._cachedMeta,{iScale:a,vScale:l}=n,o=this.getParsed(e),c=o._custom,d=Cf(c)?"["+c.start+", "+c.end+"]":""+l.getLabelForValue(o[l.axis]);return{label:""+a.getLabelForValue(o[a.axis]),value:d}}initialize(){this.enableOptionSharing=!0,super.initialize();const e=this._cachedMeta;e.stack=this.getDataset().stack}update(e){const n=this._cachedMeta;this.updateElements(n.data,0,n.data.length,e)}updateElements(e,n,a,l){const o=l==="reset",{index:c,_cachedMeta:{vScale:d}}=this,h=d.getBasePixel(),m=d.isHorizontal(),p=this._getRuler(),{sharedOptions:b,includeOptions:y}=this._getSharedOptions(n,l);for(let v=n;v<n+a;v++){const w=this.getParsed(v),N=o||Le(w[d.axis])?{base:h,head:h}:this._calculateBarValuePixels(v),j=this._calculateBarIndexPixels(v,p),M=(w._stacks||{})[d.axis],T={horizontal:m,base:N.base,enableBorderRadius:!M||Cf(w._custom)||c===M._top||c===M._bottom,x:m?N.head:j.center,y:m?j.center:N.head,height:m?j.size:Math.abs(N.size),width:m?Math.abs(N.size):j.size};y&&(T.options=b||this.resolveDataElementOptions(v,e[v].active?"active":l));const A=T.options||e[v].options;C5(T,A,M,c),k5(T,A,p.ratio),this.updateElement(e[v],v,T,l)}}_getStacks(e,n){const{iScale:a}=this._cachedMeta,l=a.getMatchingVisibleMetas(this._type).filter(p=>p.controller.options.grouped),o=a.options.stacked,c=[],d=this._cachedMeta.controller.getParsed(n),h=d&&d[a.axis],m=p=>{const b=p._parsed.find(v=>v[a.axis]===h),y=b&&b[p.vScale.axis];if(Le(y)||isNaN(y))return!0};for(const p of l)if(!(n!==void 0&&m(p))&&((o===!1||c.indexOf(p.stack)===-1||o===void 0&&p.stack===void 0)&&c.push(p.stack),p.index===e))break;return c.length||c.push(void 0),c}_getStackCount(e){return this._getStacks(void 0,e).length}_getStackIndex(e,n,a){const l=this._getStacks(e,a),o=n!==void 0?l.indexOf(n):-1;return o===-1?l.length-1:o}_getRuler(){const e=this.options,n=this._cachedMeta,a=n.iScale,l=[];let o,c;for(o=0,c=n.data.length;o<c;++o)l.push(a.getPixelForValue(this.getParsed(o)[a.axis],o));const d=e.barThickness;return{min:d||E5(n),pixels:l,start:a._startPixel,end:a._endPixel,stackCount:this._getStackCount(),scale:a,grouped:e.grouped,ratio:d?1:e.categoryPercentage*e.barPercentage}}_calculateBarValuePixels(e){const{_cachedMeta:{vScale:n,_stacked:a,index:l},options:{base:o,minBarLength:c}}=this,d=o||0,h=this.getParsed(e),m=h._custom,p=Cf(m);let b=h[n.axis],y=0,v=a?this.applyStack(n,h,a):b,w,N;v!==b&&(y=v-b,v=b),p&&(b=m.barStart,v=m.barEnd-m.barStart,b!==0&&ai(b)!==ai(m.barEnd)&&(y=0),y+=b);const j=!Le(o)&&!p?o:y;let M=n.getPixelForValue(j);if(this.chart.getDataVisibility(e)?w=n.getPixelForValue(y+v):w=M,N=w-M,Math.abs(N)<c){N=R5(N,n,d)*c,b===d&&(M-=N/2);const T=n.getPixelForDecimal(0),A=n.getPixelForDecimal(1),C=Math.min(T,A),S=Math.max(T,A);M=Math.max(Math.min(M,S),C),w=M+N,a&&!p&&(h._stacks[n.axis]._visualValues[l]=n.getValueForPixel(w)-n.getValueForPixel(M))}if(M===n.getPixelForValue(d)){const T=ai(N)*n.getLineWidthForValue(d)/2;M+=T,N-=T}return{size:N,base:M,head:w,center:w+N/2}}_calculateBarIndexPixels(e,n){const a=n.scale,l=this.options,o=l.skipNull,c=Re(l.maxBarThickness,1/0);let d,h;if(n.grouped){const m=o?this._getStackCount(e):n.stackCount,p=l.barThickness==="flex"?T5(e,n,l,m):M5(e,n,l,m),b=this._getStackIndex(this.index,this._cachedMeta.stack,o?e:void 0);d=p.start+p.chunk*b+p.chunk/2,h=Math.min(c,p.chunk*p.ratio)}else d=a.getPixelForValue(this.getParsed(e)[a.axis],e),h=Math.min(c,n.min*n.ratio);return{base:d-h/2,head:d+h/2,center:d,size:h}}draw(){const e=this._cachedMeta,n=e.vScale,a=e.data,l=a.length;let o=0;for(;o<l;++o)this.getParsed(o)[n.axis]!==null&&!a[o].hidden&&a[o].draw(this._ctx)}}ae(_c,"id","bar"),ae(_c,"defaults",{datasetElementType:!1,dataElementType:"bar",categoryPercentage:.8,barPercentage:.9,grouped:!0,animations:{numbers:{type:"number",properties:["x","y","base","width","height"]}}}),ae(_c,"overrides",{scales:{_index_:{type:"category",offset:!0,grid:{offset:!0}},_value_:{type:"linear",beginAtZero:!0}}});class Sc extends qn{initialize(){this.enableOptionSharing=!0,super.initialize()}parsePrimitiveData(e,n,a,l){const o=super.parsePrimitiveData(e,n,a,l);for(let c=0;c<o.length;c++)o[c]._custom=this.resolveDataElementOptions(c+a).radius;return o}parseArrayData(e,n,a,l){const o=super.parseArrayData(e,n,a,l);for(let c=0;c<o.length;c++){const d=n[a+c];o[c]._custom=Re(d[2],this.resolveDataElementOptions(c+a).radius)}return o}parseObjectData(e,n,a,l){const o=super.parseObjectData(e,n,a,l);for(let c=0;c<o.length;c++){const d=n[a+c];o[c]._custom=Re(d&&d.r&&+d.r,this.resolveDataElementOptions(c+a).radius)}return o}getMaxOverflow(){const e=this._cachedMeta.data;let n=0;for(let a=e.length-1;a>=0;--a)n=Math.max(n,e[a].size(this.resolveDataElementOptions(a))/2);return n>0&&n}getLabelAndValue(e){const n=this._cachedMeta,a=this.chart.data.labels||[],{xScale:l,yScale:o}=n,c=this.getParsed(e),d=l.getLabelForValue(c.x),h=o.getLabelForValue(c.y),m=c._custom;return{label:a[e]||"",value:"("+d+", "+h+(m?", "+m:"")+")"}}update(e){const n=this._cachedMeta.data;this.updateElements(n,0,n.length,e)}updateElements(e,n,a,l){const o=l==="reset",{iScale:c,vScale:d}=this._cachedMeta,{sharedOptions:h,includeOptions:m}=this._getSharedOptions(n,l),p=c.axis,b=d.axis;for(let y=n;y<n+a;y++){const v=e[y],w=!o&&this.getParsed(y),N={},j=N[p]=o?c.getPixelForDecimal(.5):c.getPixelForValue(w[p]),M=N[b]=o?d.getBasePixel():d.getPixelForValue(w[b]);N.skip=isNaN(j)||isNaN(M),m&&(N.options=h||this.resolveDataElementOptions(y,v.active?"active":l),o&&(N.options.radius=0)),this.updateElement(v,y,N,l)}}resolveDataElementOptions(e,n){const a=this.getParsed(e);let l=super.resolveDataElementOptions(e,n);l.$shared&&(l=Object.assign({},l,{$shared:!1}));const o=l.radius;return n!=="active"&&(l.radius=0),l.radius+=Re(a&&a._custom,o),l}}ae(Sc,"id","bubble"),ae(Sc,"defaults",{datasetElementType:!1,dataElementType:"point",animations:{numbers:{type:"number",properties:["x","y","borderWidth","radius"]}}}),ae(Sc,"overrides",{scales:{x:{type:"linear"},y:{type:"linear"}}});function L5(t,e,n){let a=1,l=1,o=0,c=0;if(e<nt){const d=t,h=d+e,m=Math.cos(d),p=Math.sin(d),b=Math.cos(h),y=Math.sin(h),v=(A,C,S)=>Mr(A,d,h,!0)?1:Math.max(C,C*n,S,S*n),w=(A,C,S)=>Mr(A,d,h,!0)?-1:Math.min(C,C*n,S,S*n),N=v(0,m,b),j=v(bt,p,y),M=w(it,m,b),T=w(it+bt,p,y);a=(N-M)/2,l=(j-T)/2,o=-(N+M)/2,c=-(j+T)/2}return{ratioX:a,ratioY:l,offsetX:o,offsetY:c}}class Ja extends qn{constructor(e,n){super(e,n),this.enableOptionSharing=!0,this.innerRadius=void 0,this.outerRadius=void 0,this.offsetX=void 0,this.offsetY=void 0}linkScales(){}parse(e,n){const a=this.getDataset().data,l=this._cachedMeta;if(this._parsing===!1)l._parsed=a;else{let o=h=>+a[h];if(Be(a[e])){const{key:h="value"}=this._parsing;o=m=>+ma(a[m],h)}let c,d;for(c=e,d=e+n;c<d;++c)l._parsed[c]=o(c)}}_getRotation(){return Vn(this.options.rotation-90)}_getCircumference(){return Vn(this.options.circumference)}_getRotationExtents(){let e=nt,n=-nt;for(let a=0;a<this.chart.data.datasets.length;++a)if(this.chart.isDatasetVisible(a)&&this.chart.getDatasetMeta(a).type===this._type){const l=this.chart.getDatasetMeta(a).controller,o=l._getRotation(),c=l._getCircumference();e=Math.min(e,o),n=Math.max(n,o+c)}return{rotation:e,circumference:n-e}}update(e){const n=this.chart,{chartArea:a}=n,l=this._cachedMeta,o=l.data,c=this.getMaxBorderWidth()+this.getMaxOffset(o)+this.options.spacing,d=Math.max((Math.min(a.width,a.height)-c)/2,0),h=Math.min(Wj(this.options.cutout,d),1),m=this._getRingWeight(this.index),{circumference:p,rotation:b}=this._getRotationExtents(),{ratioX:y,ratioY:v,offsetX:w,offsetY:N}=L5(b,p,h),j=(a.width-c)/y,M=(a.height-c)/v,T=Math.max(Math.min(j,M)/2,0),A=Cy(this.options.radius,T),C=Math.max(A*h,0),S=(A-C)/this._getVisibleDatasetWeightTotal();this.offsetX=w*A,this.offsetY=N*A,l.total=this.calculateTotal(),this.outerRadius=A-S*this._getRingWeightOffset(this.index),this.innerRadius=Math.max(this.outerRadius-S*m,0),this.updateElements(o,0,o.length,e)}_circumference(e,n){const a=this.options,l=this._cachedMeta,o=this._getCircumference();return n&&a.animation.animateRotate||!this.chart.getDataVisibility(e)||l._parsed[e]===null||l.data[e].hidden?0:this.calculateCircumference(l._parsed[e]*o/nt)}updateElements(e,n,a,l){const o=l==="reset",c=this.chart,d=c.chartArea,m=c.options.animation,p=(d.left+d.right)/2,b=(d.top+d.bottom)/2,y=o&&m.animateScale,v=y?0:this.innerRadius,w=y?0:this.outerRadius,{sharedOptions:N,includeOptions:j}=this._getSharedOptions(n,l);let M=this._getRotation(),T;for(T=0;T<n;++T)M+=this._circumference(T,o);for(T=n;T<n+a;++T){const A=this._circumference(T,o),C=e[T],S={x:p+this.offsetX,y:b+this.offsetY,startAngle:M,endAngle:M+A,circumference:A,outerRadius:w,innerRadius:v};j&&(S.options=N||this.resolveDataElementOptions(T,C.active?"active":l)),M+=A,this.updateElement(C,T,S,l)}}calculateTotal(){const e=this._cachedMeta,n=e.data;let a=0,l;for(l=0;l<n.length;l++){const o=e._parsed[l];o!==null&&!isNaN(o)&&this.chart.getDataVisibility(l)&&!n[l].hidden&&(a+=Math.abs(o))}return a}calculateCircumference(e){const n=this._cachedMeta.total;return n>0&&!isNaN(e)?nt*(Math.abs(e)/n):0}getLabelAndValue(e){const n=this._cachedMeta,a=this.chart,l=a.data.labels||[],o=Hr(n._parsed[e],a.options.locale);return{label:l[e]||"",value:o}}getMaxBorderWidth(e){let n=0;const a=this.chart;let l,o,c,d,h;if(!e){for(l=0,o=a.data.datasets.length;l<o;++l)if(a.isDatasetVisible(l)){c=a.getDatasetMeta(l),e=c.data,d=c.controller;break}}if(!e)return 0;for(l=0,o=e.length;l<o;++l)h=d.resolveDataElementOptions(l),h.borderAlign!=="inner"&&(n=Math.max(n,h.borderWidth||0,h.hoverBorderWidth||0));return n}getMaxOffset(e){let n=0;for(let a=0,l=e.length;a<l;++a){const o=this.resolveDataElementOptions(a);n=Math.max(n,o.offset||0,o.hoverOffset||0)}return n}_getRingWeightOffset(e){let n=0;for(let a=0;a<e;++a)this.chart.isDatasetVisible(a)&&(n+=this._getRingWeight(a));return n}_getRingWeight(e){return Math.max(Re(this.chart.data.datasets[e].weight,1),0)}_getVisibleDatasetWeightTotal(){return this._getRingWeightOffset(this.chart.data.datasets.length)||1}}ae(Ja,"id","doughnut"),ae(Ja,"defaults",{datasetElementType:!1,dataElementType:"arc",animation:{animateRotate:!0,animateScale:!1},animations:{numbers:{type:"number",properties:["circumference","endAngle","innerRadius","outerRadius","startAngle","x","y","offset","borderWidth","spacing"]}},cutout:"50%",rotation:0,circumference:360,radius:"100%",spacing:0,indexAxis:"r"}),ae(Ja,"descriptors",{_scriptable:e=>e!=="spacing",_indexable:e=>e!=="spacing"&&!e.startsWith("borderDash")&&!e.startsWith("hoverBorderDash")}),ae(Ja,"overrides",{aspectRatio:1,plugins:{legend:{labels:{generateLabels(e){const n=e.data;if(n.labels.length&&n.datasets.length){const{labels:{pointStyle:a,color:l}}=e.legend.options;return n.labels.map((o,c)=>{const h=e.getDatasetMeta(0).controller.getStyle(c);return{text:o,fillStyle:h.backgroundColor,strokeStyle:h.borderColor,fontColor:l,lineWidth:h.borderWidth,pointStyle:a,hidden:!e.getDataVisibility(c),index:c}})}return[]}},onClick(e,n,a){a.chart.toggleDataVisibility(n.index),a.chart.update()}}}});class jc extends qn{initialize(){this.enableOptionSharing=!0,this.supportsDecimation=!0,super.initialize()}update(e){const n=this._cachedMeta,{dataset:a,data:l=[],_dataset:o}=n,c=this.chart._animationsDisabled;let{start:d,count:h}=Py(n,l,c);this._drawStart=d,this._drawCount=h,Fy(n)&&(d=0,h=l.length),a._chart=this.chart,a._datasetIndex=this.index,a._decimated=!!o._decimated,a.points=l;const m=this.resolveDatasetElementOptions(e);this.options.showLine||(m.borderWidth=0),m.segment=this.options.segment,this.updateElement(a,void 0,{animated:!c,options:m},e),this.updateElements(l,d,h,e)}updateElements(e,n,a,l){const o=l==="reset",{iScale:c,vScale:d,_stacked:h,_dataset:m}=this._cachedMeta,{sharedOptions:p,includeOptions:b}=this._getSharedOptions(n,l),y=c.axis,v=d.axis,{spanGaps:w,segment:N}=this.options,j=Ws(w)?w:Number.POSITIVE_INFINITY,M=this.chart._animationsDisabled||o||l==="none",T=n+a,A=e.length;let C=n>0&&this.getParsed(n-1);for(let S=0;S<A;++S){const k=e[S],F=M?k:{};if(S<n||S>=T){F.skip=!0;continue}const $=this.getParsed(S),V=Le($[v]),te=F[y]=c.getPixelForValue($[y],S),se=F[v]=o||V?d.getBasePixel():d.getPixelForValue(h?this.applyStack(d,$,h):$[v],S);F.skip=isNaN(te)||isNaN(se)||V,F.stop=S>0&&Math.abs($[y]-C[y])>j,N&&(F.parsed=$,F.raw=m.data[S]),b&&(F.options=p||this.resolveDataElementOptions(S,k.active?"active":l)),M||this.updateElement(k,S,F,l),C=$}}getMaxOverflow(){const e=this._cachedMeta,n=e.dataset,a=n.options&&n.options.borderWidth||0,l=e.data||[];if(!l.length)return a;const o=l[0].size(this.resolveDataElementOptions(0)),c=l[l.length-1].size(this.resolveDataElementOptions(l.length-1));return Math.max(a,o,c)/2}draw(){const e=this._cachedMeta;e.dataset.updateControlPoints(this.chart.chartArea,e.iScale.axis),super.draw()}}ae(jc,"id","line"),ae(jc,"defaults",{datasetElementType:"line",dataElementType:"point",showLine:!0,spanGaps:!1}),ae(jc,"overrides",{scales:{_index_:{type:"category"},_value_:{type:"linear"}}});class vr extends qn{constructor(e,n){super(e,n),this.innerRadius=void 0,this.outerRadius=void 0}getLabelAndValue(e){const n=this._cachedMeta,a=this.chart,l=a.data.labels||[],o=Hr(n._parsed[e].r,a.options.locale);return{label:l[e]||"",value:o}}parseObjectData(e,n,a,l){return Qy.bind(this)(e,n,a,l)}update(e){const n=this._cachedMeta.data;this._updateRadius(),this.updateElements(n,0,n.length,e)}getMinMax(){const e=this._cachedMeta,n={min:Number.POSITIVE_INFINITY,max:Number.NEGATIVE_INFINITY};return e.data.forEach((a,l)=>{const o=this.getParsed(l).r;!isNaN(o)&&this.chart.getDataVisibility(l)&&(o<n.min&&(n.min=o),o>n.max&&(n.max=o))}),n}_updateRadius(){const e=this.chart,n=e.chartArea,a=e.options,l=Math.min(n.right-n.left,n.bottom-n.top),o=Math.max(l/2,0),c=Math.max(a.cutoutPercentage?o/100*a.cutoutPercentage:1,0),d=(o-c)/e.getVisibleDatasetCount();this.outerRadius=o-d*this.index,this.innerRadius=this.outerRadius-d}updateElements(e,n,a,l){const o=l==="reset",c=this.chart,h=c.options.animation,m=this._cachedMeta.rScale,p=m.xCenter,b=m.yCenter,y=m.getIndexAngle(0)-.5*it;let v=y,w;const N=360/this.countVisibleElements();for(w=0;w<n;++w)v+=this._computeAngle(w,l,N);for(w=n;w<n+a;w++){const j=e[w];let M=v,T=v+this._computeAngle(w,l,N),A=c.getDataVisibility(w)?m.getDistanceFromCenterForValue(this.getParsed(w).r):0;v=T,o&&(h.animateScale&&(A=0),h.animateRotate&&(M=T=y));const C={x:p,y:b,innerRadius:0,outerRadius:A,startAngle:M,endAngle:T,options:this.resolveDataElementOptions(w,j.active?"active":l)};this.updateElement(j,w,C,l)}}countVisibleElements(){const e=this._cachedMeta;let n=0;return e.data.forEach((a,l)=>{!isNaN(this.getParsed(l).r)&&this.chart.getDataVisibility(l)&&n++}),n}_computeAngle(e,n,a){return this.chart.getDataVisibility(e)?Vn(this.resolveDataElementOptions(e,n).angle||a):0}}ae(vr,"id","polarArea"),ae(vr,"defaults",{dataElementType:"arc",animation:{animateRotate:!0,animateScale:!0},animations:{numbers:{type:"number",properties:["x","y","startAngle","endAngle","innerRadius","outerRadius"]}},indexAxis:"r",startAngle:0}),ae(vr,"overrides",{aspectRatio:1,plugins:{legend:{labels:{generateLabels(e){const n=e.data;if(n.labels.length&&n.datasets.length){const{labels:{pointStyle:a,color:l}}=e.legend.options;return n.labels.map((o,c)=>{const h=e.getDatasetMeta(0).controller.getStyle(c);return{text:o,fillStyle:h.backgroundColor,strokeStyle:h.borderColor,fontColor:l,lineWidth:h.borderWidth,pointStyle:a,hidden:!e.getDataVisibility(c),index:c}})}return[]}},onClick(e,n,a){a.chart.toggleDataVisibility(n.index),a.chart.update()}}},scales:{r:{type:"radialLinear",angleLines:{display:!1},beginAtZero:!0,grid:{circular:!0},pointLabels:{display:!1},startAngle:0}}});class th extends Ja{}ae(th,"id","pie"),ae(th,"defaults",{cutout:0,rotation:0,circumference:360,radius:"100%"});class Nc extends qn{getLabelAndValue(e){const n=this._cachedMeta.vScale,a=this.getParsed(e);return{label:n.getLabels()[e],value:""+n.getLabelForValue(a[n.axis])}}parseObjectData(e,n,a,l){return Qy.bind(this)(e,n,a,l)}update(e){const n=this._cachedMeta,a=n.dataset,l=n.data||[],o=n.iScale.getLabels();if(a.points=l,e!=="resize"){const c=this.resolveDatasetElementOptions(e);this.options.showLine||(c.borderWidth=0);const d={_loop:!0,_fullLoop:o.length===l.length,options:c};this.updateElement(a,void 0,d,e)}this.updateElements(l,0,l.length,e)}updateElements(e,n,a,l){const o=this._cachedMeta.rScale,c=l==="reset";for(let d=n;d<n+a;d++){const h=e[d],m=this.resolveDataElementOptions(d,h.active?"active":l),p=o.getPointPositionForValue(d,this.getParsed(d).r),b=c?o.xCenter:p.x,y=c?o.yCenter:p.y,v={x:b,y,angle:p.angle,skip:isNaN(b)||isNaN(y),options:m};this.updateElement(h,d,v,l)}}}ae(Nc,"id","radar"),ae(Nc,"defaults",{datasetElementType:"line",dataElementType:"point",indexAxis:"r",showLine:!0,elements:{line:{fill:"start"}}}),ae(Nc,"overrides",{aspectRatio:1,scales:{r:{type:"radialLinear"}}});class Ec extends qn{getLabelAndValue(e){const n=this._cachedMeta,a=this.chart.data.labels||[],{xScale:l,yScale:o}=n,c=this.getParsed(e),d=l.getLabelForValue(c.x),h=o.getLabelForValue(c.y);return{label:a[e]||"",value:"("+d+", "+h+")"}}update(e){const n=this._cachedMeta,{data:a=[]}=n,l=this.chart._animationsDisabled;let{start:o,count:c}=Py(n,a,l);if(this._drawStart=o,this._drawCount=c,Fy(n)&&(o=0,c=a.length),this.options.showLine){this.datasetElementType||this.addElements();const{dataset:d,_dataset:h}=n;d._chart=this.chart,d._datasetIndex=this.index,d._decimated=!!h._decimated,d.points=a;const m=this.resolveDatasetElementOptions(e);m.segment=this.options.segment,this.updateElement(d,void 0,{animated:!l,options:m},e)}else this.datasetElementType&&(delete n.dataset,this.datasetElementType=!1);this.updateElements(a,o,c,e)}addElements(){const{showLine:e}=this.options;!this.datasetElementType&&e&&(this.datasetElementType=this.chart.registry.getElement("line")),super.addElements()}updateElements(e,n,a,l){const o=l==="reset",{iScale:c,vScale:d,_stacked:h,_dataset:m}=this._cachedMeta,p=this.resolveDataElementOptions(n,l),b=this.getSharedOptions(p),y=this.includeOptions(l,b),v=c.axis,w=d.axis,{spanGaps:N,segment:j}=this.options,M=Ws(N)?N:Number.POSITIVE_INFINITY,T=this.chart._animationsDisabled||o||l==="none";let A=n>0&&this.getParsed(n-1);for(let C=n;C<n+a;++C){const S=e[C],k=this.getParsed(C),F=T?S:{},$=Le(k[w]),V=F[v]=c.getPixelForValue(k[v],C),te=F[w]=o||$?d.getBasePixel():d.getPixelForValue(h?this.applyStack(d,k,h):k[w],C);F.skip=isNaN(V)||isNaN(te)||$,F.stop=C>0&&Math.abs(k[v]-A[v])>M,j&&(F.parsed=k,F.raw=m.data[C]),y&&(F.options=b||this.resolveDataElementOptions(C,S.active?"active":l)),T||this.updateElement(S,C,F,l),A=k}this.updateSharedOptions(b,l,p)}getMaxOverflow(){const e=this._cachedMeta,n=e.data||[];if(!this.options.showLine){let d=0;for(let h=n.length-1;h>=0;--h)d=Math.max(d,n[h].size(this.resolveDataElementOptions(h))/2);return d>0&&d}const a=e.dataset,l=a.options&&a.options.borderWidth||0;if(!n.length)return l;const o=n[0].size(this.resolveDataElementOptions(0)),c=n[n.length-1].size(this.resolveDataElementOptions(n.length-1));return Math.max(l,o,c)/2}}ae(Ec,"id","scatter"),ae(Ec,"defaults",{datasetElementType:!1,dataElementType:"point",showLine:!1,fill:!1}),ae(Ec,"overrides",{interaction:{mode:"point"},scales:{x:{type:"linear"},y:{type:"linear"}}});var z5=Object.freeze({__proto__:null,BarController:_c,BubbleController:Sc,DoughnutController:Ja,LineController:jc,PieController:th,PolarAreaController:vr,RadarController:Nc,ScatterController:Ec});function Xa(){throw new Error("This method is not implemented: Check that a complete date adapter is provided.")}class Fh{constructor(e){ae(this,"options");this.options=e||{}}static override(e){Object.assign(Fh.prototype,e)}init(){}formats(){return Xa()}parse(){return Xa()}format(){return Xa()}add(){return Xa()}diff(){return Xa()}startOf(){return Xa()}endOf(){return Xa()}}var B5={_date:Fh};function H5(t,e,n,a){const{controller:l,data:o,_sorted:c}=t,d=l._cachedMeta.iScale,h=t.dataset&&t.dataset.options?t.dataset.options.spanGaps:null;if(d&&e===d.axis&&e!=="r"&&c&&o.length){const m=d._reversePixels?rN:Oi;if(a){if(l._sharedOptions){const p=o[0],b=typeof p.getRange=="function"&&p.getRange(e);if(b){const y=m(o,e,n-b),v=m(o,e,n+b);return{lo:y.lo,hi:v.hi}}}}else{const p=m(o,e,n);if(h){const{vScale:b}=l._cachedMeta,{_parsed:y}=t,v=y.slice(0,p.lo+1).reverse().findIndex(N=>!Le(N[b.axis]));p.lo-=Math.max(0,v);const w=y.slice(p.hi).findIndex(N=>!Le(N[b.axis]));p.hi+=Math.max(0,w)}return p}}return{lo:0,hi:o.length-1}}function au(t,e,n,a,l){const o=t.getSortedVisibleDatasetMetas(),c=n[e];for(let d=0,h=o.length;d<h;++d){const{index:m,data:p}=o[d],{lo:b,hi:y}=H5(o[d],e,c,l);for(let v=b;v<=y;++v){const w=p[v];w.skip||a(w,m,v)}}}function U5(t){const e=t.indexOf("x")!==-1,n=t.indexOf("y")!==-1;return function(a,l){const o=e?Math.abs(a.x-l.x):0,c=n?Math.abs(a.y-l.y):0;return Math.sqrt(Math.pow(o,2)+Math.pow(c,2))}}function Of(t,e,n,a,l){const o=[];return!l&&!t.isPointInArea(e)||au(t,n,e,function(d,h,m){!l&&!ki(d,t.chartArea,0)||d.inRange(e.x,e.y,a)&&o.push({element:d,datasetIndex:h,index:m})},!0),o}function P5(t,e,n,a){let l=[];function o(c,d,h){const{startAngle:m,endAngle:p}=c.getProps(["startAngle","endAngle"],a),{angle:b}=Ly(c,{x:e.x,y:e.y});Mr(b,m,p)&&l.push({element:c,datasetIndex:d,index:h})}return au(t,n,e,o),l}function F5(t,e,n,a,l,o){let c=[];const d=U5(n);let h=Number.POSITIVE_INFINITY;function m(p,b,y){const v=p.inRange(e.x,e.y,l);if(a&&!v)return;const w=p.getCenterPoint(l);if(!(!!o||t.isPointInArea(w))&&!v)return;const j=d(e,w);j<h?(c=[{element:p,datasetIndex:b,index:y}],h=j):j===h&&c.push({element:p,datasetIndex:b,index:y})}return au(t,n,e,m),c}function kf(t,e,n,a,l,o){return!o&&!t.isPointInArea(e)?[]:n==="r"&&!a?P5(t,e,n,l):F5(t,e,n,a,l,o)}function Lx(t,e,n,a,l){const o=[],c=n==="x"?"inXRange":"inYRange";let d=!1;return au(t,n,e,(h,m,p)=>{h[c]&&h[c](e[n],l)&&(o.push({element:h,datasetIndex:m,index:p}),d=d||h.inRange(e.x,e.y,l))}),a&&!d?[]:o}var V5={modes:{index(t,e,n,a){const l=Wa(e,t),o=n.axis||"x",c=n.includeInvisible||!1,d=n.intersect?Of(t,l,o,a,c):kf(t,l,o,!1,a,c),h=[];return d.length?(t.getSortedVisibleDatasetMetas().forEach(m=>{const p=d[0].index,b=m.data[p];b&&!b.skip&&h.push({element:b,datasetIndex:m.index,index:p})}),h):[]},dataset(t,e,n,a){const l=Wa(e,t),o=n.axis||"xy",c=n.includeInvisible||!1;let d=n.intersect?Of(t,l,o,a,c):kf(t,l,o,!1,a,c);if(d.length>0){const h=d[0].datasetIndex,m=t.getDatasetMeta(h).data;d=[];for(let p=0;p<m.length;++p)d.push({element:m[p],datasetIndex:h,index:p})}return d},point(t,e,n,a){const l=Wa(e,t),o=n.axis||"xy",c=n.includeInvisible||!1;return Of(t,l,o,a,c)},nearest(t,e,n,a){const l=Wa(e,t),o=n.axis||"xy",c=n.includeInvisible||!1;return kf(t,l,o,n.intersect,a,c)},x(t,e,n,a){const l=Wa(e,t);return Lx(t,l,"x",n.intersect,a)},y(t,e,n,a){const l=Wa(e,t);return Lx(t,l,"y",n.intersect,a)}}};const sv=["left","top","right","bottom"];function ar(t,e){return t.filter(n=>n.pos===e)}function zx(t,e){return t.filter(n=>sv.indexOf(n.pos)===-1&&n.box.axis===e)}function sr(t,e){return t.sort((n,a)=>{const l=e?a:n,o=e?n:a;return l.weight===o.weight?l.index-o.index:l.weight-o.weight})}function q5(t){const e=[];let n,a,l,o,c,d;for(n=0,a=(t||[]).length;n<a;++n)l=t[n],{position:o,options:{stack:c,stackWeight:d=1}}=l,e.push({index:n,box:l,pos:o,horizontal:l.isHorizontal(),weight:l.weight,stack:c&&o+c,stackWeight:d});return e}function $5(t){const e={};for(const n of t){const{stack:a,pos:l,stackWeight:o}=n;if(!a||!sv.includes(l))continue;const c=e[a]||(e[a]={count:0,placed:0,weight:0,size:0});c.count++,c.weight+=o}return e}function Y5(t,e){const n=$5(t),{vBoxMaxWidth:a,hBoxMaxHeight:l}=e;let o,c,d;for(o=0,c=t.length;o<c;++o){d=t[o];const{fullSize:h}=d.box,m=n[d.stack],p=m&&d.stackWeight/m.weight;d.horizontal?(d.width=p?p*a:h&&e.availableWidth,d.height=l):(d.width=a,d.height=p?p*l:h&&e.availableHeight)}return n}function X5(t){const e=q5(t),n=sr(e.filter(m=>m.box.fullSize),!0),a=sr(ar(e,"left"),!0),l=sr(ar(e,"right")),o=sr(ar(e,"top"),!0),c=sr(ar(e,"bottom")),d=zx(e,"x"),h=zx(e,"y");return{fullSize:n,leftAndTop:a.concat(o),rightAndBottom:l.concat(h).concat(c).concat(d),chartArea:ar(e,"chartArea"),vertical:a.concat(l).concat(h),horizontal:o.concat(c).concat(d)}}function Bx(t,e,n,a){return Math.max(t[n],e[n])+Math.max(t[a],e[a])}function lv(t,e){t.top=Math.max(t.top,e.top),t.left=Math.max(t.left,e.left),t.bottom=Math.max(t.bottom,e.bottom),t.right=Math.max(t.right,e.right)}function G5(t,e,n,a){const{pos:l,box:o}=n,c=t.maxPadding;if(!Be(l)){n.size&&(t[l]-=n.size);const b=a[n.stack]||{size:0,count:1};b.size=Math.max(b.size,n.horizontal?o.height:o.width),n.size=b.size/b.count,t[l]+=n.size}o.getPadding&&lv(c,o.getPadding());const d=Math.max(0,e.outerWidth-Bx(c,t,"left","right")),h=Math.max(0,e.outerHeight-Bx(c,t,"top","bottom")),m=d!==t.w,p=h!==t.h;return t.w=d,t.h=h,n.horizontal?{same:m,other:p}:{same:p,other:m}}function W5(t){const e=t.maxPadding;function n(a){const l=Math.max(e[a]-t[a],0);return t[a]+=l,l}t.y+=n("top"),t.x+=n("left"),n("right"),n("bottom")}function Q5(t,e){const n=e.maxPadding;function a(l){const o={left:0,top:0,right:0,bottom:0};return l.forEach(c=>{o[c]=Math.max(e[c],n[c])}),o}return a(t?["left","right"]:["top","bottom"])}function fr(t,e,n,a){const l=[];let o,c,d,h,m,p;for(o=0,c=t.length,m=0;o<c;++o){d=t[o],h=d.box,h.update(d.width||e.w,d.height||e.h,Q5(d.horizontal,e));const{same:b,other:y}=G5(e,n,d,a);m|=b&&l.length,p=p||y,h.fullSize||l.push(d)}return m&&fr(l,e,n,a)||p}function rc(t,e,n,a,l){t.top=n,t.left=e,t.right=e+a,t.bottom=n+l,t.width=a,t.height=l}function Hx(t,e,n,a){const l=n.padding;let{x:o,y:c}=e;for(const d of t){const h=d.box,m=a[d.stack]||{placed:0,weight:1},p=d.stackWeight/m.weight||1;if(d.horizontal){const b=e.w*p,y=m.size||h.height;Er(m.start)&&(c=m.start),h.fullSize?rc(h,l.left,c,n.outerWidth-l.right-l.left,y):rc(h,e.left+m.placed,c,b,y),m.start=c,m.placed+=b,c=h.bottom}else{const b=e.h*p,y=m.size||h.width;Er(m.start)&&(o=m.start),h.fullSize?rc(h,o,l.top,y,n.outerHeight-l.bottom-l.top):rc(h,o,e.top+m.placed,y,b),m.start=o,m.placed+=b,o=h.right}}e.x=o,e.y=c}var Xt={addBox(t,e){t.boxes||(t.boxes=[]),e.fullSize=e.fullSize||!1,e.position=e.position||"top",e.weight=e.weight||0,e._layers=e._layers||function(){return[{z:0,draw(n){e.draw(n)}}]},t.boxes.push(e)},removeBox(t,e){const n=t.boxes?t.boxes.indexOf(e):-1;n!==-1&&t.boxes.splice(n,1)},configure(t,e,n){e.fullSize=n.fullSize,e.position=n.position,e.weight=n.weight},update(t,e,n,a){if(!t)return;const l=Gt(t.options.layout.padding),o=Math.max(e-l.width,0),c=Math.max(n-l.height,0),d=X5(t.boxes),h=d.vertical,m=d.horizontal;We(t.boxes,N=>{typeof N.beforeLayout=="function"&&N.beforeLayout()});const p=h.reduce((N,j)=>j.box.options&&j.box.options.display===!1?N:N+1,0)||1,b=Object.freeze({outerWidth:e,outerHeight:n,padding:l,availableWidth:o,availableHeight:c,vBoxMaxWidth:o/2/p,hBoxMaxHeight:c/2}),y=Object.assign({},l);lv(y,Gt(a));const v=Object.assign({maxPadding:y,w:o,h:c,x:l.left,y:l.top},l),w=Y5(h.concat(m),b);fr(d.fullSize,v,b,w),fr(h,v,b,w),fr(m,v,b,w)&&fr(h,v,b,w),W5(v),Hx(d.leftAndTop,v,b,w),v.x+=v.w,v.y+=v.h,Hx(d.rightAndBottom,v,b,w),t.chartArea={left:v.left,top:v.top,right:v.left+v.w,bottom:v.top+v.h,height:v.h,width:v.w},We(d.chartArea,N=>{const j=N.box;Object.assign(j,t.chartArea),j.update(v.w,v.h,{left:0,top:0,right:0,bottom:0})})}};class rv{acquireContext(e,n){}releaseContext(e){return!1}addEventListener(e,n,a){}removeEventListener(e,n,a){}getDevicePixelRatio(){return 1}getMaximumSize(e,n,a,l){return n=Math.max(0,n||e.width),a=a||e.height,{width:n,height:Math.max(0,l?Math.floor(n/l):a)}}isAttached(e){return!0}updateConfig(e){}}class Z5 extends rv{acquireContext(e){return e&&e.getContext&&e.getContext("2d")||null}updateConfig(e){e.options.animation=!1}}const Mc="$chartjs",K5={touchstart:"mousedown",touchmove:"mousemove",touchend:"mouseup",pointerenter:"mouseenter",pointerdown:"mousedown",pointermove:"mousemove",pointerup:"mouseup",pointerleave:"mouseout",pointerout:"mouseout"},Ux=t=>t===null||t==="";function I5(t,e){const n=t.style,a=t.getAttribute("height"),l=t.getAttribute("width");if(t[Mc]={initial:{height:a,width:l,style:{display:n.display,height:n.height,width:n.width}}},n.display=n.display||"block",n.boxSizing=n.boxSizing||"border-box",Ux(l)){const o=_x(t,"width");o!==void 0&&(t.width=o)}if(Ux(a))if(t.style.height==="")t.height=t.width/(e||2);else{const o=_x(t,"height");o!==void 0&&(t.height=o)}return t}const ov=e5?{passive:!0}:!1;function J5(t,e,n){t&&t.addEventListener(e,n,ov)}function e4(t,e,n){t&&t.canvas&&t.canvas.removeEventListener(e,n,ov)}function t4(t,e){const n=K5[t.type]||t.type,{x:a,y:l}=Wa(t,e);return{type:n,chart:e,native:t,x:a!==void 0?a:null,y:l!==void 0?l:null}}function Fc(t,e){for(const n of t)if(n===e||n.contains(e))return!0}function n4(t,e,n){const a=t.canvas,l=new MutationObserver(o=>{let c=!1;for(const d of o)c=c||Fc(d.addedNodes,a),c=c&&!Fc(d.removedNodes,a);c&&n()});return l.observe(document,{childList:!0,subtree:!0}),l}function i4(t,e,n){const a=t.canvas,l=new MutationObserver(o=>{let c=!1;for(const d of o)c=c||Fc(d.removedNodes,a),c=c&&!Fc(d.addedNodes,a);c&&n()});return l.observe(document,{childList:!0,subtree:!0}),l}const Dr=new Map;let Px=0;function cv(){const t=window.devicePixelRatio;t!==Px&&(Px=t,Dr.forEach((e,n)=>{n.currentDevicePixelRatio!==t&&e()}))}function a4(t,e){Dr.size||window.addEventListener("resize",cv),Dr.set(t,e)}function s4(t){Dr.delete(t),Dr.size||window.removeEventListener("resize",cv)}function l4(t,e,n){const a=t.canvas,l=a&&Ph(a);if(!l)return;const o=Uy((d,h)=>{const m=l.clientWidth;n(d,h),m<l.clientWidth&&n()},window),c=new ResizeObserver(d=>{const h=d[0],m=h.contentRect.width,p=h.contentRect.height;m===0&&p===0||o(m,p)});return c.observe(l),a4(t,o),c}function Lf(t,e,n){n&&n.disconnect(),e==="resize"&&s4(t)}function r4(t,e,n){const a=t.canvas,l=Uy(o=>{t.ctx!==null&&n(t4(o,t))},t);return J5(a,e,l),l}class o4 extends rv{acquireContext(e,n){const a=e&&e.getContext&&e.getContext("2d");return a&&a.canvas===e?(I5(e,n),a):null}releaseContext(e){const n=e.canvas;if(!n[Mc])return!1;const a=n[Mc].initial;["height","width"].forEach(o=>{const c=a[o];Le(c)?n.removeAttribute(o):n.setAttribute(o,c)});const l=a.style||{};return Object.keys(l).forEach(o=>{n.style[o]=l[o]}),n.width=n.width,delete n[Mc],!0}addEventListener(e,n,a){this.removeEventListener(e,n);const l=e.$proxies||(e.$proxies={}),c={attach:n4,detach:i4,resize:l4}[n]||r4;l[n]=c(e,n,a)}removeEventListener(e,n){const a=e.$proxies||(e.$proxies={}),l=a[n];if(!l)return;({attach:Lf,detach:Lf,resize:Lf}[n]||e4)(e,n,l),a[n]=void 0}getDevicePixelRatio(){return window.devicePixelRatio}getMaximumSize(e,n,a,l){return JN(e,n,a,l)}isAttached(e){const n=e&&Ph(e);return!!(n&&n.isConnected)}}function c4(t){return!Uh()||typeof OffscreenCanvas<"u"&&t instanceof OffscreenCanvas?Z5:o4}class $n{constructor(){ae(this,"x");ae(this,"y");ae(this,"active",!1);ae(this,"options");ae(this,"$animations")}tooltipPosition(e){const{x:n,y:a}=this.getProps(["x","y"],e);return{x:n,y:a}}hasValue(){return Ws(this.x)&&Ws(this.y)}getProps(e,n){const a=this.$animations;if(!n||!a)return this;const l={};return e.forEach(o=>{l[o]=a[o]&&a[o].active()?a[o]._to:this[o]}),l}}ae($n,"defaults",{}),ae($n,"defaultRoutes");function u4(t,e){const n=t.options.ticks,a=d4(t),l=Math.min(n.maxTicksLimit||a,a),o=n.major.enabled?h4(e):[],c=o.length,d=o[0],h=o[c-1],m=[];if(c>l)return m4(e,m,o,c/l),m;const p=f4(o,e,l);if(c>0){let b,y;const v=c>1?Math.round((h-d)/(c-1)):null;for(oc(e,m,p,Le(v)?0:d-v,d),b=0,y=c-1;b<y;b++)oc(e,m,p,o[b],o[b+1]);return oc(e,m,p,h,Le(v)?e.length:h+v),m}return oc(e,m,p),m}function d4(t){const e=t.options.offset,n=t._tickSize(),a=t._length/n+(e?0:1),l=t._maxLength/n;return Math.floor(Math.min(a,l))}function f4(t,e,n){const a=g4(t),l=e.length/n;if(!a)return Math.max(l,1);const o=nN(a);for(let c=0,d=o.length-1;c<d;c++){const h=o[c];if(h>l)return h}return Math.max(l,1)}function h4(t){const e=[];let n,a;for(n=0,a=t.length;n<a;n++)t[n].major&&e.push(n);return e}function m4(t,e,n,a){let l=0,o=n[0],c;for(a=Math.ceil(a),c=0;c<t.length;c++)c===o&&(e.push(t[c]),l++,o=n[l*a])}function oc(t,e,n,a,l){const o=Re(a,0),c=Math.min(Re(l,t.length),t.length);let d=0,h,m,p;for(n=Math.ceil(n),l&&(h=l-a,n=h/Math.floor(h/n)),p=o;p<0;)d++,p=Math.round(o+d*n);for(m=Math.max(o,0);m<c;m++)m===p&&(e.push(t[m]),d++,p=Math.round(o+d*n))}function g4(t){const e=t.length;let n,a;if(e<2)return!1;for(a=t[0],n=1;n<e;++n)if(t[n]-t[n-1]!==a)return!1;return a}const p4=t=>t==="left"?"right":t==="right"?"left":t,Fx=(t,e,n)=>e==="top"||e==="left"?t[e]+n:t[e]-n,Vx=(t,e)=>Math.min(e||t,t);function qx(t,e){const n=[],a=t.length/e,l=t.length;let o=0;for(;o<l;o+=a)n.push(t[Math.floor(o)]);return n}function x4(t,e,n){const a=t.ticks.length,l=Math.min(e,a-1),o=t._startPixel,c=t._endPixel,d=1e-6;let h=t.getPixelForTick(l),m;if(!(n&&(a===1?m=Math.max(h-o,c-h):e===0?m=(t.getPixelForTick(1)-h)/2:m=(h-t.getPixelForTick(l-1))/2,h+=l<e?m:-m,h<o-d||h>c+d)))return h}function b4(t,e){We(t,n=>{const a=n.gc,l=a.length/2;let o;if(l>e){for(o=0;o<l;++o)delete n.data[a[o]];a.splice(0,l)}})}function lr(t){return t.drawTicks?t.tickLength:0}function $x(t,e){if(!t.display)return 0;const n=Nt(t.font,e),a=Gt(t.padding);return(st(t.text)?t.text.length:1)*n.lineHeight+a.height}function y4(t,e){return xa(t,{scale:e,type:"scale"})}function v4(t,e,n){return xa(t,{tick:n,index:e,type:"tick"})}function w4(t,e,n){let a=Oh(t);return(n&&e!=="right"||!n&&e==="right")&&(a=p4(a)),a}function _4(t,e,n,a){const{top:l,left:o,bottom:c,right:d,chart:h}=t,{chartArea:m,scales:p}=h;let b=0,y,v,w;const N=c-l,j=d-o;if(t.isHorizontal()){if(v=$t(a,o,d),Be(n)){const M=Object.keys(n)[0],T=n[M];w=p[M].getPixelForValue(T)+N-e}else n==="center"?w=(m.bottom+m.top)/2+N-e:w=Fx(t,n,e);y=d-o}else{if(Be(n)){const M=Object.keys(n)[0],T=n[M];v=p[M].getPixelForValue(T)-j+e}else n==="center"?v=(m.left+m.right)/2-j+e:v=Fx(t,n,e);w=$t(a,c,l),b=n==="left"?-bt:bt}return{titleX:v,titleY:w,maxWidth:y,rotation:b}}class rs extends $n{constructor(e){super(),this.id=e.id,this.type=e.type,this.options=void 0,this.ctx=e.ctx,this.chart=e.chart,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this._margins={left:0,right:0,top:0,bottom:0},this.maxWidth=void 0,this.maxHeight=void 0,this.paddingTop=void 0,this.paddingBottom=void 0,this.paddingLeft=void 0,this.paddingRight=void 0,this.axis=void 0,this.labelRotation=void 0,this.min=void 0,this.max=void 0,this._range=void 0,this.ticks=[],this._gridLineItems=null,this._labelItems=null,this._labelSizes=null,this._length=0,this._maxLength=0,this._longestTextCache={},this._startPixel=void 0,this._endPixel=void 0,this._reversePixels=!1,this._userMax=void 0,this._userMin=void 0,this._suggestedMax=void 0,this._suggestedMin=void 0,this._ticksLength=0,this._borderValue=0,this._cache={},this._dataLimitsCached=!1,this.$context=void 0}init(e){this.options=e.setContext(this.getContext()),this.axis=e.axis,this._userMin=this.parse(e.min),this._userMax=this.parse(e.max),this._suggestedMin=this.parse(e.suggestedMin),this._suggestedMax=this.parse(e.suggestedMax)}parse(e,n){return e}getUserBounds(){let{_userMin:e,_userMax:n,_suggestedMin:a,_suggestedMax:l}=this;return e=fn(e,Number.POSITIVE_INFINITY),n=fn(n,Number.NEGATIVE_INFINITY),a=fn(a,Number.POSITIVE_INFINITY),l=fn(l,Number.NEGATIVE_INFINITY),{min:fn(e,a),max:fn(n,l),minDefined:pt(e),maxDefined:pt(n)}}getMinMax(e){let{min:n,max:a,minDefined:l,maxDefined:o}=this.getUserBounds(),c;if(l&&o)return{min:n,max:a};const d=this.getMatchingVisibleMetas();for(let h=0,m=d.length;h<m;++h)c=d[h].controller.getMinMax(this,e),l||(n=Math.min(n,c.min)),o||(a=Math.max(a,c.max));return n=o&&n>a?a:n,a=l&&n>a?n:a,{min:fn(n,fn(a,n)),max:fn(a,fn(n,a))}}getPadding(){return{left:this.paddingLeft||0,top:this.paddingTop||0,right:this.paddingRight||0,bottom:this.paddingBottom||0}}getTicks(){return this.ticks}getLabels(){const e=this.chart.data;return this.options.labels||(this.isHorizontal()?e.xLabels:e.yLabels)||e.labels||[]}getLabelItems(e=this.chart.chartArea){return this._labelItems||(this._labelItems=this._computeLabelItems(e))}beforeLayout(){this._cache={},this._dataLimitsCached=!1}beforeUpdate(){tt(this.options.beforeUpdate,[this])}update(e,n,a){const{beginAtZero:l,grace:o,ticks:c}=this.options,d=c.sampleSize;this.beforeUpdate(),this.maxWidth=e,this.maxHeight=n,this._margins=a=Object.assign({left:0,right:0,top:0,bottom:0},a),this.ticks=null,this._labelSizes=null,this._gridLineItems=null,this._labelItems=null,this.beforeSetDimensions(),this.setDimensions(),this.afterSetDimensions(),this._maxLength=this.isHorizontal()?this.width+a.left+a.right:this.height+a.top+a.bottom,this._dataLimitsCached||(this.beforeDataLimits(),this.determineDataLimits(),this.afterDataLimits(),this._range=AN(this,o,l),this._dataLimitsCached=!0),this.beforeBuildTicks(),this.ticks=this.buildTicks()||[],this.afterBuildTicks();const h=d<this.ticks.length;this._convertTicksToLabels(h?qx(this.ticks,d):this.ticks),this.configure(),this.beforeCalculateLabelRotation(),this.calculateLabelRotation(),this.afterCalculateLabelRotation(),c.display&&(c.autoSkip||c.source==="auto")&&(this.ticks=u4(this,this.ticks),this._labelSizes=null,this.afterAutoSkip()),h&&this._convertTicksToLabels(this.ticks),this.beforeFit(),this.fit(),this.afterFit(),this.afterUpdate()}configure(){let e=this.options.reverse,n,a;this.isHorizontal()?(n=this.left,a=this.right):(n=this.top,a=this.bottom,e=!e),this._startPixel=n,this._endPixel=a,this._reversePixels=e,this._length=a-n,this._alignToPixels=this.options.alignToPixels}afterUpdate(){tt(this.options.afterUpdate,[this])}beforeSetDimensions(){tt(this.options.beforeSetDimensions,[this])}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=0,this.right=this.width):(this.height=this.maxHeight,this.top=0,this.bottom=this.height),this.paddingLeft=0,this.paddingTop=0,this.paddingRight=0,this.paddingBottom=0}afterSetDimensions(){tt(this.options.afterSetDimensions,[this])}_callHooks(e){this.chart.notifyPlugins(e,this.getContext()),tt(this.options[e],[this])}beforeDataLimits(){this._callHooks("beforeDataLimits")}determineDataLimits(){}afterDataLimits(){this._callHooks("afterDataLimits")}beforeBuildTicks(){this._callHooks("beforeBuildTicks")}buildTicks(){return[]}afterBuildTicks(){this._callHooks("afterBuildTicks")}beforeTickToLabelConversion(){tt(this.options.beforeTickToLabelConversion,[this])}generateTickLabels(e){const n=this.options.ticks;let a,l,o;for(a=0,l=e.length;a<l;a++)o=e[a],o.label=tt(n.callback,[o.value,a,e],this)}afterTickToLabelConversion(){tt(this.options.afterTickToLabelConversion,[this])}beforeCalculateLabelRotation(){tt(this.options.beforeCalculateLabelRotation,[this])}calculateLabelRotation(){const e=this.options,n=e.ticks,a=Vx(this.ticks.length,e.ticks.maxTicksLimit),l=n.minRotation||0,o=n.maxRotation;let c=l,d,h,m;if(!this._isVisible()||!n.display||l>=o||a<=1||!this.isHorizontal()){this.labelRotation=l;return}const p=this._getLabelSizes(),b=p.widest.width,y=p.highest.height,v=Rt(this.chart.width-b,0,this.maxWidth);d=e.offset?this.maxWidth/a:v/(a-1),b+6>d&&(d=v/(a-(e.offset?.5:1)),h=this.maxHeight-lr(e.grid)-n.padding-$x(e.title,this.chart.options.font),m=Math.sqrt(b*b+y*y),c=Ah(Math.min(Math.asin(Rt((p.highest.height+6)/d,-1,1)),Math.asin(Rt(h/m,-1,1))-Math.asin(Rt(y/m,-1,1)))),c=Math.max(l,Math.min(o,c))),this.labelRotation=c}afterCalculateLabelRotation(){tt(this.options.afterCalculateLabelRotation,[this])}afterAutoSkip(){}beforeFit(){tt(this.options.beforeFit,[this])}fit(){const e={width:0,height:0},{chart:n,options:{ticks:a,title:l,grid:o}}=this,c=this._isVisible(),d=this.isHorizontal();if(c){const h=$x(l,n.options.font);if(d?(e.width=this.maxWidth,e.height=lr(o)+h):(e.height=this.maxHeight,e.width=lr(o)+h),a.display&&this.ticks.length){const{first:m,last:p,widest:b,highest:y}=this._getLabelSizes(),v=a.padding*2,w=Vn(this.labelRotation),N=Math.cos(w),j=Math.sin(w);if(d){const M=a.mirror?0:j*b.width+N*y.height;e.height=Math.min(this.maxHeight,e.height+M+v)}else{const M=a.mirror?0:N*b.width+j*y.height;e.width=Math.min(this.maxWidth,e.width+M+v)}this._calculatePadding(m,p,j,N)}}this._handleMargins(),d?(this.width=this._length=n.width-this._margins.left-this._margins.right,this.height=e.height):(this.width=e.width,this.height=this._length=n.height-this._margins.top-this._margins.bottom)}_calculatePadding(e,n,a,l){const{ticks:{align:o,padding:c},position:d}=this.options,h=this.labelRotation!==0,m=d!=="top"&&this.axis==="x";if(this.isHorizontal()){const p=this.getPixelForTick(0)-this.left,b=this.right-this.getPixelForTick(this.ticks.length-1);let y=0,v=0;h?m?(y=l*e.width,v=a*n.height):(y=a*e.height,v=l*n.width):o==="start"?v=n.width:o==="end"?y=e.width:o!=="inner"&&(y=e.width/2,v=n.width/2),this.paddingLeft=Math.max((y-p+c)*this.width/(this.width-p),0),this.paddingRight=Math.max((v-b+c)*this.width/(this.width-b),0)}else{let p=n.height/2,b=e.height/2;o==="start"?(p=0,b=e.height):o==="end"&&(p=n.height,b=0),this.paddingTop=p+c,this.paddingBottom=b+c}}_handleMargins(){this._margins&&(this._margins.left=Math.max(this.paddingLeft,this._margins.left),this._margins.top=Math.max(this.paddingTop,this._margins.top),this._margins.right=Math.max(this.paddingRight,this._margins.right),this._margins.bottom=Math.max(this.paddingBottom,this._margins.bottom))}afterFit(){tt(this.options.afterFit,[this])}isHorizontal(){const{axis:e,position:n}=this.options;return n==="top"||n==="bottom"||e==="x"}isFullSize(){return this.options.fullSize}_convertTicksToLabels(e){this.beforeTickToLabelConversion(),this.generateTickLabels(e);let n,a;for(n=0,a=e.length;n<a;n++)Le(e[n].label)&&(e.splice(n,1),a--,n--);this.afterTickToLabelConversion()}_getLabelSizes(){let e=this._labelSizes;if(!e){const n=this.options.ticks.sampleSize;let a=this.ticks;n<a.length&&(a=qx(a,n)),this._labelSizes=e=this._computeLabelSizes(a,a.length,this.options.ticks.maxTicksLimit)}return e}_computeLabelSizes(e,n,a){const{ctx:l,_longestTextCache:o}=this,c=[],d=[],h=Math.floor(n/Vx(n,a));let m=0,p=0,b,y,v,w,N,j,M,T,A,C,S;for(b=0;b<n;b+=h){if(w=e[b].label,N=this._resolveTickFontOptions(b),l.font=j=N.string,M=o[j]=o[j]||{data:{},gc:[]},T=N.lineHeight,A=C=0,!Le(w)&&!st(w))A=Uc(l,M.data,M.gc,A,w),C=T;else if(st(w))for(y=0,v=w.length;y<v;++y)S=w[y],!Le(S)&&!st(S)&&(A=Uc(l,M.data,M.gc,A,S),C+=T);c.push(A),d.push(C),m=Math.max(A,m),p=Math.max(C,p)}b4(o,n);const k=c.indexOf(m),F=d.indexOf(p),$=V=>({width:c[V]||0,height:d[V]||0});return{first:$(0),last:$(n-1),widest:$(k),highest:$(F),widths:c,heights:d}}getLabelForValue(e){return e}getPixelForValue(e,n){return NaN}getValueForPixel(e){}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getPixelForDecimal(e){this._reversePixels&&(e=1-e);const n=this._startPixel+e*this._length;return lN(this._alignToPixels?Ya(this.chart,n,0):n)}getDecimalForPixel(e){const n=(e-this._startPixel)/this._length;return this._reversePixels?1-n:n}getBasePixel(){return this.getPixelForValue(this.getBaseValue())}getBaseValue(){const{min:e,max:n}=this;return e<0&&n<0?n:e>0&&n>0?e:0}getContext(e){const n=this.ticks||[];if(e>=0&&e<n.length){const a=n[e];return a.$context||(a.$context=v4(this.getContext(),e,a))}return this.$context||(this.$context=y4(this.chart.getContext(),this))}_tickSize(){const e=this.options.ticks,n=Vn(this.labelRotation),a=Math.abs(Math.cos(n)),l=Math.abs(Math.sin(n)),o=this._getLabelSizes(),c=e.autoSkipPadding||0,d=o?o.widest.width+c:0,h=o?o.highest.height+c:0;return this.isHorizontal()?h*a>d*l?d/a:h/l:h*l<d*a?h/a:d/l}_isVisible(){const e=this.options.display;return e!=="auto"?!!e:this.getMatchingVisibleMetas().length>0}_computeGridLineItems(e){const n=this.axis,a=this.chart,l=this.options,{grid:o,position:c,border:d}=l,h=o.offset,m=this.isHorizontal(),b=this.ticks.length+(h?1:0),y=lr(o),v=[],w=d.setContext(this.getContext()),N=w.display?w.width:0,j=N/2,M=function(Q){return Ya(a,Q,N)};let T,A,C,S,k,F,$,V,te,se,ee,ge;if(c==="top")T=M(this.bottom),F=this.bottom-y,V=T-j,se=M(e.top)+j,ge=e.bottom;else if(c==="bottom")T=M(this.top),se=e.top,ge=M(e.bottom)-j,F=T+j,V=this.top+y;else if(c==="left")T=M(this.right),k=this.right-y,$=T-j,te=M(e.left)+j,ee=e.right;else if(c==="right")T=M(this.left),te=e.left,ee=M(e.right)-j,k=T+j,$=this.left+y;else if(n==="x"){if(c==="center")T=M((e.top+e.bottom)/2+.5);else if(Be(c)){const Q=Object.keys(c)[0],ie=c[Q];T=M(this.chart.scales[Q].getPixelForValue(ie))}se=e.top,ge=e.bottom,F=T+j,V=F+y}else if(n==="y"){if(c==="center")T=M((e.left+e.right)/2);else if(Be(c)){const Q=Object.keys(c)[0],ie=c[Q];T=M(this.chart.scales[Q].getPixelForValue(ie))}k=T-j,$=k-y,te=e.left,ee=e.right}const Me=Re(l.ticks.maxTicksLimit,b),K=Math.max(1,Math.ceil(b/Me));for(A=0;A<b;A+=K){const Q=this.getContext(A),ie=o.setContext(Q),re=d.setContext(Q),pe=ie.lineWidth,O=ie.color,I=re.dash||[],ue=re.dashOffset,de=ie.tickWidth,le=ie.tickColor,Ne=ie.tickBorderDash||[],je=ie.tickBorderDashOffset;C=x4(this,A,h),C!==void 0&&(S=Ya(a,C,pe),m?k=$=te=ee=S:F=V=se=ge=S,v.push({tx1:k,ty1:F,tx2:$,ty2:V,x1:te,y1:se,x2:ee,y2:ge,width:pe,color:O,borderDash:I,borderDashOffset:ue,tickWidth:de,tickColor:le,tickBorderDash:Ne,tickBorderDashOffset:je}))}return this._ticksLength=b,this._borderValue=T,v}_computeLabelItems(e){const n=this.axis,a=this.options,{position:l,ticks:o}=a,c=this.isHorizontal(),d=this.ticks,{align:h,crossAlign:m,padding:p,mirror:b}=o,y=lr(a.grid),v=y+p,w=b?-p:v,N=-Vn(this.labelRotation),j=[];let M,T,A,C,S,k,F,$,V,te,se,ee,ge="middle";if(l==="top")k=this.bottom-w,F=this._getXAxisLabelAlignment();else if(l==="bottom")k=this.top+w,F=this._getXAxisLabelAlignment();else if(l==="left"){const K=this._getYAxisLabelAlignment(y);F=K.textAlign,S=K.x}else if(l==="right"){const K=this._getYAxisLabelAlignment(y);F=K.textAlign,S=K.x}else if(n==="x"){if(l==="center")k=(e.top+e.bottom)/2+v;else if(Be(l)){const K=Object.keys(l)[0],Q=l[K];k=this.chart.scales[K].getPixelForValue(Q)+v}F=this._getXAxisLabelAlignment()}else if(n==="y"){if(l==="center")S=(e.left+e.right)/2-v;else if(Be(l)){const K=Object.keys(l)[0],Q=l[K];S=this.chart.scales[K].getPixelForValue(Q)}F=this._getYAxisLabelAlignment(y).textAlign}n==="y"&&(h==="start"?ge="top":h==="end"&&(ge="bottom"));const Me=this._getLabelSizes();for(M=0,T=d.length;M<T;++M){A=d[M],C=A.label;const K=o.setContext(this.getContext(M));$=this.getPixelForTick(M)+o.labelOffset,V=this._resolveTickFontOptions(M),te=V.lineHeight,se=st(C)?C.length:1;const Q=se/2,ie=K.color,re=K.textStrokeColor,pe=K.textStrokeWidth;let O=F;c?(S=$,F==="inner"&&(M===T-1?O=this.options.reverse?"left":"right":M===0?O=this.options.reverse?"right":"left":O="center"),l==="top"?m==="near"||N!==0?ee=-se*te+te/2:m==="center"?ee=-Me.highest.height/2-Q*te+te:ee=-Me.highest.height+te/2:m==="near"||N!==0?ee=te/2:m==="center"?ee=Me.highest.height/2-Q*te:ee=Me.highest.height-se*te,b&&(ee*=-1),N!==0&&!K.showLabelBackdrop&&(S+=te/2*Math.sin(N))):(k=$,ee=(1-se)*te/2);let I;if(K.showLabelBackdrop){const ue=Gt(K.backdropPadding),de=Me.heights[M],le=Me.widths[M];let Ne=ee-ue.top,je=0-ue.left;switch(ge){case"middle":Ne-=de/2;break;case"bottom":Ne-=de;break}switch(F){case"center":je-=le/2;break;case"right":je-=le;break;case"inner":M===T-1?je-=le:M>0&&(je-=le/2);break}I={left:je,top:Ne,width:le+ue.width,height:de+ue.height,color:K.backdropColor}}j.push({label:C,font:V,textOffset:ee,options:{rotation:N,color:ie,strokeColor:re,strokeWidth:pe,textAlign:O,textBaseline:ge,translation:[S,k],backdrop:I}})}return j}_getXAxisLabelAlignment(){const{position:e,ticks:n}=this.options;if(-Vn(this.labelRotation))return e==="top"?"left":"right";let l="center";return n.align==="start"?l="left":n.align==="end"?l="right":n.align==="inner"&&(l="inner"),l}_getYAxisLabelAlignment(e){const{position:n,ticks:{crossAlign:a,mirror:l,padding:o}}=this.options,c=this._getLabelSizes(),d=e+o,h=c.widest.width;let m,p;return n==="left"?l?(p=this.right+o,a==="near"?m="left":a==="center"?(m="center",p+=h/2):(m="right",p+=h)):(p=this.right-d,a==="near"?m="right":a==="center"?(m="center",p-=h/2):(m="left",p=this.left)):n==="right"?l?(p=this.left+o,a==="near"?m="right":a==="center"?(m="center",p-=h/2):(m="left",p-=h)):(p=this.left+d,a==="near"?m="left":a==="center"?(m="center",p+=h/2):(m="right",p=this.right)):m="right",{textAlign:m,x:p}}_computeLabelArea(){if(this.options.ticks.mirror)return;const e=this.chart,n=this.options.position;if(n==="left"||n==="right")return{top:0,left:this.left,bottom:e.height,right:this.right};if(n==="top"||n==="bottom")return{top:this.top,left:0,bottom:this.bottom,right:e.width}}drawBackground(){const{ctx:e,options:{backgroundColor:n},left:a,top:l,width:o,height:c}=this;n&&(e.save(),e.fillStyle=n,e.fillRect(a,l,o,c),e.restore())}getLineWidthForValue(e){const n=this.options.grid;if(!this._isVisible()||!n.display)return 0;const l=this.ticks.findIndex(o=>o.value===e);return l>=0?n.setContext(this.getContext(l)).lineWidth:0}drawGrid(e){const n=this.options.grid,a=this.ctx,l=this._gridLineItems||(this._gridLineItems=this._computeGridLineItems(e));let o,c;const d=(h,m,p)=>{!p.width||!p.color||(a.save(),a.lineWidth=p.width,a.strokeStyle=p.color,a.setLineDash(p.borderDash||[]),a.lineDashOffset=p.borderDashOffset,a.beginPath(),a.moveTo(h.x,h.y),a.lineTo(m.x,m.y),a.stroke(),a.restore())};if(n.display)for(o=0,c=l.length;o<c;++o){const h=l[o];n.drawOnChartArea&&d({x:h.x1,y:h.y1},{x:h.x2,y:h.y2},h),n.drawTicks&&d({x:h.tx1,y:h.ty1},{x:h.tx2,y:h.ty2},{color:h.tickColor,width:h.tickWidth,borderDash:h.tickBorderDash,borderDashOffset:h.tickBorderDashOffset})}}drawBorder(){const{chart:e,ctx:n,options:{border:a,grid:l}}=this,o=a.setContext(this.getContext()),c=a.display?o.width:0;if(!c)return;const d=l.setContext(this.getContext(0)).lineWidth,h=this._borderValue;let m,p,b,y;this.isHorizontal()?(m=Ya(e,this.left,c)-c/2,p=Ya(e,this.right,d)+d/2,b=y=h):(b=Ya(e,this.top,c)-c/2,y=Ya(e,this.bottom,d)+d/2,m=p=h),n.save(),n.lineWidth=o.width,n.strokeStyle=o.color,n.beginPath(),n.moveTo(m,b),n.lineTo(p,y),n.stroke(),n.restore()}drawLabels(e){if(!this.options.ticks.display)return;const a=this.ctx,l=this._computeLabelArea();l&&tu(a,l);const o=this.getLabelItems(e);for(const c of o){const d=c.options,h=c.font,m=c.label,p=c.textOffset;ss(a,m,0,p,h,d)}l&&nu(a)}drawTitle(){const{ctx:e,options:{position:n,title:a,reverse:l}}=this;if(!a.display)return;const o=Nt(a.font),c=Gt(a.padding),d=a.align;let h=o.lineHeight/2;n==="bottom"||n==="center"||Be(n)?(h+=c.bottom,st(a.text)&&(h+=o.lineHeight*(a.text.length-1))):h+=c.top;const{titleX:m,titleY:p,maxWidth:b,rotation:y}=_4(this,h,n,d);ss(e,a.text,0,0,o,{color:a.color,maxWidth:b,rotation:y,textAlign:w4(d,n,l),textBaseline:"middle",translation:[m,p]})}draw(e){this._isVisible()&&(this.drawBackground(),this.drawGrid(e),this.drawBorder(),this.drawTitle(),this.drawLabels(e))}_layers(){const e=this.options,n=e.ticks&&e.ticks.z||0,a=Re(e.grid&&e.grid.z,-1),l=Re(e.border&&e.border.z,0);return!this._isVisible()||this.draw!==rs.prototype.draw?[{z:n,draw:o=>{this.draw(o)}}]:[{z:a,draw:o=>{this.drawBackground(),this.drawGrid(o),this.drawTitle()}},{z:l,draw:()=>{this.drawBorder()}},{z:n,draw:o=>{this.drawLabels(o)}}]}getMatchingVisibleMetas(e){const n=this.chart.getSortedVisibleDatasetMetas(),a=this.axis+"AxisID",l=[];let o,c;for(o=0,c=n.length;o<c;++o){const d=n[o];d[a]===this.id&&(!e||d.type===e)&&l.push(d)}return l}_resolveTickFontOptions(e){const n=this.options.ticks.setContext(this.getContext(e));return Nt(n.font)}_maxDigits(){const e=this._resolveTickFontOptions(0).lineHeight;return(this.isHorizontal()?this.width:this.height)/e}}class cc{constructor(e,n,a){this.type=e,this.scope=n,this.override=a,this.items=Object.create(null)}isForType(e){return Object.prototype.isPrototypeOf.call(this.type.prototype,e.prototype)}register(e){const n=Object.getPrototypeOf(e);let a;N4(n)&&(a=this.register(n));const l=this.items,o=e.id,c=this.scope+"."+o;if(!o)throw new Error("class does not have id: "+e);return o in l||(l[o]=e,S4(e,c,a),this.override&&lt.override(e.id,e.overrides)),c}get(e){return this.items[e]}unregister(e){const n=this.items,a=e.id,l=this.scope;a in n&&delete n[a],l&&a in lt[l]&&(delete lt[l][a],this.override&&delete as[a])}}function S4(t,e,n){const a=Nr(Object.create(null),[n?lt.get(n):{},lt.get(e),t.defaults]);lt.set(e,a),t.defaultRoutes&&j4(e,t.defaultRoutes),t.descriptors&&lt.describe(e,t.descriptors)}function j4(t,e){Object.keys(e).forEach(n=>{const a=n.split("."),l=a.pop(),o=[t].concat(a).join("."),c=e[n].split("."),d=c.pop(),h=c.join(".");lt.route(o,l,h,d)})}function N4(t){return"id"in t&&"defaults"in t}class E4{constructor(){this.controllers=new cc(qn,"datasets",!0),this.elements=new cc($n,"elements"),this.plugins=new cc(Object,"plugins"),this.scales=new cc(rs,"scales"),this._typedRegistries=[this.controllers,this.scales,this.elements]}add(...e){this._each("register",e)}remove(...e){this._each("unregister",e)}addControllers(...e){this._each("register",e,this.controllers)}addElements(...e){this._each("register",e,this.elements)}addPlugins(...e){this._each("register",e,this.plugins)}addScales(...e){this._each("register",e,this.scales)}getController(e){return this._get(e,this.controllers,"controller")}getElement(e){return this._get(e,this.elements,"element")}getPlugin(e){return this._get(e,this.plugins,"plugin")}getScale(e){return this._get(e,this.scales,"scale")}removeControllers(...e){this._each("unregister",e,this.controllers)}removeElements(...e){this._each("unregister",e,this.elements)}removePlugins(...e){this._each("unregister",e,this.plugins)}removeScales(...e){this._each("unregister",e,this.scales)}_each(e,n,a){[...n].forEach(l=>{const o=a||this._getRegistryForType(l);a||o.isForType(l)||o===this.plugins&&l.id?this._exec(e,o,l):We(l,c=>{const d=a||this._getRegistryForType(c);this._exec(e,d,c)})})}_exec(e,n,a){const l=Rh(e);tt(a["before"+l],[],a),n[e](a),tt(a["after"+l],[],a)}_getRegistryForType(e){for(let n=0;n<this._typedRegistries.length;n++){const a=this._typedRegistries[n];if(a.isForType(e))return a}return this.plugins}_get(e,n,a){const l=n.get(e);if(l===void 0)throw new Error('"'+e+'" is not a registered '+a+".");return l}}var ti=new E4;class M4{constructor(){this._init=[]}notify(e,n,a,l){n==="beforeInit"&&(this._init=this._createDescriptors(e,!0),this._notify(this._init,e,"install"));const o=l?this._descriptors(e).filter(l):this._descriptors(e),c=this._notify(o,e,n,a);return n==="afterDestroy"&&(this._notify(o,e,"stop"),this._notify(this._init,e,"uninstall")),c}_notify(e,n,a,l){l=l||{};for(const o of e){const c=o.plugin,d=c[a],h=[n,l,o.options];if(tt(d,h,c)===!1&&l.cancelable)return!1}return!0}invalidate(){Le(this._cache)||(this._oldCache=this._cache,this._cache=void 0)}_descriptors(e){if(this._cache)return this._cache;const n=this._cache=this._createDescriptors(e);return this._notifyStateChanges(e),n}_createDescriptors(e,n){const a=e&&e.config,l=Re(a.options&&a.options.plugins,{}),o=T4(a);return l===!1&&!n?[]:R4(e,o,l,n)}_notifyStateChanges(e){const n=this._oldCache||[],a=this._cache,l=(o,c)=>o.filter(d=>!c.some(h=>d.plugin.id===h.plugin.id));this._notify(l(n,a),e,"stop"),this._notify(l(a,n),e,"start")}}function T4(t){const e={},n=[],a=Object.keys(ti.plugins.items);for(let o=0;o<a.length;o++)n.push(ti.getPlugin(a[o]));const l=t.plugins||[];for(let o=0;o<l.length;o++){const c=l[o];n.indexOf(c)===-1&&(n.push(c),e[c.id]=!0)}return{plugins:n,localIds:e}}function D4(t,e){return!e&&t===!1?null:t===!0?{}:t}function R4(t,{plugins:e,localIds:n},a,l){const o=[],c=t.getContext();for(const d of e){const h=d.id,m=D4(a[h],l);m!==null&&o.push({plugin:d,options:A4(t.config,{plugin:d,local:n[h]},m,c)})}return o}function A4(t,{plugin:e,local:n},a,l){const o=t.pluginScopeKeys(e),c=t.getOptionScopes(a,o);return n&&e.defaults&&c.push(e.defaults),t.createResolver(c,l,[""],{scriptable:!1,indexable:!1,allKeys:!0})}function nh(t,e){const n=lt.datasets[t]||{};return((e.datasets||{})[t]||{}).indexAxis||e.indexAxis||n.indexAxis||"x"}function C4(t,e){let n=t;return t==="_index_"?n=e:t==="_value_"&&(n=e==="x"?"y":"x"),n}function O4(t,e){return t===e?"_index_":"_value_"}function Yx(t){if(t==="x"||t==="y"||t==="r")return t}function k4(t){if(t==="top"||t==="bottom")return"x";if(t==="left"||t==="right")return"y"}function ih(t,...e){if(Yx(t))return t;for(const n of e){const a=n.axis||k4(n.position)||t.length>1&&Yx(t[0].toLowerCase());if(a)return a}throw new Error(`Cannot determine type of '${t}' axis. Please provide 'axis' or 'position' option.`)}function Xx(t,e,n){if(n[e+"AxisID"]===t)return{axis:e}}function L4(t,e){if(e.data&&e.data.datasets){const n=e.data.datasets.filter(a=>a.xAxisID===t||a.yAxisID===t);if(n.length)return Xx(t,"x",n[0])||Xx(t,"y",n[0])}return{}}function z4(t,e){const n=as[t.type]||{scales:{}},a=e.scales||{},l=nh(t.type,e),o=Object.create(null);return Object.keys(a).forEach(c=>{const d=a[c];if(!Be(d))return console.error(`Invalid scale configuration for scale: ${c}`);if(d._proxy)return console.warn(`Ignoring resolver passed as options for scale: ${c}`);const h=ih(c,d,L4(c,t),lt.scales[d.type]),m=O4(h,l),p=n.scales||{};o[c]=pr(Object.create(null),[{axis:h},d,p[h],p[m]])}),t.data.datasets.forEach(c=>{const d=c.type||t.type,h=c.indexAxis||nh(d,e),p=(as[d]||{}).scales||{};Object.keys(p).forEach(b=>{const y=C4(b,h),v=c[y+"AxisID"]||y;o[v]=o[v]||Object.create(null),pr(o[v],[{axis:y},a[v],p[b]])})}),Object.keys(o).forEach(c=>{const d=o[c];pr(d,[lt.scales[d.type],lt.scale])}),o}function uv(t){const e=t.options||(t.options={});e.plugins=Re(e.plugins,{}),e.scales=z4(t,e)}function dv(t){return t=t||{},t.datasets=t.datasets||[],t.labels=t.labels||[],t}function B4(t){return t=t||{},t.data=dv(t.data),uv(t),t}const Gx=new Map,fv=new Set;function uc(t,e){let n=Gx.get(t);return n||(n=e(),Gx.set(t,n),fv.add(n)),n}const rr=(t,e,n)=>{const a=ma(e,n);a!==void 0&&t.add(a)};class H4{constructor(e){this._config=B4(e),this._scopeCache=new Map,this._resolverCache=new Map}get platform(){return this._config.platform}get type(){return this._config.type}set type(e){this._config.type=e}get data(){return this._config.data}set data(e){this._config.data=dv(e)}get options(){return this._config.options}set options(e){this._config.options=e}get plugins(){return this._config.plugins}update(){const e=this._config;this.clearCache(),uv(e)}clearCache(){this._scopeCache.clear(),this._resolverCache.clear()}datasetScopeKeys(e){return uc(e,()=>[[`datasets.${e}`,""]])}datasetAnimationScopeKeys(e,n){return uc(`${e}.transition.${n}`,()=>[[`datasets.${e}.transitions.${n}`,`transitions.${n}`],[`datasets.${e}`,""]])}datasetElementScopeKeys(e,n){return uc(`${e}-${n}`,()=>[[`datasets.${e}.elements.${n}`,`datasets.${e}`,`elements.${n}`,""]])}pluginScopeKeys(e){const n=e.id,a=this.type;return uc(`${a}-plugin-${n}`,()=>[[`plugins.${n}`,...e.additionalOptionScopes||[]]])}_cachedScopes(e,n){const a=this._scopeCache;let l=a.get(e);return(!l||n)&&(l=new Map,a.set(e,l)),l}getOptionScopes(e,n,a){const{options:l,type:o}=this,c=this._cachedScopes(e,a),d=c.get(n);if(d)return d;const h=new Set;n.forEach(p=>{e&&(h.add(e),p.forEach(b=>rr(h,e,b))),p.forEach(b=>rr(h,l,b)),p.forEach(b=>rr(h,as[o]||{},b)),p.forEach(b=>rr(h,lt,b)),p.forEach(b=>rr(h,Jf,b))});const m=Array.from(h);return m.length===0&&m.push(Object.create(null)),fv.has(n)&&c.set(n,m),m}chartOptionScopes(){const{options:e,type:n}=this;return[e,as[n]||{},lt.datasets[n]||{},{type:n},lt,Jf]}resolveNamedOptions(e,n,a,l=[""]){const o={$shared:!0},{resolver:c,subPrefixes:d}=Wx(this._resolverCache,e,l);let h=c;if(P4(c,n)){o.$shared=!1,a=ga(a)?a():a;const m=this.createResolver(e,a,d);h=Qs(c,a,m)}for(const m of n)o[m]=h[m];return o}createResolver(e,n,a=[""],l){const{resolver:o}=Wx(this._resolverCache,e,a);return Be(n)?Qs(o,n,void 0,l):o}}function Wx(t,e,n){let a=t.get(e);a||(a=new Map,t.set(e,a));const l=n.join();let o=a.get(l);return o||(o={resolver:zh(e,n),subPrefixes:n.filter(d=>!d.toLowerCase().includes("hover"))},a.set(l,o)),o}const U4=t=>Be(t)&&Object.getOwnPropertyNames(t).some(e=>ga(t[e]));function P4(t,e){const{isScriptable:n,isIndexable:a}=Yy(t);for(const l of e){const o=n(l),c=a(l),d=(c||o)&&t[l];if(o&&(ga(d)||U4(d))||c&&st(d))return!0}return!1}var F4="4.4.8";const V4=["top","bottom","left","right","chartArea"];function Qx(t,e){return t==="top"||t==="bottom"||V4.indexOf(t)===-1&&e==="x"}function Zx(t,e){return function(n,a){return n[t]===a[t]?n[e]-a[e]:n[t]-a[t]}}function Kx(t){const e=t.chart,n=e.options.animation;e.notifyPlugins("afterRender"),tt(n&&n.onComplete,[t],e)}function q4(t){const e=t.chart,n=e.options.animation;tt(n&&n.onProgress,[t],e)}function hv(t){return Uh()&&typeof t=="string"?t=document.getElementById(t):t&&t.length&&(t=t[0]),t&&t.canvas&&(t=t.canvas),t}const Tc={},Ix=t=>{const e=hv(t);return Object.values(Tc).filter(n=>n.canvas===e).pop()};function $4(t,e,n){const a=Object.keys(t);for(const l of a){const o=+l;if(o>=e){const c=t[l];delete t[l],(n>0||o>e)&&(t[o+n]=c)}}}function Y4(t,e,n,a){return!n||t.type==="mouseout"?null:a?e:t}function dc(t,e,n){return t.options.clip?t[n]:e[n]}function X4(t,e){const{xScale:n,yScale:a}=t;return n&&a?{left:dc(n,e,"left"),right:dc(n,e,"right"),top:dc(a,e,"top"),bottom:dc(a,e,"bottom")}:e}class ni{static register(...e){ti.add(...e),Jx()}static unregister(...e){ti.remove(...e),Jx()}constructor(e,n){const a=this.config=new H4(n),l=hv(e),o=Ix(l);if(o)throw new Error("Canvas is already in use. Chart with ID '"+o.id+"' must be destroyed before the canvas with ID '"+o.canvas.id+"' can be reused.");const c=a.createResolver(a.chartOptionScopes(),this.getContext());this.platform=new(a.platform||c4(l)),this.platform.updateConfig(a);const d=this.platform.acquireContext(l,c.aspectRatio),h=d&&d.canvas,m=h&&h.height,p=h&&h.width;if(this.id=Gj(),this.ctx=d,this.canvas=h,this.width=p,this.height=m,this._options=c,this._aspectRatio=this.aspectRatio,this._layers=[],this._metasets=[],this._stacks=void 0,this.boxes=[],this.currentDevicePixelRatio=void 0,this.chartArea=void 0,this._active=[],this._lastEvent=void 0,this._listeners={},this._responsiveListeners=void 0,this._sortedMetasets=[],this.scales={},this._plugins=new M4,this.$proxies={},this._hiddenIndices={},this.attached=!1,this._animationsDisabled=void 0,this.$context=void 0,this._doResize=uN(b=>this.update(b),c.resizeDelay||0),this._dataChanges=[],Tc[this.id]=this,!d||!h){console.error("Failed to create chart: can't acquire context from the given item");return}Di.listen(this,"complete",Kx),Di.listen(this,"progress",q4),this._initialize(),this.attached&&this.update()}get aspectRatio(){const{options:{aspectRatio:e,maintainAspectRatio:n},width:a,height:l,_aspectRatio:o}=this;return Le(e)?n&&o?o:l?a/l:null:e}get data(){return this.config.data}set data(e){this.config.data=e}get options(){return this._options}set options(e){this.config.options=e}get registry(){return ti}_initialize(){return this.notifyPlugins("beforeInit"),this.options.responsive?this.resize():wx(this,this.options.devicePixelRatio),this.bindEvents(),this.notifyPlugins("afterInit"),this}clear(){return bx(this.canvas,this.ctx),this}stop(){return Di.stop(this),this}resize(e,n){Di.running(this)?this._resizeBeforeDraw={width:e,height:n}:this._resize(e,n)}_resize(e,n){const a=this.options,l=this.canvas,o=a.maintainAspectRatio&&this.aspectRatio,c=this.platform.getMaximumSize(l,e,n,o),d=a.devicePixelRatio||this.platform.getDevicePixelRatio(),h=this.width?"resize":"attach";this.width=c.width,this.height=c.height,this._aspectRatio=this.aspectRatio,wx(this,d,!0)&&(this.notifyPlugins("resize",{size:c}),tt(a.onResize,[this,c],this),this.attached&&this._doResize(h)&&this.render())}ensureScalesHaveIDs(){const n=this.options.scales||{};We(n,(a,l)=>{a.id=l})}buildOrUpdateScales(){const e=this.options,n=e.scales,a=this.scales,l=Object.keys(a).reduce((c,d)=>(c[d]=!1,c),{});let o=[];n&&(o=o.concat(Object.keys(n).map(c=>{const d=n[c],h=ih(c,d),m=h==="r",p=h==="x";return{options:d,dposition:m?"chartArea":p?"bottom":"left",dtype:m?"radialLinear":p?"category":"linear"}}))),We(o,c=>{const d=c.options,h=d.id,m=ih(h,d),p=Re(d.type,c.dtype);(d.position===void 0||Qx(d.position,m)!==Qx(c.dposition))&&(d.position=c.dposition),l[h]=!0;let b=null;if(h in a&&a[h].type===p)b=a[h];else{const y=ti.getScale(p);b=new y({id:h,type:p,ctx:this.ctx,chart:this}),a[b.id]=b}b.init(d,e)}),We(l,(c,d)=>{c||delete a[d]}),We(a,c=>{Xt.configure(this,c,c.options),Xt.addBox(this,c)})}_updateMetasets(){const e=this._metasets,n=this.data.datasets.length,a=e.length;if(e.sort((l,o)=>l.index-o.index),a>n){for(let l=n;l<a;++l)this._destroyDatasetMeta(l);e.splice(n,a-n)}this._sortedMetasets=e.slice(0).sort(Zx("order","index"))}_removeUnreferencedMetasets(){const{_metasets:e,data:{datasets:n}}=this;e.length>n.length&&delete this._stacks,e.forEach((a,l)=>{n.filter(o=>o===a._dataset).length===0&&this._destroyDatasetMeta(l)})}buildOrUpdateControllers(){const e=[],n=this.data.datasets;let a,l;for(this._removeUnreferencedMetasets(),a=0,l=n.length;a<l;a++){const o=n[a];let c=this.getDatasetMeta(a);const d=o.type||this.config.type;if(c.type&&c.type!==d&&(this._destroyDatasetMeta(a),c=this.getDatasetMeta(a)),c.type=d,c.indexAxis=o.indexAxis||nh(d,this.options),c.order=o.order||0,c.index=a,c.label=""+o.label,c.visible=this.isDatasetVisible(a),c.controller)c.controller.updateIndex(a),c.controller.linkScales();else{const h=ti.getController(d),{datasetElementType:m,dataElementType:p}=lt.datasets[d];Object.assign(h,{dataElementType:ti.getElement(p),datasetElementType:m&&ti.getElement(m)}),c.controller=new h(this,a),e.push(c.controller)}}return this._updateMetasets(),e}_resetElements(){We(this.data.datasets,(e,n)=>{this.getDatasetMeta(n).controller.reset()},this)}reset(){this._resetElements(),this.notifyPlugins("reset")}update(e){const n=this.config;n.update();const a=this._options=n.createResolver(n.chartOptionScopes(),this.getContext()),l=this._animationsDisabled=!a.animation;if(this._updateScales(),this._checkEventBindings(),this._updateHiddenIndices(),this._plugins.invalidate(),this.notifyPlugins("beforeUpdate",{mode:e,cancelable:!0})===!1)return;const o=this.buildOrUpdateControllers();this.notifyPlugins("beforeElementsUpdate");let c=0;for(let m=0,p=this.data.datasets.length;m<p;m++){const{controller:b}=this.getDatasetMeta(m),y=!l&&o.indexOf(b)===-1;b.buildOrUpdateElements(y),c=Math.max(+b.getMaxOverflow(),c)}c=this._minPadding=a.layout.autoPadding?c:0,this._updateLayout(c),l||We(o,m=>{m.reset()}),this._updateDatasets(e),this.notifyPlugins("afterUpdate",{mode:e}),this._layers.sort(Zx("z","_idx"));const{_active:d,_lastEvent:h}=this;h?this._eventHandler(h,!0):d.length&&this._updateHoverStyles(d,d,!0),this.render()}_updateScales(){We(this.scales,e=>{Xt.removeBox(this,e)}),this.ensureScalesHaveIDs(),this.buildOrUpdateScales()}_checkEventBindings(){const e=this.options,n=new Set(Object.keys(this._listeners)),a=new Set(e.events);(!cx(n,a)||!!this._responsiveListeners!==e.responsive)&&(this.unbindEvents(),this.bindEvents())}_updateHiddenIndices(){const{_hiddenIndices:e}=this,n=this._getUniformDataChanges()||[];for(const{method:a,start:l,count:o}of n){const c=a==="_removeElements"?-o:o;$4(e,l,c)}}_getUniformDataChanges(){const e=this._dataChanges;if(!e||!e.length)return;this._dataChanges=[];const n=this.data.datasets.length,a=o=>new Set(e.filter(c=>c[0]===o).map((c,d)=>d+","+c.splice(1).join(","))),l=a(0);for(let o=1;o<n;o++)if(!cx(l,a(o)))return;return Array.from(l).map(o=>o.split(",")).map(o=>({method:o[1],start:+o[2],count:+o[3]}))}_updateLayout(e){if(this.notifyPlugins("beforeLayout",{cancelable:!0})===!1)return;Xt.update(this,this.width,this.height,e);const n=this.chartArea,a=n.width<=0||n.height<=0;this._layers=[],We(this.boxes,l=>{a&&l.position==="chartArea"||(l.configure&&l.configure(),this._layers.push(...l._layers()))},this),this._layers.forEach((l,o)=>{l._idx=o}),this.notifyPlugins("afterLayout")}_updateDatasets(e){if(this.notifyPlugins("beforeDatasetsUpdate",{mode:e,cancelable:!0})!==!1){for(let n=0,a=this.data.datasets.length;n<a;++n)this.getDatasetMeta(n).controller.configure();for(let n=0,a=this.data.datasets.length;n<a;++n)this._updateDataset(n,ga(e)?e({datasetIndex:n}):e);this.notifyPlugins("afterDatasetsUpdate",{mode:e})}}_updateDataset(e,n){const a=this.getDatasetMeta(e),l={meta:a,index:e,mode:n,cancelable:!0};this.notifyPlugins("beforeDatasetUpdate",l)!==!1&&(a.controller._update(n),l.cancelable=!1,this.notifyPlugins("afterDatasetUpdate",l))}render(){this.notifyPlugins("beforeRender",{cancelable:!0})!==!1&&(Di.has(this)?this.attached&&!Di.running(this)&&Di.start(this):(this.draw(),Kx({chart:this})))}draw(){let e;if(this._resizeBeforeDraw){const{width:a,height:l}=this._resizeBeforeDraw;this._resizeBeforeDraw=null,this._resize(a,l)}if(this.clear(),this.width<=0||this.height<=0||this.notifyPlugins("beforeDraw",{cancelable:!0})===!1)return;const n=this._layers;for(e=0;e<n.length&&n[e].z<=0;++e)n[e].draw(this.chartArea);for(this._drawDatasets();e<n.length;++e)n[e].draw(this.chartArea);this.notifyPlugins("afterDraw")}_getSortedDatasetMetas(e){const n=this._sortedMetasets,a=[];let l,o;for(l=0,o=n.length;l<o;++l){const c=n[l];(!e||c.visible)&&a.push(c)}return a}getSortedVisibleDatasetMetas(){return this._getSortedDatasetMetas(!0)}_drawDatasets(){if(this.notifyPlugins("beforeDatasetsDraw",{cancelable:!0})===!1)return;const e=this.getSortedVisibleDatasetMetas();for(let n=e.length-1;n>=0;--n)this._drawDataset(e[n]);this.notifyPlugins("afterDatasetsDraw")}_drawDataset(e){const n=this.ctx,a=e._clip,l=!a.disabled,o=X4(e,this.chartArea),c={meta:e,index:e.index,cancelable:!0};this.notifyPlugins("beforeDatasetDraw",c)!==!1&&(l&&tu(n,{left:a.left===!1?0:o.left-a.left,right:a.right===!1?this.width:o.right+a.right,top:a.top===!1?0:o.top-a.top,bottom:a.bottom===!1?this.height:o.bottom+a.bottom}),e.controller.draw(),l&&nu(n),c.cancelable=!1,this.notifyPlugins("afterDatasetDraw",c))}isPointInArea(e){return ki(e,this.chartArea,this._minPadding)}getElementsAtEventForMode(e,n,a,l){const o=V5.modes[n];return typeof o=="function"?o(this,e,a,l):[]}getDatasetMeta(e){const n=this.data.datasets[e],a=this._metasets;let l=a.filter(o=>o&&o._dataset===n).pop();return l||(l={type:null,data:[],dataset:null,controller:null,hidden:null,xAxisID:null,yAxisID:null,order:n&&n.order||0,index:e,_dataset:n,_parsed:[],_sorted:!1},a.push(l)),l}getContext(){return this.$context||(this.$context=xa(null,{chart:this,type:"chart"}))}getVisibleDatasetCount(){return this.getSortedVisibleDatasetMetas().length}isDatasetVisible(e){const n=this.data.datasets[e];if(!n)return!1;const a=this.getDatasetMeta(e);return typeof a.hidden=="boolean"?!a.hidden:!n.hidden}setDatasetVisibility(e,n){const a=this.getDatasetMeta(e);a.hidden=!n}toggleDataVisibility(e){this._hiddenIndices[e]=!this._hiddenIndices[e]}getDataVisibility(e){return!this._hiddenIndices[e]}_updateVisibility(e,n,a){const l=a?"show":"hide",o=this.getDatasetMeta(e),c=o.controller._resolveAnimations(void 0,l);Er(n)?(o.data[n].hidden=!a,this.update()):(this.setDatasetVisibility(e,a),c.update(o,{visible:a}),this.update(d=>d.datasetIndex===e?l:void 0))}hide(e,n){this._updateVisibility(e,n,!1)}show(e,n){this._updateVisibility(e,n,!0)}_destroyDatasetMeta(e){const n=this._metasets[e];n&&n.controller&&n.controller._destroy(),delete this._metasets[e]}_stop(){let e,n;for(this.stop(),Di.remove(this),e=0,n=this.data.datasets.length;e<n;++e)this._destroyDatasetMeta(e)}destroy(){this.notifyPlugins("beforeDestroy");const{canvas:e,ctx:n}=this;this._stop(),this.config.clearCache(),e&&(this.unbindEvents(),bx(e,n),this.platform.releaseContext(n),this.canvas=null,this.ctx=null),delete Tc[this.id],this.notifyPlugins("afterDestroy")}toBase64Image(...e){return this.canvas.toDataURL(...e)}bindEvents(){this.bindUserEvents(),this.options.responsive?this.bindResponsiveEvents():this.attached=!0}bindUserEvents(){const e=this._listeners,n=this.platform,a=(o,c)=>{n.addEventListener(this,o,c),e[o]=c},l=(o,c,d)=>{o.offsetX=c,o.offsetY=d,this._eventHandler(o)};We(this.options.events,o=>a(o,l))}bindResponsiveEvents(){this._responsiveListeners||(this._responsiveListeners={});const e=this._responsiveListeners,n=this.platform,a=(h,m)=>{n.addEventListener(this,h,m),e[h]=m},l=(h,m)=>{e[h]&&(n.removeEventListener(this,h,m),delete e[h])},o=(h,m)=>{this.canvas&&this.resize(h,m)};let c;const d=()=>{l("attach",d),this.attached=!0,this.resize(),a("resize",o),a("detach",c)};c=()=>{this.attached=!1,l("resize",o),this._stop(),this._resize(0,0),a("attach",d)},n.isAttached(this.canvas)?d():c()}unbindEvents(){We(this._listeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._listeners={},We(this._responsiveListeners,(e,n)=>{this.platform.removeEventListener(this,n,e)}),this._responsiveListeners=void 0}updateHoverStyle(e,n,a){const l=a?"set":"remove";let o,c,d,h;for(n==="dataset"&&(o=this.getDatasetMeta(e[0].datasetIndex),o.controller["_"+l+"DatasetHoverStyle"]()),d=0,h=e.length;d<h;++d){c=e[d];const m=c&&this.getDatasetMeta(c.datasetIndex).controller;m&&m[l+"HoverStyle"](c.element,c.datasetIndex,c.index)}}getActiveElements(){return this._active||[]}setActiveElements(e){const n=this._active||[],a=e.map(({datasetIndex:o,index:c})=>{const d=this.getDatasetMeta(o);if(!d)throw new Error("No dataset found at index "+o);return{datasetIndex:o,element:d.data[c],index:c}});!zc(a,n)&&(this._active=a,this._lastEvent=null,this._updateHoverStyles(a,n))}notifyPlugins(e,n,a){return this._plugins.notify(this,e,n,a)}isPluginEnabled(e){return this._plugins._cache.filter(n=>n.plugin.id===e).length===1}_updateHoverStyles(e,n,a){const l=this.options.hover,o=(h,m)=>h.filter(p=>!m.some(b=>p.datasetIndex===b.datasetIndex&&p.index===b.index)),c=o(n,e),d=a?e:o(e,n);c.length&&this.updateHoverStyle(c,l.mode,!1),d.length&&l.mode&&this.updateHoverStyle(d,l.mode,!0)}_eventHandler(e,n){const a={event:e,replay:n,cancelable:!0,inChartArea:this.isPointInArea(e)},l=c=>(c.options.events||this.options.events).includes(e.native.type);if(this.notifyPlugins("beforeEvent",a,l)===!1)return;const o=this._handleEvent(e,n,a.inChartArea);return a.cancelable=!1,this.notifyPlugins("afterEvent",a,l),(o||a.changed)&&this.render(),this}_handleEvent(e,n,a){const{_active:l=[],options:o}=this,c=n,d=this._getActiveElements(e,l,a,c),h=Jj(e),m=Y4(e,this._lastEvent,a,h);a&&(this._lastEvent=null,tt(o.onHover,[e,d,this],this),h&&tt(o.onClick,[e,d,this],this));const p=!zc(d,l);return(p||n)&&(this._active=d,this._updateHoverStyles(d,l,n)),this._lastEvent=m,p}_getActiveElements(e,n,a,l){if(e.type==="mouseout")return[];if(!a)return n;const o=this.options.hover;return this.getElementsAtEventForMode(e,o.mode,o,l)}}ae(ni,"defaults",lt),ae(ni,"instances",Tc),ae(ni,"overrides",as),ae(ni,"registry",ti),ae(ni,"version",F4),ae(ni,"getChart",Ix);function Jx(){return We(ni.instances,t=>t._plugins.invalidate())}function G4(t,e,n){const{startAngle:a,pixelMargin:l,x:o,y:c,outerRadius:d,innerRadius:h}=e;let m=l/d;t.beginPath(),t.arc(o,c,d,a-m,n+m),h>l?(m=l/h,t.arc(o,c,h,n+m,a-m,!0)):t.arc(o,c,l,n+bt,a-bt),t.closePath(),t.clip()}function W4(t){return Lh(t,["outerStart","outerEnd","innerStart","innerEnd"])}function Q4(t,e,n,a){const l=W4(t.options.borderRadius),o=(n-e)/2,c=Math.min(o,a*e/2),d=h=>{const m=(n-Math.min(o,h))*a/2;return Rt(h,0,Math.min(o,m))};return{outerStart:d(l.outerStart),outerEnd:d(l.outerEnd),innerStart:Rt(l.innerStart,0,c),innerEnd:Rt(l.innerEnd,0,c)}}function Xs(t,e,n,a){return{x:n+t*Math.cos(e),y:a+t*Math.sin(e)}}function Vc(t,e,n,a,l,o){const{x:c,y:d,startAngle:h,pixelMargin:m,innerRadius:p}=e,b=Math.max(e.outerRadius+a+n-m,0),y=p>0?p+a+n+m:0;let v=0;const w=l-h;if(a){const K=p>0?p-a:0,Q=b>0?b-a:0,ie=(K+Q)/2,re=ie!==0?w*ie/(ie+a):w;v=(w-re)/2}const N=Math.max(.001,w*b-n/it)/b,j=(w-N)/2,M=h+j+v,T=l-j-v,{outerStart:A,outerEnd:C,innerStart:S,innerEnd:k}=Q4(e,y,b,T-M),F=b-A,$=b-C,V=M+A/F,te=T-C/$,se=y+S,ee=y+k,ge=M+S/se,Me=T-k/ee;if(t.beginPath(),o){const K=(V+te)/2;if(t.arc(c,d,b,V,K),t.arc(c,d,b,K,te),C>0){const pe=Xs($,te,c,d);t.arc(pe.x,pe.y,C,te,T+bt)}const Q=Xs(ee,T,c,d);if(t.lineTo(Q.x,Q.y),k>0){const pe=Xs(ee,Me,c,d);t.arc(pe.x,pe.y,k,T+bt,Me+Math.PI)}const ie=(T-k/y+(M+S/y))/2;if(t.arc(c,d,y,T-k/y,ie,!0),t.arc(c,d,y,ie,M+S/y,!0),S>0){const pe=Xs(se,ge,c,d);t.arc(pe.x,pe.y,S,ge+Math.PI,M-bt)}const re=Xs(F,M,c,d);if(t.lineTo(re.x,re.y),A>0){const pe=Xs(F,V,c,d);t.arc(pe.x,pe.y,A,M-bt,V)}}else{t.moveTo(c,d);const K=Math.cos(V)*b+c,Q=Math.sin(V)*b+d;t.lineTo(K,Q);const ie=Math.cos(te)*b+c,re=Math.sin(te)*b+d;t.lineTo(ie,re)}t.closePath()}function Z4(t,e,n,a,l){const{fullCircles:o,startAngle:c,circumference:d}=e;let h=e.endAngle;if(o){Vc(t,e,n,a,h,l);for(let m=0;m<o;++m)t.fill();isNaN(d)||(h=c+(d%nt||nt))}return Vc(t,e,n,a,h,l),t.fill(),h}function K4(t,e,n,a,l){const{fullCircles:o,startAngle:c,circumference:d,options:h}=e,{borderWidth:m,borderJoinStyle:p,borderDash:b,borderDashOffset:y}=h,v=h.borderAlign==="inner";if(!m)return;t.setLineDash(b||[]),t.lineDashOffset=y,v?(t.lineWidth=m*2,t.lineJoin=p||"round"):(t.lineWidth=m,t.lineJoin=p||"bevel");let w=e.endAngle;if(o){Vc(t,e,n,a,w,l);for(let N=0;N<o;++N)t.stroke();isNaN(d)||(w=c+(d%nt||nt))}v&&G4(t,e,w),o||(Vc(t,e,n,a,w,l),t.stroke())}class hr extends $n{constructor(n){super();ae(this,"circumference");ae(this,"endAngle");ae(this,"fullCircles");ae(this,"innerRadius");ae(this,"outerRadius");ae(this,"pixelMargin");ae(this,"startAngle");this.options=void 0,this.circumference=void 0,this.startAngle=void 0,this.endAngle=void 0,this.innerRadius=void 0,this.outerRadius=void 0,this.pixelMargin=0,this.fullCircles=0,n&&Object.assign(this,n)}inRange(n,a,l){const o=this.getProps(["x","y"],l),{angle:c,distance:d}=Ly(o,{x:n,y:a}),{startAngle:h,endAngle:m,innerRadius:p,outerRadius:b,circumference:y}=this.getProps(["startAngle","endAngle","innerRadius","outerRadius","circumference"],l),v=(this.options.spacing+this.options.borderWidth)/2,w=Re(y,m-h),N=Mr(c,h,m)&&h!==m,j=w>=nt||N,M=Ci(d,p+v,b+v);return j&&M}getCenterPoint(n){const{x:a,y:l,startAngle:o,endAngle:c,innerRadius:d,outerRadius:h}=this.getProps(["x","y","startAngle","endAngle","innerRadius","outerRadius"],n),{offset:m,spacing:p}=this.options,b=(o+c)/2,y=(d+h+p+m)/2;return{x:a+Math.cos(b)*y,y:l+Math.sin(b)*y}}tooltipPosition(n){return this.getCenterPoint(n)}draw(n){const{options:a,circumference:l}=this,o=(a.offset||0)/4,c=(a.spacing||0)/2,d=a.circular;if(this.pixelMargin=a.borderAlign==="inner"?.33:0,this.fullCircles=l>nt?Math.floor(l/nt):0,l===0||this.innerRadius<0||this.outerRadius<0)return;n.save();const h=(this.startAngle+this.endAngle)/2;n.translate(Math.cos(h)*o,Math.sin(h)*o);const m=1-Math.sin(Math.min(it,l||0)),p=o*m;n.fillStyle=a.backgroundColor,n.strokeStyle=a.borderColor,Z4(n,this,p,c,d),K4(n,this,p,c,d),n.restore()}}ae(hr,"id","arc"),ae(hr,"defaults",{borderAlign:"center",borderColor:"#fff",borderDash:[],borderDashOffset:0,borderJoinStyle:void 0,borderRadius:0,borderWidth:2,offset:0,spacing:0,angle:void 0,circular:!0}),ae(hr,"defaultRoutes",{backgroundColor:"backgroundColor"}),ae(hr,"descriptors",{_scriptable:!0,_indexable:n=>n!=="borderDash"});function mv(t,e,n=e){t.lineCap=Re(n.borderCapStyle,e.borderCapStyle),t.setLineDash(Re(n.borderDash,e.borderDash)),t.lineDashOffset=Re(n.borderDashOffset,e.borderDashOffset),t.lineJoin=Re(n.borderJoinStyle,e.borderJoinStyle),t.lineWidth=Re(n.borderWidth,e.borderWidth),t.strokeStyle=Re(n.borderColor,e.borderColor)}function I4(t,e,n){t.lineTo(n.x,n.y)}function J4(t){return t.stepped?_N:t.tension||t.cubicInterpolationMode==="monotone"?SN:I4}function gv(t,e,n={}){const a=t.length,{start:l=0,end:o=a-1}=n,{start:c,end:d}=e,h=Math.max(l,c),m=Math.min(o,d),p=l<c&&o<c||l>d&&o>d;return{count:a,start:h,loop:e.loop,ilen:m<h&&!p?a+m-h:m-h}}function eE(t,e,n,a){const{points:l,options:o}=e,{count:c,start:d,loop:h,ilen:m}=gv(l,n,a),p=J4(o);let{move:b=!0,reverse:y}=a||{},v,w,N;for(v=0;v<=m;++v)w=l[(d+(y?m-v:v))%c],!w.skip&&(b?(t.moveTo(w.x,w.y),b=!1):p(t,N,w,y,o.stepped),N=w);return h&&(w=l[(d+(y?m:0))%c],p(t,N,w,y,o.stepped)),!!h}function tE(t,e,n,a){const l=e.points,{count:o,start:c,ilen:d}=gv(l,n,a),{move:h=!0,reverse:m}=a||{};let p=0,b=0,y,v,w,N,j,M;const T=C=>(c+(m?d-C:C))%o,A=()=>{N!==j&&(t.lineTo(p,j),t.lineTo(p,N),t.lineTo(p,M))};for(h&&(v=l[T(0)],t.moveTo(v.x,v.y)),y=0;y<=d;++y){if(v=l[T(y)],v.skip)continue;const C=v.x,S=v.y,k=C|0;k===w?(S<N?N=S:S>j&&(j=S),p=(b*p+C)/++b):(A(),t.lineTo(C,S),w=k,b=0,N=j=S),M=S}A()}function ah(t){const e=t.options,n=e.borderDash&&e.borderDash.length;return!t._decimated&&!t._loop&&!e.tension&&e.cubicInterpolationMode!=="monotone"&&!e.stepped&&!n?tE:eE}function nE(t){return t.stepped?t5:t.tension||t.cubicInterpolationMode==="monotone"?n5:Qa}function iE(t,e,n,a){let l=e._path;l||(l=e._path=new Path2D,e.path(l,n,a)&&l.closePath()),mv(t,e.options),t.stroke(l)}function aE(t,e,n,a){const{segments:l,options:o}=e,c=ah(e);for(const d of l)mv(t,o,d.style),t.beginPath(),c(t,e,d,{start:n,end:n+a-1})&&t.closePath(),t.stroke()}const sE=typeof Path2D=="function";function lE(t,e,n,a){sE&&!e.options.segment?iE(t,e,n,a):aE(t,e,n,a)}class ca extends $n{constructor(e){super(),this.animated=!0,this.options=void 0,this._chart=void 0,this._loop=void 0,this._fullLoop=void 0,this._path=void 0,this._points=void 0,this._segments=void 0,this._decimated=!1,this._pointsUpdated=!1,this._datasetIndex=void 0,e&&Object.assign(this,e)}updateControlPoints(e,n){const a=this.options;if((a.tension||a.cubicInterpolationMode==="monotone")&&!a.stepped&&!this._pointsUpdated){const l=a.spanGaps?this._loop:this._fullLoop;GN(this._points,a,e,l,n),this._pointsUpdated=!0}}set points(e){this._points=e,delete this._segments,delete this._path,this._pointsUpdated=!1}get points(){return this._points}get segments(){return this._segments||(this._segments=o5(this,this.options.segment))}first(){const e=this.segments,n=this.points;return e.length&&n[e[0].start]}last(){const e=this.segments,n=this.points,a=e.length;return a&&n[e[a-1].end]}interpolate(e,n){const a=this.options,l=e[n],o=this.points,c=tv(this,{property:n,start:l,end:l});if(!c.length)return;const d=[],h=nE(a);let m,p;for(m=0,p=c.length;m<p;++m){const{start:b,end:y}=c[m],v=o[b],w=o[y];if(v===w){d.push(v);continue}const N=Math.abs((l-v[n])/(w[n]-v[n])),j=h(v,w,N,a.stepped);j[n]=e[n],d.push(j)}return d.length===1?d[0]:d}pathSegment(e,n,a){return ah(this)(e,this,n,a)}path(e,n,a){const l=this.segments,o=ah(this);let c=this._loop;n=n||0,a=a||this.points.length-n;for(const d of l)c&=o(e,this,d,{start:n,end:n+a-1});return!!c}draw(e,n,a,l){const o=this.options||{};(this.points||[]).length&&o.borderWidth&&(e.save(),lE(e,this,a,l),e.restore()),this.animated&&(this._pointsUpdated=!1,this._path=void 0)}}ae(ca,"id","line"),ae(ca,"defaults",{borderCapStyle:"butt",borderDash:[],borderDashOffset:0,borderJoinStyle:"miter",borderWidth:3,capBezierPoints:!0,cubicInterpolationMode:"default",fill:!1,spanGaps:!1,stepped:!1,tension:0}),ae(ca,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"}),ae(ca,"descriptors",{_scriptable:!0,_indexable:e=>e!=="borderDash"&&e!=="fill"});function eb(t,e,n,a){const l=t.options,{[n]:o}=t.getProps([n],a);return Math.abs(e-o)<l.radius+l.hitRadius}class Dc extends $n{constructor(n){super();ae(this,"parsed");ae(this,"skip");ae(this,"stop");this.options=void 0,this.parsed=void 0,this.skip=void 0,this.stop=void 0,n&&Object.assign(this,n)}inRange(n,a,l){const o=this.options,{x:c,y:d}=this.getProps(["x","y"],l);return Math.pow(n-c,2)+Math.pow(a-d,2)<Math.pow(o.hitRadius+o.radius,2)}inXRange(n,a){return eb(this,n,"x",a)}inYRange(n,a){return eb(this,n,"y",a)}getCenterPoint(n){const{x:a,y:l}=this.getProps(["x","y"],n);return{x:a,y:l}}size(n){n=n||this.options||{};let a=n.radius||0;a=Math.max(a,a&&n.hoverRadius||0);const l=a&&n.borderWidth||0;return(a+l)*2}draw(n,a){const l=this.options;this.skip||l.radius<.1||!ki(this,a,this.size(l)/2)||(n.strokeStyle=l.borderColor,n.lineWidth=l.borderWidth,n.fillStyle=l.backgroundColor,eh(n,l,this.x,this.y))}getRange(){const n=this.options||{};return n.radius+n.hitRadius}}ae(Dc,"id","point"),ae(Dc,"defaults",{borderWidth:1,hitRadius:1,hoverBorderWidth:1,hoverRadius:4,pointStyle:"circle",radius:3,rotation:0}),ae(Dc,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"});function pv(t,e){const{x:n,y:a,base:l,width:o,height:c}=t.getProps(["x","y","base","width","height"],e);let d,h,m,p,b;return t.horizontal?(b=c/2,d=Math.min(n,l),h=Math.max(n,l),m=a-b,p=a+b):(b=o/2,d=n-b,h=n+b,m=Math.min(a,l),p=Math.max(a,l)),{left:d,top:m,right:h,bottom:p}}function ua(t,e,n,a){return t?0:Rt(e,n,a)}function rE(t,e,n){const a=t.options.borderWidth,l=t.borderSkipped,o=$y(a);return{t:ua(l.top,o.top,0,n),r:ua(l.right,o.right,0,e),b:ua(l.bottom,o.bottom,0,n),l:ua(l.left,o.left,0,e)}}function oE(t,e,n){const{enableBorderRadius:a}=t.getProps(["enableBorderRadius"]),l=t.options.borderRadius,o=ts(l),c=Math.min(e,n),d=t.borderSkipped,h=a||Be(l);return{topLeft:ua(!h||d.top||d.left,o.topLeft,0,c),topRight:ua(!h||d.top||d.right,o.topRight,0,c),bottomLeft:ua(!h||d.bottom||d.left,o.bottomLeft,0,c),bottomRight:ua(!h||d.bottom||d.right,o.bottomRight,0,c)}}function cE(t){const e=pv(t),n=e.right-e.left,a=e.bottom-e.top,l=rE(t,n/2,a/2),o=oE(t,n/2,a/2);return{outer:{x:e.left,y:e.top,w:n,h:a,radius:o},inner:{x:e.left+l.l,y:e.top+l.t,w:n-l.l-l.r,h:a-l.t-l.b,radius:{topLeft:Math.max(0,o.topLeft-Math.max(l.t,l.l)),topRight:Math.max(0,o.topRight-Math.max(l.t,l.r)),bottomLeft:Math.max(0,o.bottomLeft-Math.max(l.b,l.l)),bottomRight:Math.max(0,o.bottomRight-Math.max(l.b,l.r))}}}}function zf(t,e,n,a){const l=e===null,o=n===null,d=t&&!(l&&o)&&pv(t,a);return d&&(l||Ci(e,d.left,d.right))&&(o||Ci(n,d.top,d.bottom))}function uE(t){return t.topLeft||t.topRight||t.bottomLeft||t.bottomRight}function dE(t,e){t.rect(e.x,e.y,e.w,e.h)}function Bf(t,e,n={}){const a=t.x!==n.x?-e:0,l=t.y!==n.y?-e:0,o=(t.x+t.w!==n.x+n.w?e:0)-a,c=(t.y+t.h!==n.y+n.h?e:0)-l;return{x:t.x+a,y:t.y+l,w:t.w+o,h:t.h+c,radius:t.radius}}class Rc extends $n{constructor(e){super(),this.options=void 0,this.horizontal=void 0,this.base=void 0,this.width=void 0,this.height=void 0,this.inflateAmount=void 0,e&&Object.assign(this,e)}draw(e){const{inflateAmount:n,options:{borderColor:a,backgroundColor:l}}=this,{inner:o,outer:c}=cE(this),d=uE(c.radius)?Tr:dE;e.save(),(c.w!==o.w||c.h!==o.h)&&(e.beginPath(),d(e,Bf(c,n,o)),e.clip(),d(e,Bf(o,-n,c)),e.fillStyle=a,e.fill("evenodd")),e.beginPath(),d(e,Bf(o,n)),e.fillStyle=l,e.fill(),e.restore()}inRange(e,n,a){return zf(this,e,n,a)}inXRange(e,n){return zf(this,e,null,n)}inYRange(e,n){return zf(this,null,e,n)}getCenterPoint(e){const{x:n,y:a,base:l,horizontal:o}=this.getProps(["x","y","base","horizontal"],e);return{x:o?(n+l)/2:n,y:o?a:(a+l)/2}}getRange(e){return e==="x"?this.width/2:this.height/2}}ae(Rc,"id","bar"),ae(Rc,"defaults",{borderSkipped:"start",borderWidth:0,borderRadius:0,inflateAmount:"auto",pointStyle:void 0}),ae(Rc,"defaultRoutes",{backgroundColor:"backgroundColor",borderColor:"borderColor"});var fE=Object.freeze({__proto__:null,ArcElement:hr,BarElement:Rc,LineElement:ca,PointElement:Dc});const sh=["rgb(54, 162, 235)","rgb(255, 99, 132)","rgb(255, 159, 64)","rgb(255, 205, 86)","rgb(75, 192, 192)","rgb(153, 102, 255)","rgb(201, 203, 207)"],tb=sh.map(t=>t.replace("rgb(","rgba(").replace(")",", 0.5)"));function xv(t){return sh[t%sh.length]}function bv(t){return tb[t%tb.length]}function hE(t,e){return t.borderColor=xv(e),t.backgroundColor=bv(e),++e}function mE(t,e){return t.backgroundColor=t.data.map(()=>xv(e++)),e}function gE(t,e){return t.backgroundColor=t.data.map(()=>bv(e++)),e}function pE(t){let e=0;return(n,a)=>{const l=t.getDatasetMeta(a).controller;l instanceof Ja?e=mE(n,e):l instanceof vr?e=gE(n,e):l&&(e=hE(n,e))}}function nb(t){let e;for(e in t)if(t[e].borderColor||t[e].backgroundColor)return!0;return!1}function xE(t){return t&&(t.borderColor||t.backgroundColor)}function bE(){return lt.borderColor!=="rgba(0,0,0,0.1)"||lt.backgroundColor!=="rgba(0,0,0,0.1)"}var yE={id:"colors",defaults:{enabled:!0,forceOverride:!1},beforeLayout(t,e,n){if(!n.enabled)return;const{data:{datasets:a},options:l}=t.config,{elements:o}=l,c=nb(a)||xE(l)||o&&nb(o)||bE();if(!n.forceOverride&&c)return;const d=pE(t);a.forEach(d)}};function vE(t,e,n,a,l){const o=l.samples||a;if(o>=n)return t.slice(e,e+n);const c=[],d=(n-2)/(o-2);let h=0;const m=e+n-1;let p=e,b,y,v,w,N;for(c[h++]=t[p],b=0;b<o-2;b++){let j=0,M=0,T;const A=Math.floor((b+1)*d)+1+e,C=Math.min(Math.floor((b+2)*d)+1,n)+e,S=C-A;for(T=A;T<C;T++)j+=t[T].x,M+=t[T].y;j/=S,M/=S;const k=Math.floor(b*d)+1+e,F=Math.min(Math.floor((b+1)*d)+1,n)+e,{x:$,y:V}=t[p];for(v=w=-1,T=k;T<F;T++)w=.5*Math.abs(($-j)*(t[T].y-V)-($-t[T].x)*(M-V)),w>v&&(v=w,y=t[T],N=T);c[h++]=y,p=N}return c[h++]=t[m],c}function wE(t,e,n,a){let l=0,o=0,c,d,h,m,p,b,y,v,w,N;const j=[],M=e+n-1,T=t[e].x,C=t[M].x-T;for(c=e;c<e+n;++c){d=t[c],h=(d.x-T)/C*a,m=d.y;const S=h|0;if(S===p)m<w?(w=m,b=c):m>N&&(N=m,y=c),l=(o*l+d.x)/++o;else{const k=c-1;if(!Le(b)&&!Le(y)){const F=Math.min(b,y),$=Math.max(b,y);F!==v&&F!==k&&j.push({...t[F],x:l}),$!==v&&$!==k&&j.push({...t[$],x:l})}c>0&&k!==v&&j.push(t[k]),j.push(d),p=S,o=0,w=N=m,b=y=v=c}}return j}function yv(t){if(t._decimated){const e=t._data;delete t._decimated,delete t._data,Object.defineProperty(t,"data",{configurable:!0,enumerable:!0,writable:!0,value:e})}}function ib(t){t.data.datasets.forEach(e=>{yv(e)})}function _E(t,e){const n=e.length;let a=0,l;const{iScale:o}=t,{min:c,max:d,minDefined:h,maxDefined:m}=o.getUserBounds();return h&&(a=Rt(Oi(e,o.axis,c).lo,0,n-1)),m?l=Rt(Oi(e,o.axis,d).hi+1,a,n)-a:l=n-a,{start:a,count:l}}var SE={id:"decimation",defaults:{algorithm:"min-max",enabled:!1},beforeElementsUpdate:(t,e,n)=>{if(!n.enabled){ib(t);return}const a=t.width;t.data.datasets.forEach((l,o)=>{const{_data:c,indexAxis:d}=l,h=t.getDatasetMeta(o),m=c||l.data;if(dr([d,t.options.indexAxis])==="y"||!h.controller.supportsDecimation)return;const p=t.scales[h.xAxisID];if(p.type!=="linear"&&p.type!=="time"||t.options.parsing)return;let{start:b,count:y}=_E(h,m);const v=n.threshold||4*a;if(y<=v){yv(l);return}Le(c)&&(l._data=m,delete l.data,Object.defineProperty(l,"data",{configurable:!0,enumerable:!0,get:function(){return this._decimated},set:function(N){this._data=N}}));let w;switch(n.algorithm){case"lttb":w=vE(m,b,y,a,n);break;case"min-max":w=wE(m,b,y,a);break;default:throw new Error(`Unsupported decimation algorithm '${n.algorithm}'`)}l._decimated=w})},destroy(t){ib(t)}};function jE(t,e,n){const a=t.segments,l=t.points,o=e.points,c=[];for(const d of a){let{start:h,end:m}=d;m=Vh(h,m,l);const p=lh(n,l[h],l[m],d.loop);if(!e.segments){c.push({source:d,target:p,start:l[h],end:l[m]});continue}const b=tv(e,p);for(const y of b){const v=lh(n,o[y.start],o[y.end],y.loop),w=ev(d,l,v);for(const N of w)c.push({source:N,target:y,start:{[n]:ab(p,v,"start",Math.max)},end:{[n]:ab(p,v,"end",Math.min)}})}}return c}function lh(t,e,n,a){if(a)return;let l=e[t],o=n[t];return t==="angle"&&(l=mn(l),o=mn(o)),{property:t,start:l,end:o}}function NE(t,e){const{x:n=null,y:a=null}=t||{},l=e.points,o=[];return e.segments.forEach(({start:c,end:d})=>{d=Vh(c,d,l);const h=l[c],m=l[d];a!==null?(o.push({x:h.x,y:a}),o.push({x:m.x,y:a})):n!==null&&(o.push({x:n,y:h.y}),o.push({x:n,y:m.y}))}),o}function Vh(t,e,n){for(;e>t;e--){const a=n[e];if(!isNaN(a.x)&&!isNaN(a.y))break}return e}function ab(t,e,n,a){return t&&e?a(t[n],e[n]):t?t[n]:e?e[n]:0}function vv(t,e){let n=[],a=!1;return st(t)?(a=!0,n=t):n=NE(t,e),n.length?new ca({points:n,options:{tension:0},_loop:a,_fullLoop:a}):null}function sb(t){return t&&t.fill!==!1}function EE(t,e,n){let l=t[e].fill;const o=[e];let c;if(!n)return l;for(;l!==!1&&o.indexOf(l)===-1;){if(!pt(l))return l;if(c=t[l],!c)return!1;if(c.visible)return l;o.push(l),l=c.fill}return!1}function ME(t,e,n){const a=AE(t);if(Be(a))return isNaN(a.value)?!1:a;let l=parseFloat(a);return pt(l)&&Math.floor(l)===l?TE(a[0],e,l,n):["origin","start","end","stack","shape"].indexOf(a)>=0&&a}function TE(t,e,n,a){return(t==="-"||t==="+")&&(n=e+n),n===e||n<0||n>=a?!1:n}function DE(t,e){let n=null;return t==="start"?n=e.bottom:t==="end"?n=e.top:Be(t)?n=e.getPixelForValue(t.value):e.getBasePixel&&(n=e.getBasePixel()),n}function RE(t,e,n){let a;return t==="start"?a=n:t==="end"?a=e.options.reverse?e.min:e.max:Be(t)?a=t.value:a=e.getBaseValue(),a}function AE(t){const e=t.options,n=e.fill;let a=Re(n&&n.target,n);return a===void 0&&(a=!!e.backgroundColor),a===!1||a===null?!1:a===!0?"origin":a}function CE(t){const{scale:e,index:n,line:a}=t,l=[],o=a.segments,c=a.points,d=OE(e,n);d.push(vv({x:null,y:e.bottom},a));for(let h=0;h<o.length;h++){const m=o[h];for(let p=m.start;p<=m.end;p++)kE(l,c[p],d)}return new ca({points:l,options:{}})}function OE(t,e){const n=[],a=t.getMatchingVisibleMetas("line");for(let l=0;l<a.length;l++){const o=a[l];if(o.index===e)break;o.hidden||n.unshift(o.dataset)}return n}function kE(t,e,n){const a=[];for(let l=0;l<n.length;l++){const o=n[l],{first:c,last:d,point:h}=LE(o,e,"x");if(!(!h||c&&d)){if(c)a.unshift(h);else if(t.push(h),!d)break}}t.push(...a)}function LE(t,e,n){const a=t.interpolate(e,n);if(!a)return{};const l=a[n],o=t.segments,c=t.points;let d=!1,h=!1;for(let m=0;m<o.length;m++){const p=o[m],b=c[p.start][n],y=c[p.end][n];if(Ci(l,b,y)){d=l===b,h=l===y;break}}return{first:d,last:h,point:a}}class wv{constructor(e){this.x=e.x,this.y=e.y,this.radius=e.radius}pathSegment(e,n,a){const{x:l,y:o,radius:c}=this;return n=n||{start:0,end:nt},e.arc(l,o,c,n.end,n.start,!0),!a.bounds}interpolate(e){const{x:n,y:a,radius:l}=this,o=e.angle;return{x:n+Math.cos(o)*l,y:a+Math.sin(o)*l,angle:o}}}function zE(t){const{chart:e,fill:n,line:a}=t;if(pt(n))return BE(e,n);if(n==="stack")return CE(t);if(n==="shape")return!0;const l=HE(t);return l instanceof wv?l:vv(l,a)}function BE(t,e){const n=t.getDatasetMeta(e);return n&&t.isDatasetVisible(e)?n.dataset:null}function HE(t){return(t.scale||{}).getPointPositionForValue?PE(t):UE(t)}function UE(t){const{scale:e={},fill:n}=t,a=DE(n,e);if(pt(a)){const l=e.isHorizontal();return{x:l?a:null,y:l?null:a}}return null}function PE(t){const{scale:e,fill:n}=t,a=e.options,l=e.getLabels().length,o=a.reverse?e.max:e.min,c=RE(n,e,o),d=[];if(a.grid.circular){const h=e.getPointPositionForValue(0,o);return new wv({x:h.x,y:h.y,radius:e.getDistanceFromCenterForValue(c)})}for(let h=0;h<l;++h)d.push(e.getPointPositionForValue(h,c));return d}function Hf(t,e,n){const a=zE(e),{line:l,scale:o,axis:c}=e,d=l.options,h=d.fill,m=d.backgroundColor,{above:p=m,below:b=m}=h||{};a&&l.points.length&&(tu(t,n),FE(t,{line:l,target:a,above:p,below:b,area:n,scale:o,axis:c}),nu(t))}function FE(t,e){const{line:n,target:a,above:l,below:o,area:c,scale:d}=e,h=n._loop?"angle":e.axis;t.save(),h==="x"&&o!==l&&(lb(t,a,c.top),rb(t,{line:n,target:a,color:l,scale:d,property:h}),t.restore(),t.save(),lb(t,a,c.bottom)),rb(t,{line:n,target:a,color:o,scale:d,property:h}),t.restore()}function lb(t,e,n){const{segments:a,points:l}=e;let o=!0,c=!1;t.beginPath();for(const d of a){const{start:h,end:m}=d,p=l[h],b=l[Vh(h,m,l)];o?(t.moveTo(p.x,p.y),o=!1):(t.lineTo(p.x,n),t.lineTo(p.x,p.y)),c=!!e.pathSegment(t,d,{move:c}),c?t.closePath():t.lineTo(b.x,n)}t.lineTo(e.first().x,n),t.closePath(),t.clip()}function rb(t,e){const{line:n,target:a,property:l,color:o,scale:c}=e,d=jE(n,a,l);for(const{source:h,target:m,start:p,end:b}of d){const{style:{backgroundColor:y=o}={}}=h,v=a!==!0;t.save(),t.fillStyle=y,VE(t,c,v&&lh(l,p,b)),t.beginPath();const w=!!n.pathSegment(t,h);let N;if(v){w?t.closePath():ob(t,a,b,l);const j=!!a.pathSegment(t,m,{move:w,reverse:!0});N=w&&j,N||ob(t,a,p,l)}t.closePath(),t.fill(N?"evenodd":"nonzero"),t.restore()}}function VE(t,e,n){const{top:a,bottom:l}=e.chart.chartArea,{property:o,start:c,end:d}=n||{};o==="x"&&(t.beginPath(),t.rect(c,a,d-c,l-a),t.clip())}function ob(t,e,n,a){const l=e.interpolate(n,a);l&&t.lineTo(l.x,l.y)}var qE={id:"filler",afterDatasetsUpdate(t,e,n){const a=(t.data.datasets||[]).length,l=[];let o,c,d,h;for(c=0;c<a;++c)o=t.getDatasetMeta(c),d=o.dataset,h=null,d&&d.options&&d instanceof ca&&(h={visible:t.isDatasetVisible(c),index:c,fill:ME(d,c,a),chart:t,axis:o.controller.options.indexAxis,scale:o.vScale,line:d}),o.$filler=h,l.push(h);for(c=0;c<a;++c)h=l[c],!(!h||h.fill===!1)&&(h.fill=EE(l,c,n.propagate))},beforeDraw(t,e,n){const a=n.drawTime==="beforeDraw",l=t.getSortedVisibleDatasetMetas(),o=t.chartArea;for(let c=l.length-1;c>=0;--c){const d=l[c].$filler;d&&(d.line.updateControlPoints(o,d.axis),a&&d.fill&&Hf(t.ctx,d,o))}},beforeDatasetsDraw(t,e,n){if(n.drawTime!=="beforeDatasetsDraw")return;const a=t.getSortedVisibleDatasetMetas();for(let l=a.length-1;l>=0;--l){const o=a[l].$filler;sb(o)&&Hf(t.ctx,o,t.chartArea)}},beforeDatasetDraw(t,e,n){const a=e.meta.$filler;!sb(a)||n.drawTime!=="beforeDatasetDraw"||Hf(t.ctx,a,t.chartArea)},defaults:{propagate:!0,drawTime:"beforeDatasetDraw"}};const cb=(t,e)=>{let{boxHeight:n=e,boxWidth:a=e}=t;return t.usePointStyle&&(n=Math.min(n,e),a=t.pointStyleWidth||Math.min(a,e)),{boxWidth:a,boxHeight:n,itemHeight:Math.max(e,n)}},$E=(t,e)=>t!==null&&e!==null&&t.datasetIndex===e.datasetIndex&&t.index===e.index;class ub extends $n{constructor(e){super(),this._added=!1,this.legendHitBoxes=[],this._hoveredItem=null,this.doughnutMode=!1,this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this.legendItems=void 0,this.columnSizes=void 0,this.lineWidths=void 0,this.maxHeight=void 0,this.maxWidth=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.height=void 0,this.width=void 0,this._margins=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,n,a){this.maxWidth=e,this.maxHeight=n,this._margins=a,this.setDimensions(),this.buildLabels(),this.fit()}setDimensions(){this.isHorizontal()?(this.width=this.maxWidth,this.left=this._margins.left,this.right=this.width):(this.height=this.maxHeight,this.top=this._margins.top,this.bottom=this.height)}buildLabels(){const e=this.options.labels||{};let n=tt(e.generateLabels,[this.chart],this)||[];e.filter&&(n=n.filter(a=>e.filter(a,this.chart.data))),e.sort&&(n=n.sort((a,l)=>e.sort(a,l,this.chart.data))),this.options.reverse&&n.reverse(),this.legendItems=n}fit(){const{options:e,ctx:n}=this;if(!e.display){this.width=this.height=0;return}const a=e.labels,l=Nt(a.font),o=l.size,c=this._computeTitleHeight(),{boxWidth:d,itemHeight:h}=cb(a,o);let m,p;n.font=l.string,this.isHorizontal()?(m=this.maxWidth,p=this._fitRows(c,o,d,h)+10):(p=this.maxHeight,m=this._fitCols(c,l,d,h)+10),this.width=Math.min(m,e.maxWidth||this.maxWidth),this.height=Math.min(p,e.maxHeight||this.maxHeight)}_fitRows(e,n,a,l){const{ctx:o,maxWidth:c,options:{labels:{padding:d}}}=this,h=this.legendHitBoxes=[],m=this.lineWidths=[0],p=l+d;let b=e;o.textAlign="left",o.textBaseline="middle";let y=-1,v=-p;return this.legendItems.forEach((w,N)=>{const j=a+n/2+o.measureText(w.text).width;(N===0||m[m.length-1]+j+2*d>c)&&(b+=p,m[m.length-(N>0?0:1)]=0,v+=p,y++),h[N]={left:0,top:v,row:y,width:j,height:l},m[m.length-1]+=j+d}),b}_fitCols(e,n,a,l){const{ctx:o,maxHeight:c,options:{labels:{padding:d}}}=this,h=this.legendHitBoxes=[],m=this.columnSizes=[],p=c-e;let b=d,y=0,v=0,w=0,N=0;return this.legendItems.forEach((j,M)=>{const{itemWidth:T,itemHeight:A}=YE(a,n,o,j,l);M>0&&v+A+2*d>p&&(b+=y+d,m.push({width:y,height:v}),w+=y+d,N++,y=v=0),h[M]={left:w,top:v,col:N,width:T,height:A},y=Math.max(y,T),v+=A+d}),b+=y,m.push({width:y,height:v}),b}adjustHitBoxes(){if(!this.options.display)return;const e=this._computeTitleHeight(),{legendHitBoxes:n,options:{align:a,labels:{padding:l},rtl:o}}=this,c=Gs(o,this.left,this.width);if(this.isHorizontal()){let d=0,h=$t(a,this.left+l,this.right-this.lineWidths[d]);for(const m of n)d!==m.row&&(d=m.row,h=$t(a,this.left+l,this.right-this.lineWidths[d])),m.top+=this.top+e+l,m.left=c.leftForLtr(c.x(h),m.width),h+=m.width+l}else{let d=0,h=$t(a,this.top+e+l,this.bottom-this.columnSizes[d].height);for(const m of n)m.col!==d&&(d=m.col,h=$t(a,this.top+e+l,this.bottom-this.columnSizes[d].height)),m.top=h,m.left+=this.left+l,m.left=c.leftForLtr(c.x(m.left),m.width),h+=m.height+l}}isHorizontal(){return this.options.position==="top"||this.options.position==="bottom"}draw(){if(this.options.display){const e=this.ctx;tu(e,this),this._draw(),nu(e)}}_draw(){const{options:e,columnSizes:n,lineWidths:a,ctx:l}=this,{align:o,labels:c}=e,d=lt.color,h=Gs(e.rtl,this.left,this.width),m=Nt(c.font),{padding:p}=c,b=m.size,y=b/2;let v;this.drawTitle(),l.textAlign=h.textAlign("left"),l.textBaseline="middle",l.lineWidth=.5,l.font=m.string;const{boxWidth:w,boxHeight:N,itemHeight:j}=cb(c,b),M=function(k,F,$){if(isNaN(w)||w<=0||isNaN(N)||N<0)return;l.save();const V=Re($.lineWidth,1);if(l.fillStyle=Re($.fillStyle,d),l.lineCap=Re($.lineCap,"butt"),l.lineDashOffset=Re($.lineDashOffset,0),l.lineJoin=Re($.lineJoin,"miter"),l.lineWidth=V,l.strokeStyle=Re($.strokeStyle,d),l.setLineDash(Re($.lineDash,[])),c.usePointStyle){const te={radius:N*Math.SQRT2/2,pointStyle:$.pointStyle,rotation:$.rotation,borderWidth:V},se=h.xPlus(k,w/2),ee=F+y;qy(l,te,se,ee,c.pointStyleWidth&&w)}else{const te=F+Math.max((b-N)/2,0),se=h.leftForLtr(k,w),ee=ts($.borderRadius);l.beginPath(),Object.values(ee).some(ge=>ge!==0)?Tr(l,{x:se,y:te,w,h:N,radius:ee}):l.rect(se,te,w,N),l.fill(),V!==0&&l.stroke()}l.restore()},T=function(k,F,$){ss(l,$.text,k,F+j/2,m,{strikethrough:$.hidden,textAlign:h.textAlign($.textAlign)})},A=this.isHorizontal(),C=this._computeTitleHeight();A?v={x:$t(o,this.left+p,this.right-a[0]),y:this.top+p+C,line:0}:v={x:this.left+p,y:$t(o,this.top+C+p,this.bottom-n[0].height),line:0},Ky(this.ctx,e.textDirection);const S=j+p;this.legendItems.forEach((k,F)=>{l.strokeStyle=k.fontColor,l.fillStyle=k.fontColor;const $=l.measureText(k.text).width,V=h.textAlign(k.textAlign||(k.textAlign=c.textAlign)),te=w+y+$;let se=v.x,ee=v.y;h.setWidth(this.width),A?F>0&&se+te+p>this.right&&(ee=v.y+=S,v.line++,se=v.x=$t(o,this.left+p,this.right-a[v.line])):F>0&&ee+S>this.bottom&&(se=v.x=se+n[v.line].width+p,v.line++,ee=v.y=$t(o,this.top+C+p,this.bottom-n[v.line].height));const ge=h.x(se);if(M(ge,ee,k),se=dN(V,se+w+y,A?se+te:this.right,e.rtl),T(h.x(se),ee,k),A)v.x+=te+p;else if(typeof k.text!="string"){const Me=m.lineHeight;v.y+=_v(k,Me)+p}else v.y+=S}),Iy(this.ctx,e.textDirection)}drawTitle(){const e=this.options,n=e.title,a=Nt(n.font),l=Gt(n.padding);if(!n.display)return;const o=Gs(e.rtl,this.left,this.width),c=this.ctx,d=n.position,h=a.size/2,m=l.top+h;let p,b=this.left,y=this.width;if(this.isHorizontal())y=Math.max(...this.lineWidths),p=this.top+m,b=$t(e.align,b,this.right-y);else{const w=this.columnSizes.reduce((N,j)=>Math.max(N,j.height),0);p=m+$t(e.align,this.top,this.bottom-w-e.labels.padding-this._computeTitleHeight())}const v=$t(d,b,b+y);c.textAlign=o.textAlign(Oh(d)),c.textBaseline="middle",c.strokeStyle=n.color,c.fillStyle=n.color,c.font=a.string,ss(c,n.text,v,p,a)}_computeTitleHeight(){const e=this.options.title,n=Nt(e.font),a=Gt(e.padding);return e.display?n.lineHeight+a.height:0}_getLegendItemAt(e,n){let a,l,o;if(Ci(e,this.left,this.right)&&Ci(n,this.top,this.bottom)){for(o=this.legendHitBoxes,a=0;a<o.length;++a)if(l=o[a],Ci(e,l.left,l.left+l.width)&&Ci(n,l.top,l.top+l.height))return this.legendItems[a]}return null}handleEvent(e){const n=this.options;if(!WE(e.type,n))return;const a=this._getLegendItemAt(e.x,e.y);if(e.type==="mousemove"||e.type==="mouseout"){const l=this._hoveredItem,o=$E(l,a);l&&!o&&tt(n.onLeave,[e,l,this],this),this._hoveredItem=a,a&&!o&&tt(n.onHover,[e,a,this],this)}else a&&tt(n.onClick,[e,a,this],this)}}function YE(t,e,n,a,l){const o=XE(a,t,e,n),c=GE(l,a,e.lineHeight);return{itemWidth:o,itemHeight:c}}function XE(t,e,n,a){let l=t.text;return l&&typeof l!="string"&&(l=l.reduce((o,c)=>o.length>c.length?o:c)),e+n.size/2+a.measureText(l).width}function GE(t,e,n){let a=t;return typeof e.text!="string"&&(a=_v(e,n)),a}function _v(t,e){const n=t.text?t.text.length:0;return e*n}function WE(t,e){return!!((t==="mousemove"||t==="mouseout")&&(e.onHover||e.onLeave)||e.onClick&&(t==="click"||t==="mouseup"))}var QE={id:"legend",_element:ub,start(t,e,n){const a=t.legend=new ub({ctx:t.ctx,options:n,chart:t});Xt.configure(t,a,n),Xt.addBox(t,a)},stop(t){Xt.removeBox(t,t.legend),delete t.legend},beforeUpdate(t,e,n){const a=t.legend;Xt.configure(t,a,n),a.options=n},afterUpdate(t){const e=t.legend;e.buildLabels(),e.adjustHitBoxes()},afterEvent(t,e){e.replay||t.legend.handleEvent(e.event)},defaults:{display:!0,position:"top",align:"center",fullSize:!0,reverse:!1,weight:1e3,onClick(t,e,n){const a=e.datasetIndex,l=n.chart;l.isDatasetVisible(a)?(l.hide(a),e.hidden=!0):(l.show(a),e.hidden=!1)},onHover:null,onLeave:null,labels:{color:t=>t.chart.options.color,boxWidth:40,padding:10,generateLabels(t){const e=t.data.datasets,{labels:{usePointStyle:n,pointStyle:a,textAlign:l,color:o,useBorderRadius:c,borderRadius:d}}=t.legend.options;return t._getSortedDatasetMetas().map(h=>{const m=h.controller.getStyle(n?0:void 0),p=Gt(m.borderWidth);return{text:e[h.index].label,fillStyle:m.backgroundColor,fontColor:o,hidden:!h.visible,lineCap:m.borderCapStyle,lineDash:m.borderDash,lineDashOffset:m.borderDashOffset,lineJoin:m.borderJoinStyle,lineWidth:(p.width+p.height)/4,strokeStyle:m.borderColor,pointStyle:a||m.pointStyle,rotation:m.rotation,textAlign:l||m.textAlign,borderRadius:c&&(d||m.borderRadius),datasetIndex:h.index}},this)}},title:{color:t=>t.chart.options.color,display:!1,position:"center",text:""}},descriptors:{_scriptable:t=>!t.startsWith("on"),labels:{_scriptable:t=>!["generateLabels","filter","sort"].includes(t)}}};class qh extends $n{constructor(e){super(),this.chart=e.chart,this.options=e.options,this.ctx=e.ctx,this._padding=void 0,this.top=void 0,this.bottom=void 0,this.left=void 0,this.right=void 0,this.width=void 0,this.height=void 0,this.position=void 0,this.weight=void 0,this.fullSize=void 0}update(e,n){const a=this.options;if(this.left=0,this.top=0,!a.display){this.width=this.height=this.right=this.bottom=0;return}this.width=this.right=e,this.height=this.bottom=n;const l=st(a.text)?a.text.length:1;this._padding=Gt(a.padding);const o=l*Nt(a.font).lineHeight+this._padding.height;this.isHorizontal()?this.height=o:this.width=o}isHorizontal(){const e=this.options.position;return e==="top"||e==="bottom"}_drawArgs(e){const{top:n,left:a,bottom:l,right:o,options:c}=this,d=c.align;let h=0,m,p,b;return this.isHorizontal()?(p=$t(d,a,o),b=n+e,m=o-a):(c.position==="left"?(p=a+e,b=$t(d,l,n),h=it*-.5):(p=o-e,b=$t(d,n,l),h=it*.5),m=l-n),{titleX:p,titleY:b,maxWidth:m,rotation:h}}draw(){const e=this.ctx,n=this.options;if(!n.display)return;const a=Nt(n.font),o=a.lineHeight/2+this._padding.top,{titleX:c,titleY:d,maxWidth:h,rotation:m}=this._drawArgs(o);ss(e,n.text,0,0,a,{color:n.color,maxWidth:h,rotation:m,textAlign:Oh(n.align),textBaseline:"middle",translation:[c,d]})}}function ZE(t,e){const n=new qh({ctx:t.ctx,options:e,chart:t});Xt.configure(t,n,e),Xt.addBox(t,n),t.titleBlock=n}var KE={id:"title",_element:qh,start(t,e,n){ZE(t,n)},stop(t){const e=t.titleBlock;Xt.removeBox(t,e),delete t.titleBlock},beforeUpdate(t,e,n){const a=t.titleBlock;Xt.configure(t,a,n),a.options=n},defaults:{align:"center",display:!1,font:{weight:"bold"},fullSize:!0,padding:10,position:"top",text:"",weight:2e3},defaultRoutes:{color:"color"},descriptors:{_scriptable:!0,_indexable:!1}};const fc=new WeakMap;var IE={id:"subtitle",start(t,e,n){const a=new qh({ctx:t.ctx,options:n,chart:t});Xt.configure(t,a,n),Xt.addBox(t,a),fc.set(t,a)},stop(t){Xt.removeBox(t,fc.get(t)),fc.delete(t)},beforeUpdate(t,e,n){const a=fc.get(t);Xt.configure(t,a,n),a.options=n},defaults:{align:"center",display:!1,font:{weight:"normal"},fullSize:!0,padding:0,position:"top",text:"",weight:1500},defaultRoutes:{color:"color"},descriptors:{_scriptable:!0,_indexable:!1}};const mr={average(t){if(!t.length)return!1;let e,n,a=new Set,l=0,o=0;for(e=0,n=t.length;e<n;++e){const d=t[e].element;if(d&&d.hasValue()){const h=d.tooltipPosition();a.add(h.x),l+=h.y,++o}}return o===0||a.size===0?!1:{x:[...a].reduce((d,h)=>d+h)/a.size,y:l/o}},nearest(t,e){if(!t.length)return!1;let n=e.x,a=e.y,l=Number.POSITIVE_INFINITY,o,c,d;for(o=0,c=t.length;o<c;++o){const h=t[o].element;if(h&&h.hasValue()){const m=h.getCenterPoint(),p=If(e,m);p<l&&(l=p,d=h)}}if(d){const h=d.tooltipPosition();n=h.x,a=h.y}return{x:n,y:a}}};function ei(t,e){return e&&(st(e)?Array.prototype.push.apply(t,e):t.push(e)),t}function Ri(t){return(typeof t=="string"||t instanceof String)&&t.indexOf(`
 `)>-1?t.split(`
-`):t}function JE(t,e){const{element:n,datasetIndex:a,index:l}=e,o=t.getDatasetMeta(a).controller,{label:c,value:d}=o.getLabelAndValue(l);return{chart:t,label:c,parsed:o.getParsed(l),raw:t.data.datasets[a].data[l],formattedValue:d,dataset:o.getDataset(),dataIndex:l,datasetIndex:a,element:n}}function db(t,e){const n=t.chart.ctx,{body:a,footer:l,title:o}=t,{boxWidth:c,boxHeight:d}=e,h=Nt(e.bodyFont),m=Nt(e.titleFont),p=Nt(e.footerFont),b=o.length,y=l.length,v=a.length,w=Gt(e.padding);let N=w.height,j=0,M=a.reduce((C,S)=>C+S.before.length+S.lines.length+S.after.length,0);if(M+=t.beforeBody.length+t.afterBody.length,b&&(N+=b*m.lineHeight+(b-1)*e.titleSpacing+e.titleMarginBottom),M){const C=e.displayColors?Math.max(d,h.lineHeight):h.lineHeight;N+=v*C+(M-v)*h.lineHeight+(M-1)*e.bodySpacing}y&&(N+=e.footerMarginTop+y*p.lineHeight+(y-1)*e.footerSpacing);let T=0;const A=function(C){j=Math.max(j,n.measureText(C).width+T)};return n.save(),n.font=m.string,We(t.title,A),n.font=h.string,We(t.beforeBody.concat(t.afterBody),A),T=e.displayColors?c+2+e.boxPadding:0,We(a,C=>{We(C.before,A),We(C.lines,A),We(C.after,A)}),T=0,n.font=p.string,We(t.footer,A),n.restore(),j+=w.width,{width:j,height:N}}function eM(t,e){const{y:n,height:a}=e;return n<a/2?"top":n>t.height-a/2?"bottom":"center"}function tM(t,e,n,a){const{x:l,width:o}=a,c=n.caretSize+n.caretPadding;if(t==="left"&&l+o+c>e.width||t==="right"&&l-o-c<0)return!0}function nM(t,e,n,a){const{x:l,width:o}=n,{width:c,chartArea:{left:d,right:h}}=t;let m="center";return a==="center"?m=l<=(d+h)/2?"left":"right":l<=o/2?m="left":l>=c-o/2&&(m="right"),tM(m,t,e,n)&&(m="center"),m}function fb(t,e,n){const a=n.yAlign||e.yAlign||eM(t,n);return{xAlign:n.xAlign||e.xAlign||nM(t,e,n,a),yAlign:a}}function iM(t,e){let{x:n,width:a}=t;return e==="right"?n-=a:e==="center"&&(n-=a/2),n}function aM(t,e,n){let{y:a,height:l}=t;return e==="top"?a+=n:e==="bottom"?a-=l+n:a-=l/2,a}function hb(t,e,n,a){const{caretSize:l,caretPadding:o,cornerRadius:c}=t,{xAlign:d,yAlign:h}=n,m=l+o,{topLeft:p,topRight:b,bottomLeft:y,bottomRight:v}=ts(c);let w=iM(e,d);const N=aM(e,h,m);return h==="center"?d==="left"?w+=m:d==="right"&&(w-=m):d==="left"?w-=Math.max(p,y)+l:d==="right"&&(w+=Math.max(b,v)+l),{x:Rt(w,0,a.width-e.width),y:Rt(N,0,a.height-e.height)}}function hc(t,e,n){const a=Gt(n.padding);return e==="center"?t.x+t.width/2:e==="right"?t.x+t.width-a.right:t.x+a.left}function mb(t){return ei([],Ri(t))}function sM(t,e,n){return xa(t,{tooltip:e,tooltipItems:n,type:"tooltip"})}function gb(t,e){const n=e&&e.dataset&&e.dataset.tooltip&&e.dataset.tooltip.callbacks;return n?t.override(n):t}const Sv={beforeTitle:Ti,title(t){if(t.length>0){const e=t[0],n=e.chart.data.labels,a=n?n.length:0;if(this&&this.options&&this.options.mode==="dataset")return e.dataset.label||"";if(e.label)return e.label;if(a>0&&e.dataIndex<a)return n[e.dataIndex]}return""},afterTitle:Ti,beforeBody:Ti,beforeLabel:Ti,label(t){if(this&&this.options&&this.options.mode==="dataset")return t.label+": "+t.formattedValue||t.formattedValue;let e=t.dataset.label||"";e&&(e+=": ");const n=t.formattedValue;return Le(n)||(e+=n),e},labelColor(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{borderColor:n.borderColor,backgroundColor:n.backgroundColor,borderWidth:n.borderWidth,borderDash:n.borderDash,borderDashOffset:n.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{pointStyle:n.pointStyle,rotation:n.rotation}},afterLabel:Ti,afterBody:Ti,beforeFooter:Ti,footer:Ti,afterFooter:Ti};function tn(t,e,n,a){const l=t[e].call(n,a);return typeof l>"u"?Sv[e].call(n,a):l}class rh extends $n{constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){const e=this._cachedAnimations;if(e)return e;const n=this.chart,a=this.options.setContext(this.getContext()),l=a.enabled&&n.options.animation&&a.animations,o=new nv(this.chart,l);return l._cacheable&&(this._cachedAnimations=Object.freeze(o)),o}getContext(){return this.$context||(this.$context=sM(this.chart.getContext(),this,this._tooltipItems))}getTitle(e,n){const{callbacks:a}=n,l=tn(a,"beforeTitle",this,e),o=tn(a,"title",this,e),c=tn(a,"afterTitle",this,e);let d=[];return d=ei(d,Ri(l)),d=ei(d,Ri(o)),d=ei(d,Ri(c)),d}getBeforeBody(e,n){return mb(tn(n.callbacks,"beforeBody",this,e))}getBody(e,n){const{callbacks:a}=n,l=[];return We(e,o=>{const c={before:[],lines:[],after:[]},d=gb(a,o);ei(c.before,Ri(tn(d,"beforeLabel",this,o))),ei(c.lines,tn(d,"label",this,o)),ei(c.after,Ri(tn(d,"afterLabel",this,o))),l.push(c)}),l}getAfterBody(e,n){return mb(tn(n.callbacks,"afterBody",this,e))}getFooter(e,n){const{callbacks:a}=n,l=tn(a,"beforeFooter",this,e),o=tn(a,"footer",this,e),c=tn(a,"afterFooter",this,e);let d=[];return d=ei(d,Ri(l)),d=ei(d,Ri(o)),d=ei(d,Ri(c)),d}_createItems(e){const n=this._active,a=this.chart.data,l=[],o=[],c=[];let d=[],h,m;for(h=0,m=n.length;h<m;++h)d.push(JE(this.chart,n[h]));return e.filter&&(d=d.filter((p,b,y)=>e.filter(p,b,y,a))),e.itemSort&&(d=d.sort((p,b)=>e.itemSort(p,b,a))),We(d,p=>{const b=gb(e.callbacks,p);l.push(tn(b,"labelColor",this,p)),o.push(tn(b,"labelPointStyle",this,p)),c.push(tn(b,"labelTextColor",this,p))}),this.labelColors=l,this.labelPointStyles=o,this.labelTextColors=c,this.dataPoints=d,d}update(e,n){const a=this.options.setContext(this.getContext()),l=this._active;let o,c=[];if(!l.length)this.opacity!==0&&(o={opacity:0});else{const d=mr[a.position].call(this,l,this._eventPosition);c=this._createItems(a),this.title=this.getTitle(c,a),this.beforeBody=this.getBeforeBody(c,a),this.body=this.getBody(c,a),this.afterBody=this.getAfterBody(c,a),this.footer=this.getFooter(c,a);const h=this._size=db(this,a),m=Object.assign({},d,h),p=fb(this.chart,a,m),b=hb(a,m,p,this.chart);this.xAlign=p.xAlign,this.yAlign=p.yAlign,o={opacity:1,x:b.x,y:b.y,width:h.width,height:h.height,caretX:d.x,caretY:d.y}}this._tooltipItems=c,this.$context=void 0,o&&this._resolveAnimations().update(this,o),e&&a.external&&a.external.call(this,{chart:this.chart,tooltip:this,replay:n})}drawCaret(e,n,a,l){const o=this.getCaretPosition(e,a,l);n.lineTo(o.x1,o.y1),n.lineTo(o.x2,o.y2),n.lineTo(o.x3,o.y3)}getCaretPosition(e,n,a){const{xAlign:l,yAlign:o}=this,{caretSize:c,cornerRadius:d}=a,{topLeft:h,topRight:m,bottomLeft:p,bottomRight:b}=ts(d),{x:y,y:v}=e,{width:w,height:N}=n;let j,M,T,A,C,S;return o==="center"?(C=v+N/2,l==="left"?(j=y,M=j-c,A=C+c,S=C-c):(j=y+w,M=j+c,A=C-c,S=C+c),T=j):(l==="left"?M=y+Math.max(h,p)+c:l==="right"?M=y+w-Math.max(m,b)-c:M=this.caretX,o==="top"?(A=v,C=A-c,j=M-c,T=M+c):(A=v+N,C=A+c,j=M+c,T=M-c),S=A),{x1:j,x2:M,x3:T,y1:A,y2:C,y3:S}}drawTitle(e,n,a){const l=this.title,o=l.length;let c,d,h;if(o){const m=Gs(a.rtl,this.x,this.width);for(e.x=hc(this,a.titleAlign,a),n.textAlign=m.textAlign(a.titleAlign),n.textBaseline="middle",c=Nt(a.titleFont),d=a.titleSpacing,n.fillStyle=a.titleColor,n.font=c.string,h=0;h<o;++h)n.fillText(l[h],m.x(e.x),e.y+c.lineHeight/2),e.y+=c.lineHeight+d,h+1===o&&(e.y+=a.titleMarginBottom-d)}}_drawColorBox(e,n,a,l,o){const c=this.labelColors[a],d=this.labelPointStyles[a],{boxHeight:h,boxWidth:m}=o,p=Nt(o.bodyFont),b=hc(this,"left",o),y=l.x(b),v=h<p.lineHeight?(p.lineHeight-h)/2:0,w=n.y+v;if(o.usePointStyle){const N={radius:Math.min(m,h)/2,pointStyle:d.pointStyle,rotation:d.rotation,borderWidth:1},j=l.leftForLtr(y,m)+m/2,M=w+h/2;e.strokeStyle=o.multiKeyBackground,e.fillStyle=o.multiKeyBackground,eh(e,N,j,M),e.strokeStyle=c.borderColor,e.fillStyle=c.backgroundColor,eh(e,N,j,M)}else{e.lineWidth=Be(c.borderWidth)?Math.max(...Object.values(c.borderWidth)):c.borderWidth||1,e.strokeStyle=c.borderColor,e.setLineDash(c.borderDash||[]),e.lineDashOffset=c.borderDashOffset||0;const N=l.leftForLtr(y,m),j=l.leftForLtr(l.xPlus(y,1),m-2),M=ts(c.borderRadius);Object.values(M).some(T=>T!==0)?(e.beginPath(),e.fillStyle=o.multiKeyBackground,Tr(e,{x:N,y:w,w:m,h,radius:M}),e.fill(),e.stroke(),e.fillStyle=c.backgroundColor,e.beginPath(),Tr(e,{x:j,y:w+1,w:m-2,h:h-2,radius:M}),e.fill()):(e.fillStyle=o.multiKeyBackground,e.fillRect(N,w,m,h),e.strokeRect(N,w,m,h),e.fillStyle=c.backgroundColor,e.fillRect(j,w+1,m-2,h-2))}e.fillStyle=this.labelTextColors[a]}drawBody(e,n,a){const{body:l}=this,{bodySpacing:o,bodyAlign:c,displayColors:d,boxHeight:h,boxWidth:m,boxPadding:p}=a,b=Nt(a.bodyFont);let y=b.lineHeight,v=0;const w=Gs(a.rtl,this.x,this.width),N=function($){n.fillText($,w.x(e.x+v),e.y+y/2),e.y+=y+o},j=w.textAlign(c);let M,T,A,C,S,k,F;for(n.textAlign=c,n.textBaseline="middle",n.font=b.string,e.x=hc(this,j,a),n.fillStyle=a.bodyColor,We(this.beforeBody,N),v=d&&j!=="right"?c==="center"?m/2+p:m+2+p:0,C=0,k=l.length;C<k;++C){for(M=l[C],T=this.labelTextColors[C],n.fillStyle=T,We(M.before,N),A=M.lines,d&&A.length&&(this._drawColorBox(n,e,C,w,a),y=Math.max(b.lineHeight,h)),S=0,F=A.length;S<F;++S)N(A[S]),y=b.lineHeight;We(M.after,N)}v=0,y=b.lineHeight,We(this.afterBody,N),e.y-=o}drawFooter(e,n,a){const l=this.footer,o=l.length;let c,d;if(o){const h=Gs(a.rtl,this.x,this.width);for(e.x=hc(this,a.footerAlign,a),e.y+=a.footerMarginTop,n.textAlign=h.textAlign(a.footerAlign),n.textBaseline="middle",c=Nt(a.footerFont),n.fillStyle=a.footerColor,n.font=c.string,d=0;d<o;++d)n.fillText(l[d],h.x(e.x),e.y+c.lineHeight/2),e.y+=c.lineHeight+a.footerSpacing}}drawBackground(e,n,a,l){const{xAlign:o,yAlign:c}=this,{x:d,y:h}=e,{width:m,height:p}=a,{topLeft:b,topRight:y,bottomLeft:v,bottomRight:w}=ts(l.cornerRadius);n.fillStyle=l.backgroundColor,n.strokeStyle=l.borderColor,n.lineWidth=l.borderWidth,n.beginPath(),n.moveTo(d+b,h),c==="top"&&this.drawCaret(e,n,a,l),n.lineTo(d+m-y,h),n.quadraticCurveTo(d+m,h,d+m,h+y),c==="center"&&o==="right"&&this.drawCaret(e,n,a,l),n.lineTo(d+m,h+p-w),n.quadraticCurveTo(d+m,h+p,d+m-w,h+p),c==="bottom"&&this.drawCaret(e,n,a,l),n.lineTo(d+v,h+p),n.quadraticCurveTo(d,h+p,d,h+p-v),c==="center"&&o==="left"&&this.drawCaret(e,n,a,l),n.lineTo(d,h+b),n.quadraticCurveTo(d,h,d+b,h),n.closePath(),n.fill(),l.borderWidth>0&&n.stroke()}_updateAnimationTarget(e){const n=this.chart,a=this.$animations,l=a&&a.x,o=a&&a.y;if(l||o){const c=mr[e.position].call(this,this._active,this._eventPosition);if(!c)return;const d=this._size=db(this,e),h=Object.assign({},c,this._size),m=fb(n,e,h),p=hb(e,h,m,n);(l._to!==p.x||o._to!==p.y)&&(this.xAlign=m.xAlign,this.yAlign=m.yAlign,this.width=d.width,this.height=d.height,this.caretX=c.x,this.caretY=c.y,this._resolveAnimations().update(this,p))}}_willRender(){return!!this.opacity}draw(e){const n=this.options.setContext(this.getContext());let a=this.opacity;if(!a)return;this._updateAnimationTarget(n);const l={width:this.width,height:this.height},o={x:this.x,y:this.y};a=Math.abs(a)<.001?0:a;const c=Gt(n.padding),d=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;n.enabled&&d&&(e.save(),e.globalAlpha=a,this.drawBackground(o,e,l,n),Ky(e,n.textDirection),o.y+=c.top,this.drawTitle(o,e,n),this.drawBody(o,e,n),this.drawFooter(o,e,n),Iy(e,n.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,n){const a=this._active,l=e.map(({datasetIndex:d,index:h})=>{const m=this.chart.getDatasetMeta(d);if(!m)throw new Error("Cannot find a dataset at index "+d);return{datasetIndex:d,element:m.data[h],index:h}}),o=!zc(a,l),c=this._positionChanged(l,n);(o||c)&&(this._active=l,this._eventPosition=n,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,n,a=!0){if(n&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;const l=this.options,o=this._active||[],c=this._getActiveElements(e,o,n,a),d=this._positionChanged(c,e),h=n||!zc(c,o)||d;return h&&(this._active=c,(l.enabled||l.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,n))),h}_getActiveElements(e,n,a,l){const o=this.options;if(e.type==="mouseout")return[];if(!l)return n.filter(d=>this.chart.data.datasets[d.datasetIndex]&&this.chart.getDatasetMeta(d.datasetIndex).controller.getParsed(d.index)!==void 0);const c=this.chart.getElementsAtEventForMode(e,o.mode,o,a);return o.reverse&&c.reverse(),c}_positionChanged(e,n){const{caretX:a,caretY:l,options:o}=this,c=mr[o.position].call(this,e,n);return c!==!1&&(a!==c.x||l!==c.y)}}ae(rh,"positioners",mr);var lM={id:"tooltip",_element:rh,positioners:mr,afterInit(t,e,n){n&&(t.tooltip=new rh({chart:t,options:n}))},beforeUpdate(t,e,n){t.tooltip&&t.tooltip.initialize(n)},reset(t,e,n){t.tooltip&&t.tooltip.initialize(n)},afterDraw(t){const e=t.tooltip;if(e&&e._willRender()){const n={tooltip:e};if(t.notifyPlugins("beforeTooltipDraw",{...n,cancelable:!0})===!1)return;e.draw(t.ctx),t.notifyPlugins("afterTooltipDraw",n)}},afterEvent(t,e){if(t.tooltip){const n=e.replay;t.tooltip.handleEvent(e.event,n,e.inChartArea)&&(e.changed=!0)}},defaults:{enabled:!0,external:null,position:"average",backgroundColor:"rgba(0,0,0,0.8)",titleColor:"#fff",titleFont:{weight:"bold"},titleSpacing:2,titleMarginBottom:6,titleAlign:"left",bodyColor:"#fff",bodySpacing:2,bodyFont:{},bodyAlign:"left",footerColor:"#fff",footerSpacing:2,footerMarginTop:6,footerFont:{weight:"bold"},footerAlign:"left",padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(t,e)=>e.bodyFont.size,boxWidth:(t,e)=>e.bodyFont.size,multiKeyBackground:"#fff",displayColors:!0,boxPadding:0,borderColor:"rgba(0,0,0,0)",borderWidth:0,animation:{duration:400,easing:"easeOutQuart"},animations:{numbers:{type:"number",properties:["x","y","width","height","caretX","caretY"]},opacity:{easing:"linear",duration:200}},callbacks:Sv},defaultRoutes:{bodyFont:"font",footerFont:"font",titleFont:"font"},descriptors:{_scriptable:t=>t!=="filter"&&t!=="itemSort"&&t!=="external",_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:"animation"}},additionalOptionScopes:["interaction"]},rM=Object.freeze({__proto__:null,Colors:yE,Decimation:SE,Filler:qE,Legend:QE,SubTitle:IE,Title:KE,Tooltip:lM});const oM=(t,e,n,a)=>(typeof e=="string"?(n=t.push(e)-1,a.unshift({index:n,label:e})):isNaN(e)&&(n=null),n);function cM(t,e,n,a){const l=t.indexOf(e);if(l===-1)return oM(t,e,n,a);const o=t.lastIndexOf(e);return l!==o?n:l}const uM=(t,e)=>t===null?null:Rt(Math.round(t),0,e);function pb(t){const e=this.getLabels();return t>=0&&t<e.length?e[t]:t}class oh extends rs{constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){const n=this._addedLabels;if(n.length){const a=this.getLabels();for(const{index:l,label:o}of n)a[l]===o&&a.splice(l,1);this._addedLabels=[]}super.init(e)}parse(e,n){if(Le(e))return null;const a=this.getLabels();return n=isFinite(n)&&a[n]===e?n:cM(a,e,Re(n,e),this._addedLabels),uM(n,a.length-1)}determineDataLimits(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let{min:a,max:l}=this.getMinMax(!0);this.options.bounds==="ticks"&&(e||(a=0),n||(l=this.getLabels().length-1)),this.min=a,this.max=l}buildTicks(){const e=this.min,n=this.max,a=this.options.offset,l=[];let o=this.getLabels();o=e===0&&n===o.length-1?o:o.slice(e,n+1),this._valueRange=Math.max(o.length-(a?0:1),1),this._startValue=this.min-(a?.5:0);for(let c=e;c<=n;c++)l.push({value:c});return l}getLabelForValue(e){return pb.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!="number"&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}}ae(oh,"id","category"),ae(oh,"defaults",{ticks:{callback:pb}});function dM(t,e){const n=[],{bounds:l,step:o,min:c,max:d,precision:h,count:m,maxTicks:p,maxDigits:b,includeBounds:y}=t,v=o||1,w=p-1,{min:N,max:j}=e,M=!Le(c),T=!Le(d),A=!Le(m),C=(j-N)/(b+1);let S=dx((j-N)/w/v)*v,k,F,$,V;if(S<1e-14&&!M&&!T)return[{value:N},{value:j}];V=Math.ceil(j/S)-Math.floor(N/S),V>w&&(S=dx(V*S/w/v)*v),Le(h)||(k=Math.pow(10,h),S=Math.ceil(S*k)/k),l==="ticks"?(F=Math.floor(N/S)*S,$=Math.ceil(j/S)*S):(F=N,$=j),M&&T&&o&&aN((d-c)/o,S/1e3)?(V=Math.round(Math.min((d-c)/S,p)),S=(d-c)/V,F=c,$=d):A?(F=M?c:F,$=T?d:$,V=m-1,S=($-F)/V):(V=($-F)/S,xr(V,Math.round(V),S/1e3)?V=Math.round(V):V=Math.ceil(V));const te=Math.max(fx(S),fx(F));k=Math.pow(10,Le(h)?te:h),F=Math.round(F*k)/k,$=Math.round($*k)/k;let se=0;for(M&&(y&&F!==c?(n.push({value:c}),F<c&&se++,xr(Math.round((F+se*S)*k)/k,c,xb(c,C,t))&&se++):F<c&&se++);se<V;++se){const ee=Math.round((F+se*S)*k)/k;if(T&&ee>d)break;n.push({value:ee})}return T&&y&&$!==d?n.length&&xr(n[n.length-1].value,d,xb(d,C,t))?n[n.length-1].value=d:n.push({value:d}):(!T||$===d)&&n.push({value:$}),n}function xb(t,e,{horizontal:n,minRotation:a}){const l=Vn(a),o=(n?Math.sin(l):Math.cos(l))||.001,c=.75*e*(""+t).length;return Math.min(e/o,c)}class qc extends rs{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,n){return Le(e)||(typeof e=="number"||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){const{beginAtZero:e}=this.options,{minDefined:n,maxDefined:a}=this.getUserBounds();let{min:l,max:o}=this;const c=h=>l=n?l:h,d=h=>o=a?o:h;if(e){const h=ai(l),m=ai(o);h<0&&m<0?d(0):h>0&&m>0&&c(0)}if(l===o){let h=o===0?1:Math.abs(o*.05);d(o+h),e||c(l-h)}this.min=l,this.max=o}getTickLimit(){const e=this.options.ticks;let{maxTicksLimit:n,stepSize:a}=e,l;return a?(l=Math.ceil(this.max/a)-Math.floor(this.min/a)+1,l>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${a} would result generating up to ${l} ticks. Limiting to 1000.`),l=1e3)):(l=this.computeTickLimit(),n=n||11),n&&(l=Math.min(n,l)),l}computeTickLimit(){return Number.POSITIVE_INFINITY}buildTicks(){const e=this.options,n=e.ticks;let a=this.getTickLimit();a=Math.max(2,a);const l={maxTicks:a,bounds:e.bounds,min:e.min,max:e.max,precision:n.precision,step:n.stepSize,count:n.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:n.minRotation||0,includeBounds:n.includeBounds!==!1},o=this._range||this,c=dM(l,o);return e.bounds==="ticks"&&ky(c,this,"value"),e.reverse?(c.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),c}configure(){const e=this.ticks;let n=this.min,a=this.max;if(super.configure(),this.options.offset&&e.length){const l=(a-n)/Math.max(e.length-1,1)/2;n-=l,a+=l}this._startValue=n,this._endValue=a,this._valueRange=a-n}getLabelForValue(e){return Hr(e,this.chart.options.locale,this.options.ticks.format)}}class ch extends qc{determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=pt(e)?e:0,this.max=pt(n)?n:1,this.handleTickRangeOptions()}computeTickLimit(){const e=this.isHorizontal(),n=e?this.width:this.height,a=Vn(this.options.ticks.minRotation),l=(e?Math.sin(a):Math.cos(a))||.001,o=this._resolveTickFontOptions(0);return Math.ceil(n/Math.min(40,o.lineHeight/l))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}}ae(ch,"id","linear"),ae(ch,"defaults",{ticks:{callback:eu.formatters.numeric}});const Rr=t=>Math.floor(oa(t)),Ga=(t,e)=>Math.pow(10,Rr(t)+e);function bb(t){return t/Math.pow(10,Rr(t))===1}function yb(t,e,n){const a=Math.pow(10,n),l=Math.floor(t/a);return Math.ceil(e/a)-l}function fM(t,e){const n=e-t;let a=Rr(n);for(;yb(t,e,a)>10;)a++;for(;yb(t,e,a)<10;)a--;return Math.min(a,Rr(t))}function hM(t,{min:e,max:n}){e=fn(t.min,e);const a=[],l=Rr(e);let o=fM(e,n),c=o<0?Math.pow(10,Math.abs(o)):1;const d=Math.pow(10,o),h=l>o?Math.pow(10,l):0,m=Math.round((e-h)*c)/c,p=Math.floor((e-h)/d/10)*d*10;let b=Math.floor((m-p)/Math.pow(10,o)),y=fn(t.min,Math.round((h+p+b*Math.pow(10,o))*c)/c);for(;y<n;)a.push({value:y,major:bb(y),significand:b}),b>=10?b=b<15?15:20:b++,b>=20&&(o++,b=2,c=o>=0?1:c),y=Math.round((h+p+b*Math.pow(10,o))*c)/c;const v=fn(t.max,y);return a.push({value:v,major:bb(v),significand:b}),a}class uh extends rs{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,n){const a=qc.prototype.parse.apply(this,[e,n]);if(a===0){this._zero=!0;return}return pt(a)&&a>0?a:null}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=pt(e)?Math.max(0,e):null,this.max=pt(n)?Math.max(0,n):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!pt(this._userMin)&&(this.min=e===Ga(this.min,0)?Ga(this.min,-1):Ga(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let a=this.min,l=this.max;const o=d=>a=e?a:d,c=d=>l=n?l:d;a===l&&(a<=0?(o(1),c(10)):(o(Ga(a,-1)),c(Ga(l,1)))),a<=0&&o(Ga(l,-1)),l<=0&&c(Ga(a,1)),this.min=a,this.max=l}buildTicks(){const e=this.options,n={min:this._userMin,max:this._userMax},a=hM(n,this);return e.bounds==="ticks"&&ky(a,this,"value"),e.reverse?(a.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),a}getLabelForValue(e){return e===void 0?"0":Hr(e,this.chart.options.locale,this.options.ticks.format)}configure(){const e=this.min;super.configure(),this._startValue=oa(e),this._valueRange=oa(this.max)-oa(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(oa(e)-this._startValue)/this._valueRange)}getValueForPixel(e){const n=this.getDecimalForPixel(e);return Math.pow(10,this._startValue+n*this._valueRange)}}ae(uh,"id","logarithmic"),ae(uh,"defaults",{ticks:{callback:eu.formatters.logarithmic,major:{enabled:!0}}});function dh(t){const e=t.ticks;if(e.display&&t.display){const n=Gt(e.backdropPadding);return Re(e.font&&e.font.size,lt.font.size)+n.height}return 0}function mM(t,e,n){return n=st(n)?n:[n],{w:wN(t,e.string,n),h:n.length*e.lineHeight}}function vb(t,e,n,a,l){return t===a||t===l?{start:e-n/2,end:e+n/2}:t<a||t>l?{start:e-n,end:e}:{start:e,end:e+n}}function gM(t){const e={l:t.left+t._padding.left,r:t.right-t._padding.right,t:t.top+t._padding.top,b:t.bottom-t._padding.bottom},n=Object.assign({},e),a=[],l=[],o=t._pointLabels.length,c=t.options.pointLabels,d=c.centerPointLabels?it/o:0;for(let h=0;h<o;h++){const m=c.setContext(t.getPointLabelContext(h));l[h]=m.padding;const p=t.getPointPosition(h,t.drawingArea+l[h],d),b=Nt(m.font),y=mM(t.ctx,b,t._pointLabels[h]);a[h]=y;const v=mn(t.getIndexAngle(h)+d),w=Math.round(Ah(v)),N=vb(w,p.x,y.w,0,180),j=vb(w,p.y,y.h,90,270);pM(n,e,v,N,j)}t.setCenterPoint(e.l-n.l,n.r-e.r,e.t-n.t,n.b-e.b),t._pointLabelItems=yM(t,a,l)}function pM(t,e,n,a,l){const o=Math.abs(Math.sin(n)),c=Math.abs(Math.cos(n));let d=0,h=0;a.start<e.l?(d=(e.l-a.start)/o,t.l=Math.min(t.l,e.l-d)):a.end>e.r&&(d=(a.end-e.r)/o,t.r=Math.max(t.r,e.r+d)),l.start<e.t?(h=(e.t-l.start)/c,t.t=Math.min(t.t,e.t-h)):l.end>e.b&&(h=(l.end-e.b)/c,t.b=Math.max(t.b,e.b+h))}function xM(t,e,n){const a=t.drawingArea,{extra:l,additionalAngle:o,padding:c,size:d}=n,h=t.getPointPosition(e,a+l+c,o),m=Math.round(Ah(mn(h.angle+bt))),p=_M(h.y,d.h,m),b=vM(m),y=wM(h.x,d.w,b);return{visible:!0,x:h.x,y:p,textAlign:b,left:y,top:p,right:y+d.w,bottom:p+d.h}}function bM(t,e){if(!e)return!0;const{left:n,top:a,right:l,bottom:o}=t;return!(ki({x:n,y:a},e)||ki({x:n,y:o},e)||ki({x:l,y:a},e)||ki({x:l,y:o},e))}function yM(t,e,n){const a=[],l=t._pointLabels.length,o=t.options,{centerPointLabels:c,display:d}=o.pointLabels,h={extra:dh(o)/2,additionalAngle:c?it/l:0};let m;for(let p=0;p<l;p++){h.padding=n[p],h.size=e[p];const b=xM(t,p,h);a.push(b),d==="auto"&&(b.visible=bM(b,m),b.visible&&(m=b))}return a}function vM(t){return t===0||t===180?"center":t<180?"left":"right"}function wM(t,e,n){return n==="right"?t-=e:n==="center"&&(t-=e/2),t}function _M(t,e,n){return n===90||n===270?t-=e/2:(n>270||n<90)&&(t-=e),t}function SM(t,e,n){const{left:a,top:l,right:o,bottom:c}=n,{backdropColor:d}=e;if(!Le(d)){const h=ts(e.borderRadius),m=Gt(e.backdropPadding);t.fillStyle=d;const p=a-m.left,b=l-m.top,y=o-a+m.width,v=c-l+m.height;Object.values(h).some(w=>w!==0)?(t.beginPath(),Tr(t,{x:p,y:b,w:y,h:v,radius:h}),t.fill()):t.fillRect(p,b,y,v)}}function jM(t,e){const{ctx:n,options:{pointLabels:a}}=t;for(let l=e-1;l>=0;l--){const o=t._pointLabelItems[l];if(!o.visible)continue;const c=a.setContext(t.getPointLabelContext(l));SM(n,c,o);const d=Nt(c.font),{x:h,y:m,textAlign:p}=o;ss(n,t._pointLabels[l],h,m+d.lineHeight/2,d,{color:c.color,textAlign:p,textBaseline:"middle"})}}function jv(t,e,n,a){const{ctx:l}=t;if(n)l.arc(t.xCenter,t.yCenter,e,0,nt);else{let o=t.getPointPosition(0,e);l.moveTo(o.x,o.y);for(let c=1;c<a;c++)o=t.getPointPosition(c,e),l.lineTo(o.x,o.y)}}function NM(t,e,n,a,l){const o=t.ctx,c=e.circular,{color:d,lineWidth:h}=e;!c&&!a||!d||!h||n<0||(o.save(),o.strokeStyle=d,o.lineWidth=h,o.setLineDash(l.dash||[]),o.lineDashOffset=l.dashOffset,o.beginPath(),jv(t,n,c,a),o.closePath(),o.stroke(),o.restore())}function EM(t,e,n){return xa(t,{label:n,index:e,type:"pointLabel"})}class gr extends qc{constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){const e=this._padding=Gt(dh(this.options)/2),n=this.width=this.maxWidth-e.width,a=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+n/2+e.left),this.yCenter=Math.floor(this.top+a/2+e.top),this.drawingArea=Math.floor(Math.min(n,a)/2)}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!1);this.min=pt(e)&&!isNaN(e)?e:0,this.max=pt(n)&&!isNaN(n)?n:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/dh(this.options))}generateTickLabels(e){qc.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((n,a)=>{const l=tt(this.options.pointLabels.callback,[n,a],this);return l||l===0?l:""}).filter((n,a)=>this.chart.getDataVisibility(a))}fit(){const e=this.options;e.display&&e.pointLabels.display?gM(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,n,a,l){this.xCenter+=Math.floor((e-n)/2),this.yCenter+=Math.floor((a-l)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,n,a,l))}getIndexAngle(e){const n=nt/(this._pointLabels.length||1),a=this.options.startAngle||0;return mn(e*n+Vn(a))}getDistanceFromCenterForValue(e){if(Le(e))return NaN;const n=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*n:(e-this.min)*n}getValueForDistanceFromCenter(e){if(Le(e))return NaN;const n=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-n:this.min+n}getPointLabelContext(e){const n=this._pointLabels||[];if(e>=0&&e<n.length){const a=n[e];return EM(this.getContext(),e,a)}}getPointPosition(e,n,a=0){const l=this.getIndexAngle(e)-bt+a;return{x:Math.cos(l)*n+this.xCenter,y:Math.sin(l)*n+this.yCenter,angle:l}}getPointPositionForValue(e,n){return this.getPointPosition(e,this.getDistanceFromCenterForValue(n))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){const{left:n,top:a,right:l,bottom:o}=this._pointLabelItems[e];return{left:n,top:a,right:l,bottom:o}}drawBackground(){const{backgroundColor:e,grid:{circular:n}}=this.options;if(e){const a=this.ctx;a.save(),a.beginPath(),jv(this,this.getDistanceFromCenterForValue(this._endValue),n,this._pointLabels.length),a.closePath(),a.fillStyle=e,a.fill(),a.restore()}}drawGrid(){const e=this.ctx,n=this.options,{angleLines:a,grid:l,border:o}=n,c=this._pointLabels.length;let d,h,m;if(n.pointLabels.display&&jM(this,c),l.display&&this.ticks.forEach((p,b)=>{if(b!==0||b===0&&this.min<0){h=this.getDistanceFromCenterForValue(p.value);const y=this.getContext(b),v=l.setContext(y),w=o.setContext(y);NM(this,v,h,c,w)}}),a.display){for(e.save(),d=c-1;d>=0;d--){const p=a.setContext(this.getPointLabelContext(d)),{color:b,lineWidth:y}=p;!y||!b||(e.lineWidth=y,e.strokeStyle=b,e.setLineDash(p.borderDash),e.lineDashOffset=p.borderDashOffset,h=this.getDistanceFromCenterForValue(n.reverse?this.min:this.max),m=this.getPointPosition(d,h),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(m.x,m.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){const e=this.ctx,n=this.options,a=n.ticks;if(!a.display)return;const l=this.getIndexAngle(0);let o,c;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(l),e.textAlign="center",e.textBaseline="middle",this.ticks.forEach((d,h)=>{if(h===0&&this.min>=0&&!n.reverse)return;const m=a.setContext(this.getContext(h)),p=Nt(m.font);if(o=this.getDistanceFromCenterForValue(this.ticks[h].value),m.showLabelBackdrop){e.font=p.string,c=e.measureText(d.label).width,e.fillStyle=m.backdropColor;const b=Gt(m.backdropPadding);e.fillRect(-c/2-b.left,-o-p.size/2-b.top,c+b.width,p.size+b.height)}ss(e,d.label,0,-o,p,{color:m.color,strokeColor:m.textStrokeColor,strokeWidth:m.textStrokeWidth})}),e.restore()}drawTitle(){}}ae(gr,"id","radialLinear"),ae(gr,"defaults",{display:!0,animate:!0,position:"chartArea",angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:eu.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}}),ae(gr,"defaultRoutes",{"angleLines.color":"borderColor","pointLabels.color":"color","ticks.color":"color"}),ae(gr,"descriptors",{angleLines:{_fallback:"grid"}});const su={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},nn=Object.keys(su);function wb(t,e){return t-e}function _b(t,e){if(Le(e))return null;const n=t._adapter,{parser:a,round:l,isoWeekday:o}=t._parseOpts;let c=e;return typeof a=="function"&&(c=a(c)),pt(c)||(c=typeof a=="string"?n.parse(c,a):n.parse(c)),c===null?null:(l&&(c=l==="week"&&(Ws(o)||o===!0)?n.startOf(c,"isoWeek",o):n.startOf(c,l)),+c)}function Sb(t,e,n,a){const l=nn.length;for(let o=nn.indexOf(t);o<l-1;++o){const c=su[nn[o]],d=c.steps?c.steps:Number.MAX_SAFE_INTEGER;if(c.common&&Math.ceil((n-e)/(d*c.size))<=a)return nn[o]}return nn[l-1]}function MM(t,e,n,a,l){for(let o=nn.length-1;o>=nn.indexOf(n);o--){const c=nn[o];if(su[c].common&&t._adapter.diff(l,a,c)>=e-1)return c}return nn[n?nn.indexOf(n):0]}function TM(t){for(let e=nn.indexOf(t)+1,n=nn.length;e<n;++e)if(su[nn[e]].common)return nn[e]}function jb(t,e,n){if(!n)t[e]=!0;else if(n.length){const{lo:a,hi:l}=Ch(n,e),o=n[a]>=e?n[a]:n[l];t[o]=!0}}function DM(t,e,n,a){const l=t._adapter,o=+l.startOf(e[0].value,a),c=e[e.length-1].value;let d,h;for(d=o;d<=c;d=+l.add(d,1,a))h=n[d],h>=0&&(e[h].major=!0);return e}function Nb(t,e,n){const a=[],l={},o=e.length;let c,d;for(c=0;c<o;++c)d=e[c],l[d]=c,a.push({value:d,major:!1});return o===0||!n?a:DM(t,a,l,n)}class Ar extends rs{constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit="day",this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,n={}){const a=e.time||(e.time={}),l=this._adapter=new B5._date(e.adapters.date);l.init(n),pr(a.displayFormats,l.formats()),this._parseOpts={parser:a.parser,round:a.round,isoWeekday:a.isoWeekday},super.init(e),this._normalized=n.normalized}parse(e,n){return e===void 0?null:_b(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){const e=this.options,n=this._adapter,a=e.time.unit||"day";let{min:l,max:o,minDefined:c,maxDefined:d}=this.getUserBounds();function h(m){!c&&!isNaN(m.min)&&(l=Math.min(l,m.min)),!d&&!isNaN(m.max)&&(o=Math.max(o,m.max))}(!c||!d)&&(h(this._getLabelBounds()),(e.bounds!=="ticks"||e.ticks.source!=="labels")&&h(this.getMinMax(!1))),l=pt(l)&&!isNaN(l)?l:+n.startOf(Date.now(),a),o=pt(o)&&!isNaN(o)?o:+n.endOf(Date.now(),a)+1,this.min=Math.min(l,o-1),this.max=Math.max(l+1,o)}_getLabelBounds(){const e=this.getLabelTimestamps();let n=Number.POSITIVE_INFINITY,a=Number.NEGATIVE_INFINITY;return e.length&&(n=e[0],a=e[e.length-1]),{min:n,max:a}}buildTicks(){const e=this.options,n=e.time,a=e.ticks,l=a.source==="labels"?this.getLabelTimestamps():this._generate();e.bounds==="ticks"&&l.length&&(this.min=this._userMin||l[0],this.max=this._userMax||l[l.length-1]);const o=this.min,c=this.max,d=oN(l,o,c);return this._unit=n.unit||(a.autoSkip?Sb(n.minUnit,this.min,this.max,this._getLabelCapacity(o)):MM(this,d.length,n.minUnit,this.min,this.max)),this._majorUnit=!a.major.enabled||this._unit==="year"?void 0:TM(this._unit),this.initOffsets(l),e.reverse&&d.reverse(),Nb(this,d,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let n=0,a=0,l,o;this.options.offset&&e.length&&(l=this.getDecimalForValue(e[0]),e.length===1?n=1-l:n=(this.getDecimalForValue(e[1])-l)/2,o=this.getDecimalForValue(e[e.length-1]),e.length===1?a=o:a=(o-this.getDecimalForValue(e[e.length-2]))/2);const c=e.length<3?.5:.25;n=Rt(n,0,c),a=Rt(a,0,c),this._offsets={start:n,end:a,factor:1/(n+1+a)}}_generate(){const e=this._adapter,n=this.min,a=this.max,l=this.options,o=l.time,c=o.unit||Sb(o.minUnit,n,a,this._getLabelCapacity(n)),d=Re(l.ticks.stepSize,1),h=c==="week"?o.isoWeekday:!1,m=Ws(h)||h===!0,p={};let b=n,y,v;if(m&&(b=+e.startOf(b,"isoWeek",h)),b=+e.startOf(b,m?"day":c),e.diff(a,n,c)>1e5*d)throw new Error(n+" and "+a+" are too far apart with stepSize of "+d+" "+c);const w=l.ticks.source==="data"&&this.getDataTimestamps();for(y=b,v=0;y<a;y=+e.add(y,d,c),v++)jb(p,y,w);return(y===a||l.bounds==="ticks"||v===1)&&jb(p,y,w),Object.keys(p).sort(wb).map(N=>+N)}getLabelForValue(e){const n=this._adapter,a=this.options.time;return a.tooltipFormat?n.format(e,a.tooltipFormat):n.format(e,a.displayFormats.datetime)}format(e,n){const l=this.options.time.displayFormats,o=this._unit,c=n||l[o];return this._adapter.format(e,c)}_tickFormatFunction(e,n,a,l){const o=this.options,c=o.ticks.callback;if(c)return tt(c,[e,n,a],this);const d=o.time.displayFormats,h=this._unit,m=this._majorUnit,p=h&&d[h],b=m&&d[m],y=a[n],v=m&&b&&y&&y.major;return this._adapter.format(e,l||(v?b:p))}generateTickLabels(e){let n,a,l;for(n=0,a=e.length;n<a;++n)l=e[n],l.label=this._tickFormatFunction(l.value,n,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){const n=this._offsets,a=this.getDecimalForValue(e);return this.getPixelForDecimal((n.start+a)*n.factor)}getValueForPixel(e){const n=this._offsets,a=this.getDecimalForPixel(e)/n.factor-n.end;return this.min+a*(this.max-this.min)}_getLabelSize(e){const n=this.options.ticks,a=this.ctx.measureText(e).width,l=Vn(this.isHorizontal()?n.maxRotation:n.minRotation),o=Math.cos(l),c=Math.sin(l),d=this._resolveTickFontOptions(0).size;return{w:a*o+d*c,h:a*c+d*o}}_getLabelCapacity(e){const n=this.options.time,a=n.displayFormats,l=a[n.unit]||a.millisecond,o=this._tickFormatFunction(e,0,Nb(this,[e],this._majorUnit),l),c=this._getLabelSize(o),d=Math.floor(this.isHorizontal()?this.width/c.w:this.height/c.h)-1;return d>0?d:1}getDataTimestamps(){let e=this._cache.data||[],n,a;if(e.length)return e;const l=this.getMatchingVisibleMetas();if(this._normalized&&l.length)return this._cache.data=l[0].controller.getAllParsedValues(this);for(n=0,a=l.length;n<a;++n)e=e.concat(l[n].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){const e=this._cache.labels||[];let n,a;if(e.length)return e;const l=this.getLabels();for(n=0,a=l.length;n<a;++n)e.push(_b(this,l[n]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return By(e.sort(wb))}}ae(Ar,"id","time"),ae(Ar,"defaults",{bounds:"data",adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:"millisecond",displayFormats:{}},ticks:{source:"auto",callback:!1,major:{enabled:!1}}});function mc(t,e,n){let a=0,l=t.length-1,o,c,d,h;n?(e>=t[a].pos&&e<=t[l].pos&&({lo:a,hi:l}=Oi(t,"pos",e)),{pos:o,time:d}=t[a],{pos:c,time:h}=t[l]):(e>=t[a].time&&e<=t[l].time&&({lo:a,hi:l}=Oi(t,"time",e)),{time:o,pos:d}=t[a],{time:c,pos:h}=t[l]);const m=c-o;return m?d+(h-d)*(e-o)/m:d}class fh extends Ar{constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){const e=this._getTimestampsForTable(),n=this._table=this.buildLookupTable(e);this._minPos=mc(n,this.min),this._tableRange=mc(n,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){const{min:n,max:a}=this,l=[],o=[];let c,d,h,m,p;for(c=0,d=e.length;c<d;++c)m=e[c],m>=n&&m<=a&&l.push(m);if(l.length<2)return[{time:n,pos:0},{time:a,pos:1}];for(c=0,d=l.length;c<d;++c)p=l[c+1],h=l[c-1],m=l[c],Math.round((p+h)/2)!==m&&o.push({time:m,pos:c/(d-1)});return o}_generate(){const e=this.min,n=this.max;let a=super.getDataTimestamps();return(!a.includes(e)||!a.length)&&a.splice(0,0,e),(!a.includes(n)||a.length===1)&&a.push(n),a.sort((l,o)=>l-o)}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;const n=this.getDataTimestamps(),a=this.getLabelTimestamps();return n.length&&a.length?e=this.normalize(n.concat(a)):e=n.length?n:a,e=this._cache.all=e,e}getDecimalForValue(e){return(mc(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){const n=this._offsets,a=this.getDecimalForPixel(e)/n.factor-n.end;return mc(this._table,a*this._tableRange+this._minPos,!0)}}ae(fh,"id","timeseries"),ae(fh,"defaults",Ar.defaults);var RM=Object.freeze({__proto__:null,CategoryScale:oh,LinearScale:ch,LogarithmicScale:uh,RadialLinearScale:gr,TimeScale:Ar,TimeSeriesScale:fh});const AM=[z5,fE,rM,RM];ni.register(...AM);const gc=({id:t,type:e,data:n,options:a})=>{const l=R.useRef(null),[o,c]=R.useState(null),d=`${t}-${Math.random().toString(36).substr(2,9)}`;return R.useEffect(()=>{var b,y;if(o&&o.destroy(),!l.current||!n)return;const h=l.current.getContext("2d"),m={responsive:!0,maintainAspectRatio:!1,...a};let p={labels:n.labels,datasets:[]};e==="bar"?p.datasets=[{label:n.datasets?(b=n.datasets[0])==null?void 0:b.label:"Sales",data:n.datasets?(y=n.datasets[0])==null?void 0:y.data:n.values,backgroundColor:["rgba(255, 99, 132, 0.7)","rgba(54, 162, 235, 0.7)","rgba(255, 206, 86, 0.7)","rgba(75, 192, 192, 0.7)","rgba(153, 102, 255, 0.7)","rgba(255, 159, 64, 0.7)","rgba(199, 199, 199, 0.7)"],borderColor:["rgba(255, 99, 132, 1)","rgba(54, 162, 235, 1)","rgba(255, 206, 86, 1)","rgba(75, 192, 192, 1)","rgba(153, 102, 255, 1)","rgba(255, 159, 64, 1)","rgba(199, 199, 199, 1)"],borderWidth:1}]:e==="line"?p.datasets=[{label:"Sales Trend",data:n.values,fill:!1,borderColor:"rgba(75, 192, 192, 1)",tension:.1}]:e==="pie"&&(p.datasets=[{label:"Sales Distribution",data:n.values,backgroundColor:["rgba(255, 99, 132, 0.7)","rgba(54, 162, 235, 0.7)","rgba(255, 206, 86, 0.7)","rgba(75, 192, 192, 0.7)","rgba(153, 102, 255, 0.7)","rgba(255, 159, 64, 0.7)"],borderColor:["rgba(255, 99, 132, 1)","rgba(54, 162, 235, 1)","rgba(255, 206, 86, 1)","rgba(75, 192, 192, 1)","rgba(153, 102, 255, 1)","rgba(255, 159, 64, 1)"],borderWidth:1}]);try{const v=new ni(h,{type:e,data:p,options:m});c(v)}catch(v){console.error("Error creating chart:",v)}return()=>{o&&o.destroy()}},[n,t,e,a]),f.jsx("div",{style:{width:"100%",height:"300px"},children:f.jsx("canvas",{ref:l,id:d})})},CM=({limit:t})=>{const{darkTheme:e,toggleTheme:n}=Xn(),[a,l]=R.useState([]),[o,c]=R.useState(!0),[d,h]=R.useState(null),[m,p]=R.useState({key:"timestamp",direction:"descending"}),[b,y]=R.useState("All");R.useEffect(()=>{(async()=>{try{c(!0);const C=await fetch(`http://127.0.0.1:5000/transactions/${t}`);if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();l(S),c(!1)}catch(C){h(C.message),c(!1)}})()},[]);const v=A=>new Date(A).toLocaleDateString("en-US",{year:"numeric",month:"short",day:"numeric"}),w=[...a].sort((A,C)=>{if(m.key==="timestamp"){const S=new Date(A[m.key]),k=new Date(C[m.key]);return m.direction==="ascending"?S-k:k-S}else return A[m.key]<C[m.key]?m.direction==="ascending"?-1:1:A[m.key]>C[m.key]?m.direction==="ascending"?1:-1:0}),N=b==="All"?w:w.filter(A=>A.transaction_type===b),j=A=>{let C="ascending";m.key===A&&m.direction==="ascending"&&(C="descending"),p({key:A,direction:C})},M=N.reduce((A,C)=>A+C.transaction_amount,0),T=N.reduce((A,C)=>A+C.quantity,0);return o?f.jsx("div",{className:`flex items-center justify-center h-screen ${e?"bg-gray-900 text-white":"bg-white text-gray-800"}`,children:f.jsx("div",{className:"text-xl",children:"Loading transactions..."})}):d?f.jsx("div",{className:`flex items-center justify-center h-screen ${e?"bg-gray-900 text-white":"bg-white text-gray-800"}`,children:f.jsxs("div",{className:"text-xl text-red-500",children:["Error: ",d]})}):f.jsx("div",{className:`min-h-screen p-4 transition-colors duration-200 rounded-lg ${e?" text-gray-100":"bg-gray-50 text-gray-800"}`,children:f.jsxs("div",{className:"mx-auto",children:[f.jsx("div",{className:"flex justify-between items-center mb-6"}),f.jsxs("div",{className:"flex flex-col md:flex-row justify-between mb-4",children:[f.jsxs("div",{className:"mb-4 md:mb-0",children:[f.jsx("span",{className:"mr-2",children:"Filter by:"}),f.jsxs("select",{value:b,onChange:A=>y(A.target.value),className:`border rounded p-1 ${e?"bg-gray-700 border-gray-600":"bg-white border-gray-300"}`,children:[f.jsx("option",{value:"All",children:"All Transactions"}),f.jsx("option",{value:"Cash",children:"Cash"}),f.jsx("option",{value:"Online",children:"Online"})]})]}),f.jsxs("div",{className:"flex items-center",children:[f.jsx("span",{className:"mr-2",children:"Sort by:"}),f.jsxs("button",{onClick:()=>j("timestamp"),className:`mr-2 px-3 py-1 border rounded ${e?"bg-gray-700 border-gray-600 hover:bg-gray-600":"bg-gray-100 border-gray-300 hover:bg-gray-200"}`,children:["Date ",m.key==="timestamp"&&(m.direction==="ascending"?"↑":"↓")]}),f.jsxs("button",{onClick:()=>j("transaction_amount"),className:`px-3 py-1 border rounded ${e?"bg-gray-700 border-gray-600 hover:bg-gray-600":"bg-gray-100 border-gray-300 hover:bg-gray-200"}`,children:["Amount ",m.key==="transaction_amount"&&(m.direction==="ascending"?"↑":"↓")]})]})]}),f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4 mb-6",children:[f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-blue-900 text-blue-100":"bg-blue-50 text-blue-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Transactions"}),f.jsx("p",{className:"text-2xl",children:N.length})]}),f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-green-900 text-green-100":"bg-green-50 text-green-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Amount"}),f.jsxs("p",{className:"text-2xl",children:["₹",M.toFixed(2)]})]}),f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-purple-900 text-purple-100":"bg-purple-50 text-purple-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Items"}),f.jsx("p",{className:"text-2xl",children:T})]})]}),f.jsxs("div",{className:`overflow-x-auto rounded shadow ${e?"bg-gray-800":"bg-white"}`,children:[f.jsxs("table",{className:"min-w-full divide-y divide-gray-200",children:[f.jsx("thead",{className:e?"bg-gray-700":"bg-gray-50",children:f.jsxs("tr",{children:[f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Order ID"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Item"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Quantity"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Date"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Amount"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Payment"})]})}),f.jsx("tbody",{className:`divide-y ${e?"divide-gray-700":"divide-gray-200"}`,children:N.map((A,C)=>f.jsxs("tr",{className:e?"hover:bg-gray-700":`hover:bg-gray-50 ${C%2===0?"bg-gray-50":"bg-white"}`,children:[f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm font-medium",children:["#",A.order_id]}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:[f.jsx("div",{children:A.item_name}),f.jsxs("div",{className:`text-xs ${e?"text-gray-400":"text-gray-500"}`,children:["₹",A.item_price.toFixed(2)," each"]})]}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:A.quantity}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:v(A.timestamp)}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm font-medium",children:["₹",A.transaction_amount.toFixed(2)]}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:f.jsx("span",{className:`px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${A.transaction_type==="Cash"?e?"bg-yellow-900 text-yellow-200":"bg-yellow-100 text-yellow-800":e?"bg-green-900 text-green-200":"bg-green-100 text-green-800"}`,children:A.transaction_type})})]},A.order_id))})]}),N.length===0&&f.jsx("div",{className:`text-center py-10 ${e?"text-gray-400":"text-gray-500"}`,children:"No transactions found matching your criteria"})]})]})})},Eb="http://localhost:5000/api";function OM(){var F,$,V,te,se;const{darkTheme:t,toggleTheme:e}=Xn(),[n,a]=R.useState(null),[l,o]=R.useState(null),[c,d]=R.useState(),[h,m]=R.useState(!1),[p,b]=R.useState("analysis"),[y,v]=R.useState(null),[w,N]=R.useState({item_name:"Vadapav",item_type:"Fastfood",day_of_week:"Monday",time_of_day:"Evening",received_by:"Mr.",item_price:20}),[j,M]=R.useState(null);R.useEffect(()=>{T(),A(),k()},[]);const T=async()=>{var ee,ge;m(!0);try{const Me=await Ye.get(`${Eb}/get-analysis`);a(Me.data.success?Me.data:null)}catch(Me){v(((ge=(ee=Me.response)==null?void 0:ee.data)==null?void 0:ge.message)||Me.message)}finally{m(!1)}},A=async()=>{try{const ee=await Ye.get(`${Eb}/get-options`);d(ee.data.success?ee.data:null)}catch(ee){v(ee.message)}},C=async ee=>{const ge=localStorage.getItem("restaurantToken");if(ge){ee.preventDefault(),m(!0);try{const Me=await Ye.post("http://localhost:5000/predict",w,{headers:{Authorization:`Bearer ${ge}`}});o((Me.data.success,Me.data))}catch(Me){console.error("Prediction error:",Me),v(Me.message)}finally{m(!1)}}},S=ee=>{N({...w,[ee.target.name]:ee.target.value})},k=async()=>{const ee=localStorage.getItem("restaurantToken");if(ee)try{const ge=await Ye.get("http://localhost:5000/insights",{headers:{Authorization:`Bearer ${ee}`}});M(ge.data)}catch(ge){v(ge.message)}};return console.log(j),f.jsxs("div",{className:`min-h-screen p-6 md:p-8 lg:p-12 transition-colors duration-300 ${t?"bg-gradient-to-br from-gray-900 via-gray-800 to-gray-900 text-white":"bg-gradient-to-br from-gray-50 via-gray-100 to-gray-200 text-gray-800"}`,children:[f.jsx("div",{className:"flex flex-col sm:flex-row justify-between items-center mb-12",children:f.jsx("h1",{className:"text-3xl md:text-4xl font-bold mb-4 sm:mb-0 bg-clip-text text-transparent bg-gradient-to-r from-blue-500 to-purple-600",children:"Dashboard Overview"})}),f.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6 md:gap-8 mb-12",children:n&&f.jsxs(f.Fragment,{children:[f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-blue-400":"text-blue-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11.049 2.927c.3-.921 1.603-.921 1.902 0l1.519 4.674a1 1 0 00.95.69h4.915c.969 0 1.371 1.24.588 1.81l-3.976 2.888a1 1 0 00-.363 1.118l1.518 4.674c.3.922-.755 1.688-1.538 1.118l-3.976-2.888a1 1 0 00-1.176 0l-3.976 2.888c-.783.57-1.838-.197-1.538-1.118l1.518-4.674a1 1 0 00-.363-1.118l-3.976-2.888c-.784-.57-.38-1.81.588-1.81h4.914a1 1 0 00.951-.69l1.519-4.674z"})}),"Favorite Items"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"favorite-items-chart",type:"bar",data:n.favorite_items})}),f.jsx("div",{className:"bg-blue-500 dark:bg-blue-800 p-6 rounded-2xl shadow-xl transform transition-all duration-300 text-white",children:j&&j.insights.map((ee,ge)=>ge==2?f.jsx("li",{className:"flex items-start gap-3",children:f.jsx("span",{className:"text-lg font-medium",children:ee})},ge):null)})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-green-400":"text-green-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 002-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"})}),"Daily Sales"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"daily-sales-chart",type:"bar",data:n.day_sales})}),f.jsx("div",{className:"bg-blue-500 dark:bg-blue-800 p-6 rounded-2xl shadow-xl transform transition-all duration-300 text-white",children:j&&j.insights.map((ee,ge)=>ge!=2?f.jsx("li",{className:"flex items-start gap-3",children:f.jsx("span",{className:"text-lg font-medium",children:ee})},ge):null)})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-yellow-400":"text-yellow-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M7 12l3-3 3 3 4-4M8 21l4-4 4 4M3 4h18M4 4h16v12a1 1 0 01-1 1H5a1 1 0 01-1-1V4z"})}),"Monthly Sales Trend"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"monthly-sales-chart",type:"line",data:n.monthly_sales})})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-purple-400":"text-purple-600"}`,children:[f.jsxs("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:[f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 3.055A9.001 9.001 0 1020.945 13H11V3.055z"}),f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M20.488 9H15V3.512A9.025 9.025 0 0120.488 9z"})]}),"Item Type Distribution"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"item-type-chart",type:"pie",data:n.item_type_sales})})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 col-span-1 md:col-span-2 transform hover:scale-101 transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-red-400":"text-red-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M4 5a1 1 0 011-1h14a1 1 0 011 1v2a1 1 0 01-1 1H5a1 1 0 01-1-1V5zM4 13a1 1 0 011-1h6a1 1 0 011 1v6a1 1 0 01-1 1H5a1 1 0 01-1-1v-6zM16 13a1 1 0 011-1h2a1 1 0 011 1v6a1 1 0 01-1 1h-2a1 1 0 01-1-1v-6z"})}),"Sales by Day and Time"]}),f.jsx("div",{className:"overflow-hidden",children:f.jsxs("table",{className:"w-full border-collapse",children:[f.jsx("thead",{children:f.jsxs("tr",{className:`${t?"bg-gray-800":"bg-gray-100"}`,children:[f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-left",children:"Day/Time"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Morning"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Afternoon"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Evening"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Night"})]})}),f.jsx("tbody",{children:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"].map(ee=>f.jsxs("tr",{className:`${t?"hover:bg-gray-800":"hover:bg-gray-50"}`,children:[f.jsx("td",{className:"border border-gray-600 p-3 font-medium",children:ee}),["Morning","Afternoon","Evening","Night"].map(ge=>{const Me=n.heatmap_data.find(pe=>pe.day===ee&&pe.time===ge),K=Me?Me.value:0,Q=Math.max(...n.heatmap_data.map(pe=>pe.value)),ie=Math.floor(K/Q*255),re=`rgba(${ie}, ${ie}, 255, 0.8)`;return f.jsxs("td",{className:"border border-gray-600 p-3 text-center font-medium transition-all duration-300 hover:scale-105",style:{backgroundColor:re},children:["₹",K.toLocaleString()]},`${ee}-${ge}`)})]},ee))})]})})]})]})}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 mb-8`,children:[f.jsx("h2",{className:`text-2xl font-bold mb-6 ${t?"text-white":"text-gray-800"}`,children:"Sales Prediction"}),f.jsxs("form",{onSubmit:C,className:"space-y-6",children:[f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Name"}),f.jsxs("select",{name:"item_name",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Item"}),(F=c==null?void 0:c.items)==null?void 0:F.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Type"}),f.jsxs("select",{name:"item_type",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Item Type"}),($=c==null?void 0:c.item_types)==null?void 0:$.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Day of Week"}),f.jsxs("select",{name:"day_of_week",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Day"}),(V=c==null?void 0:c.days)==null?void 0:V.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Time of Day"}),f.jsxs("select",{name:"time_of_day",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Time"}),(te=c==null?void 0:c.times)==null?void 0:te.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Customer Type"}),f.jsxs("select",{name:"received_by",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Customer Type"}),(se=c==null?void 0:c.customer_types)==null?void 0:se.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Price"}),f.jsx("input",{type:"number",name:"item_price",value:w.item_price,onChange:S,required:!0,placeholder:"Item Price",className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white placeholder-gray-400 focus:border-blue-500":"bg-white border-gray-300 text-gray-800 placeholder-gray-500 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]})]}),f.jsx("button",{type:"submit",disabled:h,className:`w-full md:w-auto px-8 py-3 rounded-lg font-medium transition-all duration-300 ${h?"bg-gray-400 cursor-not-allowed":"bg-gradient-to-r from-blue-500 to-purple-600 hover:from-blue-600 hover:to-purple-700 hover:shadow-lg transform hover:-translate-y-0.5"} text-white focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500`,children:h?f.jsxs("span",{className:"flex items-center justify-center gap-2",children:[f.jsxs("svg",{className:"animate-spin h-5 w-5",fill:"none",viewBox:"0 0 24 24",children:[f.jsx("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),f.jsx("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"})]}),"Predicting..."]}):"Generate Prediction"})]}),l&&f.jsxs("div",{className:`mt-6 p-6 rounded-xl transform transition-all duration-300 ${t?"bg-gradient-to-r from-green-900 to-green-800":"bg-gradient-to-r from-green-50 to-green-100"}`,children:[f.jsx("h3",{className:`text-xl font-bold mb-4 ${t?"text-green-400":"text-green-700"}`,children:"Prediction Results"}),f.jsxs("p",{className:"text-2xl font-bold",children:["Predicted Sales: ₹ ",l.predicted_sales.toFixed(2)]})]})]}),f.jsxs(Dt,{to:"/paymenthistory",className:"flex items-center justify-end gap-2 mb-6 p-4 rounded-lg dark:bg-blue-800 bg-blue-500 text-white shadow-lg hover:shadow-xl transition-all duration-300",children:[f.jsx("h1",{children:"Quick link to payment history"}),f.jsx("span",{className:"material-symbols-outlined",children:"arrow_forward"})]})]})}function kM(){const t=Zb();return console.error(t),f.jsxs("div",{id:"error-page",children:[f.jsx("h1",{children:"Oops!"}),f.jsx("p",{children:"Sorry, an unexpected error has occurred."}),f.jsx("p",{children:f.jsx("i",{children:t.statusText||t.message})})]})}function LM(){const[t,e]=R.useState([]),[n,a]=R.useState(0),[l,o]=R.useState(""),[c,d]=R.useState(""),[h,m]=R.useState(""),[p,b]=R.useState(""),[y,v]=R.useState(""),[w,N]=R.useState(""),[j,M]=R.useState(""),[T,A]=R.useState(!1),[C,S]=R.useState(""),{darkTheme:k,toggleTheme:F}=Xn();R.useRef(null);const $=()=>{const K=new Date;o(K.toISOString().split("T")[0]),d(K.toTimeString().slice(0,5)),S(`BILL-${K.getTime().toString().slice(-6)}`),A(!T)},V=()=>{if(!y||!w||!j){alert("Please fill in all item fields correctly");return}const K={id:Date.now(),description:y,quantity:parseInt(w),price:parseFloat(j),total:parseInt(w)*parseFloat(j)},Q=[...t,K];e(Q),a(Q.reduce((ie,re)=>ie+re.total,0)),v(""),N(""),M("")},te=K=>{const Q=t.filter(ie=>ie.id!==K);e(Q),a(Q.reduce((ie,re)=>ie+re.total,0))},se=async K=>{if(K.preventDefault(),!l||!c||!h||t.length===0){alert("Please fill in all required fields and add at least one item before generating the bill");return}try{const Q=localStorage.getItem("restaurantToken");if(!Q){alert("You must be logged in to generate bills");return}const ie=ge(),re=await fetch("http://localhost:5000/generate-bill",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${Q}`},body:JSON.stringify({billNumber:C||`BILL-${Date.now().toString().slice(-6)}`,date:l,time:c,customerName:h,tableNumber:p,items:t,grandTotal:n,tax:ie})}),pe=await re.json();re.ok?(alert(`Bill generated successfully! Bill Number: ${pe.bill_number}`),ee()):alert(`Error: ${pe.error||"Failed to generate bill"}`)}catch(Q){console.error("Error generating bill:",Q),alert("An error occurred while generating the bill. Please try again.")}},ee=()=>{e([]),a(0),m(""),b(""),S(""),T||(o(""),d(""))},ge=()=>n*.18,Me=()=>{if(!l||!c||!h||t.length===0){alert("Please fill in all required fields and add at least one item before printing");return}window.print()};return f.jsxs("div",{className:`min-h-screen p-4 transition-colors duration-300 ${k?"bg-gradient-to-br from-gray-900 via-gray-800 to-gray-900 text-white":"bg-gradient-to-br from-gray-50 via-gray-100 to-gray-50 text-gray-900"}`,children:[f.jsx("div",{className:"w-full mx-auto",children:f.jsxs("form",{onSubmit:se,className:"overflow-hidden space-y-8 mb-20",children:[f.jsxs("div",{className:"flex flex-col lg:flex-row gap-8",children:[f.jsxs("div",{className:`p-6 rounded-xl flex-1 ${k?"bg-gray-700/50":"bg-gray-50"}`,children:[f.jsxs("div",{className:"flex items-center gap-2 mb-6",children:[f.jsx("svg",{className:"w-6 h-6 text-blue-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"})}),f.jsx("h2",{className:"text-xl font-semibold",children:"Customer Details"})]}),f.jsxs("div",{className:"space-y-4",children:[f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Date"}),f.jsx("input",{type:"date",value:l,onChange:K=>o(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Time"}),f.jsx("input",{type:"time",value:c,onChange:K=>d(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Bill Number"}),f.jsx("input",{type:"text",placeholder:"Auto-generated with auto-fill",value:C,onChange:K=>S(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Customer Name"}),f.jsx("input",{type:"text",placeholder:"Enter customer name",value:h,onChange:K=>m(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Table Number"}),f.jsx("input",{type:"number",placeholder:"Enter table number",value:p,onChange:K=>b(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsx("div",{className:"mt-6",children:f.jsxs("label",{className:"flex items-center space-x-3 cursor-pointer",children:[f.jsx("input",{type:"checkbox",checked:T,onChange:$,className:`rounded text-blue-600 focus:ring-blue-500 w-5 h-5 ${k?"bg-gray-800":"bg-white"}`}),f.jsx("span",{className:"text-sm opacity-90",children:"Auto-Fill Date, Time & Generate Bill Number"})]})})]})]}),f.jsxs("div",{className:`p-6 rounded-xl flex-1 ${k?"bg-gray-700/50":"bg-gray-50"}`,children:[f.jsxs("div",{className:"flex items-center gap-2 mb-6",children:[f.jsx("svg",{className:"w-6 h-6 text-green-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 5H7a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V7a2 2 0 00-2-2h-2M9 5a2 2 0 002 2h2a2 2 0 002-2M9 5a2 2 0 012-2h2a2 2 0 012 2"})}),f.jsx("h2",{className:"text-xl font-semibold",children:"Add Items"})]}),f.jsxs("div",{className:"space-y-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Item Description"}),f.jsx("input",{type:"text",placeholder:"Enter item description",value:y,onChange:K=>v(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Quantity"}),f.jsx("input",{type:"number",placeholder:"Enter quantity",value:w,onChange:K=>N(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Unit Price"}),f.jsx("input",{type:"number",placeholder:"Enter unit price",value:j,onChange:K=>M(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]})]}),f.jsx("button",{type:"button",onClick:V,className:"w-full mt-6 px-6 py-3 bg-gradient-to-r from-green-500 to-green-600 text-white rounded-lg hover:from-green-600 hover:to-green-700 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",children:"Add Item"}),f.jsxs("div",{className:`mt-6 p-4 rounded-lg ${k?"bg-gray-800/70":"bg-white"}`,children:[f.jsx("h3",{className:"font-medium mb-2",children:"Current Bill Summary"}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Items:"}),f.jsx("span",{children:t.length})]}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Subtotal:"}),f.jsxs("span",{children:["₹",n.toFixed(2)]})]}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Tax (18%):"}),f.jsxs("span",{children:["₹",ge().toFixed(2)]})]}),f.jsxs("div",{className:"flex justify-between font-medium mt-1 text-blue-600 dark:text-blue-400",children:[f.jsx("span",{children:"Total:"}),f.jsxs("span",{children:["₹",(n+ge()).toFixed(2)]})]})]})]})]})]}),f.jsx("div",{className:"overflow-hidden rounded-xl shadow-lg",children:f.jsxs("table",{className:"w-full",children:[f.jsx("thead",{children:f.jsxs("tr",{className:`${k?"bg-gray-700":"bg-gray-200"}`,children:[f.jsx("th",{className:"p-4 text-left font-semibold",children:"Description"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Quantity"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Unit Price"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Total"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Action"})]})}),f.jsx("tbody",{children:t.length===0?f.jsx("tr",{className:`${k?"bg-gray-800/50":"bg-white"}`,children:f.jsx("td",{colSpan:"5",className:"p-8 text-center text-gray-500",children:f.jsxs("div",{className:"flex flex-col items-center gap-2",children:[f.jsx("svg",{className:"w-12 h-12 opacity-50",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"})}),f.jsx("p",{children:"No items added yet. Add items to generate your bill."})]})})}):t.map((K,Q)=>f.jsxs("tr",{className:`
+`):t}function JE(t,e){const{element:n,datasetIndex:a,index:l}=e,o=t.getDatasetMeta(a).controller,{label:c,value:d}=o.getLabelAndValue(l);return{chart:t,label:c,parsed:o.getParsed(l),raw:t.data.datasets[a].data[l],formattedValue:d,dataset:o.getDataset(),dataIndex:l,datasetIndex:a,element:n}}function db(t,e){const n=t.chart.ctx,{body:a,footer:l,title:o}=t,{boxWidth:c,boxHeight:d}=e,h=Nt(e.bodyFont),m=Nt(e.titleFont),p=Nt(e.footerFont),b=o.length,y=l.length,v=a.length,w=Gt(e.padding);let N=w.height,j=0,M=a.reduce((C,S)=>C+S.before.length+S.lines.length+S.after.length,0);if(M+=t.beforeBody.length+t.afterBody.length,b&&(N+=b*m.lineHeight+(b-1)*e.titleSpacing+e.titleMarginBottom),M){const C=e.displayColors?Math.max(d,h.lineHeight):h.lineHeight;N+=v*C+(M-v)*h.lineHeight+(M-1)*e.bodySpacing}y&&(N+=e.footerMarginTop+y*p.lineHeight+(y-1)*e.footerSpacing);let T=0;const A=function(C){j=Math.max(j,n.measureText(C).width+T)};return n.save(),n.font=m.string,We(t.title,A),n.font=h.string,We(t.beforeBody.concat(t.afterBody),A),T=e.displayColors?c+2+e.boxPadding:0,We(a,C=>{We(C.before,A),We(C.lines,A),We(C.after,A)}),T=0,n.font=p.string,We(t.footer,A),n.restore(),j+=w.width,{width:j,height:N}}function eM(t,e){const{y:n,height:a}=e;return n<a/2?"top":n>t.height-a/2?"bottom":"center"}function tM(t,e,n,a){const{x:l,width:o}=a,c=n.caretSize+n.caretPadding;if(t==="left"&&l+o+c>e.width||t==="right"&&l-o-c<0)return!0}function nM(t,e,n,a){const{x:l,width:o}=n,{width:c,chartArea:{left:d,right:h}}=t;let m="center";return a==="center"?m=l<=(d+h)/2?"left":"right":l<=o/2?m="left":l>=c-o/2&&(m="right"),tM(m,t,e,n)&&(m="center"),m}function fb(t,e,n){const a=n.yAlign||e.yAlign||eM(t,n);return{xAlign:n.xAlign||e.xAlign||nM(t,e,n,a),yAlign:a}}function iM(t,e){let{x:n,width:a}=t;return e==="right"?n-=a:e==="center"&&(n-=a/2),n}function aM(t,e,n){let{y:a,height:l}=t;return e==="top"?a+=n:e==="bottom"?a-=l+n:a-=l/2,a}function hb(t,e,n,a){const{caretSize:l,caretPadding:o,cornerRadius:c}=t,{xAlign:d,yAlign:h}=n,m=l+o,{topLeft:p,topRight:b,bottomLeft:y,bottomRight:v}=ts(c);let w=iM(e,d);const N=aM(e,h,m);return h==="center"?d==="left"?w+=m:d==="right"&&(w-=m):d==="left"?w-=Math.max(p,y)+l:d==="right"&&(w+=Math.max(b,v)+l),{x:Rt(w,0,a.width-e.width),y:Rt(N,0,a.height-e.height)}}function hc(t,e,n){const a=Gt(n.padding);return e==="center"?t.x+t.width/2:e==="right"?t.x+t.width-a.right:t.x+a.left}function mb(t){return ei([],Ri(t))}function sM(t,e,n){return xa(t,{tooltip:e,tooltipItems:n,type:"tooltip"})}function gb(t,e){const n=e&&e.dataset&&e.dataset.tooltip&&e.dataset.tooltip.callbacks;return n?t.override(n):t}const Sv={beforeTitle:Ti,title(t){if(t.length>0){const e=t[0],n=e.chart.data.labels,a=n?n.length:0;if(this&&this.options&&this.options.mode==="dataset")return e.dataset.label||"";if(e.label)return e.label;if(a>0&&e.dataIndex<a)return n[e.dataIndex]}return""},afterTitle:Ti,beforeBody:Ti,beforeLabel:Ti,label(t){if(this&&this.options&&this.options.mode==="dataset")return t.label+": "+t.formattedValue||t.formattedValue;let e=t.dataset.label||"";e&&(e+=": ");const n=t.formattedValue;return Le(n)||(e+=n),e},labelColor(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{borderColor:n.borderColor,backgroundColor:n.backgroundColor,borderWidth:n.borderWidth,borderDash:n.borderDash,borderDashOffset:n.borderDashOffset,borderRadius:0}},labelTextColor(){return this.options.bodyColor},labelPointStyle(t){const n=t.chart.getDatasetMeta(t.datasetIndex).controller.getStyle(t.dataIndex);return{pointStyle:n.pointStyle,rotation:n.rotation}},afterLabel:Ti,afterBody:Ti,beforeFooter:Ti,footer:Ti,afterFooter:Ti};function tn(t,e,n,a){const l=t[e].call(n,a);return typeof l>"u"?Sv[e].call(n,a):l}class rh extends $n{constructor(e){super(),this.opacity=0,this._active=[],this._eventPosition=void 0,this._size=void 0,this._cachedAnimations=void 0,this._tooltipItems=[],this.$animations=void 0,this.$context=void 0,this.chart=e.chart,this.options=e.options,this.dataPoints=void 0,this.title=void 0,this.beforeBody=void 0,this.body=void 0,this.afterBody=void 0,this.footer=void 0,this.xAlign=void 0,this.yAlign=void 0,this.x=void 0,this.y=void 0,this.height=void 0,this.width=void 0,this.caretX=void 0,this.caretY=void 0,this.labelColors=void 0,this.labelPointStyles=void 0,this.labelTextColors=void 0}initialize(e){this.options=e,this._cachedAnimations=void 0,this.$context=void 0}_resolveAnimations(){const e=this._cachedAnimations;if(e)return e;const n=this.chart,a=this.options.setContext(this.getContext()),l=a.enabled&&n.options.animation&&a.animations,o=new nv(this.chart,l);return l._cacheable&&(this._cachedAnimations=Object.freeze(o)),o}getContext(){return this.$context||(this.$context=sM(this.chart.getContext(),this,this._tooltipItems))}getTitle(e,n){const{callbacks:a}=n,l=tn(a,"beforeTitle",this,e),o=tn(a,"title",this,e),c=tn(a,"afterTitle",this,e);let d=[];return d=ei(d,Ri(l)),d=ei(d,Ri(o)),d=ei(d,Ri(c)),d}getBeforeBody(e,n){return mb(tn(n.callbacks,"beforeBody",this,e))}getBody(e,n){const{callbacks:a}=n,l=[];return We(e,o=>{const c={before:[],lines:[],after:[]},d=gb(a,o);ei(c.before,Ri(tn(d,"beforeLabel",this,o))),ei(c.lines,tn(d,"label",this,o)),ei(c.after,Ri(tn(d,"afterLabel",this,o))),l.push(c)}),l}getAfterBody(e,n){return mb(tn(n.callbacks,"afterBody",this,e))}getFooter(e,n){const{callbacks:a}=n,l=tn(a,"beforeFooter",this,e),o=tn(a,"footer",this,e),c=tn(a,"afterFooter",this,e);let d=[];return d=ei(d,Ri(l)),d=ei(d,Ri(o)),d=ei(d,Ri(c)),d}_createItems(e){const n=this._active,a=this.chart.data,l=[],o=[],c=[];let d=[],h,m;for(h=0,m=n.length;h<m;++h)d.push(JE(this.chart,n[h]));return e.filter&&(d=d.filter((p,b,y)=>e.filter(p,b,y,a))),e.itemSort&&(d=d.sort((p,b)=>e.itemSort(p,b,a))),We(d,p=>{const b=gb(e.callbacks,p);l.push(tn(b,"labelColor",this,p)),o.push(tn(b,"labelPointStyle",this,p)),c.push(tn(b,"labelTextColor",this,p))}),this.labelColors=l,this.labelPointStyles=o,this.labelTextColors=c,this.dataPoints=d,d}update(e,n){const a=this.options.setContext(this.getContext()),l=this._active;let o,c=[];if(!l.length)this.opacity!==0&&(o={opacity:0});else{const d=mr[a.position].call(this,l,this._eventPosition);c=this._createItems(a),this.title=this.getTitle(c,a),this.beforeBody=this.getBeforeBody(c,a),this.body=this.getBody(c,a),this.afterBody=this.getAfterBody(c,a),this.footer=this.getFooter(c,a);const h=this._size=db(this,a),m=Object.assign({},d,h),p=fb(this.chart,a,m),b=hb(a,m,p,this.chart);this.xAlign=p.xAlign,this.yAlign=p.yAlign,o={opacity:1,x:b.x,y:b.y,width:h.width,height:h.height,caretX:d.x,caretY:d.y}}this._tooltipItems=c,this.$context=void 0,o&&this._resolveAnimations().update(this,o),e&&a.external&&a.external.call(this,{chart:this.chart,tooltip:this,replay:n})}drawCaret(e,n,a,l){const o=this.getCaretPosition(e,a,l);n.lineTo(o.x1,o.y1),n.lineTo(o.x2,o.y2),n.lineTo(o.x3,o.y3)}getCaretPosition(e,n,a){const{xAlign:l,yAlign:o}=this,{caretSize:c,cornerRadius:d}=a,{topLeft:h,topRight:m,bottomLeft:p,bottomRight:b}=ts(d),{x:y,y:v}=e,{width:w,height:N}=n;let j,M,T,A,C,S;return o==="center"?(C=v+N/2,l==="left"?(j=y,M=j-c,A=C+c,S=C-c):(j=y+w,M=j+c,A=C-c,S=C+c),T=j):(l==="left"?M=y+Math.max(h,p)+c:l==="right"?M=y+w-Math.max(m,b)-c:M=this.caretX,o==="top"?(A=v,C=A-c,j=M-c,T=M+c):(A=v+N,C=A+c,j=M+c,T=M-c),S=A),{x1:j,x2:M,x3:T,y1:A,y2:C,y3:S}}drawTitle(e,n,a){const l=this.title,o=l.length;let c,d,h;if(o){const m=Gs(a.rtl,this.x,this.width);for(e.x=hc(this,a.titleAlign,a),n.textAlign=m.textAlign(a.titleAlign),n.textBaseline="middle",c=Nt(a.titleFont),d=a.titleSpacing,n.fillStyle=a.titleColor,n.font=c.string,h=0;h<o;++h)n.fillText(l[h],m.x(e.x),e.y+c.lineHeight/2),e.y+=c.lineHeight+d,h+1===o&&(e.y+=a.titleMarginBottom-d)}}_drawColorBox(e,n,a,l,o){const c=this.labelColors[a],d=this.labelPointStyles[a],{boxHeight:h,boxWidth:m}=o,p=Nt(o.bodyFont),b=hc(this,"left",o),y=l.x(b),v=h<p.lineHeight?(p.lineHeight-h)/2:0,w=n.y+v;if(o.usePointStyle){const N={radius:Math.min(m,h)/2,pointStyle:d.pointStyle,rotation:d.rotation,borderWidth:1},j=l.leftForLtr(y,m)+m/2,M=w+h/2;e.strokeStyle=o.multiKeyBackground,e.fillStyle=o.multiKeyBackground,eh(e,N,j,M),e.strokeStyle=c.borderColor,e.fillStyle=c.backgroundColor,eh(e,N,j,M)}else{e.lineWidth=Be(c.borderWidth)?Math.max(...Object.values(c.borderWidth)):c.borderWidth||1,e.strokeStyle=c.borderColor,e.setLineDash(c.borderDash||[]),e.lineDashOffset=c.borderDashOffset||0;const N=l.leftForLtr(y,m),j=l.leftForLtr(l.xPlus(y,1),m-2),M=ts(c.borderRadius);Object.values(M).some(T=>T!==0)?(e.beginPath(),e.fillStyle=o.multiKeyBackground,Tr(e,{x:N,y:w,w:m,h,radius:M}),e.fill(),e.stroke(),e.fillStyle=c.backgroundColor,e.beginPath(),Tr(e,{x:j,y:w+1,w:m-2,h:h-2,radius:M}),e.fill()):(e.fillStyle=o.multiKeyBackground,e.fillRect(N,w,m,h),e.strokeRect(N,w,m,h),e.fillStyle=c.backgroundColor,e.fillRect(j,w+1,m-2,h-2))}e.fillStyle=this.labelTextColors[a]}drawBody(e,n,a){const{body:l}=this,{bodySpacing:o,bodyAlign:c,displayColors:d,boxHeight:h,boxWidth:m,boxPadding:p}=a,b=Nt(a.bodyFont);let y=b.lineHeight,v=0;const w=Gs(a.rtl,this.x,this.width),N=function($){n.fillText($,w.x(e.x+v),e.y+y/2),e.y+=y+o},j=w.textAlign(c);let M,T,A,C,S,k,F;for(n.textAlign=c,n.textBaseline="middle",n.font=b.string,e.x=hc(this,j,a),n.fillStyle=a.bodyColor,We(this.beforeBody,N),v=d&&j!=="right"?c==="center"?m/2+p:m+2+p:0,C=0,k=l.length;C<k;++C){for(M=l[C],T=this.labelTextColors[C],n.fillStyle=T,We(M.before,N),A=M.lines,d&&A.length&&(this._drawColorBox(n,e,C,w,a),y=Math.max(b.lineHeight,h)),S=0,F=A.length;S<F;++S)N(A[S]),y=b.lineHeight;We(M.after,N)}v=0,y=b.lineHeight,We(this.afterBody,N),e.y-=o}drawFooter(e,n,a){const l=this.footer,o=l.length;let c,d;if(o){const h=Gs(a.rtl,this.x,this.width);for(e.x=hc(this,a.footerAlign,a),e.y+=a.footerMarginTop,n.textAlign=h.textAlign(a.footerAlign),n.textBaseline="middle",c=Nt(a.footerFont),n.fillStyle=a.footerColor,n.font=c.string,d=0;d<o;++d)n.fillText(l[d],h.x(e.x),e.y+c.lineHeight/2),e.y+=c.lineHeight+a.footerSpacing}}drawBackground(e,n,a,l){const{xAlign:o,yAlign:c}=this,{x:d,y:h}=e,{width:m,height:p}=a,{topLeft:b,topRight:y,bottomLeft:v,bottomRight:w}=ts(l.cornerRadius);n.fillStyle=l.backgroundColor,n.strokeStyle=l.borderColor,n.lineWidth=l.borderWidth,n.beginPath(),n.moveTo(d+b,h),c==="top"&&this.drawCaret(e,n,a,l),n.lineTo(d+m-y,h),n.quadraticCurveTo(d+m,h,d+m,h+y),c==="center"&&o==="right"&&this.drawCaret(e,n,a,l),n.lineTo(d+m,h+p-w),n.quadraticCurveTo(d+m,h+p,d+m-w,h+p),c==="bottom"&&this.drawCaret(e,n,a,l),n.lineTo(d+v,h+p),n.quadraticCurveTo(d,h+p,d,h+p-v),c==="center"&&o==="left"&&this.drawCaret(e,n,a,l),n.lineTo(d,h+b),n.quadraticCurveTo(d,h,d+b,h),n.closePath(),n.fill(),l.borderWidth>0&&n.stroke()}_updateAnimationTarget(e){const n=this.chart,a=this.$animations,l=a&&a.x,o=a&&a.y;if(l||o){const c=mr[e.position].call(this,this._active,this._eventPosition);if(!c)return;const d=this._size=db(this,e),h=Object.assign({},c,this._size),m=fb(n,e,h),p=hb(e,h,m,n);(l._to!==p.x||o._to!==p.y)&&(this.xAlign=m.xAlign,this.yAlign=m.yAlign,this.width=d.width,this.height=d.height,this.caretX=c.x,this.caretY=c.y,this._resolveAnimations().update(this,p))}}_willRender(){return!!this.opacity}draw(e){const n=this.options.setContext(this.getContext());let a=this.opacity;if(!a)return;this._updateAnimationTarget(n);const l={width:this.width,height:this.height},o={x:this.x,y:this.y};a=Math.abs(a)<.001?0:a;const c=Gt(n.padding),d=this.title.length||this.beforeBody.length||this.body.length||this.afterBody.length||this.footer.length;n.enabled&&d&&(e.save(),e.globalAlpha=a,this.drawBackground(o,e,l,n),Ky(e,n.textDirection),o.y+=c.top,this.drawTitle(o,e,n),this.drawBody(o,e,n),this.drawFooter(o,e,n),Iy(e,n.textDirection),e.restore())}getActiveElements(){return this._active||[]}setActiveElements(e,n){const a=this._active,l=e.map(({datasetIndex:d,index:h})=>{const m=this.chart.getDatasetMeta(d);if(!m)throw new Error("Cannot find a dataset at index "+d);return{datasetIndex:d,element:m.data[h],index:h}}),o=!zc(a,l),c=this._positionChanged(l,n);(o||c)&&(this._active=l,this._eventPosition=n,this._ignoreReplayEvents=!0,this.update(!0))}handleEvent(e,n,a=!0){if(n&&this._ignoreReplayEvents)return!1;this._ignoreReplayEvents=!1;const l=this.options,o=this._active||[],c=this._getActiveElements(e,o,n,a),d=this._positionChanged(c,e),h=n||!zc(c,o)||d;return h&&(this._active=c,(l.enabled||l.external)&&(this._eventPosition={x:e.x,y:e.y},this.update(!0,n))),h}_getActiveElements(e,n,a,l){const o=this.options;if(e.type==="mouseout")return[];if(!l)return n.filter(d=>this.chart.data.datasets[d.datasetIndex]&&this.chart.getDatasetMeta(d.datasetIndex).controller.getParsed(d.index)!==void 0);const c=this.chart.getElementsAtEventForMode(e,o.mode,o,a);return o.reverse&&c.reverse(),c}_positionChanged(e,n){const{caretX:a,caretY:l,options:o}=this,c=mr[o.position].call(this,e,n);return c!==!1&&(a!==c.x||l!==c.y)}}ae(rh,"positioners",mr);var lM={id:"tooltip",_element:rh,positioners:mr,afterInit(t,e,n){n&&(t.tooltip=new rh({chart:t,options:n}))},beforeUpdate(t,e,n){t.tooltip&&t.tooltip.initialize(n)},reset(t,e,n){t.tooltip&&t.tooltip.initialize(n)},afterDraw(t){const e=t.tooltip;if(e&&e._willRender()){const n={tooltip:e};if(t.notifyPlugins("beforeTooltipDraw",{...n,cancelable:!0})===!1)return;e.draw(t.ctx),t.notifyPlugins("afterTooltipDraw",n)}},afterEvent(t,e){if(t.tooltip){const n=e.replay;t.tooltip.handleEvent(e.event,n,e.inChartArea)&&(e.changed=!0)}},defaults:{enabled:!0,external:null,position:"average",backgroundColor:"rgba(0,0,0,0.8)",titleColor:"#fff",titleFont:{weight:"bold"},titleSpacing:2,titleMarginBottom:6,titleAlign:"left",bodyColor:"#fff",bodySpacing:2,bodyFont:{},bodyAlign:"left",footerColor:"#fff",footerSpacing:2,footerMarginTop:6,footerFont:{weight:"bold"},footerAlign:"left",padding:6,caretPadding:2,caretSize:5,cornerRadius:6,boxHeight:(t,e)=>e.bodyFont.size,boxWidth:(t,e)=>e.bodyFont.size,multiKeyBackground:"#fff",displayColors:!0,boxPadding:0,borderColor:"rgba(0,0,0,0)",borderWidth:0,animation:{duration:400,easing:"easeOutQuart"},animations:{numbers:{type:"number",properties:["x","y","width","height","caretX","caretY"]},opacity:{easing:"linear",duration:200}},callbacks:Sv},defaultRoutes:{bodyFont:"font",footerFont:"font",titleFont:"font"},descriptors:{_scriptable:t=>t!=="filter"&&t!=="itemSort"&&t!=="external",_indexable:!1,callbacks:{_scriptable:!1,_indexable:!1},animation:{_fallback:!1},animations:{_fallback:"animation"}},additionalOptionScopes:["interaction"]},rM=Object.freeze({__proto__:null,Colors:yE,Decimation:SE,Filler:qE,Legend:QE,SubTitle:IE,Title:KE,Tooltip:lM});const oM=(t,e,n,a)=>(typeof e=="string"?(n=t.push(e)-1,a.unshift({index:n,label:e})):isNaN(e)&&(n=null),n);function cM(t,e,n,a){const l=t.indexOf(e);if(l===-1)return oM(t,e,n,a);const o=t.lastIndexOf(e);return l!==o?n:l}const uM=(t,e)=>t===null?null:Rt(Math.round(t),0,e);function pb(t){const e=this.getLabels();return t>=0&&t<e.length?e[t]:t}class oh extends rs{constructor(e){super(e),this._startValue=void 0,this._valueRange=0,this._addedLabels=[]}init(e){const n=this._addedLabels;if(n.length){const a=this.getLabels();for(const{index:l,label:o}of n)a[l]===o&&a.splice(l,1);this._addedLabels=[]}super.init(e)}parse(e,n){if(Le(e))return null;const a=this.getLabels();return n=isFinite(n)&&a[n]===e?n:cM(a,e,Re(n,e),this._addedLabels),uM(n,a.length-1)}determineDataLimits(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let{min:a,max:l}=this.getMinMax(!0);this.options.bounds==="ticks"&&(e||(a=0),n||(l=this.getLabels().length-1)),this.min=a,this.max=l}buildTicks(){const e=this.min,n=this.max,a=this.options.offset,l=[];let o=this.getLabels();o=e===0&&n===o.length-1?o:o.slice(e,n+1),this._valueRange=Math.max(o.length-(a?0:1),1),this._startValue=this.min-(a?.5:0);for(let c=e;c<=n;c++)l.push({value:c});return l}getLabelForValue(e){return pb.call(this,e)}configure(){super.configure(),this.isHorizontal()||(this._reversePixels=!this._reversePixels)}getPixelForValue(e){return typeof e!="number"&&(e=this.parse(e)),e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getPixelForTick(e){const n=this.ticks;return e<0||e>n.length-1?null:this.getPixelForValue(n[e].value)}getValueForPixel(e){return Math.round(this._startValue+this.getDecimalForPixel(e)*this._valueRange)}getBasePixel(){return this.bottom}}ae(oh,"id","category"),ae(oh,"defaults",{ticks:{callback:pb}});function dM(t,e){const n=[],{bounds:l,step:o,min:c,max:d,precision:h,count:m,maxTicks:p,maxDigits:b,includeBounds:y}=t,v=o||1,w=p-1,{min:N,max:j}=e,M=!Le(c),T=!Le(d),A=!Le(m),C=(j-N)/(b+1);let S=dx((j-N)/w/v)*v,k,F,$,V;if(S<1e-14&&!M&&!T)return[{value:N},{value:j}];V=Math.ceil(j/S)-Math.floor(N/S),V>w&&(S=dx(V*S/w/v)*v),Le(h)||(k=Math.pow(10,h),S=Math.ceil(S*k)/k),l==="ticks"?(F=Math.floor(N/S)*S,$=Math.ceil(j/S)*S):(F=N,$=j),M&&T&&o&&aN((d-c)/o,S/1e3)?(V=Math.round(Math.min((d-c)/S,p)),S=(d-c)/V,F=c,$=d):A?(F=M?c:F,$=T?d:$,V=m-1,S=($-F)/V):(V=($-F)/S,xr(V,Math.round(V),S/1e3)?V=Math.round(V):V=Math.ceil(V));const te=Math.max(fx(S),fx(F));k=Math.pow(10,Le(h)?te:h),F=Math.round(F*k)/k,$=Math.round($*k)/k;let se=0;for(M&&(y&&F!==c?(n.push({value:c}),F<c&&se++,xr(Math.round((F+se*S)*k)/k,c,xb(c,C,t))&&se++):F<c&&se++);se<V;++se){const ee=Math.round((F+se*S)*k)/k;if(T&&ee>d)break;n.push({value:ee})}return T&&y&&$!==d?n.length&&xr(n[n.length-1].value,d,xb(d,C,t))?n[n.length-1].value=d:n.push({value:d}):(!T||$===d)&&n.push({value:$}),n}function xb(t,e,{horizontal:n,minRotation:a}){const l=Vn(a),o=(n?Math.sin(l):Math.cos(l))||.001,c=.75*e*(""+t).length;return Math.min(e/o,c)}class qc extends rs{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._endValue=void 0,this._valueRange=0}parse(e,n){return Le(e)||(typeof e=="number"||e instanceof Number)&&!isFinite(+e)?null:+e}handleTickRangeOptions(){const{beginAtZero:e}=this.options,{minDefined:n,maxDefined:a}=this.getUserBounds();let{min:l,max:o}=this;const c=h=>l=n?l:h,d=h=>o=a?o:h;if(e){const h=ai(l),m=ai(o);h<0&&m<0?d(0):h>0&&m>0&&c(0)}if(l===o){let h=o===0?1:Math.abs(o*.05);d(o+h),e||c(l-h)}this.min=l,this.max=o}getTickLimit(){const e=this.options.ticks;let{maxTicksLimit:n,stepSize:a}=e,l;return a?(l=Math.ceil(this.max/a)-Math.floor(this.min/a)+1,l>1e3&&(console.warn(`scales.${this.id}.ticks.stepSize: ${a} would result generating up to ${l} ticks. Limiting to 1000.`),l=1e3)):(l=this.computeTickLimit(),n=n||11),n&&(l=Math.min(n,l)),l}computeTickLimit(){return Number.POSITIVE_INFINITY}buildTicks(){const e=this.options,n=e.ticks;let a=this.getTickLimit();a=Math.max(2,a);const l={maxTicks:a,bounds:e.bounds,min:e.min,max:e.max,precision:n.precision,step:n.stepSize,count:n.count,maxDigits:this._maxDigits(),horizontal:this.isHorizontal(),minRotation:n.minRotation||0,includeBounds:n.includeBounds!==!1},o=this._range||this,c=dM(l,o);return e.bounds==="ticks"&&ky(c,this,"value"),e.reverse?(c.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),c}configure(){const e=this.ticks;let n=this.min,a=this.max;if(super.configure(),this.options.offset&&e.length){const l=(a-n)/Math.max(e.length-1,1)/2;n-=l,a+=l}this._startValue=n,this._endValue=a,this._valueRange=a-n}getLabelForValue(e){return Hr(e,this.chart.options.locale,this.options.ticks.format)}}class ch extends qc{determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=pt(e)?e:0,this.max=pt(n)?n:1,this.handleTickRangeOptions()}computeTickLimit(){const e=this.isHorizontal(),n=e?this.width:this.height,a=Vn(this.options.ticks.minRotation),l=(e?Math.sin(a):Math.cos(a))||.001,o=this._resolveTickFontOptions(0);return Math.ceil(n/Math.min(40,o.lineHeight/l))}getPixelForValue(e){return e===null?NaN:this.getPixelForDecimal((e-this._startValue)/this._valueRange)}getValueForPixel(e){return this._startValue+this.getDecimalForPixel(e)*this._valueRange}}ae(ch,"id","linear"),ae(ch,"defaults",{ticks:{callback:eu.formatters.numeric}});const Rr=t=>Math.floor(oa(t)),Ga=(t,e)=>Math.pow(10,Rr(t)+e);function bb(t){return t/Math.pow(10,Rr(t))===1}function yb(t,e,n){const a=Math.pow(10,n),l=Math.floor(t/a);return Math.ceil(e/a)-l}function fM(t,e){const n=e-t;let a=Rr(n);for(;yb(t,e,a)>10;)a++;for(;yb(t,e,a)<10;)a--;return Math.min(a,Rr(t))}function hM(t,{min:e,max:n}){e=fn(t.min,e);const a=[],l=Rr(e);let o=fM(e,n),c=o<0?Math.pow(10,Math.abs(o)):1;const d=Math.pow(10,o),h=l>o?Math.pow(10,l):0,m=Math.round((e-h)*c)/c,p=Math.floor((e-h)/d/10)*d*10;let b=Math.floor((m-p)/Math.pow(10,o)),y=fn(t.min,Math.round((h+p+b*Math.pow(10,o))*c)/c);for(;y<n;)a.push({value:y,major:bb(y),significand:b}),b>=10?b=b<15?15:20:b++,b>=20&&(o++,b=2,c=o>=0?1:c),y=Math.round((h+p+b*Math.pow(10,o))*c)/c;const v=fn(t.max,y);return a.push({value:v,major:bb(v),significand:b}),a}class uh extends rs{constructor(e){super(e),this.start=void 0,this.end=void 0,this._startValue=void 0,this._valueRange=0}parse(e,n){const a=qc.prototype.parse.apply(this,[e,n]);if(a===0){this._zero=!0;return}return pt(a)&&a>0?a:null}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!0);this.min=pt(e)?Math.max(0,e):null,this.max=pt(n)?Math.max(0,n):null,this.options.beginAtZero&&(this._zero=!0),this._zero&&this.min!==this._suggestedMin&&!pt(this._userMin)&&(this.min=e===Ga(this.min,0)?Ga(this.min,-1):Ga(this.min,0)),this.handleTickRangeOptions()}handleTickRangeOptions(){const{minDefined:e,maxDefined:n}=this.getUserBounds();let a=this.min,l=this.max;const o=d=>a=e?a:d,c=d=>l=n?l:d;a===l&&(a<=0?(o(1),c(10)):(o(Ga(a,-1)),c(Ga(l,1)))),a<=0&&o(Ga(l,-1)),l<=0&&c(Ga(a,1)),this.min=a,this.max=l}buildTicks(){const e=this.options,n={min:this._userMin,max:this._userMax},a=hM(n,this);return e.bounds==="ticks"&&ky(a,this,"value"),e.reverse?(a.reverse(),this.start=this.max,this.end=this.min):(this.start=this.min,this.end=this.max),a}getLabelForValue(e){return e===void 0?"0":Hr(e,this.chart.options.locale,this.options.ticks.format)}configure(){const e=this.min;super.configure(),this._startValue=oa(e),this._valueRange=oa(this.max)-oa(e)}getPixelForValue(e){return(e===void 0||e===0)&&(e=this.min),e===null||isNaN(e)?NaN:this.getPixelForDecimal(e===this.min?0:(oa(e)-this._startValue)/this._valueRange)}getValueForPixel(e){const n=this.getDecimalForPixel(e);return Math.pow(10,this._startValue+n*this._valueRange)}}ae(uh,"id","logarithmic"),ae(uh,"defaults",{ticks:{callback:eu.formatters.logarithmic,major:{enabled:!0}}});function dh(t){const e=t.ticks;if(e.display&&t.display){const n=Gt(e.backdropPadding);return Re(e.font&&e.font.size,lt.font.size)+n.height}return 0}function mM(t,e,n){return n=st(n)?n:[n],{w:wN(t,e.string,n),h:n.length*e.lineHeight}}function vb(t,e,n,a,l){return t===a||t===l?{start:e-n/2,end:e+n/2}:t<a||t>l?{start:e-n,end:e}:{start:e,end:e+n}}function gM(t){const e={l:t.left+t._padding.left,r:t.right-t._padding.right,t:t.top+t._padding.top,b:t.bottom-t._padding.bottom},n=Object.assign({},e),a=[],l=[],o=t._pointLabels.length,c=t.options.pointLabels,d=c.centerPointLabels?it/o:0;for(let h=0;h<o;h++){const m=c.setContext(t.getPointLabelContext(h));l[h]=m.padding;const p=t.getPointPosition(h,t.drawingArea+l[h],d),b=Nt(m.font),y=mM(t.ctx,b,t._pointLabels[h]);a[h]=y;const v=mn(t.getIndexAngle(h)+d),w=Math.round(Ah(v)),N=vb(w,p.x,y.w,0,180),j=vb(w,p.y,y.h,90,270);pM(n,e,v,N,j)}t.setCenterPoint(e.l-n.l,n.r-e.r,e.t-n.t,n.b-e.b),t._pointLabelItems=yM(t,a,l)}function pM(t,e,n,a,l){const o=Math.abs(Math.sin(n)),c=Math.abs(Math.cos(n));let d=0,h=0;a.start<e.l?(d=(e.l-a.start)/o,t.l=Math.min(t.l,e.l-d)):a.end>e.r&&(d=(a.end-e.r)/o,t.r=Math.max(t.r,e.r+d)),l.start<e.t?(h=(e.t-l.start)/c,t.t=Math.min(t.t,e.t-h)):l.end>e.b&&(h=(l.end-e.b)/c,t.b=Math.max(t.b,e.b+h))}function xM(t,e,n){const a=t.drawingArea,{extra:l,additionalAngle:o,padding:c,size:d}=n,h=t.getPointPosition(e,a+l+c,o),m=Math.round(Ah(mn(h.angle+bt))),p=_M(h.y,d.h,m),b=vM(m),y=wM(h.x,d.w,b);return{visible:!0,x:h.x,y:p,textAlign:b,left:y,top:p,right:y+d.w,bottom:p+d.h}}function bM(t,e){if(!e)return!0;const{left:n,top:a,right:l,bottom:o}=t;return!(ki({x:n,y:a},e)||ki({x:n,y:o},e)||ki({x:l,y:a},e)||ki({x:l,y:o},e))}function yM(t,e,n){const a=[],l=t._pointLabels.length,o=t.options,{centerPointLabels:c,display:d}=o.pointLabels,h={extra:dh(o)/2,additionalAngle:c?it/l:0};let m;for(let p=0;p<l;p++){h.padding=n[p],h.size=e[p];const b=xM(t,p,h);a.push(b),d==="auto"&&(b.visible=bM(b,m),b.visible&&(m=b))}return a}function vM(t){return t===0||t===180?"center":t<180?"left":"right"}function wM(t,e,n){return n==="right"?t-=e:n==="center"&&(t-=e/2),t}function _M(t,e,n){return n===90||n===270?t-=e/2:(n>270||n<90)&&(t-=e),t}function SM(t,e,n){const{left:a,top:l,right:o,bottom:c}=n,{backdropColor:d}=e;if(!Le(d)){const h=ts(e.borderRadius),m=Gt(e.backdropPadding);t.fillStyle=d;const p=a-m.left,b=l-m.top,y=o-a+m.width,v=c-l+m.height;Object.values(h).some(w=>w!==0)?(t.beginPath(),Tr(t,{x:p,y:b,w:y,h:v,radius:h}),t.fill()):t.fillRect(p,b,y,v)}}function jM(t,e){const{ctx:n,options:{pointLabels:a}}=t;for(let l=e-1;l>=0;l--){const o=t._pointLabelItems[l];if(!o.visible)continue;const c=a.setContext(t.getPointLabelContext(l));SM(n,c,o);const d=Nt(c.font),{x:h,y:m,textAlign:p}=o;ss(n,t._pointLabels[l],h,m+d.lineHeight/2,d,{color:c.color,textAlign:p,textBaseline:"middle"})}}function jv(t,e,n,a){const{ctx:l}=t;if(n)l.arc(t.xCenter,t.yCenter,e,0,nt);else{let o=t.getPointPosition(0,e);l.moveTo(o.x,o.y);for(let c=1;c<a;c++)o=t.getPointPosition(c,e),l.lineTo(o.x,o.y)}}function NM(t,e,n,a,l){const o=t.ctx,c=e.circular,{color:d,lineWidth:h}=e;!c&&!a||!d||!h||n<0||(o.save(),o.strokeStyle=d,o.lineWidth=h,o.setLineDash(l.dash||[]),o.lineDashOffset=l.dashOffset,o.beginPath(),jv(t,n,c,a),o.closePath(),o.stroke(),o.restore())}function EM(t,e,n){return xa(t,{label:n,index:e,type:"pointLabel"})}class gr extends qc{constructor(e){super(e),this.xCenter=void 0,this.yCenter=void 0,this.drawingArea=void 0,this._pointLabels=[],this._pointLabelItems=[]}setDimensions(){const e=this._padding=Gt(dh(this.options)/2),n=this.width=this.maxWidth-e.width,a=this.height=this.maxHeight-e.height;this.xCenter=Math.floor(this.left+n/2+e.left),this.yCenter=Math.floor(this.top+a/2+e.top),this.drawingArea=Math.floor(Math.min(n,a)/2)}determineDataLimits(){const{min:e,max:n}=this.getMinMax(!1);this.min=pt(e)&&!isNaN(e)?e:0,this.max=pt(n)&&!isNaN(n)?n:0,this.handleTickRangeOptions()}computeTickLimit(){return Math.ceil(this.drawingArea/dh(this.options))}generateTickLabels(e){qc.prototype.generateTickLabels.call(this,e),this._pointLabels=this.getLabels().map((n,a)=>{const l=tt(this.options.pointLabels.callback,[n,a],this);return l||l===0?l:""}).filter((n,a)=>this.chart.getDataVisibility(a))}fit(){const e=this.options;e.display&&e.pointLabels.display?gM(this):this.setCenterPoint(0,0,0,0)}setCenterPoint(e,n,a,l){this.xCenter+=Math.floor((e-n)/2),this.yCenter+=Math.floor((a-l)/2),this.drawingArea-=Math.min(this.drawingArea/2,Math.max(e,n,a,l))}getIndexAngle(e){const n=nt/(this._pointLabels.length||1),a=this.options.startAngle||0;return mn(e*n+Vn(a))}getDistanceFromCenterForValue(e){if(Le(e))return NaN;const n=this.drawingArea/(this.max-this.min);return this.options.reverse?(this.max-e)*n:(e-this.min)*n}getValueForDistanceFromCenter(e){if(Le(e))return NaN;const n=e/(this.drawingArea/(this.max-this.min));return this.options.reverse?this.max-n:this.min+n}getPointLabelContext(e){const n=this._pointLabels||[];if(e>=0&&e<n.length){const a=n[e];return EM(this.getContext(),e,a)}}getPointPosition(e,n,a=0){const l=this.getIndexAngle(e)-bt+a;return{x:Math.cos(l)*n+this.xCenter,y:Math.sin(l)*n+this.yCenter,angle:l}}getPointPositionForValue(e,n){return this.getPointPosition(e,this.getDistanceFromCenterForValue(n))}getBasePosition(e){return this.getPointPositionForValue(e||0,this.getBaseValue())}getPointLabelPosition(e){const{left:n,top:a,right:l,bottom:o}=this._pointLabelItems[e];return{left:n,top:a,right:l,bottom:o}}drawBackground(){const{backgroundColor:e,grid:{circular:n}}=this.options;if(e){const a=this.ctx;a.save(),a.beginPath(),jv(this,this.getDistanceFromCenterForValue(this._endValue),n,this._pointLabels.length),a.closePath(),a.fillStyle=e,a.fill(),a.restore()}}drawGrid(){const e=this.ctx,n=this.options,{angleLines:a,grid:l,border:o}=n,c=this._pointLabels.length;let d,h,m;if(n.pointLabels.display&&jM(this,c),l.display&&this.ticks.forEach((p,b)=>{if(b!==0||b===0&&this.min<0){h=this.getDistanceFromCenterForValue(p.value);const y=this.getContext(b),v=l.setContext(y),w=o.setContext(y);NM(this,v,h,c,w)}}),a.display){for(e.save(),d=c-1;d>=0;d--){const p=a.setContext(this.getPointLabelContext(d)),{color:b,lineWidth:y}=p;!y||!b||(e.lineWidth=y,e.strokeStyle=b,e.setLineDash(p.borderDash),e.lineDashOffset=p.borderDashOffset,h=this.getDistanceFromCenterForValue(n.reverse?this.min:this.max),m=this.getPointPosition(d,h),e.beginPath(),e.moveTo(this.xCenter,this.yCenter),e.lineTo(m.x,m.y),e.stroke())}e.restore()}}drawBorder(){}drawLabels(){const e=this.ctx,n=this.options,a=n.ticks;if(!a.display)return;const l=this.getIndexAngle(0);let o,c;e.save(),e.translate(this.xCenter,this.yCenter),e.rotate(l),e.textAlign="center",e.textBaseline="middle",this.ticks.forEach((d,h)=>{if(h===0&&this.min>=0&&!n.reverse)return;const m=a.setContext(this.getContext(h)),p=Nt(m.font);if(o=this.getDistanceFromCenterForValue(this.ticks[h].value),m.showLabelBackdrop){e.font=p.string,c=e.measureText(d.label).width,e.fillStyle=m.backdropColor;const b=Gt(m.backdropPadding);e.fillRect(-c/2-b.left,-o-p.size/2-b.top,c+b.width,p.size+b.height)}ss(e,d.label,0,-o,p,{color:m.color,strokeColor:m.textStrokeColor,strokeWidth:m.textStrokeWidth})}),e.restore()}drawTitle(){}}ae(gr,"id","radialLinear"),ae(gr,"defaults",{display:!0,animate:!0,position:"chartArea",angleLines:{display:!0,lineWidth:1,borderDash:[],borderDashOffset:0},grid:{circular:!1},startAngle:0,ticks:{showLabelBackdrop:!0,callback:eu.formatters.numeric},pointLabels:{backdropColor:void 0,backdropPadding:2,display:!0,font:{size:10},callback(e){return e},padding:5,centerPointLabels:!1}}),ae(gr,"defaultRoutes",{"angleLines.color":"borderColor","pointLabels.color":"color","ticks.color":"color"}),ae(gr,"descriptors",{angleLines:{_fallback:"grid"}});const su={millisecond:{common:!0,size:1,steps:1e3},second:{common:!0,size:1e3,steps:60},minute:{common:!0,size:6e4,steps:60},hour:{common:!0,size:36e5,steps:24},day:{common:!0,size:864e5,steps:30},week:{common:!1,size:6048e5,steps:4},month:{common:!0,size:2628e6,steps:12},quarter:{common:!1,size:7884e6,steps:4},year:{common:!0,size:3154e7}},nn=Object.keys(su);function wb(t,e){return t-e}function _b(t,e){if(Le(e))return null;const n=t._adapter,{parser:a,round:l,isoWeekday:o}=t._parseOpts;let c=e;return typeof a=="function"&&(c=a(c)),pt(c)||(c=typeof a=="string"?n.parse(c,a):n.parse(c)),c===null?null:(l&&(c=l==="week"&&(Ws(o)||o===!0)?n.startOf(c,"isoWeek",o):n.startOf(c,l)),+c)}function Sb(t,e,n,a){const l=nn.length;for(let o=nn.indexOf(t);o<l-1;++o){const c=su[nn[o]],d=c.steps?c.steps:Number.MAX_SAFE_INTEGER;if(c.common&&Math.ceil((n-e)/(d*c.size))<=a)return nn[o]}return nn[l-1]}function MM(t,e,n,a,l){for(let o=nn.length-1;o>=nn.indexOf(n);o--){const c=nn[o];if(su[c].common&&t._adapter.diff(l,a,c)>=e-1)return c}return nn[n?nn.indexOf(n):0]}function TM(t){for(let e=nn.indexOf(t)+1,n=nn.length;e<n;++e)if(su[nn[e]].common)return nn[e]}function jb(t,e,n){if(!n)t[e]=!0;else if(n.length){const{lo:a,hi:l}=Ch(n,e),o=n[a]>=e?n[a]:n[l];t[o]=!0}}function DM(t,e,n,a){const l=t._adapter,o=+l.startOf(e[0].value,a),c=e[e.length-1].value;let d,h;for(d=o;d<=c;d=+l.add(d,1,a))h=n[d],h>=0&&(e[h].major=!0);return e}function Nb(t,e,n){const a=[],l={},o=e.length;let c,d;for(c=0;c<o;++c)d=e[c],l[d]=c,a.push({value:d,major:!1});return o===0||!n?a:DM(t,a,l,n)}class Ar extends rs{constructor(e){super(e),this._cache={data:[],labels:[],all:[]},this._unit="day",this._majorUnit=void 0,this._offsets={},this._normalized=!1,this._parseOpts=void 0}init(e,n={}){const a=e.time||(e.time={}),l=this._adapter=new B5._date(e.adapters.date);l.init(n),pr(a.displayFormats,l.formats()),this._parseOpts={parser:a.parser,round:a.round,isoWeekday:a.isoWeekday},super.init(e),this._normalized=n.normalized}parse(e,n){return e===void 0?null:_b(this,e)}beforeLayout(){super.beforeLayout(),this._cache={data:[],labels:[],all:[]}}determineDataLimits(){const e=this.options,n=this._adapter,a=e.time.unit||"day";let{min:l,max:o,minDefined:c,maxDefined:d}=this.getUserBounds();function h(m){!c&&!isNaN(m.min)&&(l=Math.min(l,m.min)),!d&&!isNaN(m.max)&&(o=Math.max(o,m.max))}(!c||!d)&&(h(this._getLabelBounds()),(e.bounds!=="ticks"||e.ticks.source!=="labels")&&h(this.getMinMax(!1))),l=pt(l)&&!isNaN(l)?l:+n.startOf(Date.now(),a),o=pt(o)&&!isNaN(o)?o:+n.endOf(Date.now(),a)+1,this.min=Math.min(l,o-1),this.max=Math.max(l+1,o)}_getLabelBounds(){const e=this.getLabelTimestamps();let n=Number.POSITIVE_INFINITY,a=Number.NEGATIVE_INFINITY;return e.length&&(n=e[0],a=e[e.length-1]),{min:n,max:a}}buildTicks(){const e=this.options,n=e.time,a=e.ticks,l=a.source==="labels"?this.getLabelTimestamps():this._generate();e.bounds==="ticks"&&l.length&&(this.min=this._userMin||l[0],this.max=this._userMax||l[l.length-1]);const o=this.min,c=this.max,d=oN(l,o,c);return this._unit=n.unit||(a.autoSkip?Sb(n.minUnit,this.min,this.max,this._getLabelCapacity(o)):MM(this,d.length,n.minUnit,this.min,this.max)),this._majorUnit=!a.major.enabled||this._unit==="year"?void 0:TM(this._unit),this.initOffsets(l),e.reverse&&d.reverse(),Nb(this,d,this._majorUnit)}afterAutoSkip(){this.options.offsetAfterAutoskip&&this.initOffsets(this.ticks.map(e=>+e.value))}initOffsets(e=[]){let n=0,a=0,l,o;this.options.offset&&e.length&&(l=this.getDecimalForValue(e[0]),e.length===1?n=1-l:n=(this.getDecimalForValue(e[1])-l)/2,o=this.getDecimalForValue(e[e.length-1]),e.length===1?a=o:a=(o-this.getDecimalForValue(e[e.length-2]))/2);const c=e.length<3?.5:.25;n=Rt(n,0,c),a=Rt(a,0,c),this._offsets={start:n,end:a,factor:1/(n+1+a)}}_generate(){const e=this._adapter,n=this.min,a=this.max,l=this.options,o=l.time,c=o.unit||Sb(o.minUnit,n,a,this._getLabelCapacity(n)),d=Re(l.ticks.stepSize,1),h=c==="week"?o.isoWeekday:!1,m=Ws(h)||h===!0,p={};let b=n,y,v;if(m&&(b=+e.startOf(b,"isoWeek",h)),b=+e.startOf(b,m?"day":c),e.diff(a,n,c)>1e5*d)throw new Error(n+" and "+a+" are too far apart with stepSize of "+d+" "+c);const w=l.ticks.source==="data"&&this.getDataTimestamps();for(y=b,v=0;y<a;y=+e.add(y,d,c),v++)jb(p,y,w);return(y===a||l.bounds==="ticks"||v===1)&&jb(p,y,w),Object.keys(p).sort(wb).map(N=>+N)}getLabelForValue(e){const n=this._adapter,a=this.options.time;return a.tooltipFormat?n.format(e,a.tooltipFormat):n.format(e,a.displayFormats.datetime)}format(e,n){const l=this.options.time.displayFormats,o=this._unit,c=n||l[o];return this._adapter.format(e,c)}_tickFormatFunction(e,n,a,l){const o=this.options,c=o.ticks.callback;if(c)return tt(c,[e,n,a],this);const d=o.time.displayFormats,h=this._unit,m=this._majorUnit,p=h&&d[h],b=m&&d[m],y=a[n],v=m&&b&&y&&y.major;return this._adapter.format(e,l||(v?b:p))}generateTickLabels(e){let n,a,l;for(n=0,a=e.length;n<a;++n)l=e[n],l.label=this._tickFormatFunction(l.value,n,e)}getDecimalForValue(e){return e===null?NaN:(e-this.min)/(this.max-this.min)}getPixelForValue(e){const n=this._offsets,a=this.getDecimalForValue(e);return this.getPixelForDecimal((n.start+a)*n.factor)}getValueForPixel(e){const n=this._offsets,a=this.getDecimalForPixel(e)/n.factor-n.end;return this.min+a*(this.max-this.min)}_getLabelSize(e){const n=this.options.ticks,a=this.ctx.measureText(e).width,l=Vn(this.isHorizontal()?n.maxRotation:n.minRotation),o=Math.cos(l),c=Math.sin(l),d=this._resolveTickFontOptions(0).size;return{w:a*o+d*c,h:a*c+d*o}}_getLabelCapacity(e){const n=this.options.time,a=n.displayFormats,l=a[n.unit]||a.millisecond,o=this._tickFormatFunction(e,0,Nb(this,[e],this._majorUnit),l),c=this._getLabelSize(o),d=Math.floor(this.isHorizontal()?this.width/c.w:this.height/c.h)-1;return d>0?d:1}getDataTimestamps(){let e=this._cache.data||[],n,a;if(e.length)return e;const l=this.getMatchingVisibleMetas();if(this._normalized&&l.length)return this._cache.data=l[0].controller.getAllParsedValues(this);for(n=0,a=l.length;n<a;++n)e=e.concat(l[n].controller.getAllParsedValues(this));return this._cache.data=this.normalize(e)}getLabelTimestamps(){const e=this._cache.labels||[];let n,a;if(e.length)return e;const l=this.getLabels();for(n=0,a=l.length;n<a;++n)e.push(_b(this,l[n]));return this._cache.labels=this._normalized?e:this.normalize(e)}normalize(e){return By(e.sort(wb))}}ae(Ar,"id","time"),ae(Ar,"defaults",{bounds:"data",adapters:{},time:{parser:!1,unit:!1,round:!1,isoWeekday:!1,minUnit:"millisecond",displayFormats:{}},ticks:{source:"auto",callback:!1,major:{enabled:!1}}});function mc(t,e,n){let a=0,l=t.length-1,o,c,d,h;n?(e>=t[a].pos&&e<=t[l].pos&&({lo:a,hi:l}=Oi(t,"pos",e)),{pos:o,time:d}=t[a],{pos:c,time:h}=t[l]):(e>=t[a].time&&e<=t[l].time&&({lo:a,hi:l}=Oi(t,"time",e)),{time:o,pos:d}=t[a],{time:c,pos:h}=t[l]);const m=c-o;return m?d+(h-d)*(e-o)/m:d}class fh extends Ar{constructor(e){super(e),this._table=[],this._minPos=void 0,this._tableRange=void 0}initOffsets(){const e=this._getTimestampsForTable(),n=this._table=this.buildLookupTable(e);this._minPos=mc(n,this.min),this._tableRange=mc(n,this.max)-this._minPos,super.initOffsets(e)}buildLookupTable(e){const{min:n,max:a}=this,l=[],o=[];let c,d,h,m,p;for(c=0,d=e.length;c<d;++c)m=e[c],m>=n&&m<=a&&l.push(m);if(l.length<2)return[{time:n,pos:0},{time:a,pos:1}];for(c=0,d=l.length;c<d;++c)p=l[c+1],h=l[c-1],m=l[c],Math.round((p+h)/2)!==m&&o.push({time:m,pos:c/(d-1)});return o}_generate(){const e=this.min,n=this.max;let a=super.getDataTimestamps();return(!a.includes(e)||!a.length)&&a.splice(0,0,e),(!a.includes(n)||a.length===1)&&a.push(n),a.sort((l,o)=>l-o)}_getTimestampsForTable(){let e=this._cache.all||[];if(e.length)return e;const n=this.getDataTimestamps(),a=this.getLabelTimestamps();return n.length&&a.length?e=this.normalize(n.concat(a)):e=n.length?n:a,e=this._cache.all=e,e}getDecimalForValue(e){return(mc(this._table,e)-this._minPos)/this._tableRange}getValueForPixel(e){const n=this._offsets,a=this.getDecimalForPixel(e)/n.factor-n.end;return mc(this._table,a*this._tableRange+this._minPos,!0)}}ae(fh,"id","timeseries"),ae(fh,"defaults",Ar.defaults);var RM=Object.freeze({__proto__:null,CategoryScale:oh,LinearScale:ch,LogarithmicScale:uh,RadialLinearScale:gr,TimeScale:Ar,TimeSeriesScale:fh});const AM=[z5,fE,rM,RM];ni.register(...AM);const gc=({id:t,type:e,data:n,options:a})=>{const l=R.useRef(null),[o,c]=R.useState(null),d=`${t}-${Math.random().toString(36).substr(2,9)}`;return R.useEffect(()=>{var b,y;if(o&&o.destroy(),!l.current||!n)return;const h=l.current.getContext("2d"),m={responsive:!0,maintainAspectRatio:!1,...a};let p={labels:n.labels,datasets:[]};e==="bar"?p.datasets=[{label:n.datasets?(b=n.datasets[0])==null?void 0:b.label:"Sales",data:n.datasets?(y=n.datasets[0])==null?void 0:y.data:n.values,backgroundColor:["rgba(255, 99, 132, 0.7)","rgba(54, 162, 235, 0.7)","rgba(255, 206, 86, 0.7)","rgba(75, 192, 192, 0.7)","rgba(153, 102, 255, 0.7)","rgba(255, 159, 64, 0.7)","rgba(199, 199, 199, 0.7)"],borderColor:["rgba(255, 99, 132, 1)","rgba(54, 162, 235, 1)","rgba(255, 206, 86, 1)","rgba(75, 192, 192, 1)","rgba(153, 102, 255, 1)","rgba(255, 159, 64, 1)","rgba(199, 199, 199, 1)"],borderWidth:1}]:e==="line"?p.datasets=[{label:"Sales Trend",data:n.values,fill:!1,borderColor:"rgba(75, 192, 192, 1)",tension:.1}]:e==="pie"&&(p.datasets=[{label:"Sales Distribution",data:n.values,backgroundColor:["rgba(255, 99, 132, 0.7)","rgba(54, 162, 235, 0.7)","rgba(255, 206, 86, 0.7)","rgba(75, 192, 192, 0.7)","rgba(153, 102, 255, 0.7)","rgba(255, 159, 64, 0.7)"],borderColor:["rgba(255, 99, 132, 1)","rgba(54, 162, 235, 1)","rgba(255, 206, 86, 1)","rgba(75, 192, 192, 1)","rgba(153, 102, 255, 1)","rgba(255, 159, 64, 1)"],borderWidth:1}]);try{const v=new ni(h,{type:e,data:p,options:m});c(v)}catch(v){console.error("Error creating chart:",v)}return()=>{o&&o.destroy()}},[n,t,e,a]),f.jsx("div",{style:{width:"100%",height:"300px"},children:f.jsx("canvas",{ref:l,id:d})})},CM=({limit:t})=>{const{darkTheme:e,toggleTheme:n}=Xn(),[a,l]=R.useState([]),[o,c]=R.useState(!0),[d,h]=R.useState(null),[m,p]=R.useState({key:"timestamp",direction:"descending"}),[b,y]=R.useState("All");R.useEffect(()=>{(async()=>{try{c(!0);const C=await fetch(`http://127.0.0.1:5000/transactions/${t}`,{headers:{Authorization:`Bearer ${localStorage.getItem("restaurantToken")}`}});if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();l(S),c(!1)}catch(C){h(C.message),c(!1)}})()},[]);const v=A=>new Date(A).toLocaleDateString("en-US",{year:"numeric",month:"short",day:"numeric"}),w=[...a].sort((A,C)=>{if(m.key==="timestamp"){const S=new Date(A[m.key]),k=new Date(C[m.key]);return m.direction==="ascending"?S-k:k-S}else return A[m.key]<C[m.key]?m.direction==="ascending"?-1:1:A[m.key]>C[m.key]?m.direction==="ascending"?1:-1:0}),N=b==="All"?w:w.filter(A=>A.transaction_type===b),j=A=>{let C="ascending";m.key===A&&m.direction==="ascending"&&(C="descending"),p({key:A,direction:C})},M=N.reduce((A,C)=>A+C.transaction_amount,0),T=N.reduce((A,C)=>A+C.quantity,0);return o?f.jsx("div",{className:`flex items-center justify-center h-screen ${e?"bg-gray-900 text-white":"bg-white text-gray-800"}`,children:f.jsx("div",{className:"text-xl",children:"Loading transactions..."})}):d?f.jsx("div",{className:`flex items-center justify-center h-screen ${e?"bg-gray-900 text-white":"bg-white text-gray-800"}`,children:f.jsxs("div",{className:"text-xl text-red-500",children:["Error: ",d]})}):f.jsx("div",{className:`min-h-screen p-4 transition-colors duration-200 rounded-lg ${e?" text-gray-100":"bg-gray-50 text-gray-800"}`,children:f.jsxs("div",{className:"mx-auto",children:[f.jsx("div",{className:"flex justify-between items-center mb-6"}),f.jsxs("div",{className:"flex flex-col md:flex-row justify-between mb-4",children:[f.jsxs("div",{className:"mb-4 md:mb-0",children:[f.jsx("span",{className:"mr-2",children:"Filter by:"}),f.jsxs("select",{value:b,onChange:A=>y(A.target.value),className:`border rounded p-1 ${e?"bg-gray-700 border-gray-600":"bg-white border-gray-300"}`,children:[f.jsx("option",{value:"All",children:"All Transactions"}),f.jsx("option",{value:"Cash",children:"Cash"}),f.jsx("option",{value:"Online",children:"Online"})]})]}),f.jsxs("div",{className:"flex items-center",children:[f.jsx("span",{className:"mr-2",children:"Sort by:"}),f.jsxs("button",{onClick:()=>j("timestamp"),className:`mr-2 px-3 py-1 border rounded ${e?"bg-gray-700 border-gray-600 hover:bg-gray-600":"bg-gray-100 border-gray-300 hover:bg-gray-200"}`,children:["Date ",m.key==="timestamp"&&(m.direction==="ascending"?"↑":"↓")]}),f.jsxs("button",{onClick:()=>j("transaction_amount"),className:`px-3 py-1 border rounded ${e?"bg-gray-700 border-gray-600 hover:bg-gray-600":"bg-gray-100 border-gray-300 hover:bg-gray-200"}`,children:["Amount ",m.key==="transaction_amount"&&(m.direction==="ascending"?"↑":"↓")]})]})]}),f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4 mb-6",children:[f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-blue-900 text-blue-100":"bg-blue-50 text-blue-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Transactions"}),f.jsx("p",{className:"text-2xl",children:N.length})]}),f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-green-900 text-green-100":"bg-green-50 text-green-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Amount"}),f.jsxs("p",{className:"text-2xl",children:["₹",M.toFixed(2)]})]}),f.jsxs("div",{className:`p-4 rounded shadow ${e?"bg-purple-900 text-purple-100":"bg-purple-50 text-purple-800"}`,children:[f.jsx("h3",{className:"text-lg font-semibold",children:"Total Items"}),f.jsx("p",{className:"text-2xl",children:T})]})]}),f.jsxs("div",{className:`overflow-x-auto rounded shadow ${e?"bg-gray-800":"bg-white"}`,children:[f.jsxs("table",{className:"min-w-full divide-y divide-gray-200",children:[f.jsx("thead",{className:e?"bg-gray-700":"bg-gray-50",children:f.jsxs("tr",{children:[f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Order ID"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Item"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Quantity"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Date"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Amount"}),f.jsx("th",{className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Payment"})]})}),f.jsx("tbody",{className:`divide-y ${e?"divide-gray-700":"divide-gray-200"}`,children:N.map((A,C)=>f.jsxs("tr",{className:e?"hover:bg-gray-700":`hover:bg-gray-50 ${C%2===0?"bg-gray-50":"bg-white"}`,children:[f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm font-medium",children:["#",A.order_id]}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:[f.jsx("div",{children:A.item_name}),f.jsxs("div",{className:`text-xs ${e?"text-gray-400":"text-gray-500"}`,children:["₹",A.item_price.toFixed(2)," each"]})]}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:A.quantity}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:v(A.timestamp)}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-sm font-medium",children:["₹",A.transaction_amount.toFixed(2)]}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-sm",children:f.jsx("span",{className:`px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${A.transaction_type==="Cash"?e?"bg-yellow-900 text-yellow-200":"bg-yellow-100 text-yellow-800":e?"bg-green-900 text-green-200":"bg-green-100 text-green-800"}`,children:A.transaction_type})})]},A.order_id))})]}),N.length===0&&f.jsx("div",{className:`text-center py-10 ${e?"text-gray-400":"text-gray-500"}`,children:"No transactions found matching your criteria"})]})]})})},Eb="http://localhost:5000/api";function OM(){var F,$,V,te,se;const{darkTheme:t,toggleTheme:e}=Xn(),[n,a]=R.useState(null),[l,o]=R.useState(null),[c,d]=R.useState(),[h,m]=R.useState(!1),[p,b]=R.useState("analysis"),[y,v]=R.useState(null),[w,N]=R.useState({item_name:"Vadapav",item_type:"Fastfood",day_of_week:"Monday",time_of_day:"Evening",received_by:"Mr.",item_price:20}),[j,M]=R.useState(null);R.useEffect(()=>{T(),A(),k()},[]);const T=async()=>{var ee,ge;m(!0);try{const Me=await Ye.get(`${Eb}/get-analysis`);a(Me.data.success?Me.data:null)}catch(Me){v(((ge=(ee=Me.response)==null?void 0:ee.data)==null?void 0:ge.message)||Me.message)}finally{m(!1)}},A=async()=>{try{const ee=await Ye.get(`${Eb}/get-options`);d(ee.data.success?ee.data:null)}catch(ee){v(ee.message)}},C=async ee=>{const ge=localStorage.getItem("restaurantToken");if(ge){ee.preventDefault(),m(!0);try{const Me=await Ye.post("http://localhost:5000/predict",w,{headers:{Authorization:`Bearer ${ge}`}});o((Me.data.success,Me.data))}catch(Me){console.error("Prediction error:",Me),v(Me.message)}finally{m(!1)}}},S=ee=>{N({...w,[ee.target.name]:ee.target.value})},k=async()=>{const ee=localStorage.getItem("restaurantToken");if(ee)try{const ge=await Ye.get("http://localhost:5000/insights",{headers:{Authorization:`Bearer ${ee}`}});M(ge.data)}catch(ge){v(ge.message)}};return console.log(j),f.jsxs("div",{className:`min-h-screen p-6 md:p-8 lg:p-12 transition-colors duration-300 ${t?"bg-gradient-to-br from-gray-900 via-gray-800 to-gray-900 text-white":"bg-gradient-to-br from-gray-50 via-gray-100 to-gray-200 text-gray-800"}`,children:[f.jsx("div",{className:"flex flex-col sm:flex-row justify-between items-center mb-12",children:f.jsx("h1",{className:"text-3xl md:text-4xl font-bold mb-4 sm:mb-0 bg-clip-text text-transparent bg-gradient-to-r from-blue-500 to-purple-600",children:"Dashboard Overview"})}),f.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6 md:gap-8 mb-12",children:n&&f.jsxs(f.Fragment,{children:[f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-blue-400":"text-blue-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11.049 2.927c.3-.921 1.603-.921 1.902 0l1.519 4.674a1 1 0 00.95.69h4.915c.969 0 1.371 1.24.588 1.81l-3.976 2.888a1 1 0 00-.363 1.118l1.518 4.674c.3.922-.755 1.688-1.538 1.118l-3.976-2.888a1 1 0 00-1.176 0l-3.976 2.888c-.783.57-1.838-.197-1.538-1.118l1.518-4.674a1 1 0 00-.363-1.118l-3.976-2.888c-.784-.57-.38-1.81.588-1.81h4.914a1 1 0 00.951-.69l1.519-4.674z"})}),"Favorite Items"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"favorite-items-chart",type:"bar",data:n.favorite_items})}),f.jsx("div",{className:"bg-blue-500 dark:bg-blue-800 p-6 rounded-2xl shadow-xl transform transition-all duration-300 text-white",children:j&&j.insights.map((ee,ge)=>ge==2?f.jsx("li",{className:"flex items-start gap-3",children:f.jsx("span",{className:"text-lg font-medium",children:ee})},ge):null)})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-green-400":"text-green-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 002-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"})}),"Daily Sales"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"daily-sales-chart",type:"bar",data:n.day_sales})}),f.jsx("div",{className:"bg-blue-500 dark:bg-blue-800 p-6 rounded-2xl shadow-xl transform transition-all duration-300 text-white",children:j&&j.insights.map((ee,ge)=>ge!=2?f.jsx("li",{className:"flex items-start gap-3",children:f.jsx("span",{className:"text-lg font-medium",children:ee})},ge):null)})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-yellow-400":"text-yellow-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M7 12l3-3 3 3 4-4M8 21l4-4 4 4M3 4h18M4 4h16v12a1 1 0 01-1 1H5a1 1 0 01-1-1V4z"})}),"Monthly Sales Trend"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"monthly-sales-chart",type:"line",data:n.monthly_sales})})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 transform transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-purple-400":"text-purple-600"}`,children:[f.jsxs("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:[f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 3.055A9.001 9.001 0 1020.945 13H11V3.055z"}),f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M20.488 9H15V3.512A9.025 9.025 0 0120.488 9z"})]}),"Item Type Distribution"]}),f.jsx("div",{className:"h-80",children:f.jsx(gc,{id:"item-type-chart",type:"pie",data:n.item_type_sales})})]}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 col-span-1 md:col-span-2 transform hover:scale-101 transition-all duration-300`,children:[f.jsxs("h2",{className:`text-xl font-bold mb-6 flex items-center gap-2 ${t?"text-red-400":"text-red-600"}`,children:[f.jsx("svg",{className:"w-6 h-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M4 5a1 1 0 011-1h14a1 1 0 011 1v2a1 1 0 01-1 1H5a1 1 0 01-1-1V5zM4 13a1 1 0 011-1h6a1 1 0 011 1v6a1 1 0 01-1 1H5a1 1 0 01-1-1v-6zM16 13a1 1 0 011-1h2a1 1 0 011 1v6a1 1 0 01-1 1h-2a1 1 0 01-1-1v-6z"})}),"Sales by Day and Time"]}),f.jsx("div",{className:"overflow-hidden",children:f.jsxs("table",{className:"w-full border-collapse",children:[f.jsx("thead",{children:f.jsxs("tr",{className:`${t?"bg-gray-800":"bg-gray-100"}`,children:[f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-left",children:"Day/Time"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Morning"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Afternoon"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Evening"}),f.jsx("th",{className:"border border-gray-600 p-3 font-semibold text-center",children:"Night"})]})}),f.jsx("tbody",{children:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"].map(ee=>f.jsxs("tr",{className:`${t?"hover:bg-gray-800":"hover:bg-gray-50"}`,children:[f.jsx("td",{className:"border border-gray-600 p-3 font-medium",children:ee}),["Morning","Afternoon","Evening","Night"].map(ge=>{const Me=n.heatmap_data.find(pe=>pe.day===ee&&pe.time===ge),K=Me?Me.value:0,Q=Math.max(...n.heatmap_data.map(pe=>pe.value)),ie=Math.floor(K/Q*255),re=`rgba(${ie}, ${ie}, 255, 0.8)`;return f.jsxs("td",{className:"border border-gray-600 p-3 text-center font-medium transition-all duration-300 hover:scale-105",style:{backgroundColor:re},children:["₹",K.toLocaleString()]},`${ee}-${ge}`)})]},ee))})]})})]})]})}),f.jsxs("div",{className:`rounded-2xl shadow-xl overflow-hidden ${t?"bg-gradient-to-br from-gray-800 to-gray-900":"bg-gradient-to-br from-white to-gray-50"} p-6 mb-8`,children:[f.jsx("h2",{className:`text-2xl font-bold mb-6 ${t?"text-white":"text-gray-800"}`,children:"Sales Prediction"}),f.jsxs("form",{onSubmit:C,className:"space-y-6",children:[f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Name"}),f.jsxs("select",{name:"item_name",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Item"}),(F=c==null?void 0:c.items)==null?void 0:F.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Type"}),f.jsxs("select",{name:"item_type",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Item Type"}),($=c==null?void 0:c.item_types)==null?void 0:$.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Day of Week"}),f.jsxs("select",{name:"day_of_week",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Day"}),(V=c==null?void 0:c.days)==null?void 0:V.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Time of Day"}),f.jsxs("select",{name:"time_of_day",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Time"}),(te=c==null?void 0:c.times)==null?void 0:te.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Customer Type"}),f.jsxs("select",{name:"received_by",onChange:S,required:!0,className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-800 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"",children:"Select Customer Type"}),(se=c==null?void 0:c.customer_types)==null?void 0:se.map(ee=>f.jsx("option",{value:ee,children:ee},ee))]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Item Price"}),f.jsx("input",{type:"number",name:"item_price",value:w.item_price,onChange:S,required:!0,placeholder:"Item Price",className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${t?"bg-gray-700 border-gray-600 text-white placeholder-gray-400 focus:border-blue-500":"bg-white border-gray-300 text-gray-800 placeholder-gray-500 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]})]}),f.jsx("button",{type:"submit",disabled:h,className:`w-full md:w-auto px-8 py-3 rounded-lg font-medium transition-all duration-300 ${h?"bg-gray-400 cursor-not-allowed":"bg-gradient-to-r from-blue-500 to-purple-600 hover:from-blue-600 hover:to-purple-700 hover:shadow-lg transform hover:-translate-y-0.5"} text-white focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500`,children:h?f.jsxs("span",{className:"flex items-center justify-center gap-2",children:[f.jsxs("svg",{className:"animate-spin h-5 w-5",fill:"none",viewBox:"0 0 24 24",children:[f.jsx("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),f.jsx("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"})]}),"Predicting..."]}):"Generate Prediction"})]}),l&&f.jsxs("div",{className:`mt-6 p-6 rounded-xl transform transition-all duration-300 ${t?"bg-gradient-to-r from-green-900 to-green-800":"bg-gradient-to-r from-green-50 to-green-100"}`,children:[f.jsx("h3",{className:`text-xl font-bold mb-4 ${t?"text-green-400":"text-green-700"}`,children:"Prediction Results"}),f.jsxs("p",{className:"text-2xl font-bold",children:["Predicted Sales: ₹ ",l.predicted_sales.toFixed(2)]})]})]}),f.jsxs(Dt,{to:"/paymenthistory",className:"flex items-center justify-end gap-2 mb-6 p-4 rounded-lg dark:bg-blue-800 bg-blue-500 text-white shadow-lg hover:shadow-xl transition-all duration-300",children:[f.jsx("h1",{children:"Quick link to payment history"}),f.jsx("span",{className:"material-symbols-outlined",children:"arrow_forward"})]})]})}function kM(){const t=Zb();return console.error(t),f.jsxs("div",{id:"error-page",children:[f.jsx("h1",{children:"Oops!"}),f.jsx("p",{children:"Sorry, an unexpected error has occurred."}),f.jsx("p",{children:f.jsx("i",{children:t.statusText||t.message})})]})}function LM(){const[t,e]=R.useState([]),[n,a]=R.useState(0),[l,o]=R.useState(""),[c,d]=R.useState(""),[h,m]=R.useState(""),[p,b]=R.useState(""),[y,v]=R.useState(""),[w,N]=R.useState(""),[j,M]=R.useState(""),[T,A]=R.useState(!1),[C,S]=R.useState(""),{darkTheme:k,toggleTheme:F}=Xn();R.useRef(null);const $=()=>{const K=new Date;o(K.toISOString().split("T")[0]),d(K.toTimeString().slice(0,5)),S(`BILL-${K.getTime().toString().slice(-6)}`),A(!T)},V=()=>{if(!y||!w||!j){alert("Please fill in all item fields correctly");return}const K={id:Date.now(),description:y,quantity:parseInt(w),price:parseFloat(j),total:parseInt(w)*parseFloat(j)},Q=[...t,K];e(Q),a(Q.reduce((ie,re)=>ie+re.total,0)),v(""),N(""),M("")},te=K=>{const Q=t.filter(ie=>ie.id!==K);e(Q),a(Q.reduce((ie,re)=>ie+re.total,0))},se=async K=>{if(K.preventDefault(),!l||!c||!h||t.length===0){alert("Please fill in all required fields and add at least one item before generating the bill");return}try{const Q=localStorage.getItem("restaurantToken");if(!Q){alert("You must be logged in to generate bills");return}const ie=ge(),re=await fetch("http://localhost:5000/generate-bill",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${Q}`},body:JSON.stringify({billNumber:C||`BILL-${Date.now().toString().slice(-6)}`,date:l,time:c,customerName:h,tableNumber:p,items:t,grandTotal:n,tax:ie})}),pe=await re.json();re.ok?(alert(`Bill generated successfully! Bill Number: ${pe.bill_number}`),ee()):alert(`Error: ${pe.error||"Failed to generate bill"}`)}catch(Q){console.error("Error generating bill:",Q),alert("An error occurred while generating the bill. Please try again.")}},ee=()=>{e([]),a(0),m(""),b(""),S(""),T||(o(""),d(""))},ge=()=>n*.18,Me=()=>{if(!l||!c||!h||t.length===0){alert("Please fill in all required fields and add at least one item before printing");return}window.print()};return f.jsxs("div",{className:`min-h-screen p-4 transition-colors duration-300 ${k?"bg-gradient-to-br from-gray-900 via-gray-800 to-gray-900 text-white":"bg-gradient-to-br from-gray-50 via-gray-100 to-gray-50 text-gray-900"}`,children:[f.jsx("div",{className:"w-full mx-auto",children:f.jsxs("form",{onSubmit:se,className:"overflow-hidden space-y-8 mb-20",children:[f.jsxs("div",{className:"flex flex-col lg:flex-row gap-8",children:[f.jsxs("div",{className:`p-6 rounded-xl flex-1 ${k?"bg-gray-700/50":"bg-gray-50"}`,children:[f.jsxs("div",{className:"flex items-center gap-2 mb-6",children:[f.jsx("svg",{className:"w-6 h-6 text-blue-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z"})}),f.jsx("h2",{className:"text-xl font-semibold",children:"Customer Details"})]}),f.jsxs("div",{className:"space-y-4",children:[f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Date"}),f.jsx("input",{type:"date",value:l,onChange:K=>o(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Time"}),f.jsx("input",{type:"time",value:c,onChange:K=>d(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Bill Number"}),f.jsx("input",{type:"text",placeholder:"Auto-generated with auto-fill",value:C,onChange:K=>S(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Customer Name"}),f.jsx("input",{type:"text",placeholder:"Enter customer name",value:h,onChange:K=>m(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Table Number"}),f.jsx("input",{type:"number",placeholder:"Enter table number",value:p,onChange:K=>b(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`,required:!0})]}),f.jsx("div",{className:"mt-6",children:f.jsxs("label",{className:"flex items-center space-x-3 cursor-pointer",children:[f.jsx("input",{type:"checkbox",checked:T,onChange:$,className:`rounded text-blue-600 focus:ring-blue-500 w-5 h-5 ${k?"bg-gray-800":"bg-white"}`}),f.jsx("span",{className:"text-sm opacity-90",children:"Auto-Fill Date, Time & Generate Bill Number"})]})})]})]}),f.jsxs("div",{className:`p-6 rounded-xl flex-1 ${k?"bg-gray-700/50":"bg-gray-50"}`,children:[f.jsxs("div",{className:"flex items-center gap-2 mb-6",children:[f.jsx("svg",{className:"w-6 h-6 text-green-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 5H7a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V7a2 2 0 00-2-2h-2M9 5a2 2 0 002 2h2a2 2 0 002-2M9 5a2 2 0 012-2h2a2 2 0 012 2"})}),f.jsx("h2",{className:"text-xl font-semibold",children:"Add Items"})]}),f.jsxs("div",{className:"space-y-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Item Description"}),f.jsx("input",{type:"text",placeholder:"Enter item description",value:y,onChange:K=>v(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Quantity"}),f.jsx("input",{type:"number",placeholder:"Enter quantity",value:w,onChange:K=>N(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]}),f.jsxs("div",{className:"space-y-2",children:[f.jsx("label",{className:"block text-sm font-medium opacity-90",children:"Unit Price"}),f.jsx("input",{type:"number",placeholder:"Enter unit price",value:j,onChange:K=>M(K.target.value),className:`w-full px-4 py-3 rounded-lg border transition-all duration-200 ${k?"bg-gray-800 border-gray-600 text-white focus:border-blue-500":"bg-white border-gray-300 text-gray-900 focus:border-blue-500"} focus:ring-2 focus:ring-blue-500 focus:ring-opacity-20`})]})]}),f.jsx("button",{type:"button",onClick:V,className:"w-full mt-6 px-6 py-3 bg-gradient-to-r from-green-500 to-green-600 text-white rounded-lg hover:from-green-600 hover:to-green-700 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",children:"Add Item"}),f.jsxs("div",{className:`mt-6 p-4 rounded-lg ${k?"bg-gray-800/70":"bg-white"}`,children:[f.jsx("h3",{className:"font-medium mb-2",children:"Current Bill Summary"}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Items:"}),f.jsx("span",{children:t.length})]}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Subtotal:"}),f.jsxs("span",{children:["₹",n.toFixed(2)]})]}),f.jsxs("div",{className:"flex justify-between text-sm opacity-90",children:[f.jsx("span",{children:"Tax (18%):"}),f.jsxs("span",{children:["₹",ge().toFixed(2)]})]}),f.jsxs("div",{className:"flex justify-between font-medium mt-1 text-blue-600 dark:text-blue-400",children:[f.jsx("span",{children:"Total:"}),f.jsxs("span",{children:["₹",(n+ge()).toFixed(2)]})]})]})]})]})]}),f.jsx("div",{className:"overflow-hidden rounded-xl shadow-lg",children:f.jsxs("table",{className:"w-full",children:[f.jsx("thead",{children:f.jsxs("tr",{className:`${k?"bg-gray-700":"bg-gray-200"}`,children:[f.jsx("th",{className:"p-4 text-left font-semibold",children:"Description"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Quantity"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Unit Price"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Total"}),f.jsx("th",{className:"p-4 text-center font-semibold",children:"Action"})]})}),f.jsx("tbody",{children:t.length===0?f.jsx("tr",{className:`${k?"bg-gray-800/50":"bg-white"}`,children:f.jsx("td",{colSpan:"5",className:"p-8 text-center text-gray-500",children:f.jsxs("div",{className:"flex flex-col items-center gap-2",children:[f.jsx("svg",{className:"w-12 h-12 opacity-50",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"})}),f.jsx("p",{children:"No items added yet. Add items to generate your bill."})]})})}):t.map((K,Q)=>f.jsxs("tr",{className:`
                         ${k?"bg-gray-800/50 hover:bg-gray-700/50":"bg-white hover:bg-gray-50"}
                         transition-colors duration-200
                         ${Q!==t.length-1?"border-b border-gray-200/20":""}
-                      `,children:[f.jsx("td",{className:"p-4",children:K.description}),f.jsx("td",{className:"p-4 text-center",children:K.quantity}),f.jsxs("td",{className:"p-4 text-center",children:["₹",K.price.toFixed(2)]}),f.jsxs("td",{className:"p-4 text-center font-medium",children:["₹",K.total.toFixed(2)]}),f.jsx("td",{className:"p-4 text-center",children:f.jsx("button",{onClick:()=>te(K.id),className:"px-4 py-2 text-red-500 hover:text-red-700 hover:bg-red-50 dark:hover:bg-red-900/20 rounded-lg transition-colors duration-200 focus:outline-none focus:ring-2 focus:ring-red-500 focus:ring-opacity-20",children:"Remove"})})]},K.id))}),f.jsxs("tfoot",{children:[f.jsxs("tr",{className:`${k?"bg-gray-700/80":"bg-gray-100"} font-semibold`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Subtotal"}),f.jsxs("td",{className:"p-4 text-center",children:["₹",n.toFixed(2)]}),f.jsx("td",{})]}),f.jsxs("tr",{className:`${k?"bg-gray-700/90":"bg-gray-100"} font-semibold`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Tax (18%)"}),f.jsxs("td",{className:"p-4 text-center",children:["₹",ge().toFixed(2)]}),f.jsx("td",{})]}),f.jsxs("tr",{className:`${k?"bg-blue-900/50":"bg-blue-50"} font-bold text-lg`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Grand Total"}),f.jsxs("td",{className:"p-4 text-center text-blue-600 dark:text-blue-400",children:["₹",(n+ge()).toFixed(2)]}),f.jsx("td",{})]})]})]})}),f.jsxs("div",{className:"flex justify-end space-x-4 mt-8",children:[f.jsx("button",{type:"button",className:"px-8 py-3 bg-gradient-to-r from-gray-500 to-gray-600 text-white rounded-lg hover:from-gray-600 hover:to-gray-700 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",onClick:Me,children:"Print Bill"}),f.jsx("button",{type:"submit",className:"px-8 py-3 bg-gradient-to-r from-blue-500 to-blue-600 text-white rounded-lg hover:from-blue-600 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",children:"Generate Bill"})]})]})}),f.jsx("div",{id:"printArea",className:"print-only",children:f.jsxs("div",{className:"bill-paper",children:[f.jsxs("div",{className:"bill-header",children:[f.jsx("h1",{children:"Your Restaurant Name"}),f.jsx("p",{children:"123 Street, City, State - 123456"}),f.jsx("p",{children:"Phone: (123) 456-7890"}),f.jsx("p",{children:"GST No: 12ABCDE3456F7Z8"})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("div",{className:"bill-details",children:[f.jsxs("p",{children:[f.jsx("strong",{children:"Bill No:"})," ",C||"BILL-123456"]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Date:"})," ",l]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Time:"})," ",c]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Customer:"})," ",h]}),p&&f.jsxs("p",{children:[f.jsx("strong",{children:"Table No:"})," ",p]})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("table",{className:"bill-items",children:[f.jsx("thead",{children:f.jsxs("tr",{children:[f.jsx("th",{align:"left",children:"Item"}),f.jsx("th",{align:"center",children:"Qty"}),f.jsx("th",{align:"right",children:"Price"}),f.jsx("th",{align:"right",children:"Total"})]})}),f.jsx("tbody",{children:t.map(K=>f.jsxs("tr",{children:[f.jsx("td",{children:K.description}),f.jsx("td",{align:"center",children:K.quantity}),f.jsxs("td",{align:"right",children:["₹",K.price.toFixed(2)]}),f.jsxs("td",{align:"right",children:["₹",K.total.toFixed(2)]})]},K.id))})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("div",{className:"bill-totals",children:[f.jsxs("div",{className:"bill-total-row",children:[f.jsx("span",{children:"Subtotal:"}),f.jsxs("span",{children:["₹",n.toFixed(2)]})]}),f.jsxs("div",{className:"bill-total-row",children:[f.jsx("span",{children:"Tax (18%):"}),f.jsxs("span",{children:["₹",ge().toFixed(2)]})]}),f.jsxs("div",{className:"bill-total-row grand-total",children:[f.jsx("span",{children:"Grand Total:"}),f.jsxs("span",{children:["₹",(n+ge()).toFixed(2)]})]})]}),f.jsxs("div",{className:"bill-footer",children:[f.jsx("p",{children:"Thank you for dining with us!"}),f.jsx("p",{children:"Please visit again"})]})]})})]})}function zM(){const{darkTheme:t,toggleTheme:e}=Xn(),[n,a]=R.useState([]),[l,o]=R.useState([]),[c,d]=R.useState(!0),[h,m]=R.useState(null),[p,b]=R.useState({key:"timestamp",direction:"descending"}),[y,v]=R.useState("All");R.useEffect(()=>{w(),N()},[]);const w=async()=>{try{d(!0);const C=await fetch("http://127.0.0.1:5000/transactions/all");if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();a(S),d(!1)}catch(C){m(C.message),d(!1)}},N=async()=>{try{d(!0);const C=await fetch("http://127.0.0.1:5000/popularitem");if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();o(S),d(!1)}catch(C){m(C.message),d(!1)}},j=[...n].sort((C,S)=>{if(p.key==="timestamp"){const k=new Date(C[p.key]),F=new Date(S[p.key]);return p.direction==="ascending"?k-F:F-k}else return C[p.key]<S[p.key]?p.direction==="ascending"?-1:1:C[p.key]>S[p.key]?p.direction==="ascending"?1:-1:0}),M=y==="All"?j:j.filter(C=>C.transaction_type===y),T=M.reduce((C,S)=>C+S.transaction_amount,0),A=M.reduce((C,S)=>C+S.quantity,0);return f.jsx("div",{className:`min-h-screen ${t?"dark:bg-gray-900":"bg-gray-100"} transition-colors duration-300`,children:f.jsxs("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-6",children:[f.jsx("div",{className:"flex items-center justify-between mb-6",children:f.jsx("h1",{className:`text-3xl font-bold ${t?"dark:text-white":"text-gray-800"}`,children:"Payment History"})}),f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-8",children:[f.jsx(Uf,{title:"Today's Revenue",value:`₹${T}`,icon:"currency_rupee",trend:"+12.5%",positive:!0}),f.jsx(Uf,{title:"Total Orders",value:`${A}`,icon:"receipt_long",trend:"-3.2%"}),f.jsx(Uf,{title:"Popular Item",value:`${l.popular_item}`,icon:"local_pizza",subtext:"42 sold today"})]}),f.jsxs("div",{className:` ${t?"dark:bg-gray-800":"bg-white"} rounded-lg shadow p-6`,children:[f.jsx("h2",{className:`text-xl font-semibold mb-4 ${t?"dark:text-white":"text-gray-800"}`,children:"Recent Transactions"}),f.jsx(CM,{limit:10})]})]})})}function Uf({title:t,value:e,icon:n,trend:a,positive:l=!1,subtext:o}){const{darkTheme:c,toggleTheme:d}=Xn();return f.jsxs("div",{className:` ${c?"dark:bg-gray-800":"bg-white"} rounded-lg shadow p-5`,children:[f.jsxs("div",{className:"flex items-center mb-3",children:[f.jsx("span",{className:"material-symbols-outlined text-indigo-500 text-3xl mr-3",children:n}),f.jsxs("div",{children:[f.jsx("h3",{className:`text-lg font-semibold ${c?"dark:text-gray-300":"text-gray-700"}`,children:t}),f.jsx("p",{className:`text-2xl font-bold ${c?"dark:text-white":"text-gray-900"}`,children:e})]})]}),a&&f.jsx("p",{className:`text-sm font-medium ${l?"text-green-500":"text-red-500"}`,children:a}),o&&f.jsx("p",{className:"text-sm text-gray-500 mt-1",children:o})]})}function BM(){const{darkTheme:t}=Xn(),[e,n]=R.useState({item_name:"",item_type:"",day_of_week:"",time_of_day:"",received_by:"",item_price:""}),[a,l]=R.useState(null),[o,c]=R.useState(!1),[d,h]=R.useState(null),[m,p]=R.useState(""),[b,y]=R.useState(!1),[v,w]=R.useState(!1),N=R.useRef(null),j=S=>{const k=S.target.files[0];k&&(l(k),p(k.name))},M=S=>{S.preventDefault(),S.stopPropagation(),S.type==="dragenter"||S.type==="dragover"?w(!0):S.type==="dragleave"&&w(!1)},T=S=>{if(S.preventDefault(),S.stopPropagation(),w(!1),S.dataTransfer.files&&S.dataTransfer.files[0]){const k=S.dataTransfer.files[0];k.type==="text/csv"||k.name.endsWith(".csv")?(l(k),p(k.name)):alert("Please upload a CSV file only")}},A=()=>{N.current.click()},C=async()=>{if(!a)return;const S=localStorage.getItem("restaurantToken");if(!S)return alert("No token found. Please log in again.");try{c(!0),y(!1);const k=new FormData;k.append("file",a),await Ye.post("http://127.0.0.1:5000/api/load-data",k,{headers:{"Content-Type":"multipart/form-data",Authorization:`Bearer ${S}`}}),y(!0),p(""),l(null)}catch(k){alert("Error uploading file"),console.error("Upload error:",k)}finally{c(!1)}};return f.jsx("div",{className:`min-h-screen ${t?"bg-gray-900 text-white":"bg-gray-50 text-gray-800"} py-12 px-4 sm:px-6 lg:px-8`,children:f.jsxs("div",{className:`max-w-lvh mx-auto ${t?"bg-gray-800":"bg-white"} rounded-xl shadow-lg overflow-hidden`,children:[f.jsxs("div",{className:"bg-gradient-to-r from-blue-600 to-purple-600 px-6 py-8 text-white",children:[f.jsx("h1",{className:"text-3xl font-bold",children:"Sales Prediction"}),f.jsx("p",{className:"mt-2 opacity-80",children:"Upload data or make instant predictions"})]}),f.jsx("div",{className:"p-6",children:f.jsxs("div",{className:`${t?"bg-gray-700":"bg-gray-50"} p-4 rounded-lg`,children:[f.jsx("h2",{className:`text-lg font-medium ${t?"text-white":"text-gray-900"} mb-4`,children:"Upload CSV Data"}),f.jsx("div",{className:`mt-2 flex justify-center px-6 pt-5 pb-6 border-2 border-dashed rounded-md transition-colors
+                      `,children:[f.jsx("td",{className:"p-4",children:K.description}),f.jsx("td",{className:"p-4 text-center",children:K.quantity}),f.jsxs("td",{className:"p-4 text-center",children:["₹",K.price.toFixed(2)]}),f.jsxs("td",{className:"p-4 text-center font-medium",children:["₹",K.total.toFixed(2)]}),f.jsx("td",{className:"p-4 text-center",children:f.jsx("button",{onClick:()=>te(K.id),className:"px-4 py-2 text-red-500 hover:text-red-700 hover:bg-red-50 dark:hover:bg-red-900/20 rounded-lg transition-colors duration-200 focus:outline-none focus:ring-2 focus:ring-red-500 focus:ring-opacity-20",children:"Remove"})})]},K.id))}),f.jsxs("tfoot",{children:[f.jsxs("tr",{className:`${k?"bg-gray-700/80":"bg-gray-100"} font-semibold`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Subtotal"}),f.jsxs("td",{className:"p-4 text-center",children:["₹",n.toFixed(2)]}),f.jsx("td",{})]}),f.jsxs("tr",{className:`${k?"bg-gray-700/90":"bg-gray-100"} font-semibold`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Tax (18%)"}),f.jsxs("td",{className:"p-4 text-center",children:["₹",ge().toFixed(2)]}),f.jsx("td",{})]}),f.jsxs("tr",{className:`${k?"bg-blue-900/50":"bg-blue-50"} font-bold text-lg`,children:[f.jsx("td",{colSpan:"3",className:"p-4 text-right",children:"Grand Total"}),f.jsxs("td",{className:"p-4 text-center text-blue-600 dark:text-blue-400",children:["₹",(n+ge()).toFixed(2)]}),f.jsx("td",{})]})]})]})}),f.jsxs("div",{className:"flex justify-end space-x-4 mt-8",children:[f.jsx("button",{type:"button",className:"px-8 py-3 bg-gradient-to-r from-gray-500 to-gray-600 text-white rounded-lg hover:from-gray-600 hover:to-gray-700 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",onClick:Me,children:"Print Bill"}),f.jsx("button",{type:"submit",className:"px-8 py-3 bg-gradient-to-r from-blue-500 to-blue-600 text-white rounded-lg hover:from-blue-600 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",children:"Generate Bill"})]})]})}),f.jsx("div",{id:"printArea",className:"print-only",children:f.jsxs("div",{className:"bill-paper",children:[f.jsxs("div",{className:"bill-header",children:[f.jsx("h1",{children:"Your Restaurant Name"}),f.jsx("p",{children:"123 Street, City, State - 123456"}),f.jsx("p",{children:"Phone: (123) 456-7890"}),f.jsx("p",{children:"GST No: 12ABCDE3456F7Z8"})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("div",{className:"bill-details",children:[f.jsxs("p",{children:[f.jsx("strong",{children:"Bill No:"})," ",C||"BILL-123456"]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Date:"})," ",l]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Time:"})," ",c]}),f.jsxs("p",{children:[f.jsx("strong",{children:"Customer:"})," ",h]}),p&&f.jsxs("p",{children:[f.jsx("strong",{children:"Table No:"})," ",p]})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("table",{className:"bill-items",children:[f.jsx("thead",{children:f.jsxs("tr",{children:[f.jsx("th",{align:"left",children:"Item"}),f.jsx("th",{align:"center",children:"Qty"}),f.jsx("th",{align:"right",children:"Price"}),f.jsx("th",{align:"right",children:"Total"})]})}),f.jsx("tbody",{children:t.map(K=>f.jsxs("tr",{children:[f.jsx("td",{children:K.description}),f.jsx("td",{align:"center",children:K.quantity}),f.jsxs("td",{align:"right",children:["₹",K.price.toFixed(2)]}),f.jsxs("td",{align:"right",children:["₹",K.total.toFixed(2)]})]},K.id))})]}),f.jsx("div",{className:"bill-divider"}),f.jsxs("div",{className:"bill-totals",children:[f.jsxs("div",{className:"bill-total-row",children:[f.jsx("span",{children:"Subtotal:"}),f.jsxs("span",{children:["₹",n.toFixed(2)]})]}),f.jsxs("div",{className:"bill-total-row",children:[f.jsx("span",{children:"Tax (18%):"}),f.jsxs("span",{children:["₹",ge().toFixed(2)]})]}),f.jsxs("div",{className:"bill-total-row grand-total",children:[f.jsx("span",{children:"Grand Total:"}),f.jsxs("span",{children:["₹",(n+ge()).toFixed(2)]})]})]}),f.jsxs("div",{className:"bill-footer",children:[f.jsx("p",{children:"Thank you for dining with us!"}),f.jsx("p",{children:"Please visit again"})]})]})})]})}function zM(){const{darkTheme:t,toggleTheme:e}=Xn(),[n,a]=R.useState([]),[l,o]=R.useState([]),[c,d]=R.useState(!0),[h,m]=R.useState(null),[p,b]=R.useState({key:"timestamp",direction:"descending"}),[y,v]=R.useState("All");R.useEffect(()=>{w(),N()},[]);const w=async()=>{try{d(!0);const C=await fetch("http://127.0.0.1:5000/transactions/all",{headers:{Authorization:`Bearer ${localStorage.getItem("restaurantToken")}`}});if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();a(S),d(!1)}catch(C){m(C.message),d(!1)}},N=async()=>{try{d(!0);const C=await fetch("http://127.0.0.1:5000/popularitem");if(!C.ok)throw new Error(`HTTP error! Status: ${C.status}`);const S=await C.json();o(S),d(!1)}catch(C){m(C.message),d(!1)}},j=[...n].sort((C,S)=>{if(p.key==="timestamp"){const k=new Date(C[p.key]),F=new Date(S[p.key]);return p.direction==="ascending"?k-F:F-k}else return C[p.key]<S[p.key]?p.direction==="ascending"?-1:1:C[p.key]>S[p.key]?p.direction==="ascending"?1:-1:0}),M=y==="All"?j:j.filter(C=>C.transaction_type===y),T=M.reduce((C,S)=>C+S.transaction_amount,0),A=M.reduce((C,S)=>C+S.quantity,0);return f.jsx("div",{className:`min-h-screen ${t?"dark:bg-gray-900":"bg-gray-100"} transition-colors duration-300`,children:f.jsxs("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-6",children:[f.jsx("div",{className:"flex items-center justify-between mb-6",children:f.jsx("h1",{className:`text-3xl font-bold ${t?"dark:text-white":"text-gray-800"}`,children:"Payment History"})}),f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-8",children:[f.jsx(Uf,{title:"Today's Revenue",value:`₹${T}`,icon:"currency_rupee",trend:"+12.5%",positive:!0}),f.jsx(Uf,{title:"Total Orders",value:`${A}`,icon:"receipt_long",trend:"-3.2%"}),f.jsx(Uf,{title:"Popular Item",value:`${l.popular_item}`,icon:"local_pizza",subtext:"42 sold today"})]}),f.jsxs("div",{className:` ${t?"dark:bg-gray-800":"bg-white"} rounded-lg shadow p-6`,children:[f.jsx("h2",{className:`text-xl font-semibold mb-4 ${t?"dark:text-white":"text-gray-800"}`,children:"Recent Transactions"}),f.jsx(CM,{limit:10})]})]})})}function Uf({title:t,value:e,icon:n,trend:a,positive:l=!1,subtext:o}){const{darkTheme:c,toggleTheme:d}=Xn();return f.jsxs("div",{className:` ${c?"dark:bg-gray-800":"bg-white"} rounded-lg shadow p-5`,children:[f.jsxs("div",{className:"flex items-center mb-3",children:[f.jsx("span",{className:"material-symbols-outlined text-indigo-500 text-3xl mr-3",children:n}),f.jsxs("div",{children:[f.jsx("h3",{className:`text-lg font-semibold ${c?"dark:text-gray-300":"text-gray-700"}`,children:t}),f.jsx("p",{className:`text-2xl font-bold ${c?"dark:text-white":"text-gray-900"}`,children:e})]})]}),a&&f.jsx("p",{className:`text-sm font-medium ${l?"text-green-500":"text-red-500"}`,children:a}),o&&f.jsx("p",{className:"text-sm text-gray-500 mt-1",children:o})]})}function BM(){const{darkTheme:t}=Xn(),[e,n]=R.useState({item_name:"",item_type:"",day_of_week:"",time_of_day:"",received_by:"",item_price:""}),[a,l]=R.useState(null),[o,c]=R.useState(!1),[d,h]=R.useState(null),[m,p]=R.useState(""),[b,y]=R.useState(!1),[v,w]=R.useState(!1),N=R.useRef(null),j=S=>{const k=S.target.files[0];k&&(l(k),p(k.name))},M=S=>{S.preventDefault(),S.stopPropagation(),S.type==="dragenter"||S.type==="dragover"?w(!0):S.type==="dragleave"&&w(!1)},T=S=>{if(S.preventDefault(),S.stopPropagation(),w(!1),S.dataTransfer.files&&S.dataTransfer.files[0]){const k=S.dataTransfer.files[0];k.type==="text/csv"||k.name.endsWith(".csv")?(l(k),p(k.name)):alert("Please upload a CSV file only")}},A=()=>{N.current.click()},C=async()=>{if(!a)return;const S=localStorage.getItem("restaurantToken");if(!S)return alert("No token found. Please log in again.");try{c(!0),y(!1);const k=new FormData;k.append("file",a),await Ye.post("http://127.0.0.1:5000/api/load-data",k,{headers:{"Content-Type":"multipart/form-data",Authorization:`Bearer ${S}`}}),y(!0),p(""),l(null)}catch(k){alert("Error uploading file"),console.error("Upload error:",k)}finally{c(!1)}};return f.jsx("div",{className:`min-h-screen ${t?"bg-gray-900 text-white":"bg-gray-50 text-gray-800"} py-12 px-4 sm:px-6 lg:px-8`,children:f.jsxs("div",{className:`max-w-lvh mx-auto ${t?"bg-gray-800":"bg-white"} rounded-xl shadow-lg overflow-hidden`,children:[f.jsxs("div",{className:"bg-gradient-to-r from-blue-600 to-purple-600 px-6 py-8 text-white",children:[f.jsx("h1",{className:"text-3xl font-bold",children:"Sales Prediction"}),f.jsx("p",{className:"mt-2 opacity-80",children:"Upload data or make instant predictions"})]}),f.jsx("div",{className:"p-6",children:f.jsxs("div",{className:`${t?"bg-gray-700":"bg-gray-50"} p-4 rounded-lg`,children:[f.jsx("h2",{className:`text-lg font-medium ${t?"text-white":"text-gray-900"} mb-4`,children:"Upload CSV Data"}),f.jsx("div",{className:`mt-2 flex justify-center px-6 pt-5 pb-6 border-2 border-dashed rounded-md transition-colors
                 ${t?"border-gray-600":"border-gray-300"}
                 ${v?t?"border-blue-400 bg-blue-900 bg-opacity-20":"border-blue-400 bg-blue-50":""}`,onDragEnter:M,onDragLeave:M,onDragOver:M,onDrop:T,children:f.jsxs("div",{className:"space-y-1 text-center",children:[f.jsx("svg",{className:`mx-auto h-12 w-12 ${t?"text-gray-500":"text-gray-400"}`,stroke:"currentColor",fill:"none",viewBox:"0 0 48 48","aria-hidden":"true",children:f.jsx("path",{d:"M28 8H12a4 4 0 00-4 4v20m32-12v8m0 0v8a4 4 0 01-4 4H12a4 4 0 01-4-4v-4m32-4l-3.172-3.172a4 4 0 00-5.656 0L28 28M8 32l9.172-9.172a4 4 0 015.656 0L28 28m0 0l4 4m4-24h8m-4-4v8m-12 4h.02",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round"})}),f.jsxs("div",{className:`flex text-sm ${t?"text-gray-300":"text-gray-600"}`,children:[f.jsx("button",{type:"button",onClick:A,className:`relative cursor-pointer px-3 py-2 rounded-md font-medium text-blue-500 hover:text-blue-400 focus-within:outline-none focus-within:ring-2 focus-within:ring-offset-2 focus-within:ring-blue-500
                       ${t?"bg-gray-600":"bg-white"} hover:${t?"bg-gray-500":"bg-gray-50"}`,children:f.jsx("span",{children:"Upload a file"})}),f.jsx("input",{ref:N,id:"file-upload",name:"file-upload",type:"file",className:"sr-only",onChange:j,accept:".csv"}),f.jsx("p",{className:"pl-1 m-auto",children:"or drag and drop"})]}),f.jsx("p",{className:`text-xs ${t?"text-gray-400":"text-gray-500"}`,children:"CSV files only"})]})}),m&&f.jsxs("div",{className:`mt-3 flex items-center text-sm ${t?"text-gray-300":"text-gray-500"}`,children:[f.jsx("svg",{className:`flex-shrink-0 mr-1.5 h-5 w-5 ${t?"text-gray-500":"text-gray-400"}`,xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor",children:f.jsx("path",{fillRule:"evenodd",d:"M8 4a3 3 0 00-3 3v4a5 5 0 0010 0V7a3 3 0 00-3-3H8zm6 8a3 3 0 01-6 0V7a1 1 0 012 0v5a1 1 0 102 0V7a3 3 0 00-3-3H7a3 3 0 00-3 3v5a5 5 0 0010 0V7a1 1 0 112 0v5z",clipRule:"evenodd"})}),f.jsx("span",{children:m})]}),f.jsx("button",{onClick:C,disabled:!a||o,className:`mt-4 w-full flex justify-center py-3 px-4 border border-transparent rounded-md shadow-sm text-white ${t?"bg-green-700 hover:bg-green-800":"bg-green-600 hover:bg-green-700"} focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-green-500 disabled:opacity-50 disabled:cursor-not-allowed transition-colors`,children:o?"Uploading...":"Upload File"}),b&&f.jsx("div",{className:`mt-3 p-3 ${t?"bg-green-900 border-green-800":"bg-green-50 border-green-200"} border rounded-md`,children:f.jsxs("p",{className:`text-sm ${t?"text-green-200":"text-green-800"} flex items-center`,children:[f.jsx("svg",{className:`h-5 w-5 ${t?"text-green-500":"text-green-400"} mr-2`,xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor",children:f.jsx("path",{fillRule:"evenodd",d:"M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z",clipRule:"evenodd"})}),"File uploaded successfully"]})})]})})]})})}function HM(){return f.jsx(f.Fragment,{children:f.jsxs("main",{className:"viewmenu-container",children:[f.jsx("h1",{children:"View Menu"}),f.jsxs("div",{className:"search-filter",children:[f.jsx("input",{type:"text",id:"search-input",placeholder:"Search menu items..."}),f.jsxs("select",{id:"filter-select",children:[f.jsx("option",{value:"all",children:"All"}),f.jsx("option",{value:"food",children:"Food"}),f.jsx("option",{value:"beverage",children:"Beverage"})]})]}),f.jsxs("table",{id:"menu-table",children:[f.jsx("thead",{children:f.jsxs("tr",{children:[f.jsx("th",{children:"Item ID"}),f.jsx("th",{children:"Name"}),f.jsx("th",{children:"Category"}),f.jsx("th",{children:"Price"})]})}),f.jsxs("tbody",{children:[f.jsxs("tr",{children:[f.jsx("td",{children:"001"}),f.jsx("td",{children:"Burger"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$10.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"002"}),f.jsx("td",{children:"Pizza"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$15.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"003"}),f.jsx("td",{children:"Coffee"}),f.jsx("td",{children:"Beverage"}),f.jsx("td",{children:"$5.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"004"}),f.jsx("td",{children:"Pasta"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$12.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"005"}),f.jsx("td",{children:"Iced Tea"}),f.jsx("td",{children:"Beverage"}),f.jsx("td",{children:"$4.00"})]})]})]})]})})}function UM(){const[t,e]=R.useState([{id:"001",name:"Burger",category:"Food",price:10},{id:"002",name:"Pizza",category:"Food",price:15},{id:"003",name:"Coffee",category:"Beverage",price:5}]),[n,a]=R.useState({name:"",category:"Food",price:""}),l=d=>{if(d.preventDefault(),!n.name||isNaN(n.price)||n.price<=0){alert("Invalid item details");return}const h=(t.length+1).toString().padStart(3,"0");e([...t,{id:h,...n}]),a({name:"",category:"Food",price:""})},o=(d,h,m)=>{const p=[...t];p[d][h]=m,e(p)},c=d=>{e(t.filter(h=>h.id!==d))};return f.jsx(f.Fragment,{children:f.jsxs("main",{className:"updatemenu-container",children:[f.jsx("h1",{children:"Update Menu"}),f.jsxs("div",{className:"add-item-form",children:[f.jsx("h2",{children:"Add New Item"}),f.jsxs("form",{onSubmit:l,children:[f.jsxs("div",{className:"form-group",children:[f.jsx("label",{htmlFor:"new-item-name",children:"Name"}),f.jsx("input",{type:"text",id:"new-item-name",placeholder:"Enter item name",value:n.name,onChange:d=>a({...n,name:d.target.value}),required:!0})]}),f.jsxs("div",{className:"form-group",children:[f.jsx("label",{htmlFor:"new-item-category",children:"Category"}),f.jsxs("select",{id:"new-item-category",value:n.category,onChange:d=>a({...n,category:d.target.value}),required:!0,children:[f.jsx("option",{value:"Food",children:"Food"}),f.jsx("option",{value:"Beverage",children:"Beverage"})]})]}),f.jsxs("div",{className:"form-group",children:[f.jsx("label",{htmlFor:"new-item-price",children:"Price"}),f.jsx("input",{type:"number",id:"new-item-price",placeholder:"Enter price",step:"0.01",value:n.price,onChange:d=>a({...n,price:parseFloat(d.target.value)}),required:!0})]}),f.jsx("button",{type:"submit",className:"submit-btn",children:"Add Item"})]})]}),f.jsxs("table",{id:"menu-table",children:[f.jsx("thead",{children:f.jsxs("tr",{children:[f.jsx("th",{children:"Item ID"}),f.jsx("th",{children:"Name"}),f.jsx("th",{children:"Category"}),f.jsx("th",{children:"Price"}),f.jsx("th",{children:"Actions"})]})}),f.jsx("tbody",{children:t.map((d,h)=>f.jsxs("tr",{children:[f.jsx("td",{children:d.id}),f.jsx("td",{children:f.jsx("input",{type:"text",value:d.name,className:"editable-input",onChange:m=>o(h,"name",m.target.value)})}),f.jsx("td",{children:d.category}),f.jsx("td",{children:f.jsx("input",{type:"number",value:d.price,className:"editable-input",step:"0.01",onChange:m=>o(h,"price",parseFloat(m.target.value))})}),f.jsxs("td",{children:[f.jsx("button",{className:"action-btn save-btn",title:"Save Changes",children:f.jsx("span",{className:"material-symbols-outlined",children:"save"})}),f.jsx("button",{className:"action-btn delete-btn",title:"Delete Item",onClick:()=>c(d.id),children:f.jsx("span",{className:"material-symbols-outlined",children:"delete"})})]})]},d.id))})]})]})})}function PM(){const[t,e]=R.useState([]),[n,a]=R.useState(!0),[l,o]=R.useState(null),[c,d]=R.useState(""),[h,m]=R.useState("all"),[p,b]=R.useState(!1),[y,v]=R.useState(null),{darkTheme:w}=Xn(),N=Ks();R.useEffect(()=>{j()},[]);const j=async()=>{a(!0);try{const S=localStorage.getItem("restaurantToken");if(!S)throw new Error("You must be logged in to view bills");const k=await fetch("http://localhost:5000/bills",{method:"GET",headers:{Authorization:`Bearer ${S}`}});if(!k.ok){const V=await k.json();throw new Error(V.error||"Failed to fetch bills")}const $=(await k.json()).map(V=>({...V,status:new Date(V.created_at)<new Date(Date.now()-864e5)?"paid":"unpaid"}));e($)}catch(S){console.error("Error fetching bills:",S),o(S.message)}finally{a(!1)}},M=async S=>{try{const k=localStorage.getItem("restaurantToken");if(!k)throw new Error("You must be logged in to view bill details");const F=await fetch(`http://localhost:5000/bills/${S}`,{method:"GET",headers:{Authorization:`Bearer ${k}`}});if(!F.ok){const V=await F.json();throw new Error(V.error||"Failed to fetch bill details")}const $=await F.json();v($),b(!0)}catch(k){console.error("Error fetching bill details:",k),alert(k.message)}},T=async S=>{if(window.confirm("Are you sure you want to delete this bill?"))try{const k=localStorage.getItem("restaurantToken");if(!k)throw new Error("You must be logged in to delete bills");const F=await fetch(`http://localhost:5000/bills/${S}`,{method:"DELETE",headers:{Authorization:`Bearer ${k}`}});if(!F.ok){const $=await F.json();throw new Error($.error||"Failed to delete bill")}j(),alert("Bill deleted successfully")}catch(k){console.error("Error deleting bill:",k),alert(k.message)}},A=S=>{localStorage.setItem("printBillData",JSON.stringify(S));const k=window.open("/printbill","_blank");k?k.focus():alert("Please allow pop-ups to print bills")},C=t.filter(S=>{const k=S.bill_number.toLowerCase().includes(c.toLowerCase())||S.customer_name.toLowerCase().includes(c.toLowerCase()),F=h==="all"||S.status===h;return k&&F});return f.jsxs("div",{className:`min-h-screen py-10 px-4 md:px-8 lg:px-12 transition-colors duration-300 ${w?"bg-gradient-to-br from-gray-900 via-gray-800 to-gray-900 text-white":"bg-gradient-to-br from-gray-50 via-gray-100 to-gray-50 text-gray-900"}`,children:[f.jsxs("div",{className:"w-full mx-auto",children:[f.jsx("div",{className:`mb-10 rounded-2xl shadow-xl overflow-hidden ${w?"bg-gradient-to-r from-indigo-900 to-purple-900":"bg-gradient-to-r from-indigo-600 to-purple-600"}`,children:f.jsxs("div",{className:"px-6 py-8 text-white",children:[f.jsx("h1",{className:"text-4xl font-extrabold tracking-tight text-center",children:"Manage Bills"}),f.jsx("p",{className:"text-center mt-2 text-lg opacity-90",children:"View, edit, and manage your restaurant bills"})]})}),f.jsx("div",{className:`p-6 rounded-xl mb-8 ${w?"bg-gray-800/80 backdrop-blur-lg":"bg-white/80 backdrop-blur-lg"} shadow-lg`,children:f.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-4",children:[f.jsxs("div",{className:"relative flex-1",children:[f.jsx("div",{className:"absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none",children:f.jsx("svg",{className:"w-5 h-5 text-gray-400",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z"})})}),f.jsx("input",{type:"text",placeholder:"Search by bill number or customer name...",value:c,onChange:S=>d(S.target.value),className:`w-full pl-10 pr-4 py-3 rounded-lg border transition-all duration-200 ${w?"bg-gray-700 border-gray-600 text-white focus:border-indigo-500":"bg-white border-gray-300 text-gray-900 focus:border-indigo-500"} focus:ring-2 focus:ring-indigo-500 focus:ring-opacity-20`})]}),f.jsx("div",{className:"flex-shrink-0 w-full md:w-auto",children:f.jsxs("select",{value:h,onChange:S=>m(S.target.value),className:`w-full md:w-48 px-4 py-3 rounded-lg border transition-all duration-200 ${w?"bg-gray-700 border-gray-600 text-white focus:border-indigo-500":"bg-white border-gray-300 text-gray-900 focus:border-indigo-500"} focus:ring-2 focus:ring-indigo-500 focus:ring-opacity-20`,children:[f.jsx("option",{value:"all",children:"All Bills"}),f.jsx("option",{value:"paid",children:"Paid"}),f.jsx("option",{value:"unpaid",children:"Unpaid"})]})}),f.jsx("button",{onClick:()=>N("/newbill"),className:"flex-shrink-0 w-full md:w-auto px-6 py-3 bg-gradient-to-r from-green-500 to-green-600 text-white rounded-lg hover:from-green-600 hover:to-green-700 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-offset-2 transition-all duration-200 transform hover:-translate-y-0.5 shadow-md hover:shadow-lg font-medium",children:f.jsxs("div",{className:"flex items-center justify-center",children:[f.jsx("svg",{className:"w-5 h-5 mr-2",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 4v16m8-8H4"})}),"Create New Bill"]})})]})}),f.jsx("div",{className:`rounded-xl shadow-xl overflow-hidden ${w?"bg-gray-800/80 backdrop-blur-lg":"bg-white/80 backdrop-blur-lg"}`,children:n?f.jsx("div",{className:"flex justify-center items-center p-12",children:f.jsxs("svg",{className:"animate-spin h-10 w-10 text-indigo-500",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[f.jsx("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),f.jsx("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"})]})}):l?f.jsxs("div",{className:"p-8 text-center",children:[f.jsx("div",{className:"text-red-500 mb-4",children:l}),f.jsx("button",{onClick:j,className:"px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-indigo-500 focus:ring-offset-2",children:"Try Again"})]}):C.length===0?f.jsxs("div",{className:"p-8 text-center",children:[f.jsx("svg",{className:"mx-auto h-12 w-12 text-gray-400",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"})}),f.jsx("h3",{className:"mt-4 text-lg font-medium",children:"No bills found"}),f.jsx("p",{className:"mt-1 text-gray-500 dark:text-gray-400",children:c||h!=="all"?"Try adjusting your search or filter criteria":"Start by creating your first bill"})]}):f.jsx("div",{className:"overflow-x-auto",children:f.jsxs("table",{className:"w-full",children:[f.jsx("thead",{children:f.jsxs("tr",{className:`${w?"bg-gray-700":"bg-gray-200"}`,children:[f.jsx("th",{className:"px-6 py-4 text-left font-semibold",children:"Bill #"}),f.jsx("th",{className:"px-6 py-4 text-left font-semibold",children:"Date & Time"}),f.jsx("th",{className:"px-6 py-4 text-left font-semibold",children:"Customer"}),f.jsx("th",{className:"px-6 py-4 text-left font-semibold",children:"Table"}),f.jsx("th",{className:"px-6 py-4 text-right font-semibold",children:"Amount"}),f.jsx("th",{className:"px-6 py-4 text-center font-semibold",children:"Actions"})]})}),f.jsx("tbody",{className:"divide-y divide-gray-200 dark:divide-gray-700",children:C.map(S=>f.jsxs("tr",{className:`${w?"hover:bg-gray-700/50":"hover:bg-gray-50"} transition-colors duration-150`,children:[f.jsx("td",{className:"px-6 py-4 whitespace-nowrap font-medium",children:S.bill_number}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap",children:S.timestamp}),f.jsx("td",{className:"px-6 py-4",children:S.customer_name}),f.jsx("td",{className:"px-6 py-4",children:S.table_number||"-"}),f.jsxs("td",{className:"px-6 py-4 text-right font-medium",children:["₹",S.total_amount.toFixed(2)]}),f.jsx("td",{className:"px-6 py-4 text-center",children:f.jsxs("div",{className:"flex justify-center space-x-2",children:[f.jsx("button",{onClick:()=>M(S.id),className:`p-2 rounded-lg transition-colors duration-200 ${w?"hover:bg-gray-600":"hover:bg-gray-200"}`,title:"View Bill",children:f.jsxs("svg",{className:"w-5 h-5 text-blue-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:[f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M15 12a3 3 0 11-6 0 3 3 0 016 0z"}),f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"})]})}),f.jsx("button",{onClick:()=>A(S),className:`p-2 rounded-lg transition-colors duration-200 ${w?"hover:bg-gray-600":"hover:bg-gray-200"}`,title:"Print Bill",children:f.jsx("svg",{className:"w-5 h-5 text-gray-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M17 17h2a2 2 0 002-2v-4a2 2 0 00-2-2H5a2 2 0 00-2 2v4a2 2 0 002 2h2m2 4h6a2 2 0 002-2v-4a2 2 0 00-2-2H9a2 2 0 00-2 2v4a2 2 0 002 2zm8-12V5a2 2 0 00-2-2H9a2 2 0 00-2 2v4h10z"})})}),f.jsx("button",{onClick:()=>T(S.id),className:`p-2 rounded-lg transition-colors duration-200 ${w?"hover:bg-gray-600":"hover:bg-gray-200"}`,title:"Delete Bill",children:f.jsx("svg",{className:"w-5 h-5 text-red-500",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"})})})]})})]},S.id))})]})})})]}),p&&y&&f.jsx("div",{className:"fixed inset-0 z-50 overflow-y-auto",children:f.jsxs("div",{className:"flex items-end justify-center min-h-screen pt-4 px-4 pb-20 text-center sm:block sm:p-0",children:[f.jsx("div",{className:"fixed inset-0 transition-opacity","aria-hidden":"true",onClick:()=>b(!1),children:f.jsx("div",{className:"absolute inset-0 bg-gray-900 opacity-75"})}),f.jsx("span",{className:"hidden sm:inline-block sm:align-middle sm:h-screen","aria-hidden":"true",children:"​"}),f.jsxs("div",{className:`inline-block align-bottom rounded-lg text-left overflow-hidden shadow-xl transform transition-all sm:my-8 sm:align-middle sm:max-w-3xl sm:w-full ${w?"bg-gray-800":"bg-white"}`,role:"dialog","aria-modal":"true","aria-labelledby":"modal-headline",children:[f.jsx("div",{className:`px-6 pt-5 pb-6 border-b ${w?"border-gray-700":"border-gray-200"}`,children:f.jsxs("div",{className:"flex items-center justify-between",children:[f.jsx("h3",{className:"text-lg font-medium",id:"modal-headline",children:"Bill Details"}),f.jsx("button",{onClick:()=>b(!1),className:"rounded-md p-1 inline-flex items-center justify-center focus:outline-none focus:ring-2 focus:ring-inset focus:ring-indigo-500",children:f.jsx("svg",{className:"h-6 w-6",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:"2",d:"M6 18L18 6M6 6l12 12"})})})]})}),f.jsxs("div",{className:`px-6 py-4 ${w?"bg-gray-800":"bg-white"}`,children:[f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4 mb-6",children:[f.jsxs("div",{children:[f.jsx("h4",{className:"text-sm font-medium opacity-70",children:"Bill Number"}),f.jsx("p",{className:"text-lg font-medium",children:y.bill_number})]}),f.jsxs("div",{children:[f.jsx("h4",{className:"text-sm font-medium opacity-70",children:"Date & Time"}),f.jsx("p",{children:y.timestamp})]}),f.jsxs("div",{children:[f.jsx("h4",{className:"text-sm font-medium opacity-70",children:"Customer Name"}),f.jsx("p",{children:y.customer_name})]}),f.jsxs("div",{children:[f.jsx("h4",{className:"text-sm font-medium opacity-70",children:"Table Number"}),f.jsx("p",{children:y.table_number||"-"})]})]}),f.jsx("div",{className:`rounded-lg overflow-hidden border ${w?"border-gray-700":"border-gray-200"}`,children:f.jsxs("table",{className:"min-w-full divide-y divide-gray-200 dark:divide-gray-700",children:[f.jsx("thead",{className:w?"bg-gray-700":"bg-gray-100",children:f.jsxs("tr",{children:[f.jsx("th",{scope:"col",className:"px-6 py-3 text-left text-xs font-medium uppercase tracking-wider",children:"Item"}),f.jsx("th",{scope:"col",className:"px-6 py-3 text-center text-xs font-medium uppercase tracking-wider",children:"Qty"}),f.jsx("th",{scope:"col",className:"px-6 py-3 text-right text-xs font-medium uppercase tracking-wider",children:"Price"}),f.jsx("th",{scope:"col",className:"px-6 py-3 text-right text-xs font-medium uppercase tracking-wider",children:"Total"})]})}),f.jsx("tbody",{className:`divide-y ${w?"divide-gray-700":"divide-gray-200"}`,children:y.items&&y.items.map((S,k)=>f.jsxs("tr",{children:[f.jsx("td",{className:"px-6 py-4 whitespace-nowrap",children:S.description}),f.jsx("td",{className:"px-6 py-4 whitespace-nowrap text-center",children:S.quantity}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-right",children:["₹",S.unit_price.toFixed(2)]}),f.jsxs("td",{className:"px-6 py-4 whitespace-nowrap text-right",children:["₹",S.total_price.toFixed(2)]})]},S.id))}),f.jsxs("tfoot",{children:[f.jsxs("tr",{className:w?"bg-gray-800":"bg-white",children:[f.jsx("td",{colSpan:"3",className:"px-6 py-3 text-right font-medium",children:"Subtotal"}),f.jsxs("td",{className:"px-6 py-3 text-right",children:["₹",y.subtotal.toFixed(2)]})]}),f.jsxs("tr",{className:w?"bg-gray-800":"bg-white",children:[f.jsx("td",{colSpan:"3",className:"px-6 py-3 text-right font-medium",children:"Tax (18%)"}),f.jsxs("td",{className:"px-6 py-3 text-right",children:["₹",y.tax_amount.toFixed(2)]})]}),f.jsxs("tr",{className:`font-bold ${w?"bg-gray-700":"bg-gray-100"}`,children:[f.jsx("td",{colSpan:"3",className:"px-6 py-3 text-right",children:"Grand Total"}),f.jsxs("td",{className:"px-6 py-3 text-right",children:["₹",y.total_amount.toFixed(2)]})]})]})]})})]}),f.jsxs("div",{className:`px-6 py-4 flex justify-end space-x-3 ${w?"bg-gray-800":"bg-gray-50"}`,children:[f.jsxs("button",{type:"button",onClick:()=>A(y),className:"inline-flex justify-center py-2 px-4 border border-transparent shadow-sm text-sm font-medium rounded-md text-white bg-green-600 hover:bg-green-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-green-500",children:[f.jsx("svg",{className:"w-5 h-5 mr-2",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M17 17h2a2 2 0 002-2v-4a2 2 0 00-2-2H5a2 2 0 00-2 2v4a2 2 0 002 2h2m2 4h6a2 2 0 002-2v-4a2 2 0 00-2-2H9a2 2 0 00-2 2v4a2 2 0 002 2zm8-12V5a2 2 0 00-2-2H9a2 2 0 00-2 2v4h10z"})}),"Print Bill"]}),f.jsx("button",{type:"button",onClick:()=>b(!1),className:`inline-flex justify-center py-2 px-4 border shadow-sm text-sm font-medium rounded-md focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 ${w?"border-gray-600 bg-gray-700 text-white hover:bg-gray-600":"border-gray-300 bg-white text-gray-700 hover:bg-gray-50"}`,children:"Close"})]})]})]})})]})}function FM(){return f.jsx(f.Fragment,{children:f.jsxs("main",{className:"viewmenu-container",children:[f.jsx("h1",{children:"View Menu"}),f.jsxs("div",{className:"search-filter",children:[f.jsx("input",{type:"text",id:"search-input",placeholder:"Search menu items..."}),f.jsxs("select",{id:"filter-select",children:[f.jsx("option",{value:"all",children:"All"}),f.jsx("option",{value:"food",children:"Food"}),f.jsx("option",{value:"beverage",children:"Beverage"})]})]}),f.jsxs("table",{id:"menu-table",children:[f.jsx("thead",{children:f.jsxs("tr",{children:[f.jsx("th",{children:"Item ID"}),f.jsx("th",{children:"Name"}),f.jsx("th",{children:"Category"}),f.jsx("th",{children:"Price"})]})}),f.jsxs("tbody",{children:[f.jsxs("tr",{children:[f.jsx("td",{children:"001"}),f.jsx("td",{children:"Burger"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$10.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"002"}),f.jsx("td",{children:"Pizza"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$15.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"003"}),f.jsx("td",{children:"Coffee"}),f.jsx("td",{children:"Beverage"}),f.jsx("td",{children:"$5.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"004"}),f.jsx("td",{children:"Pasta"}),f.jsx("td",{children:"Food"}),f.jsx("td",{children:"$12.00"})]}),f.jsxs("tr",{children:[f.jsx("td",{children:"005"}),f.jsx("td",{children:"Iced Tea"}),f.jsx("td",{children:"Beverage"}),f.jsx("td",{children:"$4.00"})]})]})]})]})})}const Pf="http://localhost:5000/api",Mb=({type:t="bar",id:e,data:n,options:a})=>{const l=R.useRef(null);return R.useEffect(()=>{if(!l.current)return;const o=l.current.getContext("2d"),c=new ni(o,{type:t,data:n,options:a||{responsive:!0,maintainAspectRatio:!1}});return()=>{c.destroy()}},[t,n,a]),f.jsxs("div",{style:{width:"100%",height:"250px"},children:[" ",f.jsx("canvas",{ref:l,id:e}),";"]})};function VM(){const[t,e]=R.useState(null),[n,a]=R.useState(null),[l,o]=R.useState(null),[c,d]=R.useState(!1),[h,m]=R.useState("analysis"),[p,b]=R.useState(null),[y,v]=R.useState({item_name:"Vadapav",item_type:"Fastfood",day_of_week:"Monday",time_of_day:"Evening",received_by:"Mr.",item_price:20});R.useEffect(()=>{w(),N()},[]);const w=async()=>{var T,A;d(!0);try{const C=await Ye.get(`${Pf}/get-analysis`);e(C.data.success?C.data:null)}catch(C){b(((A=(T=C.response)==null?void 0:T.data)==null?void 0:A.message)||C.message)}finally{d(!1)}},N=async()=>{try{const T=await Ye.get(`${Pf}/get-options`);o(T.data.success?T.data:null)}catch(T){b(T.message)}},j=async T=>{T.preventDefault(),d(!0);try{const A=await Ye.post(`${Pf}/predict`,y);a(A.data.success?A.data:null)}catch(A){b(A.message)}finally{d(!1)}},M=T=>{v({...y,[T.target.name]:T.target.value})};return f.jsxs("div",{className:"container mx-auto p-4",children:[f.jsx("h1",{className:"text-3xl font-bold text-center mb-6",children:"Restaurant Sales Analysis & Prediction"}),p&&f.jsx("p",{className:"text-red-500",children:p}),f.jsxs("div",{className:"flex border-b mb-4",children:[f.jsx("button",{className:`tab ${h==="analysis"&&"active"}`,onClick:()=>m("analysis"),children:"Sales Analysis"}),f.jsx("button",{className:`tab ${h==="prediction"&&"active"}`,onClick:()=>m("prediction"),children:"Sales Prediction"})]}),h==="analysis"&&f.jsxs("div",{children:[f.jsx("button",{className:"btn",onClick:w,disabled:c,children:c?"Loading...":"Refresh"}),t&&f.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:[f.jsxs("div",{className:"chart-box",children:[f.jsx("h2",{children:"Sales by Day of Week"}),f.jsx(Mb,{id:"day-sales-chart",data:{labels:t.day_sales.labels,datasets:[{label:"Sales (Rs.)",data:t.day_sales.values}]}})]}),f.jsxs("div",{className:"chart-box",children:[f.jsx("h2",{children:"Top 10 Favorite Items"}),f.jsx(Mb,{id:"favorite-items-chart",data:{labels:t.favorite_items.labels,datasets:[{label:"Quantity Sold",data:t.favorite_items.values}]}})]})]})]}),h==="prediction"&&f.jsxs("div",{children:[f.jsxs("form",{onSubmit:j,className:"space-y-4",children:[f.jsx("input",{type:"text",name:"item_name",value:y.item_name,onChange:M,required:!0,placeholder:"Item Name"}),f.jsx("input",{type:"text",name:"item_type",value:y.item_type,onChange:M,required:!0,placeholder:"Item Type"}),f.jsxs("select",{name:"day_of_week",value:y.day_of_week,onChange:M,required:!0,children:[f.jsx("option",{children:"Monday"}),f.jsx("option",{children:"Tuesday"}),f.jsx("option",{children:"Wednesday"}),f.jsx("option",{children:"Thursday"}),f.jsx("option",{children:"Friday"}),f.jsx("option",{children:"Saturday"}),f.jsx("option",{children:"Sunday"})]}),f.jsxs("select",{name:"time_of_day",value:y.time_of_day,onChange:M,required:!0,children:[f.jsx("option",{children:"Morning"}),f.jsx("option",{children:"Afternoon"}),f.jsx("option",{children:"Evening"}),f.jsx("option",{children:"Night"})]}),f.jsx("input",{type:"text",name:"received_by",value:y.received_by,onChange:M,required:!0,placeholder:"Received By"}),f.jsx("input",{type:"number",name:"item_price",value:y.item_price,onChange:M,required:!0,placeholder:"Item Price"}),f.jsx("button",{type:"submit",className:"btn",disabled:c,children:c?"Predicting...":"Predict Sales"})]}),n&&f.jsxs("p",{className:"result",children:["Predicted Sales: Rs. ",n.predicted_sales]})]})]})}function qM(){const{darkTheme:t}=Xn(),[e,n]=R.useState({email:"",password:""}),[a,l]=R.useState(!1),[o,c]=R.useState(""),[d,h]=R.useState(!1),m=Ks(),p=y=>{n({...e,[y.target.name]:y.target.value}),c("")},b=async y=>{var v,w;if(y.preventDefault(),!e.email||!e.password){c("Please fill in all fields");return}try{l(!0),c("");const j=(await Ye.post("http://localhost:5000/login",e)).data.access_token;console.log(j),localStorage.setItem("restaurantToken",j),m("/upload"),console.log("Login successful")}catch(N){c(((w=(v=N.response)==null?void 0:v.data)==null?void 0:w.message)||"An error occurred during login")}finally{l(!1)}};return f.jsx("div",{className:`min-h-screen flex items-center justify-center ${t?"bg-gray-900":"bg-gray-50"} py-12 px-4 sm:px-6 lg:px-8`,children:f.jsxs("div",{className:`max-w-md w-full space-y-8 ${t?"bg-gray-800":"bg-white"} p-8 rounded-xl shadow-lg`,children:[f.jsxs("div",{children:[f.jsx("h2",{className:`mt-6 text-center text-3xl font-extrabold ${t?"text-white":"text-gray-900"}`,children:"Sign in to your account"}),f.jsxs("p",{className:`mt-2 text-center text-sm ${t?"text-gray-400":"text-gray-600"}`,children:["Don't have an account?"," ",f.jsx(Dt,{to:"/signup",className:"font-medium text-blue-600 hover:text-blue-500",children:"Sign up"})]})]}),f.jsxs("form",{className:"mt-8 space-y-6",onSubmit:b,children:[f.jsxs("div",{className:"space-y-4",children:[f.jsxs("div",{children:[f.jsx("label",{htmlFor:"email-address",className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Email address"}),f.jsx("input",{id:"email-address",name:"email",type:"email",autoComplete:"email",required:!0,value:e.email,onChange:p,className:`appearance-none relative block w-full px-3 py-2 mt-1 border ${t?"bg-gray-700 border-gray-600 text-white placeholder-gray-400 focus:ring-blue-500 focus:border-blue-500":"bg-white border-gray-300 text-gray-900 placeholder-gray-500 focus:ring-blue-500 focus:border-blue-500"} rounded-md focus:outline-none focus:z-10 sm:text-sm`,placeholder:"Enter your email"})]}),f.jsxs("div",{children:[f.jsx("label",{htmlFor:"password",className:`block text-sm font-medium ${t?"text-gray-300":"text-gray-700"}`,children:"Password"}),f.jsxs("div",{className:"relative",children:[f.jsx("input",{id:"password",name:"password",type:d?"text":"password",autoComplete:"current-password",required:!0,value:e.password,onChange:p,className:`appearance-none relative block w-full px-3 py-2 mt-1 border ${t?"bg-gray-700 border-gray-600 text-white placeholder-gray-400 focus:ring-blue-500 focus:border-blue-500":"bg-white border-gray-300 text-gray-900 placeholder-gray-500 focus:ring-blue-500 focus:border-blue-500"} rounded-md focus:outline-none focus:z-10 sm:text-sm`,placeholder:"Enter your password"}),f.jsx("button",{type:"button",onClick:()=>h(!d),className:`absolute inset-y-0 right-0 pr-3 flex items-center text-sm leading-5 ${t?"text-gray-400 hover:text-gray-300":"text-gray-600 hover:text-gray-500"}`,children:d?f.jsx("svg",{className:"h-5 w-5",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13.875 18.825A10.05 10.05 0 0112 19c-4.478 0-8.268-2.943-9.543-7a9.97 9.97 0 011.563-3.029m5.858.908a3 3 0 114.243 4.243M9.878 9.878l4.242 4.242M9.88 9.88l-3.29-3.29m7.532 7.532l3.29 3.29M3 3l3.59 3.59m0 0A9.953 9.953 0 0112 5c4.478 0 8.268 2.943 9.543 7a10.025 10.025 0 01-4.132 5.411m0 0L21 21"})}):f.jsxs("svg",{className:"h-5 w-5",fill:"none",viewBox:"0 0 24 24",stroke:"currentColor",children:[f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M15 12a3 3 0 11-6 0 3 3 0 016 0z"}),f.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"})]})})]})]})]}),f.jsxs("div",{className:"flex items-center justify-between",children:[f.jsxs("div",{className:"flex items-center",children:[f.jsx("input",{id:"remember-me",name:"remember-me",type:"checkbox",className:`h-4 w-4 rounded ${t?"border-gray-600 bg-gray-700 text-blue-600 focus:ring-blue-500":"border-gray-300 text-blue-600 focus:ring-blue-500"}`}),f.jsx("label",{htmlFor:"remember-me",className:`ml-2 block text-sm ${t?"text-gray-300":"text-gray-700"}`,children:"Remember me"})]}),f.jsx("div",{className:"text-sm",children:f.jsx("a",{href:"#",className:"font-medium text-blue-600 hover:text-blue-500",children:"Forgot your password?"})})]}),o&&f.jsx("div",{className:`text-sm ${t?"text-red-400 bg-red-900 bg-opacity-30":"text-red-600 bg-red-50"} px-4 py-2 rounded-md`,children:o}),f.jsx("div",{children:f.jsxs("button",{type:"submit",disabled:a,className:"group relative w-full flex justify-center py-2 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500 disabled:opacity-50 disabled:cursor-not-allowed transition-colors",children:[a?f.jsx("span",{className:"absolute left-0 inset-y-0 flex items-center pl-3",children:f.jsxs("svg",{className:"animate-spin h-5 w-5 text-white",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",children:[f.jsx("circle",{className:"opacity-25",cx:"12",cy:"12",r:"10",stroke:"currentColor",strokeWidth:"4"}),f.jsx("path",{className:"opacity-75",fill:"currentColor",d:"M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"})]})}):f.jsx("span",{className:"absolute left-0 inset-y-0 flex items-center pl-3",children:f.jsx("svg",{className:"h-5 w-5 text-blue-500 group-hover:text-blue-400",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 20 20",fill:"currentColor","aria-hidden":"true",children:f.jsx("path",{fillRule:"evenodd",d:"M5 9V7a5 5 0 0110 0v2a2 2 0 012 2v5a2 2 0 01-2 2H5a2 2 0 01-2-2v-5a2 2 0 012-2zm8-2v2H7V7a3 3 0 016 0z",clipRule:"evenodd"})})}),a?"Signing in...":"Sign in"]})})]}),f.jsxs("div",{className:"mt-6",children:[f.jsxs("div",{className:"relative",children:[f.jsx("div",{className:"absolute inset-0 flex items-center",children:f.jsx("div",{className:`w-full border-t ${t?"border-gray-700":"border-gray-300"}`})}),f.jsx("div",{className:"relative flex justify-center text-sm",children:f.jsx("span",{className:`px-2 ${t?"bg-gray-800 text-gray-400":"bg-white text-gray-500"}`,children:"Or continue with"})})]}),f.jsx("div",{className:"mt-6 grid grid-cols-1 gap-3",children:f.jsxs("button",{type:"button",className:`w-full inline-flex justify-center py-2 px-4 border border-gray-300 rounded-md shadow-sm ${t?"bg-gray-700 text-white hover:bg-gray-600":"bg-white text-gray-500 hover:bg-gray-50"} text-sm font-medium`,children:[f.jsx("svg",{className:"w-5 h-5","aria-hidden":"true",fill:"currentColor",viewBox:"0 0 488 512",children:f.jsx("path",{d:"M488 261.8C488 403.3 391.1 504 248 504 110.8 504 0 393.2 0 256S110.8 8 248 8c66.8 0 123 24.5 166.3 64.9l-67.5 64.9C258.5 52.6 94.3 116.6 94.3 256c0 86.5 69.1 156.6 153.7 156.6 98.2 0 135-70.4 140.8-106.9H248v-85.3h236.1c2.3 12.7 3.9 24.9 3.9 41.4z"})}),f.jsx("span",{className:"ml-2",children:"Google"})]})})]})]})})}/**
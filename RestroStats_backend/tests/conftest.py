@@ -0,0 +1,53 @@
+import os
+import tempfile
+
+import pytest
+
+# Point the app at throwaway storage before anything imports it: a SQLite
+# database, model store, scheduler file and upload spool per test session.
+_tmp_dir = tempfile.mkdtemp(prefix="restrostats-tests-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + os.path.join(_tmp_dir, "test.sqlite3")
+os.environ["MODEL_STORE_DIR"] = os.path.join(_tmp_dir, "model_store")
+os.environ["MODEL_PATH"] = os.path.join(_tmp_dir, "sales_model.pkl")
+os.environ["SCHEDULER_DB"] = os.path.join(_tmp_dir, "scheduler.sqlite3")
+os.environ["UPLOAD_DIR"] = _tmp_dir
+
+from app import app, bcrypt, create_access_token, db  # noqa: E402
+from entities.Restaurant import Restaurant  # noqa: E402
+
+
+@pytest.fixture
+def app_context():
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+@pytest.fixture
+def client(app_context):
+    return app.test_client()
+
+
+@pytest.fixture
+def restaurant_id(app_context):
+    restaurant = Restaurant(
+        name="Test Restaurant",
+        email="test@example.com",
+        password=bcrypt.generate_password_hash("secret").decode("utf-8"),
+        city="Mumbai",
+        state="Maharashtra",
+    )
+    db.session.add(restaurant)
+    db.session.commit()
+    return restaurant.id
+
+
+@pytest.fixture
+def auth_headers(restaurant_id):
+    with app.test_request_context():
+        token = create_access_token(identity=str(restaurant_id))
+    return {"Authorization": f"Bearer {token}"}
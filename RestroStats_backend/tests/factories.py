@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+ITEMS = [
+    ("Vadapav", "Fastfood", 20.0),
+    ("Sugarcane juice", "Beverages", 25.0),
+    ("Panipuri", "Fastfood", 20.0),
+    ("Frankie", "Fastfood", 50.0),
+    ("Cold coffee", "Beverages", 40.0),
+]
+
+
+def payment_rows(n, start="2024-01-01 08:00", seed=0, order_offset=0):
+    """n upload rows shaped like a POS export, in the CSV column layout."""
+    rng = np.random.default_rng(seed)
+    items = [ITEMS[i] for i in rng.integers(0, len(ITEMS), n)]
+    quantity = rng.integers(1, 6, n)
+    price = np.array([item[2] for item in items])
+    timestamps = pd.Timestamp(start) + pd.to_timedelta(np.arange(n) * 7, unit="min")
+    return pd.DataFrame(
+        {
+            "order_id": [str(order_offset + i) for i in range(n)],
+            "timestamp": timestamps.strftime("%Y-%m-%d %H:%M"),
+            "item_name": [item[0] for item in items],
+            "item_type": [item[1] for item in items],
+            "item_price": price,
+            "quantity": quantity,
+            "transaction_amount": price * quantity,
+            "transaction_type": rng.choice(["Cash", "Online"], n),
+            "received_by": rng.choice(["Mr.", "Mrs."], n),
+        }
+    )
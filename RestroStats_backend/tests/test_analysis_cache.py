@@ -0,0 +1,61 @@
+import threading
+
+from app import app, db
+from cleaning.payments import clean_upload_chunk
+from controllers import Restaurant_Sales
+from prediction_models import analysis_cache, food_sales_analysis
+from repository.Bulk_Insert import bulk_insert_payments
+from tests.factories import payment_rows
+
+
+def test_state_is_built_once_per_data_version(restaurant_id, monkeypatch):
+    analysis_cache.clear_analysis_cache()
+    builds = []
+    build_state = analysis_cache._build_state
+
+    def counting_build(rid):
+        builds.append(rid)
+        return build_state(rid)
+
+    monkeypatch.setattr(analysis_cache, "_build_state", counting_build)
+    bulk_insert_payments(clean_upload_chunk(payment_rows(200)), restaurant_id)
+    db.session.commit()
+
+    states = []
+
+    def request():
+        with app.app_context():
+            states.append(analysis_cache.get_analysis_state(restaurant_id))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert builds == [restaurant_id]
+    assert all(state is states[0] for state in states)
+
+    # New payments move the data version, the next request rebuilds
+    bulk_insert_payments(clean_upload_chunk(payment_rows(10, order_offset=1000)), restaurant_id)
+    db.session.commit()
+    state = analysis_cache.get_analysis_state(restaurant_id)
+    assert builds == [restaurant_id, restaurant_id]
+    assert len(state["df_clean"]) == 210
+
+
+def test_analysis_error_does_not_leak_the_traceback(client, monkeypatch):
+    def broken(restaurant_id=None):
+        raise RuntimeError("payments table is locked")
+
+    monkeypatch.setattr(Restaurant_Sales, "get_analysis_state", broken)
+    response = client.get("/api/get-analysis")
+    assert response.status_code == 500
+    assert response.json == {"success": False, "message": "Error getting analysis: payments table is locked"}
+
+
+def test_restaurant_without_payments_gets_no_sample_data(restaurant_id, monkeypatch, tmp_path):
+    payment_rows(20).to_csv(tmp_path / "sample_data.csv", index=False)
+    monkeypatch.chdir(tmp_path)
+    assert food_sales_analysis.load_payments(restaurant_id).empty
+    assert len(food_sales_analysis.load_payments()) == 20
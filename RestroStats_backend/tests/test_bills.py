@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import app, db
+from entities.Bill import Bill
+from repository.Group_Commit import BillCommitPending, bill_committer
+
+
+def _add_bills(restaurant_id, count):
+    start = datetime(2024, 1, 1, 12, 0)
+    for i in range(count):
+        db.session.add(
+            Bill(
+                restaurant_id=restaurant_id,
+                bill_number=f"B{i}",
+                timestamp=start + timedelta(minutes=i),
+                customer_name="Guest",
+                subtotal=100.0,
+                tax_amount=5.0,
+                total_amount=105.0,
+            )
+        )
+    db.session.commit()
+
+
+def test_bills_without_paging_args_keep_the_list_shape(client, restaurant_id, auth_headers):
+    _add_bills(restaurant_id, 5)
+    bills = client.get("/bills", headers=auth_headers).json
+    assert isinstance(bills, list)
+    assert [bill["bill_number"] for bill in bills] == ["B4", "B3", "B2", "B1", "B0"]
+
+
+def test_bills_pages_follow_next_cursor(client, restaurant_id, auth_headers):
+    _add_bills(restaurant_id, 5)
+    seen, cursor = [], None
+    while True:
+        query = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        page = client.get("/bills", headers=auth_headers, query_string=query).json
+        seen += [bill["bill_number"] for bill in page["bills"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ["B4", "B3", "B2", "B1", "B0"]
+
+
+BILL = {
+    "billNumber": "B-1",
+    "date": "2024-01-01",
+    "time": "12:30",
+    "customerName": "Guest",
+    "items": [{"description": "Vadapav", "quantity": 2, "price": 20, "total": 40}],
+    "grandTotal": 40,
+    "tax": 7.2,
+}
+
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_generate_bill_retry_with_same_key_saves_once(client, auth_headers, monkeypatch, group_commit):
+    monkeypatch.setitem(app.config, "BILL_GROUP_COMMIT", group_commit)
+    headers = dict(auth_headers, **{"Idempotency-Key": "retry-1"})
+    first = client.post("/generate-bill", json=BILL, headers=headers)
+    retry = client.post("/generate-bill", json=BILL, headers=headers)
+    assert first.status_code == 201
+    assert retry.status_code == 200
+    assert retry.json["bill_id"] == first.json["bill_id"]
+    assert Bill.query.count() == 1
+
+
+def test_generate_bill_still_committing_returns_202(client, auth_headers, monkeypatch):
+    monkeypatch.setitem(app.config, "BILL_GROUP_COMMIT", True)
+
+    def pending(bill, items):
+        raise BillCommitPending()
+
+    monkeypatch.setattr(bill_committer, "submit", pending)
+    response = client.post("/generate-bill", json=BILL, headers=auth_headers)
+    assert response.status_code == 202
+    assert response.json["idempotency_key"]
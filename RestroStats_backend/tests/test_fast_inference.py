@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from prediction_models.fast_inference import compile_model
+
+CATEGORICAL = ["item_name", "time_of_day"]
+NUMERICAL = ["hour", "item_price"]
+COLUMNS = CATEGORICAL + NUMERICAL
+
+
+def _training_frame(rows=300, seed=7):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "item_name": rng.choice(["Vadapav", "Panipuri", "Sandwich", "Cold coffee"], rows),
+            "time_of_day": rng.choice(["Morning", "Afternoon", "Evening", "Night"], rows),
+            "hour": rng.integers(0, 24, rows),
+            # Prices that float32 cannot hold exactly
+            "item_price": rng.uniform(10, 200, rows).round(3) + 1e-6,
+        }
+    )
+    target = frame["item_price"] * rng.integers(1, 5, rows) + frame["hour"] * 0.37
+    return frame[COLUMNS], target
+
+
+def _fit(regressor):
+    X, y = _training_frame()
+    model = Pipeline(
+        steps=[
+            (
+                "preprocessor",
+                ColumnTransformer(
+                    transformers=[("cat", OneHotEncoder(handle_unknown="ignore"), CATEGORICAL)],
+                    remainder="passthrough",
+                ),
+            ),
+            ("model", regressor),
+        ]
+    )
+    return model.fit(X, y)
+
+
+RECORDS = [
+    {"item_name": "Vadapav", "time_of_day": "Morning", "hour": 9, "item_price": 20.000001},
+    {"item_name": "Cold coffee", "time_of_day": "Night", "hour": 22, "item_price": 123.456789},
+    # Categories the encoder never saw
+    {"item_name": "Misal pav", "time_of_day": "Evening", "hour": 18, "item_price": 55.5},
+    {"item_name": "Sandwich", "time_of_day": "Brunch", "hour": 11, "item_price": 80.25},
+    {"item_name": "Dosa", "time_of_day": "Midnight", "hour": 0, "item_price": 199.999999},
+]
+
+
+@pytest.mark.parametrize(
+    "regressor, rtol",
+    [
+        (RandomForestRegressor(n_estimators=20, random_state=42), 1e-7),
+        (LinearRegression(), 1e-12),
+    ],
+    ids=["forest", "linear"],
+)
+def test_compiled_pipeline_matches_sklearn_predict(regressor, rtol):
+    model = _fit(regressor)
+    compiled = compile_model(model)
+    assert compiled is not None
+
+    expected = model.predict(pd.DataFrame.from_records(RECORDS, columns=COLUMNS))
+    np.testing.assert_allclose(compiled.predict_records(RECORDS), expected, rtol=rtol)
+
+
+def test_linear_rows_stay_float64():
+    compiled = compile_model(_fit(LinearRegression()))
+    assert compiled.encode(RECORDS).dtype == np.float64
+    assert compile_model(_fit(RandomForestRegressor(n_estimators=5))).encode(RECORDS).dtype == np.float32
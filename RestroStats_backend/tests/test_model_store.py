@@ -0,0 +1,24 @@
+from prediction_models.model_store import ModelStore
+
+
+def test_gated_save_promotes_only_no_worse_versions(tmp_path):
+    store = ModelStore(str(tmp_path))
+    assert store.save({"fit": 1}, "sales", {"cv_rmse": 10.0}, gate="cv_rmse") == 1
+    assert store.current_version("sales") == 1
+
+    # Worse: stored for inspection, the served version stays
+    assert store.save({"fit": 2}, "sales", {"cv_rmse": 12.0}, gate="cv_rmse") == 2
+    assert store.current_version("sales") == 1
+    assert store.versions("sales") == [1, 2]
+
+    assert store.save({"fit": 3}, "sales", {"cv_rmse": 10.0}, gate="cv_rmse") == 3
+    assert store.current_version("sales") == 3
+    assert store.save({"fit": 4}, "sales", {"cv_rmse": 9.5}, gate="cv_rmse") == 4
+    assert store.load("sales")[0] == {"fit": 4}
+
+
+def test_ungated_save_always_promotes(tmp_path):
+    store = ModelStore(str(tmp_path))
+    store.save({"fit": 1}, "sales", {"cv_rmse": 10.0})
+    store.save({"fit": 2}, "sales", {"cv_rmse": 12.0})
+    assert store.current_version("sales") == 2
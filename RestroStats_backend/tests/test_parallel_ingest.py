@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from cleaning.payments import clean_load_chunk
+from prediction_models import food_sales_analysis
+from tests.factories import payment_rows
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_ingest_worker_modules_do_not_import_the_app():
+    # What a spawned ingest worker imports to clean a file
+    code = (
+        "import sys, repository.Parallel_Ingest, cleaning.payments\n"
+        "print(sorted(m for m in ('app', 'flask', 'sqlalchemy', 'sklearn') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_clean_load_chunk_matches_clean_data():
+    rows = payment_rows(200)
+    rows["timestamp"] = pd.to_datetime(rows["timestamp"]).dt.strftime("%d-%m-%Y %H:%M")
+    rows.loc[::7, "transaction_type"] = None
+
+    cleaned = clean_load_chunk(rows.copy())
+    expected, _ = food_sales_analysis.clean_data(rows.dropna())
+    pd.testing.assert_frame_equal(cleaned, expected)
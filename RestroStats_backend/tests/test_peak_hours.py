@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from app import app
+from cleaning.payments import clean_upload_chunk
+from repository.Bulk_Insert import bulk_insert_payments
+from tests.factories import payment_rows
+
+
+@pytest.mark.parametrize("use_rollups", [False, True])
+def test_day_hour_grid_matches_the_payment_weekdays(client, restaurant_id, auth_headers, monkeypatch, use_rollups):
+    monkeypatch.setitem(app.config, "USE_PAYMENT_ROLLUPS", use_rollups)
+    rows = payment_rows(2000)
+    bulk_insert_payments(clean_upload_chunk(rows.copy()), restaurant_id)
+
+    grid = client.get("/peak-hours", headers=auth_headers, query_string={"by_day": 1}).json["day_hour_sales"]
+
+    timestamps = pd.to_datetime(rows["timestamp"])
+    expected = rows.groupby([timestamps.dt.day_name(), timestamps.dt.hour])["transaction_amount"].sum()
+    assert set(grid) == set(timestamps.dt.day_name())
+    for (day_name, hour), total in expected.items():
+        assert grid[day_name][hour] == pytest.approx(total)
+    assert sum(map(sum, grid.values())) == pytest.approx(rows["transaction_amount"].sum())
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from app import app
+from controllers import Restaurant_Sales
+from prediction_models.model_registry import model_registry
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"items": "Vadapav"},
+        {"items": [{"item_name": "Vadapav"}, "Panipuri"]},
+        [{"item_name": "Vadapav"}],
+    ],
+)
+def test_batch_rejects_malformed_items(client, body):
+    response = client.post("/api/predict/batch", json=body)
+    assert response.status_code == 400
+    assert response.json["success"] is False
+
+
+def test_batch_rejects_too_many_items(client, monkeypatch):
+    monkeypatch.setitem(app.config, "MAX_BATCH_PREDICTIONS", 3)
+    response = client.post("/api/predict/batch", json={"items": [{}] * 4})
+    assert response.status_code == 400
+
+
+def test_batch_scores_every_item(client, monkeypatch):
+    monkeypatch.setitem(app.config, "MAX_BATCH_PREDICTIONS", 3)
+    response = client.post(
+        "/api/predict/batch", json={"items": [{"item_name": "Vadapav"}, {"hour": 9}, {}]}
+    )
+    assert response.status_code == 200
+    predictions = response.json["predictions"]
+    assert [p["time_of_day"] for p in predictions] == ["Evening", "Morning", "Evening"]
+
+
+class RecordingModel:
+    """Stands in for the served pipeline and keeps the frames it is asked to score."""
+
+    compiled_ = None
+
+    def __init__(self):
+        self.frames = []
+
+    def predict(self, frame):
+        self.frames.append(frame)
+        return np.ones(len(frame))
+
+
+def test_custom_slots_are_translated_to_the_training_slots(client, auth_headers, monkeypatch):
+    slots = [
+        {"name": "Breakfast", "start": 6},
+        {"name": "Lunch", "start": 11},
+        {"name": "Dinner", "start": 17},
+        {"name": "Late", "start": 22},
+    ]
+    assert client.put("/restaurant/time-slots", json={"time_slots": slots}, headers=auth_headers).status_code == 200
+    model = RecordingModel()
+    monkeypatch.setattr(model_registry, "get", lambda name=None: model)
+
+    items = [{"time_of_day": "Lunch"}, {"time_of_day": "Dinner"}, {"hour": 7}, {"time_of_day": "Late"}]
+    response = client.post("/api/predict/batch", json={"items": items}, headers=auth_headers)
+
+    assert response.status_code == 200
+    # The response keeps the restaurant's names, the model sees the defaults
+    assert [p["time_of_day"] for p in response.json["predictions"]] == ["Lunch", "Dinner", "Breakfast", "Late"]
+    assert model.frames[0]["time_of_day"].tolist() == ["Afternoon", "Evening", "Morning", "Night"]
+
+
+def test_unknown_slot_names_are_rejected(client, auth_headers):
+    response = client.post(
+        "/api/predict/batch", json={"items": [{"time_of_day": "Brunch"}]}, headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert "Brunch" in response.json["message"]
+
+
+def test_batch_error_does_not_leak_the_traceback(client, monkeypatch):
+    def broken(scenarios, time_slots):
+        raise RuntimeError("model file is corrupt")
+
+    monkeypatch.setattr(Restaurant_Sales, "predict_scenarios", broken)
+    response = client.post("/api/predict/batch", json={"items": [{}]})
+    assert response.status_code == 500
+    assert response.json == {"success": False, "message": "Error making prediction: model file is corrupt"}
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select
+
+from app import app, db
+from cleaning.payments import clean_upload_chunk
+from entities.Payment import Payment
+from prediction_models.Retrain_Model import retrain_model
+from repository.Bulk_Insert import bulk_insert_payments
+from tests.factories import payment_rows
+
+
+def _ingest(restaurant_id, rows):
+    bulk_insert_payments(clean_upload_chunk(rows), restaurant_id)
+    db.session.commit()
+
+
+def test_ingest_retrain_ingest_retrain(restaurant_id, monkeypatch):
+    monkeypatch.setitem(app.config, "RETRAIN_SETTLE_SECONDS", 0)
+
+    _ingest(restaurant_id, payment_rows(300))
+    first = retrain_model(batch_size=64)
+    assert first["rows"] == 300
+
+    _ingest(restaurant_id, payment_rows(200, start="2024-02-01 08:00", order_offset=1000))
+    second = retrain_model(batch_size=64)
+    assert second["rows"] == 200
+    assert second["version"] > first["version"]
+
+    assert retrain_model(batch_size=64)["rows"] == 0
+
+
+def test_late_commit_with_a_lower_id_is_not_skipped(restaurant_id, monkeypatch):
+    monkeypatch.setitem(app.config, "RETRAIN_SETTLE_SECONDS", 0)
+    _ingest(restaurant_id, payment_rows(50))
+    # The id a slow writer took before the first run, committed only after it
+    late_id = db.session.execute(select(func.min(Payment.id))).scalar()
+    late_row = db.session.execute(select(Payment.__table__).where(Payment.id == late_id)).mappings().one()
+    db.session.execute(delete(Payment).where(Payment.id == late_id))
+    db.session.commit()
+
+    assert retrain_model()["rows"] == 49
+
+    db.session.execute(insert(Payment), [dict(late_row, created_at=datetime.utcnow())])
+    db.session.commit()
+    assert retrain_model()["rows"] == 1
@@ -0,0 +1,70 @@
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import update
+
+from app import db
+from cleaning.payments import clean_upload_chunk
+from entities.PaymentRollup import PaymentRollup
+from prediction_models import food_sales_analysis
+from repository.Bulk_Insert import bulk_insert_payments
+from repository.Rollups import backfill_rollups, rollup_frame
+from tests.factories import payment_rows
+
+
+def test_rollup_analysis_matches_raw_payments(restaurant_id):
+    bulk_insert_payments(clean_upload_chunk(payment_rows(500)), restaurant_id)
+    db.session.commit()
+
+    raw = food_sales_analysis.load_payments(restaurant_id)
+    # Parsed once at ingest, read back as datetimes
+    assert pd.api.types.is_datetime64_any_dtype(raw["timestamp"])
+    raw_clean, raw_time = food_sales_analysis.clean_data(raw)
+    from_rows = food_sales_analysis.analyze_data(raw_clean, raw_time)
+    rollups = rollup_frame(restaurant_id)
+    from_rollups = food_sales_analysis.analyze_data(rollups, rollups)
+
+    assert not from_rollups["customer_time_preference"].empty
+    pd.testing.assert_frame_equal(
+        from_rollups["customer_time_preference"],
+        from_rows["customer_time_preference"],
+        check_dtype=False,
+        check_names=False,
+    )
+    pd.testing.assert_series_equal(
+        from_rollups["day_sales"], from_rows["day_sales"], check_dtype=False, check_names=False
+    )
+
+
+def _rollups(restaurant_id):
+    return (
+        rollup_frame(restaurant_id)
+        .sort_values(["sale_date", "hour", "item_name", "item_type", "received_by"])
+        .reset_index(drop=True)
+    )
+
+
+def test_reupload_with_duplicates_refreshes_only_touched_hours(restaurant_id):
+    early = payment_rows(30, start="2024-01-01 02:00", seed=1, order_offset=10_000)
+    bulk_insert_payments(clean_upload_chunk(early), restaurant_id)
+    bulk_insert_payments(clean_upload_chunk(payment_rows(300)), restaurant_id)
+    db.session.commit()
+    # A bucket on the same day but outside the re-uploaded hours is left alone
+    db.session.execute(
+        update(PaymentRollup)
+        .where(PaymentRollup.sale_date == date(2024, 1, 1), PaymentRollup.hour == 2)
+        .values(row_count=PaymentRollup.row_count + 1000)
+    )
+    db.session.commit()
+
+    # Rows 0-299 again plus 200 new ones
+    stats = bulk_insert_payments(clean_upload_chunk(payment_rows(500)), restaurant_id)
+    db.session.commit()
+    assert stats["inserted"] == 200
+
+    refreshed = _rollups(restaurant_id)
+    backfill_rollups(restaurant_id)
+    expected = _rollups(restaurant_id)
+    untouched = (refreshed["sale_date"] == date(2024, 1, 1)) & (refreshed["hour"] == 2)
+    refreshed.loc[untouched, "row_count"] -= 1000
+    pd.testing.assert_frame_equal(refreshed, expected)
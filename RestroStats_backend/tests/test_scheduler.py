@@ -0,0 +1,22 @@
+from app import app
+from repository.Job_Store import job_store
+from repository.Scheduler import enabled_jobs
+
+
+def test_rollup_refresh_runs_only_with_rollups_enabled(monkeypatch):
+    monkeypatch.setitem(app.config, "USE_PAYMENT_ROLLUPS", False)
+    assert "refresh-rollups" not in enabled_jobs()
+    monkeypatch.setitem(app.config, "USE_PAYMENT_ROLLUPS", True)
+    assert "refresh-rollups" in enabled_jobs()
+
+
+def test_job_status_is_not_served_over_http():
+    assert "/scheduler/jobs" not in {rule.rule for rule in app.url_map.iter_rules()}
+
+
+def test_job_status_cli_lists_registered_jobs():
+    job_store.init()
+    job_store.register("precompute-insights", 60)
+    result = app.test_cli_runner().invoke(args=["scheduler-jobs"])
+    assert result.exit_code == 0
+    assert "precompute-insights" in result.output
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+from app import db
+from cleaning.payments import clean_upload_chunk
+from repository.Bulk_Insert import bulk_insert_payments
+from tests.factories import payment_rows
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the whole app in a fresh interpreter and reports every statement
+# sent to the database while doing so
+IMPORT_APP = """
+import json, time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+statements = []
+event.listen(Engine, "before_cursor_execute", lambda conn, cursor, sql, *args: statements.append(sql))
+start = time.perf_counter()
+import app
+print(json.dumps({"seconds": time.perf_counter() - start, "statements": statements}))
+"""
+
+
+def _import_app():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_APP],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_app_import_reads_no_tables(restaurant_id):
+    bulk_insert_payments(clean_upload_chunk(payment_rows(20000)), restaurant_id)
+    db.session.commit()
+
+    startup = _import_app()
+
+    # Analysis state is built on first request, so start-up cost does not
+    # depend on how many payments are stored
+    assert startup["statements"] == []
+    print(f"app import took {startup['seconds']:.2f}s with 20000 payments stored")
@@ -0,0 +1,61 @@
+import gc
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from sqlalchemy import func, select
+
+from app import db
+from cleaning.payments import clean_upload_chunk
+from entities.Payment import Payment
+from repository.Bulk_Insert import stream_insert_payments
+from tests.factories import payment_rows
+
+CHUNK_SIZE = 2000
+
+
+def _peak_streaming_memory(path, restaurant_id):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with open(path, "rb") as f:
+            stats = stream_insert_payments(f, restaurant_id, clean_upload_chunk, chunk_size=CHUNK_SIZE)
+        db.session.commit()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return stats, peak
+
+
+def test_upload_streams_in_bounded_memory(restaurant_id, tmp_path):
+    small, large = tmp_path / "small.csv", tmp_path / "large.csv"
+    payment_rows(2 * CHUNK_SIZE, seed=1).to_csv(small, index=False)
+    # Eight times the rows of the small file, far above one chunk
+    payment_rows(16 * CHUNK_SIZE, start="2025-01-01 08:00", seed=2).to_csv(large, index=False)
+
+    small_stats, small_peak = _peak_streaming_memory(small, restaurant_id)
+    large_stats, large_peak = _peak_streaming_memory(large, restaurant_id)
+
+    assert small_stats["inserted"] == 2 * CHUNK_SIZE
+    assert large_stats["inserted"] == 16 * CHUNK_SIZE
+    assert db.session.execute(select(func.count(Payment.id))).scalar() == 18 * CHUNK_SIZE
+    # Peak memory follows the chunk size, not the file size
+    assert large_peak < 2 * small_peak, (small_peak, large_peak)
+
+
+def test_upload_chunks_share_the_detected_timestamp_format(restaurant_id, tmp_path):
+    path = tmp_path / "day_first.csv"
+    # First chunk unambiguously day-first, the second readable either way
+    rows = pd.concat(
+        [payment_rows(5, start="2024-01-13 08:00"), payment_rows(5, start="2024-03-02 08:00", order_offset=5)]
+    )
+    rows["timestamp"] = pd.to_datetime(rows["timestamp"]).dt.strftime("%d/%m/%Y %H:%M")
+    rows.to_csv(path, index=False)
+
+    with open(path, "rb") as f:
+        stream_insert_payments(f, restaurant_id, clean_upload_chunk, chunk_size=5)
+    db.session.commit()
+
+    stored = db.session.execute(select(Payment.timestamp).where(Payment.order_id == "5")).scalar()
+    assert stored == datetime(2024, 3, 2, 8, 0)
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from cleaning.payments import clean_upload_chunk
+from cleaning.timestamp import normalize_timestamps
+from tests.factories import payment_rows
+
+
+def test_values_outside_the_detected_format_get_a_flexible_retry():
+    values = pd.Series(["2024-01-05 10:00", "2024-01-06 11:15", "2024-01-07 12:30", "08/01/2024 09:30"])
+    parsed, report = normalize_timestamps(values, dayfirst=True)
+    assert report["format"] == "%Y-%m-%d %H:%M"
+    assert report["unparsed"] == 0
+    assert parsed.iloc[-1] == pd.Timestamp("2024-01-08 09:30")
+
+
+def test_ambiguous_day_and_month_follow_dayfirst():
+    values = pd.Series(["03/04/2024 10:00", "05/06/2024 11:00"])
+    day_first, report = normalize_timestamps(values, dayfirst=True)
+    assert report["format"] == "%d/%m/%Y %H:%M"
+    assert day_first.tolist() == [pd.Timestamp("2024-04-03 10:00"), pd.Timestamp("2024-06-05 11:00")]
+
+    month_first, report = normalize_timestamps(values)
+    assert report["format"] == "%m/%d/%Y %H:%M"
+    assert month_first.tolist() == [pd.Timestamp("2024-03-04 10:00"), pd.Timestamp("2024-05-06 11:00")]
+
+
+def test_unparsed_rows_are_reported():
+    values = pd.Series(["2024-01-05 10:00", "not a date", "2024-01-05 10:00", None])
+    parsed, report = normalize_timestamps(values)
+    assert parsed.isna().tolist() == [False, True, False, True]
+    assert report["unparsed"] == 2
+    assert report["unparsed_examples"] == ["not a date"]
+
+
+def _day_first_chunk(start):
+    chunk = payment_rows(5, start=start)
+    chunk["timestamp"] = pd.to_datetime(chunk["timestamp"]).dt.strftime("%d/%m/%Y %H:%M")
+    return chunk
+
+
+def test_upload_chunks_keep_the_first_detected_format():
+    # Unambiguously day-first, then a chunk that reads either way
+    first, second = _day_first_chunk("2024-01-13 08:00"), _day_first_chunk("2024-03-02 08:00")
+
+    state = {}
+    clean_upload_chunk(first, state=state)
+    assert state["timestamp_format"] == "%d/%m/%Y %H:%M"
+    assert clean_upload_chunk(second.copy(), state=state)["timestamp"].iloc[0] == pd.Timestamp("2024-03-02 08:00")
+
+    # Detected on its own, the ambiguous chunk would be read month-first
+    assert clean_upload_chunk(second.copy())["timestamp"].iloc[0] == pd.Timestamp("2024-02-03 08:00")
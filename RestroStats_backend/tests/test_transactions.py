@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+from app import app, bcrypt, db
+from cleaning.payments import clean_upload_chunk
+from entities.Restaurant import Restaurant
+from repository.Bulk_Insert import bulk_insert_payments
+from tests.factories import payment_rows
+
+
+def _other_restaurant():
+    other = Restaurant(
+        name="Other",
+        email="other@example.com",
+        password=bcrypt.generate_password_hash("secret").decode("utf-8"),
+        city="Pune",
+        state="Maharashtra",
+    )
+    db.session.add(other)
+    db.session.commit()
+    return other.id
+
+
+def test_transaction_lists_need_a_token(client):
+    assert client.get("/transactions/10").status_code == 401
+    assert client.get("/transactions/all").status_code == 401
+
+
+def test_transaction_lists_are_scoped_to_the_caller(client, restaurant_id, auth_headers, monkeypatch):
+    monkeypatch.setitem(app.config, "MAX_PAGE_SIZE", 7)
+    bulk_insert_payments(clean_upload_chunk(payment_rows(30)), restaurant_id)
+    bulk_insert_payments(clean_upload_chunk(payment_rows(5, seed=3)), _other_restaurant())
+    db.session.commit()
+
+    latest = client.get("/transactions/5", headers=auth_headers).json
+    assert len(latest) == 5
+
+    everything = client.get("/transactions/all", headers=auth_headers).json
+    # Streamed over several pages of MAX_PAGE_SIZE, newest first, no repeats
+    assert len(everything) == 30
+    assert len({row["id"] for row in everything}) == 30
+    assert everything[:5] == latest
+
+
+# More than the export's yield_per (1000), so several batches are streamed
+EXPORT_ROWS = 2500
+
+
+def _export_fixture(restaurant_id):
+    bulk_insert_payments(clean_upload_chunk(payment_rows(EXPORT_ROWS)), restaurant_id)
+    bulk_insert_payments(clean_upload_chunk(payment_rows(5, seed=3, order_offset=90000)), _other_restaurant())
+    db.session.commit()
+
+
+def _streamed_chunks(response):
+    assert response.is_streamed
+    chunks = [chunk.decode() for chunk in response.response if chunk]
+    response.close()
+    return chunks
+
+
+def test_export_ndjson_streams_every_row_of_the_caller(client, restaurant_id, auth_headers):
+    _export_fixture(restaurant_id)
+    response = client.get("/transactions/export", headers=auth_headers, buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    chunks = _streamed_chunks(response)
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert len(rows) == EXPORT_ROWS
+    # In timestamp order, and none of the other restaurant's 9000x orders
+    assert [row["order_id"] for row in rows] == [str(i) for i in range(EXPORT_ROWS)]
+
+
+def test_export_csv_streams_every_row_of_the_caller(client, restaurant_id, auth_headers):
+    _export_fixture(restaurant_id)
+    response = client.get("/transactions/export?format=csv", headers=auth_headers, buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+
+    chunks = _streamed_chunks(response)
+    # Header, then one chunk per batch
+    assert len(chunks) == 4
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert len(rows) == EXPORT_ROWS
+    assert {row["order_id"] for row in rows} == {str(i) for i in range(EXPORT_ROWS)}
+
+
+def test_export_rejects_unknown_formats(client, auth_headers):
+    assert client.get("/transactions/export?format=xml", headers=auth_headers).status_code == 400
+    assert client.get("/transactions/export").status_code == 401
@@ -0,0 +1,83 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from app import app, db
+from entities.Payment import Payment
+from entities.UploadJob import UploadJob
+from repository import Upload_Jobs
+from repository.Upload_Jobs import fail_stale_upload_jobs, run_upload_job
+from tests.factories import payment_rows
+
+
+def _job(restaurant_id, status, heartbeat_at):
+    job = UploadJob(restaurant_id=restaurant_id, kind="upload", status=status, heartbeat_at=heartbeat_at)
+    db.session.add(job)
+    db.session.commit()
+    return job.id
+
+
+def test_stale_jobs_are_marked_failed(restaurant_id):
+    stale = datetime.utcnow() - timedelta(seconds=app.config["UPLOAD_JOB_STALE_SECONDS"] + 60)
+    queued = _job(restaurant_id, "queued", stale)
+    running = _job(restaurant_id, "running", stale)
+    live = _job(restaurant_id, "running", datetime.utcnow())
+    done = _job(restaurant_id, "done", stale)
+
+    assert fail_stale_upload_jobs() == 2
+    db.session.expire_all()
+    assert [db.session.get(UploadJob, job_id).status for job_id in (queued, running, live, done)] == [
+        "failed",
+        "failed",
+        "running",
+        "done",
+    ]
+
+
+def _upload_file(rows=10):
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w") as f:
+        payment_rows(rows).to_csv(f, index=False)
+    return path
+
+
+def test_job_failed_as_stale_while_queued_is_not_run(restaurant_id):
+    stale = datetime.utcnow() - timedelta(seconds=app.config["UPLOAD_JOB_STALE_SECONDS"] + 60)
+    job_id = _job(restaurant_id, "queued", stale)
+    assert fail_stale_upload_jobs() == 1
+
+    # The pool finally reaches the job: it must not flip back to running/done
+    path = _upload_file()
+    run_upload_job(job_id, path, restaurant_id, lambda chunk, state=None: chunk)
+
+    db.session.expire_all()
+    assert db.session.get(UploadJob, job_id).status == "failed"
+    assert Payment.query.count() == 0
+    assert not os.path.exists(path)
+
+
+def test_jobs_queued_in_a_live_process_keep_beating(restaurant_id, monkeypatch):
+    stale = datetime.utcnow() - timedelta(seconds=app.config["UPLOAD_JOB_STALE_SECONDS"] + 60)
+    waiting = _job(restaurant_id, "queued", stale)
+    lost = _job(restaurant_id, "queued", stale)
+    monkeypatch.setattr(Upload_Jobs, "_queued_ids", {waiting})
+
+    Upload_Jobs._beat_queued_jobs()
+    assert fail_stale_upload_jobs() == 1
+    db.session.expire_all()
+    assert db.session.get(UploadJob, waiting).status == "queued"
+    assert db.session.get(UploadJob, lost).status == "failed"
+
+
+def test_failed_job_reports_only_the_message(client, restaurant_id, auth_headers):
+    job_id = _job(restaurant_id, "queued", datetime.utcnow())
+    path = _upload_file()
+
+    def broken_clean(chunk, state=None):
+        raise ValueError("timestamp column is missing")
+
+    run_upload_job(job_id, path, restaurant_id, broken_clean)
+
+    job = client.get(f"/jobs/{job_id}", headers=auth_headers).json
+    assert job["status"] == "failed"
+    assert job["error"] == "timestamp column is missing"
@@ -18,6 +18,8 @@ export default function NewBillPage() {
   const [billNumber, setBillNumber] = useState("");
   const { darkTheme, toggleTheme } = useTheme();
   const printAreaRef = useRef(null);
+  // One key per bill, so retrying a submit never saves the bill twice
+  const idempotencyKeyRef = useRef(null);
 
   const handleAutoFill = () => {
     const now = new Date();
@@ -74,11 +76,16 @@ export default function NewBillPage() {
       // Calculate tax amount
       const taxAmount = calculateTax();
       
+      if (!idempotencyKeyRef.current) {
+        idempotencyKeyRef.current = crypto.randomUUID();
+      }
+      
       const response = await fetch(`${baseURL}/generate-bill`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`
+          'Authorization': `Bearer ${token}`,
+          'Idempotency-Key': idempotencyKeyRef.current
         },
         body: JSON.stringify({
           billNumber: billNumber || `BILL-${Date.now().toString().slice(-6)}`,
@@ -94,7 +101,10 @@ export default function NewBillPage() {
       
       const data = await response.json();
       
-      if (response.ok) {
+      if (response.status === 202) {
+        // Still being saved: submitting again reuses the key and cannot duplicate it
+        alert(`${data.message}. Submit again in a moment to confirm Bill Number: ${data.bill_number}`);
+      } else if (response.ok) {
         alert(`Bill generated successfully! Bill Number: ${data.bill_number}`);
         // Optional: Clear form or redirect
         clearForm();
@@ -110,6 +120,7 @@ export default function NewBillPage() {
   
   // Add a helper function to clear the form
   const clearForm = () => {
+    idempotencyKeyRef.current = null;
     setItems([]);
     setGrandTotal(0);
     setCustomerName("");
@@ -26,7 +26,12 @@ export default function PaymentHistory() {
   const fetchTransactions = async () => {
     try {
       setIsLoading(true);
-      const response = await fetch(`${baseURL}/transactions/all`);
+      const token = localStorage.getItem("restaurantToken");
+      const response = await fetch(`${baseURL}/transactions/all`, {
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      });
       if (!response.ok) {
         throw new Error(`HTTP error! Status: ${response.status}`);
       }
@@ -40,7 +40,12 @@ const TransactionDisplay = ({limit}) => {
     const fetchTransactions = async () => {
       try {
         setIsLoading(true);
-        const response = await fetch(`${baseURL}/transactions/${limit}`);
+        const token = localStorage.getItem('restaurantToken');
+        const response = await fetch(`${baseURL}/transactions/${limit}`, {
+          headers: {
+            Authorization: `Bearer ${token}`
+          }
+        });
         if (!response.ok) {
           throw new Error(`HTTP error! Status: ${response.status}`);
         }
@@ -3,10 +3,13 @@ import { useTheme } from "./ThemeProvider";
 import { useNavigate } from "react-router-dom";
 
 const baseURL = import.meta.env.VITE_BASE_URL;
+const BILLS_PAGE_SIZE = 50;
 
 export default function ViewBill() {
   const [bills, setBills] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState("");
   const [filterStatus, setFilterStatus] = useState("all");
@@ -20,15 +23,21 @@ export default function ViewBill() {
     fetchBills();
   }, []);
 
-  const fetchBills = async () => {
-    setIsLoading(true);
+  // Loads the first page, or the page after `cursor` when loading more
+  const fetchBills = async (cursor = null) => {
+    const setLoading = cursor ? setIsLoadingMore : setIsLoading;
+    setLoading(true);
     try {
       const token = localStorage.getItem("restaurantToken");
       if (!token) {
         throw new Error("You must be logged in to view bills");
       }
 
-      const response = await fetch(`${baseURL}/bills`, {
+      const params = new URLSearchParams({ limit: BILLS_PAGE_SIZE });
+      if (cursor) {
+        params.set("cursor", cursor);
+      }
+      const response = await fetch(`${baseURL}/bills?${params}`, {
         method: "GET",
         headers: {
           Authorization: `Bearer ${token}`,
@@ -44,17 +53,18 @@ export default function ViewBill() {
       
       // Add payment status based on created_at date (for demo purposes)
       // In a real app, you would have a status field in your database
-      const billsWithStatus = data.map(bill => ({
+      const billsWithStatus = data.bills.map(bill => ({
         ...bill,
         status: new Date(bill.created_at) < new Date(Date.now() - 86400000) ? "paid" : "unpaid"
       }));
       
-      setBills(billsWithStatus);
+      setBills(cursor ? (previous) => [...previous, ...billsWithStatus] : billsWithStatus);
+      setNextCursor(data.next_cursor);
     } catch (error) {
       console.error("Error fetching bills:", error);
       setError(error.message);
     } finally {
-      setIsLoading(false);
+      setLoading(false);
     }
   };
 
@@ -229,7 +239,7 @@ export default function ViewBill() {
             <div className="p-8 text-center">
               <div className="text-red-500 mb-4">{error}</div>
               <button 
-                onClick={fetchBills}
+                onClick={() => fetchBills()}
                 className="px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-indigo-500 focus:ring-offset-2"
               >
                 Try Again
@@ -332,6 +342,17 @@ export default function ViewBill() {
                   ))}
                 </tbody>
               </table>
+              {nextCursor && (
+                <div className="p-4 text-center">
+                  <button
+                    onClick={() => fetchBills(nextCursor)}
+                    disabled={isLoadingMore}
+                    className="px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-indigo-500 focus:ring-offset-2 disabled:opacity-50"
+                  >
+                    {isLoadingMore ? "Loading..." : "Load more bills"}
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>